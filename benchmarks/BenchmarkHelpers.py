@@ -0,0 +1,111 @@
+# ----------------------------------------------------------------------
+# |
+# |  BenchmarkHelpers.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-16 10:02:17
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2026
+# |  Distributed under the MIT License.
+# |
+# ----------------------------------------------------------------------
+"""Functionality shared by the benchmarks"""
+
+import sys
+import time
+
+from collections.abc import Callable
+from pathlib import Path
+
+from dbrownell_Common import PathEx
+
+
+# ----------------------------------------------------------------------
+SAMPLE_SCHEMAS_DIR = PathEx.EnsureDir(
+    Path(__file__).parent.parent / "src" / "SimpleSchemaGenerator" / "SampleSchemas"
+)
+
+
+# ----------------------------------------------------------------------
+def LoadCorpus(
+    scale: int,
+) -> list[tuple[str, str]]:
+    """Return (name, content) for each sample schema, repeated `scale` times."""
+
+    sample_schemas = [
+        (filename.name, filename.read_text(encoding="utf-8"))
+        for filename in sorted(SAMPLE_SCHEMAS_DIR.glob("*.SimpleSchema"))
+    ]
+
+    return [(f"{index}/{name}", content) for index in range(scale) for name, content in sample_schemas]
+
+
+# ----------------------------------------------------------------------
+def CreateLargeContent(
+    scale: int,
+) -> str:
+    """Return the content of a single large file, similar to a generated schema."""
+
+    # Include statements must appear at the beginning of a file, so files that include others are
+    # skipped.
+    return "\n".join(content for _, content in LoadCorpus(scale) if not content.startswith("from "))
+
+
+# ----------------------------------------------------------------------
+def CreateCorpusWorkspace(
+    workspace: Path,
+    scale: int,
+) -> list[Path]:
+    """Write the sample schemas to `scale` subdirectories of the workspace and return the filenames."""
+
+    filenames: list[Path] = []
+
+    for name, content in LoadCorpus(scale):
+        filename = workspace / name
+
+        filename.parent.mkdir(parents=True, exist_ok=True)
+        filename.write_text(content, encoding="utf-8")
+
+        filenames.append(filename)
+
+    return filenames
+
+
+# ----------------------------------------------------------------------
+def Measure(
+    func: Callable[[], object],
+    iterations: int,
+) -> float:
+    """Return the fastest time (in seconds) of `iterations` invocations of `func`."""
+
+    best: float | None = None
+
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+
+        if best is None or elapsed < best:
+            best = elapsed
+
+    assert best is not None
+    return best
+
+
+# ----------------------------------------------------------------------
+def WriteResults(
+    title: str,
+    rows: list[tuple[str, str]],
+) -> None:
+    """Write a table of results to stdout."""
+
+    name_width = max(len(name) for name, _ in rows)
+
+    sys.stdout.write(f"{title}\n{'-' * len(title)}\n")
+
+    for name, value in rows:
+        sys.stdout.write(f"    {name:<{name_width}}  {value}\n")
+
+    sys.stdout.write("\n")
@@ -0,0 +1,89 @@
+# ----------------------------------------------------------------------
+# |
+# |  Chunking_Benchmark.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-16 22:05:41
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2026
+# |  Distributed under the MIT License.
+# |
+# ----------------------------------------------------------------------
+"""Compares parsing a single large file in one worker process with parsing chunks of it in many worker processes."""
+
+import sys
+
+from pathlib import Path, PurePath
+
+import typer
+
+from dbrownell_Common.Streams.DoneManager import DoneManager
+
+from BenchmarkHelpers import CreateLargeContent, Measure, WriteResults
+from SimpleSchemaGenerator.Schema.Parse.ANTLR.Parse import ExecutorType, Parse
+from SimpleSchemaGenerator.Schema.Parse.ANTLR.ParseOptions import ParseOptions
+
+
+# ----------------------------------------------------------------------
+app = typer.Typer(
+    help=__doc__,
+    pretty_exceptions_show_locals=False,
+    pretty_exceptions_enable=False,
+)
+
+
+# ----------------------------------------------------------------------
+@app.command()
+def Main(
+    scale: int = typer.Option(200, min=1, help="Number of times that the sample schemas are repeated."),
+    chunk_lines: int = typer.Option(2000, min=1, help="Minimum number of lines in each chunk."),
+    iterations: int = typer.Option(3, min=1, help="Number of iterations; the fastest is reported."),
+) -> None:
+    """Run the benchmark."""
+
+    content = CreateLargeContent(scale)
+    num_lines = len(content.split("\n"))
+
+    # Both measurements include the creation of the process pool
+    # ----------------------------------------------------------------------
+    def ParseFile(
+        this_chunk_lines: int | None,
+    ) -> None:
+        with DoneManager.Create(sys.stderr, "", line_prefix="") as dm:
+            Parse(
+                dm,
+                {Path.cwd(): {PurePath("Benchmark.SimpleSchema"): lambda: content}},
+                options=ParseOptions(
+                    quiet=True,
+                    executor=ExecutorType.Process,
+                    chunk_lines=this_chunk_lines,
+                ),
+            )
+
+            assert dm.result == 0, dm.result
+
+    # ----------------------------------------------------------------------
+
+    whole_time = Measure(lambda: ParseFile(None), iterations)
+    chunked_time = Measure(lambda: ParseFile(chunk_lines), iterations)
+
+    WriteResults(
+        f"{num_lines} lines",
+        [
+            ("Whole file", f"{whole_time:.3f}s ({num_lines / whole_time:,.0f} lines/s)"),
+            (
+                f"Chunks of {chunk_lines} lines",
+                f"{chunked_time:.3f}s ({num_lines / chunked_time:,.0f} lines/s)",
+            ),
+            ("Speedup", f"{whole_time / chunked_time:.2f}x"),
+        ],
+    )
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,174 @@
+# ----------------------------------------------------------------------
+# |
+# |  DfaSnapshot_Benchmark.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-16 11:21:48
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2026
+# |  Distributed under the MIT License.
+# |
+# ----------------------------------------------------------------------
+"""Compares the latency of parsing files in a new process with and without a DFA snapshot."""
+
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from pathlib import Path, PurePath
+from typing import Annotated
+
+import typer
+
+from dbrownell_Common.Streams.DoneManager import DoneManager
+
+from BenchmarkHelpers import SAMPLE_SCHEMAS_DIR, WriteResults
+from SimpleSchemaGenerator.Schema.Parse.ANTLR.DfaSnapshot import LoadDfaSnapshot, SaveDfaSnapshot
+from SimpleSchemaGenerator.Schema.Parse.ANTLR.Parse import Parse
+from SimpleSchemaGenerator.Schema.Parse.ANTLR.ParseOptions import ParseOptions
+
+
+# ----------------------------------------------------------------------
+app = typer.Typer(
+    help=__doc__,
+    no_args_is_help=False,
+    pretty_exceptions_show_locals=False,
+    pretty_exceptions_enable=False,
+)
+
+
+# ----------------------------------------------------------------------
+@app.command("Main")
+def Main(
+    filename: str = typer.Option("Structures.SimpleSchema", help="Name of the sample schema parsed first."),
+    iterations: int = typer.Option(5, min=1, help="Number of processes created for each configuration."),
+) -> None:
+    """Run the benchmark."""
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        snapshot_filename = Path(temp_dir) / "snapshot"
+
+        # Create the snapshot by parsing all of the sample schemas
+        _RunChild("Warm", "--save", str(snapshot_filename))
+
+        cold_times = [_ParseTimes(_RunChild("Child", filename)) for _ in range(iterations)]
+        warm_times = [
+            _ParseTimes(_RunChild("Child", filename, "--snapshot", str(snapshot_filename)))
+            for _ in range(iterations)
+        ]
+
+    cold_load, cold_first, cold_all = (statistics.median(values) for values in zip(*cold_times, strict=True))
+    warm_load, warm_first, warm_all = (statistics.median(values) for values in zip(*warm_times, strict=True))
+
+    assert cold_load == 0.0
+
+    WriteResults(
+        f"Median of {iterations} processes",
+        [
+            ("Snapshot load", f"{warm_load * 1000:.1f}ms"),
+            (f"First file ({filename})", _FormatComparison(cold_first, warm_first, warm_load)),
+            ("All sample schemas", _FormatComparison(cold_all, warm_all, warm_load)),
+        ],
+    )
+
+
+# ----------------------------------------------------------------------
+@app.command("Warm", hidden=True)
+def Warm(
+    save: Annotated[Path, typer.Option()],
+) -> None:
+    for filename in SAMPLE_SCHEMAS_DIR.glob("*.SimpleSchema"):
+        _ParseFile(filename.name)
+
+    SaveDfaSnapshot(save)
+
+
+# ----------------------------------------------------------------------
+@app.command("Child", hidden=True)
+def Child(
+    filename: str,
+    snapshot: Annotated[Path | None, typer.Option()] = None,
+) -> None:
+    load_time = 0.0
+
+    if snapshot is not None:
+        start = time.perf_counter()
+
+        if not LoadDfaSnapshot(snapshot):
+            raise typer.Exit(1)
+
+        load_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    _ParseFile(filename)
+    first_time = time.perf_counter() - start
+
+    # Parse the remaining files
+    for other_filename in SAMPLE_SCHEMAS_DIR.glob("*.SimpleSchema"):
+        if other_filename.name != filename:
+            _ParseFile(other_filename.name)
+
+    all_time = time.perf_counter() - start
+
+    sys.stdout.write(f"{load_time} {first_time} {all_time}")
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+def _RunChild(*args: str) -> str:
+    return subprocess.run(  # noqa: S603
+        [sys.executable, __file__, *args],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+
+
+# ----------------------------------------------------------------------
+def _FormatComparison(
+    cold_time: float,
+    warm_time: float,
+    load_time: float,
+) -> str:
+    return "cold {:.1f}ms, warm {:.1f}ms ({:.2f}x; {:.2f}x including the snapshot load)".format(
+        cold_time * 1000,
+        warm_time * 1000,
+        cold_time / warm_time,
+        cold_time / (warm_time + load_time),
+    )
+
+
+# ----------------------------------------------------------------------
+def _ParseTimes(
+    output: str,
+) -> tuple[float, float, float]:
+    load_time, first_time, all_time = (float(value) for value in output.split())
+    return load_time, first_time, all_time
+
+
+# ----------------------------------------------------------------------
+def _ParseFile(
+    filename: str,
+) -> None:
+    with DoneManager.Create(sys.stderr, "", line_prefix="") as dm:
+        Parse(
+            dm,
+            {
+                SAMPLE_SCHEMAS_DIR: {
+                    PurePath(filename): lambda: (SAMPLE_SCHEMAS_DIR / filename).read_text(encoding="utf-8"),
+                },
+            },
+            options=ParseOptions(single_threaded=True, quiet=True),
+        )
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+if __name__ == "__main__":
+    app()
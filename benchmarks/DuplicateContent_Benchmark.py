@@ -0,0 +1,97 @@
+# ----------------------------------------------------------------------
+# |
+# |  DuplicateContent_Benchmark.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-16 23:59:57
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2026
+# |  Distributed under the MIT License.
+# |
+# ----------------------------------------------------------------------
+"""Compares the time taken to parse workspaces that contain copies of the same files with the time taken to parse workspaces whose files are all different."""
+
+import sys
+import tempfile
+
+from collections.abc import Callable
+from pathlib import Path
+from typing import Annotated
+
+import typer
+
+from dbrownell_Common.Streams.DoneManager import DoneManager
+
+from BenchmarkHelpers import CreateCorpusWorkspace, Measure, WriteResults
+from SimpleSchemaGenerator.Schema.Parse.ANTLR.Parse import CreateWorkspaces, ExecutorType, Parse
+from SimpleSchemaGenerator.Schema.Parse.ANTLR.ParseOptions import ParseOptions
+
+
+# ----------------------------------------------------------------------
+app = typer.Typer(
+    help=__doc__,
+    pretty_exceptions_show_locals=False,
+    pretty_exceptions_enable=False,
+)
+
+
+# ----------------------------------------------------------------------
+@app.command()
+def Main(
+    scale: int = typer.Option(20, min=1, help="Number of workspaces that contain the sample schemas."),
+    executor: Annotated[
+        ExecutorType, typer.Option(help="Executor used to parse the files.")
+    ] = ExecutorType.Thread,
+    iterations: int = typer.Option(5, min=1, help="Number of iterations; the fastest is reported."),
+) -> None:
+    """Run the benchmark."""
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_directory = Path(temp_dir).resolve()
+
+        # Each subdirectory is a workspace that contains the same files
+        filenames = CreateCorpusWorkspace(temp_directory / "Duplicated", scale)
+
+        # Each subdirectory is a workspace whose files are different from those in other workspaces
+        for filename in CreateCorpusWorkspace(temp_directory / "Unique", scale):
+            with filename.open("a", encoding="utf-8") as f:
+                f.write(f"\n# {filename.parent.name}\n")
+
+        # ----------------------------------------------------------------------
+        def CreateParseFunc(
+            root: Path,
+        ) -> Callable[[], None]:
+            workspaces = CreateWorkspaces(sorted(path for path in root.iterdir() if path.is_dir()))
+
+            # ----------------------------------------------------------------------
+            def Impl() -> None:
+                with DoneManager.Create(sys.stderr, "", line_prefix="") as dm:
+                    Parse(dm, workspaces, options=ParseOptions(quiet=True, executor=executor))
+                    assert dm.result == 0, dm.result
+
+            # ----------------------------------------------------------------------
+
+            return Impl
+
+        # ----------------------------------------------------------------------
+
+        unique_time = Measure(CreateParseFunc(temp_directory / "Unique"), iterations)
+        duplicated_time = Measure(CreateParseFunc(temp_directory / "Duplicated"), iterations)
+
+    WriteResults(
+        f"{len(filenames)} files in {scale} workspaces ({executor})",
+        [
+            ("Unique content", f"{unique_time:.3f}s"),
+            ("Duplicated content", f"{duplicated_time:.3f}s"),
+            ("Speedup", f"{unique_time / duplicated_time:.2f}x"),
+        ],
+    )
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+if __name__ == "__main__":
+    app()
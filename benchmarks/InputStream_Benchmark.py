@@ -0,0 +1,109 @@
+# ----------------------------------------------------------------------
+# |
+# |  InputStream_Benchmark.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-16 13:22:48
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2026
+# |  Distributed under the MIT License.
+# |
+# ----------------------------------------------------------------------
+"""Compares the memory used by (and lexing throughput of) the default ANTLR InputStream and CompactInputStream."""
+
+import gc
+import tracemalloc
+
+from collections.abc import Callable
+
+import antlr4  # type: ignore[import-untyped]
+import typer
+
+from BenchmarkHelpers import CreateLargeContent, Measure, WriteResults
+from SimpleSchemaGenerator.Schema.Parse.ANTLR.CompactInputStream import CompactInputStream
+from SimpleSchemaGenerator.Schema.Parse.ANTLR.Parse import SimpleSchemaLexer
+
+
+# ----------------------------------------------------------------------
+app = typer.Typer(
+    help=__doc__,
+    pretty_exceptions_show_locals=False,
+    pretty_exceptions_enable=False,
+)
+
+
+# ----------------------------------------------------------------------
+@app.command()
+def Main(
+    scale: int = typer.Option(200, min=1, help="Number of times that the sample schemas are repeated."),
+    iterations: int = typer.Option(3, min=1, help="Number of iterations; the fastest is reported."),
+) -> None:
+    """Run the benchmark."""
+
+    content = CreateLargeContent(scale)
+
+    num_lines = len(content.split("\n"))
+
+    rows: list[tuple[str, str]] = [("Content", _FormatSize(len(content.encode("utf-8"))))]
+
+    # Warm the DFA caches so that both streams are measured with the same state
+    _Lex(antlr4.InputStream(content))
+
+    for name, stream_type in [
+        ("InputStream", antlr4.InputStream),
+        ("CompactInputStream", CompactInputStream),
+    ]:
+        memory = _MeasureMemory(lambda stream_type=stream_type: stream_type(content))
+        lex_time = Measure(lambda stream_type=stream_type: _Lex(stream_type(content)), iterations)
+
+        rows += [
+            (f"{name} memory", _FormatSize(memory)),
+            (f"{name} lexing", f"{lex_time:.3f}s ({num_lines / lex_time:,.0f} lines/s)"),
+        ]
+
+    WriteResults(f"{num_lines} lines", rows)
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+def _MeasureMemory(
+    create_func: Callable[[], antlr4.InputStream],
+) -> int:
+    gc.collect()
+
+    tracemalloc.start()
+    try:
+        stream = create_func()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    del stream
+    return size
+
+
+# ----------------------------------------------------------------------
+def _Lex(
+    stream: antlr4.InputStream,
+) -> None:
+    lexer = SimpleSchemaLexer(stream)
+    lexer.CustomInitialization()
+
+    antlr4.CommonTokenStream(lexer).fill()
+
+
+# ----------------------------------------------------------------------
+def _FormatSize(
+    num_bytes: int,
+) -> str:
+    return f"{num_bytes / (1024 * 1024):.2f} MiB"
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+if __name__ == "__main__":
+    app()
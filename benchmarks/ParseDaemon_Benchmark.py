@@ -0,0 +1,101 @@
+# ----------------------------------------------------------------------
+# |
+# |  ParseDaemon_Benchmark.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-16 23:59:31
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2026
+# |  Distributed under the MIT License.
+# |
+# ----------------------------------------------------------------------
+"""Compares the latency of a Validate command that parses a workspace itself with one that sends the request to a running daemon."""
+
+import subprocess
+import sys
+import tempfile
+import time
+
+from pathlib import Path
+
+import typer
+
+from BenchmarkHelpers import CreateCorpusWorkspace, Measure, WriteResults
+from SimpleSchemaGenerator.ParseDaemonClient import IsRunning, SendRequest
+
+
+# ----------------------------------------------------------------------
+app = typer.Typer(
+    help=__doc__,
+    pretty_exceptions_show_locals=False,
+    pretty_exceptions_enable=False,
+)
+
+
+# ----------------------------------------------------------------------
+@app.command()
+def Main(
+    scale: int = typer.Option(1, min=1, help="Number of times that the sample schemas are repeated."),
+    iterations: int = typer.Option(5, min=1, help="Number of iterations; the fastest is reported."),
+) -> None:
+    """Run the benchmark."""
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        workspace = Path(temp_dir).resolve() / "workspace"
+        socket_path = Path(temp_dir) / "daemon.sock"
+
+        filenames = CreateCorpusWorkspace(workspace, scale)
+
+        command_line = [sys.executable, "-m", "SimpleSchemaGenerator.EntryPoint"]
+
+        # ----------------------------------------------------------------------
+        def ValidateInProcess() -> None:
+            subprocess.run(  # noqa: S603
+                [*command_line, "Validate", str(workspace), "--no-daemon"],
+                check=True,
+                stdout=subprocess.DEVNULL,
+            )
+
+        # ----------------------------------------------------------------------
+        def ValidateWithDaemon() -> None:
+            # Measure the command that a user would run, including the time to start the process
+            subprocess.run(  # noqa: S603
+                [*command_line, "Validate", str(workspace), "--socket", str(socket_path)],
+                check=True,
+                stdout=subprocess.DEVNULL,
+            )
+
+        # ----------------------------------------------------------------------
+
+        with subprocess.Popen([*command_line, "Daemon", "--socket", str(socket_path)]) as daemon:  # noqa: S603
+            try:
+                while not IsRunning(socket_path):
+                    time.sleep(0.1)
+
+                # The first request populates the daemon
+                ValidateWithDaemon()
+
+                process_time = Measure(ValidateInProcess, iterations)
+                daemon_time = Measure(ValidateWithDaemon, iterations)
+
+            finally:
+                SendRequest(socket_path, "Shutdown")
+                daemon.wait()
+
+    WriteResults(
+        f"{len(filenames)} files",
+        [
+            ("New process", f"{process_time * 1000:,.1f}ms"),
+            ("Daemon", f"{daemon_time * 1000:,.1f}ms"),
+            ("Speedup", f"{process_time / daemon_time:.2f}x"),
+        ],
+    )
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,103 @@
+# ----------------------------------------------------------------------
+# |
+# |  ParseSession_Benchmark.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-16 23:58:14
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2026
+# |  Distributed under the MIT License.
+# |
+# ----------------------------------------------------------------------
+"""Compares repeated calls to Parse with repeated calls to ParseSession.Parse, which keeps its worker processes, workspace index, and results warm."""
+
+import sys
+import tempfile
+
+from pathlib import Path, PurePath
+from typing import Annotated
+
+import typer
+
+from dbrownell_Common.Streams.DoneManager import DoneManager
+
+from BenchmarkHelpers import CreateCorpusWorkspace, Measure, WriteResults
+from SimpleSchemaGenerator.Schema.Parse.ANTLR.Parse import ExecutorType, Parse, ParseSession
+from SimpleSchemaGenerator.Schema.Parse.ANTLR.ParseOptions import ParseOptions
+
+
+# ----------------------------------------------------------------------
+app = typer.Typer(
+    help=__doc__,
+    pretty_exceptions_show_locals=False,
+    pretty_exceptions_enable=False,
+)
+
+
+# ----------------------------------------------------------------------
+@app.command()
+def Main(
+    scale: int = typer.Option(20, min=1, help="Number of times that the sample schemas are repeated."),
+    executor: Annotated[
+        ExecutorType, typer.Option(help="Executor used to parse the files.")
+    ] = ExecutorType.Process,
+    iterations: int = typer.Option(5, min=1, help="Number of iterations; the fastest is reported."),
+) -> None:
+    """Run the benchmark."""
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        workspace = Path(temp_dir).resolve()
+
+        filenames = CreateCorpusWorkspace(workspace, scale)
+
+        workspaces = {
+            workspace: {
+                PurePath(filename.relative_to(workspace)): lambda filename=filename: filename.read_text(
+                    encoding="utf-8"
+                )
+                for filename in filenames
+            },
+        }
+
+        options = ParseOptions(quiet=True, executor=executor)
+
+        # ----------------------------------------------------------------------
+        def ParseWorkspace() -> None:
+            with DoneManager.Create(sys.stderr, "", line_prefix="") as dm:
+                Parse(dm, workspaces, options=options)
+                assert dm.result == 0, dm.result
+
+        # ----------------------------------------------------------------------
+
+        with ParseSession(options=options) as session:
+            # ----------------------------------------------------------------------
+            def ParseWithSession() -> None:
+                with DoneManager.Create(sys.stderr, "", line_prefix="") as dm:
+                    session.Parse(dm, workspaces)
+                    assert dm.result == 0, dm.result
+
+            # ----------------------------------------------------------------------
+
+            # The first call starts the worker processes and populates the session
+            ParseWithSession()
+
+            parse_time = Measure(ParseWorkspace, iterations)
+            session_time = Measure(ParseWithSession, iterations)
+
+    WriteResults(
+        f"{len(filenames)} files ({executor})",
+        [
+            ("Parse", f"{parse_time:.3f}s"),
+            ("ParseSession.Parse", f"{session_time:.3f}s"),
+            ("Speedup", f"{parse_time / session_time:.2f}x"),
+        ],
+    )
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+if __name__ == "__main__":
+    app()
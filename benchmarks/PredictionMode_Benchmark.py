@@ -0,0 +1,100 @@
+# ----------------------------------------------------------------------
+# |
+# |  PredictionMode_Benchmark.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-16 10:02:17
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2026
+# |  Distributed under the MIT License.
+# |
+# ----------------------------------------------------------------------
+"""Compares the throughput of the two-stage (SLL then LL) parse with a parse that only uses LL prediction."""
+
+from pathlib import Path
+
+import antlr4  # type: ignore[import-untyped]
+import typer
+
+from antlr4.atn.PredictionMode import PredictionMode
+
+from BenchmarkHelpers import LoadCorpus, Measure, SAMPLE_SCHEMAS_DIR, WriteResults
+from SimpleSchemaGenerator.Schema.Parse.ANTLR import Parse as ParseModule
+from SimpleSchemaGenerator.Schema.Parse.ANTLR.WorkspaceIndex import WorkspaceIndex
+
+
+# ----------------------------------------------------------------------
+app = typer.Typer(
+    help=__doc__,
+    pretty_exceptions_show_locals=False,
+    pretty_exceptions_enable=False,
+)
+
+
+# ----------------------------------------------------------------------
+@app.command()
+def Main(
+    scale: int = typer.Option(50, min=1, help="Number of times that the sample schemas are repeated."),
+    iterations: int = typer.Option(5, min=1, help="Number of iterations; the fastest is reported."),
+) -> None:
+    """Run the benchmark."""
+
+    corpus = LoadCorpus(scale)
+    num_lines = sum(len(content.split("\n")) for _, content in corpus)
+
+    # Both measurements include lexing, as the two-stage parse lexes the content as it is parsed
+    # ----------------------------------------------------------------------
+    def ParseLL() -> None:
+        for _, content in corpus:
+            parser = ParseModule._CreateParser(content, antlr4.CommonTokenStream)  # noqa: SLF001
+            parser._interp.predictionMode = PredictionMode.LL  # noqa: SLF001
+            parser.entry_point__()
+
+    # ----------------------------------------------------------------------
+    def ParseTwoStage() -> None:
+        for name, content in corpus:
+            filename = Path(name)
+
+            ParseModule._ParseTwoStage(  # noqa: SLF001
+                content,
+                filename,
+                lambda content=content, filename=filename: ParseModule._SimpleSchemaVisitor(  # noqa: SLF001
+                    content,
+                    filename,
+                    lambda _: None,
+                    ParseModule._CreateIncludeStatementFuncFactory(  # noqa: SLF001
+                        WorkspaceIndex([SAMPLE_SCHEMAS_DIR], ParseModule.DEFAULT_FILE_EXTENSIONS),
+                        [SAMPLE_SCHEMAS_DIR],
+                        lambda *args: None,  # noqa: ARG005
+                    ),
+                    is_included_file=False,
+                    tab_width=4,
+                ),
+            )
+
+    # ----------------------------------------------------------------------
+
+    # Warm the DFA caches so that both modes are measured with the same state
+    ParseLL()
+    ParseTwoStage()
+
+    ll_time = Measure(ParseLL, iterations)
+    two_stage_time = Measure(ParseTwoStage, iterations)
+
+    WriteResults(
+        f"{len(corpus)} files, {num_lines} lines",
+        [
+            ("LL", f"{ll_time:.3f}s ({num_lines / ll_time:,.0f} lines/s)"),
+            ("SLL then LL", f"{two_stage_time:.3f}s ({num_lines / two_stage_time:,.0f} lines/s)"),
+            ("Speedup", f"{ll_time / two_stage_time:.2f}x"),
+        ],
+    )
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+if __name__ == "__main__":
+    app()
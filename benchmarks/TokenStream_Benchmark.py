@@ -0,0 +1,117 @@
+# ----------------------------------------------------------------------
+# |
+# |  TokenStream_Benchmark.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-16 13:51:07
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2026
+# |  Distributed under the MIT License.
+# |
+# ----------------------------------------------------------------------
+"""Compares the peak memory used when parsing with a filled CommonTokenStream and with a StreamingTokenStream."""
+
+import gc
+import tracemalloc
+
+from collections.abc import Callable
+
+import antlr4  # type: ignore[import-untyped]
+import typer
+
+from antlr4.atn.PredictionMode import PredictionMode
+
+from BenchmarkHelpers import CreateLargeContent, Measure, WriteResults
+from SimpleSchemaGenerator.Schema.Parse.ANTLR import Parse as ParseModule
+from SimpleSchemaGenerator.Schema.Parse.ANTLR.StreamingTokenStream import StreamingTokenStream
+
+
+# ----------------------------------------------------------------------
+app = typer.Typer(
+    help=__doc__,
+    pretty_exceptions_show_locals=False,
+    pretty_exceptions_enable=False,
+)
+
+
+# ----------------------------------------------------------------------
+@app.command()
+def Main(
+    scale: int = typer.Option(50, min=1, help="Number of times that the sample schemas are repeated."),
+    iterations: int = typer.Option(3, min=1, help="Number of iterations; the fastest is reported."),
+) -> None:
+    """Run the benchmark."""
+
+    content = CreateLargeContent(scale)
+
+    num_lines = len(content.split("\n"))
+
+    # ----------------------------------------------------------------------
+    def ParseFilled() -> object:
+        parser = ParseModule._CreateParser(content, antlr4.CommonTokenStream)  # noqa: SLF001
+        parser.getTokenStream().fill()
+
+        return _Parse(parser)
+
+    # ----------------------------------------------------------------------
+    def ParseStreaming() -> object:
+        return _Parse(ParseModule._CreateParser(content, StreamingTokenStream))  # noqa: SLF001
+
+    # ----------------------------------------------------------------------
+
+    # Warm the DFA caches so that both streams are measured with the same state
+    ParseFilled()
+
+    rows: list[tuple[str, str]] = []
+
+    for name, func in [
+        ("CommonTokenStream (filled)", ParseFilled),
+        ("StreamingTokenStream", ParseStreaming),
+    ]:
+        peak_memory = _MeasurePeakMemory(func)
+        parse_time = Measure(func, iterations)
+
+        rows += [
+            (f"{name} peak memory", f"{peak_memory / (1024 * 1024):.2f} MiB"),
+            (f"{name} time", f"{parse_time:.3f}s ({num_lines / parse_time:,.0f} lines/s)"),
+        ]
+
+    WriteResults(f"{num_lines} lines", rows)
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+def _Parse(
+    parser: ParseModule.SimpleSchemaParser,
+) -> object:
+    parser._interp.predictionMode = PredictionMode.SLL  # noqa: SLF001
+    parser._errHandler = antlr4.BailErrorStrategy()  # noqa: SLF001
+
+    return parser.entry_point__()
+
+
+# ----------------------------------------------------------------------
+def _MeasurePeakMemory(
+    func: Callable[[], object],
+) -> int:
+    gc.collect()
+
+    tracemalloc.start()
+    try:
+        result = func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    del result
+    return peak
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+if __name__ == "__main__":
+    app()
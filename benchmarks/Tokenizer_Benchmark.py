@@ -0,0 +1,94 @@
+# ----------------------------------------------------------------------
+# |
+# |  Tokenizer_Benchmark.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-16 22:41:09
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2026
+# |  Distributed under the MIT License.
+# |
+# ----------------------------------------------------------------------
+"""Compares the throughput of the ANTLR lexer with the regex tokenizer, both in isolation and when parsing."""
+
+import antlr4  # type: ignore[import-untyped]
+import typer
+
+from antlr4.atn.PredictionMode import PredictionMode
+
+from BenchmarkHelpers import LoadCorpus, Measure, WriteResults
+from SimpleSchemaGenerator.Schema.Parse.ANTLR import Parse as ParseModule
+from SimpleSchemaGenerator.Schema.Parse.ANTLR.Parse import TokenizerType
+from SimpleSchemaGenerator.Schema.Parse.ANTLR.StreamingTokenStream import StreamingTokenStream
+
+
+# ----------------------------------------------------------------------
+app = typer.Typer(
+    help=__doc__,
+    pretty_exceptions_show_locals=False,
+    pretty_exceptions_enable=False,
+)
+
+
+# ----------------------------------------------------------------------
+@app.command()
+def Main(
+    scale: int = typer.Option(50, min=1, help="Number of times that the sample schemas are repeated."),
+    iterations: int = typer.Option(5, min=1, help="Number of iterations; the fastest is reported."),
+) -> None:
+    """Run the benchmark."""
+
+    corpus = LoadCorpus(scale)
+    num_lines = sum(len(content.split("\n")) for _, content in corpus)
+
+    # ----------------------------------------------------------------------
+    def Tokenize(
+        tokenizer: TokenizerType,
+    ) -> None:
+        for _, content in corpus:
+            parser = ParseModule._CreateParser(content, StreamingTokenStream, tokenizer=tokenizer)  # noqa: SLF001
+            parser.getTokenStream().fill()
+
+    # ----------------------------------------------------------------------
+    def Parse(
+        tokenizer: TokenizerType,
+    ) -> None:
+        for _, content in corpus:
+            parser = ParseModule._CreateParser(content, StreamingTokenStream, tokenizer=tokenizer)  # noqa: SLF001
+
+            parser._interp.predictionMode = PredictionMode.SLL  # noqa: SLF001
+            parser._errHandler = antlr4.BailErrorStrategy()  # noqa: SLF001
+
+            parser.entry_point__()
+
+    # ----------------------------------------------------------------------
+
+    # Warm the DFA caches so that both tokenizers are measured with the same state
+    Parse(TokenizerType.Antlr)
+    Parse(TokenizerType.Regex)
+
+    rows: list[tuple[str, str]] = []
+
+    for title, func in [
+        ("Tokenize", Tokenize),
+        ("Parse (SLL)", Parse),
+    ]:
+        antlr_time = Measure(lambda func=func: func(TokenizerType.Antlr), iterations)
+        regex_time = Measure(lambda func=func: func(TokenizerType.Regex), iterations)
+
+        rows += [
+            (f"{title}: ANTLR", f"{antlr_time:.3f}s ({num_lines / antlr_time:,.0f} lines/s)"),
+            (f"{title}: Regex", f"{regex_time:.3f}s ({num_lines / regex_time:,.0f} lines/s)"),
+            (f"{title}: Speedup", f"{antlr_time / regex_time:.2f}x"),
+        ]
+
+    WriteResults(f"{len(corpus)} files, {num_lines} lines", rows)
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+if __name__ == "__main__":
+    app()
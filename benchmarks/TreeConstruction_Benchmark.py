@@ -0,0 +1,130 @@
+# ----------------------------------------------------------------------
+# |
+# |  TreeConstruction_Benchmark.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-16 14:32:19
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2026
+# |  Distributed under the MIT License.
+# |
+# ----------------------------------------------------------------------
+"""Compares creating elements by visiting a complete parse tree with creating elements while parsing."""
+
+import gc
+import tracemalloc
+
+from collections.abc import Callable
+from pathlib import Path
+
+import antlr4  # type: ignore[import-untyped]
+import typer
+
+from antlr4.atn.PredictionMode import PredictionMode
+
+from BenchmarkHelpers import CreateLargeContent, Measure, WriteResults
+from SimpleSchemaGenerator.Schema.Parse.ANTLR import Parse as ParseModule
+from SimpleSchemaGenerator.Schema.Parse.ANTLR.StreamingTokenStream import StreamingTokenStream
+
+
+# ----------------------------------------------------------------------
+app = typer.Typer(
+    help=__doc__,
+    pretty_exceptions_show_locals=False,
+    pretty_exceptions_enable=False,
+)
+
+
+# ----------------------------------------------------------------------
+@app.command()
+def Main(
+    scale: int = typer.Option(50, min=1, help="Number of times that the sample schemas are repeated."),
+    iterations: int = typer.Option(3, min=1, help="Number of iterations; the fastest is reported."),
+) -> None:
+    """Run the benchmark."""
+
+    content = CreateLargeContent(scale)
+    filename = Path("Benchmark.SimpleSchema")
+
+    num_lines = len(content.split("\n"))
+
+    # ----------------------------------------------------------------------
+    def CreateVisitor() -> ParseModule._SimpleSchemaVisitor:
+        return ParseModule._SimpleSchemaVisitor(  # noqa: SLF001
+            content,
+            filename,
+            lambda _: None,
+            _CreateIncludeStatement,
+            is_included_file=False,
+            tab_width=4,
+        )
+
+    # ----------------------------------------------------------------------
+    def VisitTree() -> object:
+        parser = ParseModule._CreateParser(content, StreamingTokenStream)  # noqa: SLF001
+
+        parser._interp.predictionMode = PredictionMode.SLL  # noqa: SLF001
+        parser._errHandler = antlr4.BailErrorStrategy()  # noqa: SLF001
+
+        visitor = CreateVisitor()
+        parser.entry_point__().accept(visitor)
+
+        return visitor.root
+
+    # ----------------------------------------------------------------------
+    def CreateWhileParsing() -> object:
+        return ParseModule._ParseTwoStage(content, filename, CreateVisitor).root  # noqa: SLF001
+
+    # ----------------------------------------------------------------------
+
+    # Warm the DFA caches so that both approaches are measured with the same state
+    VisitTree()
+
+    rows: list[tuple[str, str]] = []
+
+    for name, func in [
+        ("Visit parse tree", VisitTree),
+        ("Create while parsing", CreateWhileParsing),
+    ]:
+        peak_memory = _MeasurePeakMemory(func)
+        parse_time = Measure(func, iterations)
+
+        rows += [
+            (f"{name} peak memory", f"{peak_memory / (1024 * 1024):.2f} MiB"),
+            (f"{name} time", f"{parse_time:.3f}s ({num_lines / parse_time:,.0f} lines/s)"),
+        ]
+
+    WriteResults(f"{num_lines} lines", rows)
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+def _CreateIncludeStatement(*args, **kwargs) -> object:  # noqa: ARG001
+    raise AssertionError("The benchmark content does not include other files.")  # noqa: EM101, TRY003
+
+
+# ----------------------------------------------------------------------
+def _MeasurePeakMemory(
+    func: Callable[[], object],
+) -> int:
+    gc.collect()
+
+    tracemalloc.start()
+    try:
+        result = func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    del result
+    return peak
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,90 @@
+# ----------------------------------------------------------------------
+# |
+# |  Watch_Benchmark.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-16 23:59:53
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2026
+# |  Distributed under the MIT License.
+# |
+# ----------------------------------------------------------------------
+"""Compares the time taken to rebuild a workspace after a single file changes with the time taken to build it from scratch."""
+
+import io
+import tempfile
+
+from pathlib import Path
+
+import typer
+
+from BenchmarkHelpers import CreateCorpusWorkspace, Measure, WriteResults
+from SimpleSchemaGenerator.Watcher import WorkspaceWatcher
+
+
+# ----------------------------------------------------------------------
+app = typer.Typer(
+    help=__doc__,
+    pretty_exceptions_show_locals=False,
+    pretty_exceptions_enable=False,
+)
+
+
+# ----------------------------------------------------------------------
+@app.command()
+def Main(
+    scale: int = typer.Option(20, min=1, help="Number of times that the sample schemas are repeated."),
+    iterations: int = typer.Option(5, min=1, help="Number of iterations; the fastest is reported."),
+) -> None:
+    """Run the benchmark."""
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        workspace = Path(temp_dir).resolve()
+
+        filenames = CreateCorpusWorkspace(workspace, scale)
+        changed_filename = filenames[0]
+        original_content = changed_filename.read_text(encoding="utf-8")
+
+        # ----------------------------------------------------------------------
+        def FullBuild() -> None:
+            with WorkspaceWatcher([workspace], io.StringIO(), polling=True) as watcher:
+                assert watcher.Build() == 0
+
+        # ----------------------------------------------------------------------
+
+        with WorkspaceWatcher([workspace], io.StringIO(), polling=True) as watcher:
+            assert watcher.Build() == 0
+
+            iteration = 0
+
+            # ----------------------------------------------------------------------
+            def Rebuild() -> None:
+                nonlocal iteration
+
+                iteration += 1
+                changed_filename.write_text(f"{original_content}\n# {iteration}\n", encoding="utf-8")
+
+                assert watcher.Build({changed_filename}) == 0
+
+            # ----------------------------------------------------------------------
+
+            full_build_time = Measure(FullBuild, iterations)
+            rebuild_time = Measure(Rebuild, iterations)
+
+    WriteResults(
+        f"{len(filenames)} files, 1 changed",
+        [
+            ("Full build", f"{full_build_time * 1000:,.1f}ms"),
+            ("Rebuild", f"{rebuild_time * 1000:,.1f}ms"),
+            ("Speedup", f"{full_build_time / rebuild_time:.2f}x"),
+        ],
+    )
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+if __name__ == "__main__":
+    app()
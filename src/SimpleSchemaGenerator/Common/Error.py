@@ -19,9 +19,10 @@ import traceback
 
 from dataclasses import dataclass, field, InitVar, make_dataclass
 from enum import Enum
-from functools import singledispatch, singledispatchmethod
+from functools import cache, singledispatch, singledispatchmethod
 from io import StringIO
 from pathlib import Path
+from typing import Any
 
 from .Location import Location
 from .Region import Region
@@ -110,6 +111,22 @@ class Error:
 
         return instance
 
+    # ----------------------------------------------------------------------
+    def __reduce__(self) -> tuple[Any, tuple[Any, ...]]:
+        create_args = getattr(self.__class__, "_create_args", None)
+
+        if create_args is None:
+            return self.__class__, (self.message, self.regions)
+
+        # Types created by `CreateErrorType` are defined dynamically and cannot be pickled by
+        # name; they are restored by calling `CreateErrorType` with the same arguments (which
+        # returns the same type) and then populating the fields.
+        return _RestoreError, (
+            create_args,
+            {name: getattr(self, name) for name, _ in create_args[1]},
+            self.regions,
+        )
+
     # ----------------------------------------------------------------------
     def __str__(self) -> str:
         if len(self.regions) == 1 and "\n" not in self.message:
@@ -151,6 +168,12 @@ class SimpleSchemaGeneratorError(Exception):
             ],
         )
 
+    # ----------------------------------------------------------------------
+    def __reduce__(
+        self,
+    ) -> tuple[type["SimpleSchemaGeneratorError"], tuple[Error], dict[str, list[Error]]]:
+        return self.__class__, (self.errors[0],), {"errors": self.errors}
+
     # ----------------------------------------------------------------------
     def __str__(self) -> str:
         return str(self.errors[0])
@@ -161,10 +184,14 @@ class SimpleSchemaGeneratorError(Exception):
 # |  Public Functions
 # |
 # ----------------------------------------------------------------------
+@cache
 def CreateErrorType(
     message_template: str,
     **args: type,
 ) -> type[Error]:
+    # Types are cached so that calls with the same arguments return the same type; this allows
+    # errors to be unpickled as instances of the type that they were pickled from.
+
     dynamic_fields_class = make_dataclass(
         "DynamicFields",
         args.items(),
@@ -194,11 +221,24 @@ def CreateErrorType(
 
     # ----------------------------------------------------------------------
 
+    NewError._create_args = (message_template, tuple(args.items()))  # type: ignore[attr-defined]  # noqa: SLF001
+
     return NewError
 
 
 # ----------------------------------------------------------------------
 # ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+def _RestoreError(
+    create_args: tuple[str, tuple[tuple[str, type], ...]],
+    field_values: dict[str, Any],
+    regions: list[Region],
+) -> Error:
+    message_template, args = create_args
+
+    return CreateErrorType(message_template, **dict(args))(regions, **field_values)
+
+
 # ----------------------------------------------------------------------
 @singledispatch
 def _ArgToString(value: object) -> str:
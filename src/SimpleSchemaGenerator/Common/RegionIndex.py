@@ -0,0 +1,123 @@
+# ----------------------------------------------------------------------
+# |
+# |  RegionIndex.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-16 23:59:48
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2026
+# |  Distributed under the MIT License.
+# |
+# ----------------------------------------------------------------------
+"""Contains the RegionIndex object"""
+
+import bisect
+
+from collections.abc import Iterable
+from typing import Generic, TypeVar
+
+from .Location import Location
+from .Region import Region
+
+
+# ----------------------------------------------------------------------
+RegionIndexValueType = TypeVar("RegionIndexValueType")  # pylint: disable=invalid-name
+
+
+# ----------------------------------------------------------------------
+class RegionIndex(Generic[RegionIndexValueType]):
+    """Interval index that finds the values whose regions contain a location within a single file.
+
+    Regions are half-open (they contain the locations from their beginning up to, but not including,
+    their end) and are expected to be nested, as the regions of elements are. Each region stores the
+    innermost region that contains it, so a lookup is a binary search followed by a walk through the
+    enclosing regions rather than a walk through all of the values.
+    """
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        items: Iterable[tuple[Region, RegionIndexValueType]],
+    ) -> None:
+        # Regions that begin at the same location are sorted from largest to smallest; regions that are
+        # the same retain their original order, so values added later are considered to be nested within
+        # values added earlier.
+        sorted_items = sorted(
+            enumerate(items),
+            key=lambda value: (value[1][0].begin, _Negate(value[1][0].end), value[0]),
+        )
+
+        self._regions: list[Region] = [region for _, (region, _) in sorted_items]
+        self._values: list[RegionIndexValueType] = [value for _, (_, value) in sorted_items]
+        self._begins: list[Location] = [region.begin for region in self._regions]
+
+        # Index of the innermost region that contains each region (or -1)
+        self._parents: list[int] = []
+
+        stack: list[int] = []
+
+        for index, region in enumerate(self._regions):
+            while stack and not self._Contains(stack[-1], region.begin):
+                stack.pop()
+
+            self._parents.append(stack[-1] if stack else -1)
+            stack.append(index)
+
+    # ----------------------------------------------------------------------
+    def __len__(self) -> int:
+        return len(self._values)
+
+    # ----------------------------------------------------------------------
+    def Find(
+        self,
+        location: Location,
+    ) -> list[RegionIndexValueType]:
+        """Return the values whose regions contain the location, from innermost to outermost."""
+
+        results: list[RegionIndexValueType] = []
+
+        index = bisect.bisect_right(self._begins, location) - 1
+
+        while index != -1:
+            if self._Contains(index, location):
+                results.append(self._values[index])
+
+            index = self._parents[index]
+
+        return results
+
+    # ----------------------------------------------------------------------
+    def FindInnermost(
+        self,
+        location: Location,
+    ) -> RegionIndexValueType | None:
+        """Return the value with the smallest region that contains the location."""
+
+        results = self.Find(location)
+        return results[0] if results else None
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Private Methods
+    # |
+    # ----------------------------------------------------------------------
+    def _Contains(
+        self,
+        index: int,
+        location: Location,
+    ) -> bool:
+        region = self._regions[index]
+        return region.begin <= location < region.end or region.begin == region.end == location
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Private Functions
+# |
+# ----------------------------------------------------------------------
+def _Negate(
+    location: Location,
+) -> tuple[int, int]:
+    return -location.line, -location.column
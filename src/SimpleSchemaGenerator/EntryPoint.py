@@ -6,13 +6,30 @@
 # ----------------------------------------------------------------------
 """Example of how to create scripts that can be invoked from the command line once the package is installed."""
 
+import io
+import json
 import sys
 
+from collections.abc import Iterator
+from contextlib import contextmanager, suppress
+from pathlib import Path
+from typing import Annotated, Any
+
 import typer
 
+from dbrownell_Common.Streams.DoneManager import DoneManager
 from typer.core import TyperGroup  # type: ignore [import-untyped]
 
+# Note that modules that import the parser are imported within the commands that use them, so that
+# commands that send requests to a running daemon don't pay to import the parser.
 from SimpleSchemaGenerator import __version__
+from SimpleSchemaGenerator.ParseDaemonClient import (
+    FormatError,
+    GetDefaultSocketPath,
+    ParseDaemonError,
+    SendRequest,
+)
+from SimpleSchemaGenerator.Schema.Parse.ANTLR.ExecutorType import ExecutorType
 
 
 # ----------------------------------------------------------------------
@@ -34,12 +51,324 @@ app = typer.Typer(
 
 
 # ----------------------------------------------------------------------
-@app.command("EntryPoint")
-def EntryPoint(
-    x: int,
-    y: int,
+_dfa_snapshot_option = typer.Option(
+    "--dfa-snapshot",
+    dir_okay=False,
+    resolve_path=True,
+    help="File that retains the ANTLR prediction state between invocations; it is loaded at startup (and by worker processes) and saved once the files have been parsed.",
+)
+
+
+# ----------------------------------------------------------------------
+@app.command("Parse", no_args_is_help=True)
+def ParseCommand(
+    workspaces: Annotated[
+        list[Path],
+        typer.Argument(
+            exists=True,
+            file_okay=False,
+            resolve_path=True,
+            help="Workspace roots that contain the files to parse.",
+        ),
+    ],
+    *,
+    jobs: Annotated[
+        int | None,
+        typer.Option(
+            "--jobs",
+            min=1,
+            help="Number of threads (or worker processes) used to parse files; defaults to the number of CPUs.",
+        ),
+    ] = None,
+    executor: Annotated[
+        ExecutorType,
+        typer.Option("--executor", case_sensitive=False, help="Executor used to parse files."),
+    ] = ExecutorType.Thread,
+    cache_dir: Annotated[
+        Path | None,
+        typer.Option(
+            "--cache-dir",
+            file_okay=False,
+            resolve_path=True,
+            help="Directory used to cache parse results between invocations.",
+        ),
+    ] = None,
+    fail_fast: Annotated[
+        bool,
+        typer.Option("--fail-fast", help="Stop parsing once a file fails to parse."),
+    ] = False,
+    stats_json: Annotated[
+        Path | None,
+        typer.Option(
+            "--stats-json",
+            dir_okay=False,
+            resolve_path=True,
+            help="Write the time spent parsing each file (along with totals) to this JSON file.",
+        ),
+    ] = None,
+    dfa_snapshot: Annotated[Path | None, _dfa_snapshot_option] = None,
 ) -> None:
-    pass  # TODO: Remove this
+    """Parse the files within the workspaces in this process and report the errors."""
+
+    from SimpleSchemaGenerator.ParseDaemon import CreateErrorObjects
+    from SimpleSchemaGenerator.Schema.Parse.ANTLR.Parse import CreateWorkspaces, Parse
+    from SimpleSchemaGenerator.Schema.Parse.ANTLR.ParseCache import ParseCache
+    from SimpleSchemaGenerator.Schema.Parse.ANTLR.ParseOptions import ParseOptions
+    from SimpleSchemaGenerator.Schema.Parse.ANTLR.ParseStats import ParseStats
+
+    stats = ParseStats() if stats_json is not None else None
+
+    with (
+        _YieldDfaSnapshot(dfa_snapshot),
+        DoneManager.Create(io.StringIO(), "", line_prefix="") as dm,
+    ):
+        results = Parse(
+            dm,
+            CreateWorkspaces(workspaces),
+            options=ParseOptions(
+                quiet=True,
+                num_jobs=jobs,
+                executor=executor,
+                cache=None if cache_dir is None else ParseCache(cache_dir),
+                fail_fast=fail_fast,
+                stats=stats,
+                dfa_snapshot=dfa_snapshot,
+            ),
+            raise_if_single_exception=False,
+        )
+
+    num_files = sum(len(workspace_results) for workspace_results in results.values())
+
+    errors = [
+        error
+        for workspace_results in results.values()
+        for _, result in sorted(workspace_results.items())
+        if isinstance(result, Exception)
+        for error in CreateErrorObjects(result)
+    ]
+
+    for error in errors:
+        sys.stdout.write(f"{FormatError(error)}\n")
+
+    sys.stdout.write(f"{num_files} files, {len(errors)} errors\n")
+
+    if stats is not None:
+        assert stats_json is not None
+
+        stats_json.parent.mkdir(parents=True, exist_ok=True)
+
+        with stats_json.open("w", encoding="utf-8") as f:
+            json.dump(
+                {"num_files": num_files, "num_errors": len(errors), **stats.CreateJsonObject()},
+                f,
+                indent=2,
+            )
+
+    if errors:
+        raise typer.Exit(1)
+
+
+# ----------------------------------------------------------------------
+_socket_option = typer.Option(
+    "--socket",
+    dir_okay=False,
+    resolve_path=True,
+    help="Unix domain socket used to communicate with the daemon; defaults to a socket specific to the current version in $XDG_RUNTIME_DIR (or in a directory within the temporary directory that is private to the current user).",
+)
+
+
+# ----------------------------------------------------------------------
+@app.command("Daemon", no_args_is_help=False)
+def Daemon(
+    *,
+    socket_path: Annotated[Path | None, _socket_option] = None,
+    stdio: Annotated[
+        bool,
+        typer.Option(
+            "--stdio",
+            help="Read requests from stdin and write responses to stdout rather than listening on a socket.",
+        ),
+    ] = False,
+    executor: Annotated[
+        ExecutorType,
+        typer.Option("--executor", case_sensitive=False, help="Executor used to parse files."),
+    ] = ExecutorType.Thread,
+    single_threaded: Annotated[
+        bool,
+        typer.Option("--single-threaded", help="Parse files with a single thread."),
+    ] = False,
+    dfa_snapshot: Annotated[Path | None, _dfa_snapshot_option] = None,
+    max_sessions: Annotated[
+        int,
+        typer.Option(
+            "--max-sessions",
+            min=1,
+            help="Maximum number of workspace sets whose parsed results are kept warm; the least recently used set is released when this limit is reached.",
+        ),
+    ] = 8,
+) -> None:
+    """Run a daemon that serves parse and validate requests, keeping parsed results warm between requests."""
+
+    from SimpleSchemaGenerator.ParseDaemon import ParseDaemon
+
+    with (
+        _YieldDfaSnapshot(dfa_snapshot),
+        ParseDaemon(
+            executor=executor,
+            single_threaded=single_threaded,
+            dfa_snapshot=dfa_snapshot,
+            max_sessions=max_sessions,
+        ) as daemon,
+    ):
+        if stdio:
+            daemon.ServeStream(sys.stdin, sys.stdout)
+        else:
+            daemon.ServeSocket(socket_path or GetDefaultSocketPath())
+
+
+# ----------------------------------------------------------------------
+@app.command("Validate", no_args_is_help=True)
+def Validate(
+    workspaces: Annotated[
+        list[Path],
+        typer.Argument(
+            exists=True,
+            file_okay=False,
+            resolve_path=True,
+            help="Workspace roots that contain the files to validate.",
+        ),
+    ],
+    *,
+    socket_path: Annotated[Path | None, _socket_option] = None,
+    no_daemon: Annotated[
+        bool,
+        typer.Option("--no-daemon", help="Parse the files in this process, even when a daemon is running."),
+    ] = False,
+    dfa_snapshot: Annotated[Path | None, _dfa_snapshot_option] = None,
+) -> None:
+    """Validate the files within the workspaces; the request is sent to the daemon when it is running."""
+
+    result: dict[str, Any] | None = None
+
+    if not no_daemon:
+        # OSError is raised when the daemon isn't running and ParseDaemonError is raised when the daemon
+        # can't process the request (for example, a daemon started by a different version or user); the
+        # files are parsed in this process in both cases.
+        with suppress(OSError, ParseDaemonError):
+            result = SendRequest(
+                socket_path or GetDefaultSocketPath(),
+                "Validate",
+                {"workspaces": [str(workspace) for workspace in workspaces]},
+            )
+
+    if result is None:
+        from SimpleSchemaGenerator.ParseDaemon import ParseDaemon
+
+        with _YieldDfaSnapshot(dfa_snapshot), ParseDaemon(dfa_snapshot=dfa_snapshot) as daemon:
+            result = daemon.Validate(workspaces)
+
+    for error in result["errors"]:
+        sys.stdout.write(f"{FormatError(error)}\n")
+
+    sys.stdout.write(f"{result['num_files']} files, {len(result['errors'])} errors\n")
+
+    if not result["success"]:
+        raise typer.Exit(1)
+
+
+# ----------------------------------------------------------------------
+@app.command("Watch", no_args_is_help=True)
+def Watch(
+    workspaces: Annotated[
+        list[Path],
+        typer.Argument(
+            exists=True,
+            file_okay=False,
+            resolve_path=True,
+            help="Workspace roots that contain the files to watch.",
+        ),
+    ],
+    *,
+    polling: Annotated[
+        bool,
+        typer.Option("--polling", help="Poll for changes rather than using inotify."),
+    ] = False,
+    settle: Annotated[
+        float,
+        typer.Option(
+            "--settle",
+            min=0.0,
+            help="Seconds without changes to wait for before rebuilding, so that bursts of changes are processed together.",
+        ),
+    ] = 0.1,
+    executor: Annotated[
+        ExecutorType,
+        typer.Option("--executor", case_sensitive=False, help="Executor used to parse files."),
+    ] = ExecutorType.Thread,
+    single_threaded: Annotated[
+        bool,
+        typer.Option("--single-threaded", help="Parse files with a single thread."),
+    ] = False,
+) -> None:
+    """Validate the files within the workspaces and revalidate the affected files whenever files change, printing the time taken by each rebuild."""
+
+    from SimpleSchemaGenerator.Watcher import WorkspaceWatcher
+
+    with (
+        WorkspaceWatcher(
+            workspaces,
+            sys.stdout,
+            polling=polling,
+            settle_seconds=settle,
+            executor=executor,
+            single_threaded=single_threaded,
+        ) as watcher,
+        suppress(KeyboardInterrupt),
+    ):
+        watcher.Run()
+
+
+# ----------------------------------------------------------------------
+@app.command("LanguageServer", no_args_is_help=False)
+def LanguageServerCommand(
+    *,
+    stdio: Annotated[  # noqa: ARG001
+        bool,
+        typer.Option(
+            "--stdio",
+            help="Communicate over stdin and stdout; this is the only transport supported, but the flag is accepted for clients that always provide it.",
+        ),
+    ] = True,
+    debounce: Annotated[
+        float,
+        typer.Option(
+            "--debounce",
+            min=0.0,
+            help="Seconds to wait after the last edit before diagnostics are published.",
+        ),
+    ] = 0.3,
+    max_errors: Annotated[
+        int,
+        typer.Option(
+            "--max-errors",
+            min=1,
+            help="Maximum number of syntax errors reported for each file; parsing continues after an error until this many have been found.",
+        ),
+    ] = 100,
+) -> None:
+    """Run a Language Server Protocol server that provides diagnostics, hover, and go-to-definition."""
+
+    from SimpleSchemaGenerator.LanguageServer import LanguageServer
+
+    exit_code = LanguageServer(
+        sys.stdin.buffer,
+        sys.stdout.buffer,
+        debounce_seconds=debounce,
+        max_errors=max_errors,
+    ).Serve()
+
+    if exit_code != 0:
+        raise typer.Exit(exit_code)
 
 
 # ----------------------------------------------------------------------
@@ -50,6 +379,29 @@ def Version() -> None:
     sys.stdout.write(__version__)
 
 
+# ----------------------------------------------------------------------
+# |
+# |  Private Functions
+# |
+# ----------------------------------------------------------------------
+@contextmanager
+def _YieldDfaSnapshot(
+    dfa_snapshot: Path | None,
+) -> Iterator[None]:
+    if dfa_snapshot is None:
+        yield
+        return
+
+    from SimpleSchemaGenerator.Schema.Parse.ANTLR.DfaSnapshot import LoadDfaSnapshot, SaveDfaSnapshot
+
+    # The snapshot doesn't exist the first time that it is used
+    LoadDfaSnapshot(dfa_snapshot)
+
+    yield
+
+    SaveDfaSnapshot(dfa_snapshot)
+
+
 # ----------------------------------------------------------------------
 # ----------------------------------------------------------------------
 # ----------------------------------------------------------------------
@@ -0,0 +1,860 @@
+# ----------------------------------------------------------------------
+# |
+# |  LanguageServer.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-16 23:59:48
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2026
+# |  Distributed under the MIT License.
+# |
+# ----------------------------------------------------------------------
+"""Contains the LanguageServer object"""
+
+import io
+import json
+import threading
+
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path, PurePath
+from typing import Any, BinaryIO, TYPE_CHECKING
+from urllib.parse import urlparse
+from urllib.request import url2pathname
+
+from dbrownell_Common import PathEx
+from dbrownell_Common.Streams.DoneManager import DoneManager
+from dbrownell_Common.Types import override
+
+from SimpleSchemaGenerator import __version__
+from SimpleSchemaGenerator.Common.Location import Location
+from SimpleSchemaGenerator.Common.RegionIndex import RegionIndex
+from SimpleSchemaGenerator.ParseDaemon import CreateErrorObjects
+from SimpleSchemaGenerator.Schema.Elements.Common.Element import Element
+from SimpleSchemaGenerator.Schema.Elements.Common.TerminalElement import TerminalElement
+from SimpleSchemaGenerator.Schema.Elements.Statements.RootStatement import RootStatement
+from SimpleSchemaGenerator.Schema.Elements.Statements.Statement import Statement
+from SimpleSchemaGenerator.Schema.Parse.ANTLR.Grammar.Elements.Common.ParseIdentifier import (
+    ParseIdentifier,
+)
+from SimpleSchemaGenerator.Schema.Parse.ANTLR.Grammar.Elements.Statements.ParseIncludeStatement import (
+    ParseIncludeStatement,
+    ParseIncludeStatementItem,
+    ParseIncludeStatementType,
+)
+from SimpleSchemaGenerator.Schema.Parse.ANTLR.Grammar.Elements.Statements.ParseItemStatement import (
+    ParseItemStatement,
+)
+from SimpleSchemaGenerator.Schema.Parse.ANTLR.Grammar.Elements.Statements.ParseStructureStatement import (
+    ParseStructureStatement,
+)
+from SimpleSchemaGenerator.Schema.Parse.ANTLR.Grammar.Elements.Types.ParseIdentifierType import (
+    ParseIdentifierType,
+)
+from SimpleSchemaGenerator.Schema.Parse.ANTLR.Parse import ParseRecoveryError, ParseSession
+from SimpleSchemaGenerator.Schema.Parse.ANTLR.ParseOptions import ParseOptions
+from SimpleSchemaGenerator.Schema.Visitors.ElementVisitor import ElementVisitorHelper, VisitResult
+
+if TYPE_CHECKING:
+    from SimpleSchemaGenerator.Common.Region import Region
+
+
+# ----------------------------------------------------------------------
+class LanguageServer:
+    """Language Server Protocol server for SimpleSchema files.
+
+    Messages are JSON-RPC objects preceded by a Content-Length header, read from and written to a pair
+    of binary streams (usually stdin and stdout). The server supports full document synchronization,
+    diagnostics, hover, and go-to-definition.
+
+    Open documents are parsed with a ParseSession: an edited document is reparsed on its own, and the
+    results of the files that it includes are reused. Edits are debounced; diagnostics are published
+    once no edits have been received for `debounce_seconds`. Hover and definition requests are answered
+    with a RegionIndex of each file's elements rather than by walking the tree.
+
+    Parsing continues after syntax errors, so that up to `max_errors` diagnostics are published for
+    each file and hover and definition requests are answered with the statements that could be parsed.
+    """
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        input_stream: BinaryIO,
+        output_stream: BinaryIO,
+        file_extensions: list[str] | None = None,
+        *,
+        debounce_seconds: float = 0.3,
+        max_errors: int | None = 100,
+    ) -> None:
+        self.debounce_seconds = debounce_seconds
+
+        self._input_stream = input_stream
+        self._output_stream = output_stream
+        self._output_lock = threading.Lock()
+
+        # Guards all of the state below; requests are processed on the thread that calls `Serve`, while
+        # debounced parses are processed on timer threads.
+        self._lock = threading.RLock()
+
+        self._session = ParseSession(
+            file_extensions,
+            options=ParseOptions(quiet=True, max_errors=max_errors),
+        )
+
+        self._workspace_roots: list[Path] = []
+        self._documents: dict[Path, str] = {}
+
+        self._results: dict[Path, Exception | RootStatement] = {}
+        self._region_indexes: dict[Path, tuple[RootStatement, RegionIndex[Element]]] = {}
+        self._published_filenames: set[Path] = set()
+
+        # Pending work, processed by the next call to `_Rebuild`
+        self._documents_changed = False
+        self._changed_filenames: set[Path] = set()
+        self._timer: threading.Timer | None = None
+
+        self._is_shutdown = False
+        self._is_exited = False
+
+        self._request_handlers: dict[str, Callable[[dict[str, Any]], Any]] = {
+            "initialize": self._OnInitialize,
+            "shutdown": self._OnShutdown,
+            "textDocument/hover": self._OnHover,
+            "textDocument/definition": self._OnDefinition,
+        }
+
+        self._notification_handlers: dict[str, Callable[[dict[str, Any]], None]] = {
+            "exit": self._OnExit,
+            "textDocument/didOpen": self._OnDidOpen,
+            "textDocument/didChange": self._OnDidChange,
+            "textDocument/didClose": self._OnDidClose,
+            "workspace/didChangeWatchedFiles": self._OnDidChangeWatchedFiles,
+        }
+
+    # ----------------------------------------------------------------------
+    def Serve(self) -> int:
+        """Process messages until the client sends an exit notification or closes the input stream; returns the exit code."""
+
+        try:
+            while not self._is_exited:
+                try:
+                    message = _ReadMessage(self._input_stream)
+                except ValueError as ex:
+                    self._Send({"jsonrpc": "2.0", "id": None, "error": {"code": -32700, "message": str(ex)}})
+                    continue
+
+                if message is None:
+                    break
+
+                self._ProcessMessage(message)
+
+        finally:
+            with self._lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+
+            self._session.Close()
+
+        return 0 if self._is_shutdown else 1
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Private Methods
+    # |
+    # ----------------------------------------------------------------------
+    def _ProcessMessage(
+        self,
+        message: object,
+    ) -> None:
+        if not isinstance(message, dict) or "method" not in message:
+            # Responses aren't expected, as the server doesn't send requests
+            return
+
+        method = message["method"]
+        params = message.get("params") or {}
+
+        if "id" not in message:
+            notification_handler = self._notification_handlers.get(method)
+
+            if notification_handler is not None:
+                try:
+                    notification_handler(params)
+                except Exception as ex:
+                    self._Send(
+                        {
+                            "jsonrpc": "2.0",
+                            "method": "window/logMessage",
+                            "params": {"type": 1, "message": f"{method}: {ex}"},
+                        },
+                    )
+
+            return
+
+        response: dict[str, Any] = {"jsonrpc": "2.0", "id": message["id"]}
+
+        request_handler = self._request_handlers.get(method)
+
+        if self._is_shutdown:
+            response["error"] = {"code": -32600, "message": "The server has been shut down."}
+        elif request_handler is None:
+            response["error"] = {"code": -32601, "message": f"'{method}' is not a supported method."}
+        else:
+            try:
+                response["result"] = request_handler(params)
+            except Exception as ex:
+                response["error"] = {"code": -32603, "message": str(ex)}
+
+        self._Send(response)
+
+    # ----------------------------------------------------------------------
+    def _Send(
+        self,
+        message: dict[str, Any],
+    ) -> None:
+        content = json.dumps(message).encode("utf-8")
+
+        with self._output_lock:
+            self._output_stream.write(f"Content-Length: {len(content)}\r\n\r\n".encode("ascii"))
+            self._output_stream.write(content)
+            self._output_stream.flush()
+
+    # ----------------------------------------------------------------------
+    # |  Requests
+    def _OnInitialize(
+        self,
+        params: dict[str, Any],
+    ) -> dict[str, Any]:
+        uris: list[str] = [folder["uri"] for folder in params.get("workspaceFolders") or []]
+
+        if not uris and params.get("rootUri"):
+            uris.append(params["rootUri"])
+
+        with self._lock:
+            self._workspace_roots = [_UriToPath(uri) for uri in uris]
+
+            # Search from the longest path to the shortest path
+            self._workspace_roots.sort(key=lambda value: len(str(value)), reverse=True)
+
+        return {
+            "capabilities": {
+                "textDocumentSync": {"openClose": True, "change": 1},
+                "hoverProvider": True,
+                "definitionProvider": True,
+            },
+            "serverInfo": {"name": "SimpleSchemaGenerator", "version": __version__},
+        }
+
+    # ----------------------------------------------------------------------
+    def _OnShutdown(
+        self,
+        params: dict[str, Any],  # noqa: ARG002
+    ) -> None:
+        self._is_shutdown = True
+
+    # ----------------------------------------------------------------------
+    def _OnHover(
+        self,
+        params: dict[str, Any],
+    ) -> dict[str, Any] | None:
+        with self._lock:
+            self._Rebuild()
+
+            filename, location = self._GetPosition(params)
+
+            identifier, definition = self._FindDefinition(filename, location)
+            if identifier is None:
+                return None
+
+            if definition is None:
+                contents = f"`{identifier.value}`"
+            else:
+                definition_filename, definition_statement = definition
+
+                if definition_statement is None:
+                    contents = f"`{definition_filename}`"
+                else:
+                    region = definition_statement.region
+
+                    # The region ends at the beginning of the next line when it includes the newline
+                    lines = self._GetLines(definition_filename)[
+                        region.begin.line - 1 : region.end.line - (1 if region.end.column == 1 else 0)
+                    ]
+
+                    while lines and not lines[-1].strip():
+                        lines.pop()
+
+                    if len(lines) > _MAX_HOVER_LINES:
+                        lines = [*lines[:_MAX_HOVER_LINES], "..."]
+
+                    contents = "```SimpleSchema\n{}\n```\n\n{}, line {}".format(
+                        "\n".join(lines),
+                        definition_filename.name,
+                        region.begin.line,
+                    )
+
+            return {
+                "contents": {"kind": "markdown", "value": contents},
+                "range": self._CreateRange(filename, identifier.region.begin, identifier.region.end),
+            }
+
+    # ----------------------------------------------------------------------
+    def _OnDefinition(
+        self,
+        params: dict[str, Any],
+    ) -> dict[str, Any] | None:
+        with self._lock:
+            self._Rebuild()
+
+            filename, location = self._GetPosition(params)
+
+            _, definition = self._FindDefinition(filename, location)
+            if definition is None:
+                return None
+
+            definition_filename, definition_statement = definition
+
+            if definition_statement is None:
+                begin = end = Location(1, 1)
+            else:
+                assert isinstance(definition_statement, (ParseItemStatement, ParseStructureStatement))
+
+                begin = definition_statement.name.region.begin
+                end = definition_statement.name.region.end
+
+            return {
+                "uri": definition_filename.as_uri(),
+                "range": self._CreateRange(definition_filename, begin, end),
+            }
+
+    # ----------------------------------------------------------------------
+    # |  Notifications
+    def _OnExit(
+        self,
+        params: dict[str, Any],  # noqa: ARG002
+    ) -> None:
+        self._is_exited = True
+
+    # ----------------------------------------------------------------------
+    def _OnDidOpen(
+        self,
+        params: dict[str, Any],
+    ) -> None:
+        text_document = params["textDocument"]
+
+        with self._lock:
+            self._documents[_UriToPath(text_document["uri"])] = text_document["text"]
+            self._documents_changed = True
+
+            self._ScheduleRebuild()
+
+    # ----------------------------------------------------------------------
+    def _OnDidChange(
+        self,
+        params: dict[str, Any],
+    ) -> None:
+        filename = _UriToPath(params["textDocument"]["uri"])
+
+        # Documents are synchronized in full, so the last change contains all of the content
+        content_changes = params["contentChanges"]
+        if not content_changes:
+            return
+
+        with self._lock:
+            self._documents[filename] = content_changes[-1]["text"]
+            self._changed_filenames.add(filename)
+
+            self._ScheduleRebuild()
+
+    # ----------------------------------------------------------------------
+    def _OnDidClose(
+        self,
+        params: dict[str, Any],
+    ) -> None:
+        with self._lock:
+            self._documents.pop(_UriToPath(params["textDocument"]["uri"]), None)
+            self._documents_changed = True
+
+            self._ScheduleRebuild()
+
+    # ----------------------------------------------------------------------
+    def _OnDidChangeWatchedFiles(
+        self,
+        params: dict[str, Any],
+    ) -> None:
+        with self._lock:
+            for change in params["changes"]:
+                filename = _UriToPath(change["uri"])
+
+                # The content of open documents comes from the client rather than the file system
+                if filename not in self._documents:
+                    self._changed_filenames.add(filename)
+
+            self._ScheduleRebuild()
+
+    # ----------------------------------------------------------------------
+    # |  Parsing
+    def _ScheduleRebuild(self) -> None:
+        # The caller holds the lock
+        if self._timer is not None:
+            self._timer.cancel()
+
+        self._timer = threading.Timer(self.debounce_seconds, self._OnTimer)
+        self._timer.daemon = True
+        self._timer.start()
+
+    # ----------------------------------------------------------------------
+    def _OnTimer(self) -> None:
+        with self._lock:
+            if self._timer is None or self._timer is not threading.current_thread():
+                # The timer was canceled or replaced after it fired
+                return
+
+            self._Rebuild()
+
+    # ----------------------------------------------------------------------
+    def _Rebuild(self) -> None:
+        # The caller holds the lock
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        if not self._documents_changed and not self._changed_filenames:
+            return
+
+        with DoneManager.Create(io.StringIO(), "", line_prefix="") as dm:
+            if self._documents_changed:
+                results = self._session.Parse(
+                    dm,
+                    self._CreateWorkspaces(),
+                    raise_if_single_exception=False,
+                )
+            else:
+                results = self._session.Update(
+                    dm,
+                    self._changed_filenames,
+                    raise_if_single_exception=False,
+                )
+
+        self._documents_changed = False
+        self._changed_filenames = set()
+
+        self._results = {
+            workspace_root / relative_path: result
+            for workspace_root, workspace_results in results.items()
+            for relative_path, result in workspace_results.items()
+        }
+
+        self._PublishDiagnostics()
+
+    # ----------------------------------------------------------------------
+    def _CreateWorkspaces(self) -> dict[Path, dict[PurePath, Callable[[], str]]]:
+        workspaces: dict[Path, dict[PurePath, Callable[[], str]]] = {}
+
+        for filename in self._documents:
+            workspace_root = next(
+                (root for root in self._workspace_roots if PathEx.IsDescendant(filename, root)),
+                filename.parent,
+            )
+
+            relative_path = PathEx.CreateRelativePath(workspace_root, filename)
+            assert relative_path is not None
+
+            # Read the content when the file is parsed so that the latest content is used by `Update`
+            workspaces.setdefault(workspace_root, {})[relative_path] = lambda filename=filename: (
+                self._documents[filename]
+            )
+
+        return workspaces
+
+    # ----------------------------------------------------------------------
+    def _PublishDiagnostics(self) -> None:
+        diagnostics: dict[Path, list[dict[str, Any]]] = {}
+
+        for filename, result in self._results.items():
+            if not isinstance(result, Exception):
+                continue
+
+            for error_object in CreateErrorObjects(result):
+                error_filename = (
+                    filename if error_object["filename"] is None else Path(error_object["filename"])
+                )
+
+                if error_object["line"] is None:
+                    begin = Location(1, 1)
+                else:
+                    begin = Location(error_object["line"], error_object["column"])
+
+                diagnostics.setdefault(error_filename, []).append(
+                    {
+                        "range": self._CreateRange(error_filename, begin, begin),
+                        "severity": 1,
+                        "source": "SimpleSchema",
+                        "message": error_object["message"],
+                    },
+                )
+
+        # Clear the diagnostics of files that no longer have errors
+        for filename in self._published_filenames.difference(diagnostics):
+            diagnostics[filename] = []
+
+        for filename, file_diagnostics in sorted(diagnostics.items()):
+            self._Send(
+                {
+                    "jsonrpc": "2.0",
+                    "method": "textDocument/publishDiagnostics",
+                    "params": {"uri": filename.as_uri(), "diagnostics": file_diagnostics},
+                },
+            )
+
+        self._published_filenames = {filename for filename, value in diagnostics.items() if value}
+
+    # ----------------------------------------------------------------------
+    # |  Definitions
+    def _FindDefinition(
+        self,
+        filename: Path,
+        location: Location,
+    ) -> tuple[
+        ParseIdentifier | TerminalElement[Path] | None,
+        tuple[Path, Statement | None] | None,  # The statement is None when the definition is a file
+    ]:
+        root = self._GetRoot(filename)
+        if root is None:
+            return None, None
+
+        elements = self._GetRegionIndex(filename, root).Find(location)
+
+        if not elements:
+            return None, None
+
+        if (
+            len(elements) > 1
+            and isinstance(elements[1], ParseIncludeStatement)
+            and elements[0] is elements[1].filename
+        ):
+            return elements[0], (elements[1].filename.value, None)
+
+        if not isinstance(elements[0], ParseIdentifier):
+            return None, None
+
+        identifier = elements[0]
+
+        for element_index, element in enumerate(elements[1:], 1):
+            if isinstance(element, (ParseItemStatement, ParseStructureStatement)):
+                if element.name is identifier:
+                    return identifier, (filename, element)
+
+                break
+
+            if isinstance(element, ParseIdentifierType):
+                identifier_index = next(
+                    index for index, value in enumerate(element.identifiers) if value is identifier
+                )
+
+                enclosing_elements = [] if element.is_global_reference else elements[element_index + 1 :]
+
+                # The bases of a structure are resolved outside of the structure
+                if (
+                    enclosing_elements
+                    and isinstance(enclosing_elements[0], ParseStructureStatement)
+                    and any(base is element for base in enclosing_elements[0].bases or [])
+                ):
+                    enclosing_elements = enclosing_elements[1:]
+
+                return identifier, self._ResolveIdentifiers(
+                    filename,
+                    root,
+                    enclosing_elements,
+                    [value.value for value in element.identifiers[: identifier_index + 1]],
+                )
+
+            if isinstance(element, ParseIncludeStatementItem):
+                include_statement = elements[element_index + 1]
+                assert isinstance(include_statement, ParseIncludeStatement), include_statement
+
+                included_root = self._GetRoot(include_statement.filename.value)
+                if included_root is None:
+                    return identifier, None
+
+                return identifier, _FindStatement(
+                    include_statement.filename.value,
+                    included_root.statements,
+                    element.element_name.value,
+                )
+
+        return identifier, None
+
+    # ----------------------------------------------------------------------
+    def _ResolveIdentifiers(
+        self,
+        filename: Path,
+        root: RootStatement,
+        enclosing_elements: list[Element],
+        names: list[str],
+    ) -> tuple[Path, Statement | None] | None:
+        # Resolve the first name within the enclosing structures, the file, and the included files
+        definition: tuple[Path, Statement | None] | None = None
+
+        for element in enclosing_elements:
+            if isinstance(element, ParseStructureStatement):
+                definition = _FindStatement(filename, element.children, names[0])
+                if definition is not None:
+                    break
+
+        if definition is None:
+            definition = _FindStatement(filename, root.statements, names[0])
+
+        if definition is None:
+            for statement in root.statements:
+                if isinstance(statement, ParseIncludeStatement):
+                    definition = self._ResolveIncludedName(statement, names[0])
+                    if definition is not None:
+                        break
+
+        # Resolve the remaining names within the previous definition
+        for name in names[1:]:
+            if definition is None:
+                break
+
+            definition_filename, definition_statement = definition
+
+            if definition_statement is None:
+                included_root = self._GetRoot(definition_filename)
+                statements = [] if included_root is None else included_root.statements
+            elif isinstance(definition_statement, ParseStructureStatement):
+                statements = definition_statement.children
+            else:
+                return None
+
+            definition = _FindStatement(definition_filename, statements, name)
+
+        return definition
+
+    # ----------------------------------------------------------------------
+    def _ResolveIncludedName(
+        self,
+        include_statement: ParseIncludeStatement,
+        name: str,
+    ) -> tuple[Path, Statement | None] | None:
+        included_filename = include_statement.filename.value
+
+        if include_statement.include_type == ParseIncludeStatementType.Module:
+            return (included_filename, None) if included_filename.stem == name else None
+
+        included_root = self._GetRoot(included_filename)
+        if included_root is None:
+            return None
+
+        if include_statement.include_type == ParseIncludeStatementType.Star:
+            return _FindStatement(included_filename, included_root.statements, name)
+
+        for item in include_statement.items:
+            if item.reference_name.value == name:
+                return _FindStatement(included_filename, included_root.statements, item.element_name.value)
+
+        return None
+
+    # ----------------------------------------------------------------------
+    def _GetRoot(
+        self,
+        filename: Path,
+    ) -> RootStatement | None:
+        result = self._results.get(filename)
+
+        if isinstance(result, RootStatement):
+            return result
+
+        # Files with syntax errors still produce the statements that could be parsed
+        if isinstance(result, ParseRecoveryError):
+            return result.root
+
+        return None
+
+    # ----------------------------------------------------------------------
+    def _GetRegionIndex(
+        self,
+        filename: Path,
+        root: RootStatement,
+    ) -> RegionIndex[Element]:
+        cached = self._region_indexes.get(filename)
+        if cached is not None and cached[0] is root:
+            return cached[1]
+
+        collector = _RegionCollector()
+        root.Accept(collector)
+
+        region_index = RegionIndex(collector.items)
+
+        self._region_indexes[filename] = (root, region_index)
+        return region_index
+
+    # ----------------------------------------------------------------------
+    # |  Positions
+    def _GetLines(
+        self,
+        filename: Path,
+    ) -> list[str]:
+        content = self._documents.get(filename)
+
+        if content is None:
+            try:
+                content = filename.read_text(encoding="utf-8")
+            except OSError:
+                content = ""
+
+        return content.splitlines()
+
+    # ----------------------------------------------------------------------
+    def _GetPosition(
+        self,
+        params: dict[str, Any],
+    ) -> tuple[Path, Location]:
+        filename = _UriToPath(params["textDocument"]["uri"])
+        line = params["position"]["line"]
+        character = params["position"]["character"]
+
+        # LSP characters are UTF-16 code units, while columns are code points
+        lines = self._GetLines(filename)
+        text = lines[line] if line < len(lines) else ""
+
+        column = 0
+        num_code_units = 0
+
+        while column < len(text):
+            num_code_units += _GetNumUtf16CodeUnits(text[column])
+            if num_code_units > character:
+                break
+
+            column += 1
+
+        return filename, Location(line + 1, column + 1)
+
+    # ----------------------------------------------------------------------
+    def _CreateRange(
+        self,
+        filename: Path,
+        begin: Location,
+        end: Location,
+    ) -> dict[str, Any]:
+        lines = self._GetLines(filename)
+
+        # ----------------------------------------------------------------------
+        def CreatePosition(
+            location: Location,
+        ) -> dict[str, int]:
+            text = lines[location.line - 1] if location.line <= len(lines) else ""
+
+            return {
+                "line": location.line - 1,
+                "character": sum(_GetNumUtf16CodeUnits(char) for char in text[: location.column - 1]),
+            }
+
+        # ----------------------------------------------------------------------
+
+        return {"start": CreatePosition(begin), "end": CreatePosition(end)}
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Private Types
+# |
+# ----------------------------------------------------------------------
+_MAX_HOVER_LINES = 20
+
+
+# ----------------------------------------------------------------------
+class _RegionCollector(ElementVisitorHelper):
+    """Collects the region of every element"""
+
+    # ----------------------------------------------------------------------
+    def __init__(self) -> None:
+        self.items: list[tuple[Region, Element]] = []
+
+    # ----------------------------------------------------------------------
+    @override
+    @contextmanager
+    def OnElement(
+        self,
+        element: Element,
+    ) -> Iterator[VisitResult]:
+        self.items.append((element.region, element))
+        yield VisitResult.Continue
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Private Functions
+# |
+# ----------------------------------------------------------------------
+def _ReadMessage(
+    input_stream: BinaryIO,
+) -> object:
+    """Return the next message, or None if the stream has been closed."""
+
+    content_length: int | None = None
+
+    while True:
+        line = input_stream.readline()
+        if not line:
+            return None
+
+        line = line.strip()
+        if not line:
+            if content_length is None:
+                continue
+
+            break
+
+        name, _, value = line.decode("ascii").partition(":")
+
+        if name.strip().lower() == "content-length":
+            content_length = int(value.strip())
+
+    content = input_stream.read(content_length)
+    if len(content) < content_length:
+        return None
+
+    try:
+        return json.loads(content)
+    except json.JSONDecodeError as ex:
+        msg = f"Invalid JSON: {ex}"
+        raise ValueError(msg) from ex
+
+
+# ----------------------------------------------------------------------
+def _UriToPath(
+    uri: str,
+) -> Path:
+    parsed = urlparse(uri)
+
+    if parsed.scheme != "file":
+        msg = f"'{uri}' is not a file URI."
+        raise ValueError(msg)
+
+    return Path(url2pathname(parsed.path)).resolve()
+
+
+# ----------------------------------------------------------------------
+def _FindStatement(
+    filename: Path,
+    statements: list[Statement],
+    name: str,
+) -> tuple[Path, Statement] | None:
+    for statement in statements:
+        if (
+            isinstance(statement, (ParseItemStatement, ParseStructureStatement))
+            and statement.name.value == name
+        ):
+            return filename, statement
+
+    return None
+
+
+# ----------------------------------------------------------------------
+def _GetNumUtf16CodeUnits(
+    char: str,
+) -> int:
+    return 2 if ord(char) > 0xFFFF else 1  # noqa: PLR2004
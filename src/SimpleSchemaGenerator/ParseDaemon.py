@@ -0,0 +1,460 @@
+# ----------------------------------------------------------------------
+# |
+# |  ParseDaemon.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-16 23:59:31
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2026
+# |  Distributed under the MIT License.
+# |
+# ----------------------------------------------------------------------
+"""Contains the ParseDaemon object"""
+
+import io
+import json
+import os
+import socketserver
+import threading
+
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, Self, TextIO
+
+from dbrownell_Common.Streams.DoneManager import DoneManager
+
+from SimpleSchemaGenerator import __version__
+from SimpleSchemaGenerator.Common.Error import SimpleSchemaGeneratorError
+from SimpleSchemaGenerator.Schema.Elements.Statements.RootStatement import RootStatement
+from SimpleSchemaGenerator.Schema.Parse.ANTLR.Parse import (
+    AntlrError,
+    CreateWorkspaces,
+    DEFAULT_FILE_EXTENSIONS,
+    ExecutorType,
+    ParseRecoveryError,
+    ParseSession,
+)
+from SimpleSchemaGenerator.Schema.Parse.ANTLR.ParseOptions import ParseOptions
+from SimpleSchemaGenerator.ParseDaemonClient import IsRunning, ParseDaemonError
+
+
+# ----------------------------------------------------------------------
+class ParseDaemon:
+    """Serves parse requests from a long-running process.
+
+    Imported modules, warmed ANTLR DFA caches, and a ParseSession for each set of workspaces (with its
+    workspace index and parsed results) are retained between requests. The modification time and
+    size of each file are compared to those seen by the previous request for the same workspaces, so
+    a request only reads and parses the files that have changed; when files have been created or
+    removed, all of the files are read, but only those whose content has changed are parsed. At most
+    `max_sessions` ParseSessions are retained; the least recently used ParseSession is closed when
+    another one is needed.
+
+    Requests and responses are JSON objects, one per line:
+
+        request:  {"id": <any>, "method": "<method>", "params": {...}}
+        response: {"id": <any>, "result": <result>} or {"id": <any>, "error": "<message>"}
+
+    The supported methods are:
+
+        Status:    Returns information about the daemon.
+        Parse:     Parses the files in params["workspaces"] (a list of directories) and returns the
+                   errors for each file (see `Parse`).
+        Validate:  Parses the files in params["workspaces"] and returns all of the errors (see
+                   `Validate`).
+        Shutdown:  Stops serving requests once the response has been sent.
+    """
+
+    DEFAULT_MAX_SESSIONS = 8
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        file_extensions: list[str] | None = None,
+        *,
+        single_threaded: bool = False,
+        executor: ExecutorType = ExecutorType.Thread,
+        max_errors: int | None = None,
+        dfa_snapshot: Path | None = None,
+        max_sessions: int = DEFAULT_MAX_SESSIONS,
+    ) -> None:
+        if max_sessions <= 0:
+            raise ValueError(f"Invalid max_sessions value: {max_sessions}")  # noqa: EM102, TRY003
+
+        self.file_extensions = file_extensions or DEFAULT_FILE_EXTENSIONS
+        self.single_threaded = single_threaded
+        self.executor = executor
+        self.max_errors = max_errors
+        self.dfa_snapshot = dfa_snapshot
+        self.max_sessions = max_sessions
+
+        # ParseSessions are not thread-safe, so requests are processed one at a time
+        self._lock = threading.Lock()
+
+        # Ordered from least to most recently used
+        self._sessions: dict[tuple[Path, ...], ParseSession] = {}
+
+        # The modification time and size of each file seen by the last request for each session
+        self._snapshots: dict[tuple[Path, ...], dict[Path, tuple[int, int]]] = {}
+
+        self._shutdown_event = threading.Event()
+
+    # ----------------------------------------------------------------------
+    def __enter__(self) -> Self:
+        return self
+
+    # ----------------------------------------------------------------------
+    def __exit__(self, *args) -> None:
+        self.Close()
+
+    # ----------------------------------------------------------------------
+    def Close(self) -> None:
+        with self._lock:
+            for session in self._sessions.values():
+                session.Close()
+
+            self._sessions = {}
+            self._snapshots = {}
+
+    # ----------------------------------------------------------------------
+    @property
+    def is_shutdown(self) -> bool:
+        return self._shutdown_event.is_set()
+
+    # ----------------------------------------------------------------------
+    def Parse(
+        self,
+        workspace_roots: list[Path],
+    ) -> dict[str, Any]:
+        """Parse the files within the workspace roots and return the errors for each file.
+
+        Returns {"files": [{"workspace": <str>, "relative_path": <str>, "errors": [<error>, ...]}, ...]},
+        where each error is created by `CreateErrorObjects`.
+        """
+
+        workspace_roots = [workspace_root.resolve() for workspace_root in workspace_roots]
+
+        for workspace_root in workspace_roots:
+            if not workspace_root.is_dir():
+                raise ParseDaemonError(f"'{workspace_root}' is not a valid directory.")  # noqa: EM102, TRY003
+
+        key = tuple(sorted(workspace_roots))
+
+        with self._lock:
+            # The session is (re)inserted below, which marks it as the most recently used
+            session = self._sessions.pop(key, None)
+
+            if session is None:
+                while len(self._sessions) >= self.max_sessions:
+                    least_recently_used_key = next(iter(self._sessions))
+                    self._sessions.pop(least_recently_used_key).Close()
+                    self._snapshots.pop(least_recently_used_key, None)
+
+                session = ParseSession(
+                    self.file_extensions,
+                    options=ParseOptions(
+                        single_threaded=self.single_threaded,
+                        quiet=True,
+                        executor=self.executor,
+                        max_errors=self.max_errors,
+                        dfa_snapshot=self.dfa_snapshot,
+                    ),
+                )
+
+            self._sessions[key] = session
+
+            workspaces = CreateWorkspaces(workspace_roots, self.file_extensions)
+
+            snapshot = _CreateSnapshot(
+                [
+                    workspace_root / relative_path
+                    for workspace_root, sources in workspaces.items()
+                    for relative_path in sources
+                ],
+            )
+
+            previous_snapshot = self._snapshots.pop(key, None)
+
+            # Errors are returned in the response, so the output isn't needed
+            with DoneManager.Create(io.StringIO(), "", line_prefix="") as dm:
+                if previous_snapshot is not None and previous_snapshot.keys() == snapshot.keys():
+                    results = session.Update(
+                        dm,
+                        [
+                            filename
+                            for filename, file_info in snapshot.items()
+                            if previous_snapshot[filename] != file_info
+                        ],
+                        raise_if_single_exception=False,
+                    )
+                else:
+                    # Files were created or removed; the results of files whose content hasn't changed
+                    # are reused by the session.
+                    results = session.Parse(dm, workspaces, raise_if_single_exception=False)
+
+            self._snapshots[key] = snapshot
+
+        return {
+            "files": [
+                {
+                    "workspace": str(workspace_root),
+                    "relative_path": relative_path.as_posix(),
+                    "errors": [] if isinstance(result, RootStatement) else CreateErrorObjects(result),
+                }
+                for workspace_root, workspace_results in sorted(results.items())
+                for relative_path, result in sorted(workspace_results.items())
+            ],
+        }
+
+    # ----------------------------------------------------------------------
+    def Validate(
+        self,
+        workspace_roots: list[Path],
+    ) -> dict[str, Any]:
+        """Parse the files within the workspace roots and return all of the errors.
+
+        Returns {"success": <bool>, "num_files": <int>, "errors": [<error>, ...]}, where each error is
+        created by `CreateErrorObjects`.
+        """
+
+        files = self.Parse(workspace_roots)["files"]
+        errors = [error for file_info in files for error in file_info["errors"]]
+
+        return {
+            "success": not errors,
+            "num_files": len(files),
+            "errors": errors,
+        }
+
+    # ----------------------------------------------------------------------
+    def ProcessRequest(
+        self,
+        request: object,
+    ) -> dict[str, Any]:
+        """Process a request and return its response."""
+
+        request_id = request.get("id") if isinstance(request, dict) else None
+
+        try:
+            if not isinstance(request, dict):
+                raise ParseDaemonError("Requests must be JSON objects.")  # noqa: EM101, TRY003, TRY301
+
+            method = request.get("method")
+
+            params = request.get("params") or {}
+            if not isinstance(params, dict):
+                raise ParseDaemonError("Request parameters must be JSON objects.")  # noqa: EM101, TRY003, TRY301
+
+            result: Any
+
+            if method == "Status":
+                with self._lock:
+                    workspaces = [[str(workspace_root) for workspace_root in key] for key in self._sessions]
+
+                result = {
+                    "version": __version__,
+                    "pid": os.getpid(),
+                    "workspaces": workspaces,
+                }
+            elif method in ["Parse", "Validate"]:
+                workspace_roots = params.get("workspaces")
+
+                if not isinstance(workspace_roots, list) or not all(
+                    isinstance(workspace_root, str) for workspace_root in workspace_roots
+                ):
+                    raise ParseDaemonError("'workspaces' must be a list of directories.")  # noqa: EM101, TRY003, TRY301
+
+                func = self.Parse if method == "Parse" else self.Validate
+                result = func([Path(workspace_root) for workspace_root in workspace_roots])
+            elif method == "Shutdown":
+                self._shutdown_event.set()
+                result = {}
+            else:
+                raise ParseDaemonError(f"'{method}' is not a supported method.")  # noqa: EM102, TRY003, TRY301
+
+        except Exception as ex:
+            return {"id": request_id, "error": str(ex)}
+
+        return {"id": request_id, "result": result}
+
+    # ----------------------------------------------------------------------
+    def ProcessLine(
+        self,
+        line: str,
+    ) -> str:
+        """Process a request encoded as a line of JSON and return its response encoded as a line of JSON."""
+
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError as ex:
+            response: dict[str, Any] = {"id": None, "error": f"Invalid JSON: {ex}"}
+        else:
+            response = self.ProcessRequest(request)
+
+        return json.dumps(response) + "\n"
+
+    # ----------------------------------------------------------------------
+    def ServeStream(
+        self,
+        input_stream: TextIO,
+        output_stream: TextIO,
+    ) -> None:
+        """Process requests read from the input stream until it is closed or a Shutdown request is received."""
+
+        for line in input_stream:
+            if not line.strip():
+                continue
+
+            output_stream.write(self.ProcessLine(line))
+            output_stream.flush()
+
+            if self.is_shutdown:
+                break
+
+    # ----------------------------------------------------------------------
+    def ServeSocket(
+        self,
+        socket_path: Path,
+        on_listening_func: Callable[[], None] | None = None,
+    ) -> None:
+        """Process requests sent to the Unix domain socket until a Shutdown request is received.
+
+        Unix domain sockets aren't available on all platforms; use `ServeStream` on those platforms.
+
+        `on_listening_func` is called (without arguments) once clients are able to connect.
+        """
+
+        # Other users may not send requests to the daemon
+        socket_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+
+        if socket_path.exists():
+            if IsRunning(socket_path):
+                raise ParseDaemonError(f"A daemon is already listening on '{socket_path}'.")  # noqa: EM102, TRY003
+
+            # The socket was left behind by a daemon that didn't exit cleanly
+            socket_path.unlink()
+
+        daemon = self
+
+        # ----------------------------------------------------------------------
+        class RequestHandler(socketserver.StreamRequestHandler):
+            # ----------------------------------------------------------------------
+            def handle(self) -> None:
+                for line in self.rfile:
+                    if not line.strip():
+                        continue
+
+                    self.wfile.write(daemon.ProcessLine(line.decode("utf-8")).encode("utf-8"))
+                    self.wfile.flush()
+
+                    if daemon.is_shutdown:
+                        break
+
+        # ----------------------------------------------------------------------
+        class Server(socketserver.ThreadingUnixStreamServer):
+            # Connections may remain open indefinitely
+            daemon_threads = True
+
+        # ----------------------------------------------------------------------
+
+        # Create the socket with permissions that prevent other users from connecting to it before its
+        # permissions are set.
+        original_umask = os.umask(0o077)
+
+        try:
+            server = Server(str(socket_path), RequestHandler)
+        finally:
+            os.umask(original_umask)
+
+        with server:
+            try:
+                socket_path.chmod(0o600)
+
+                # ----------------------------------------------------------------------
+                def WaitForShutdown() -> None:
+                    self._shutdown_event.wait()
+                    server.shutdown()
+
+                # ----------------------------------------------------------------------
+
+                threading.Thread(target=WaitForShutdown, daemon=True).start()
+
+                if on_listening_func is not None:
+                    on_listening_func()
+
+                server.serve_forever()
+
+            finally:
+                socket_path.unlink(missing_ok=True)
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Public Functions
+# |
+# ----------------------------------------------------------------------
+def CreateErrorObjects(
+    ex: Exception,
+) -> list[dict[str, Any]]:
+    """Return JSON-serializable objects that describe each error within the exception.
+
+    Each object is {"message": <str>, "filename": <str | None>, "line": <int | None>, "column": <int | None>}.
+    """
+
+    if isinstance(ex, ParseRecoveryError):
+        return [error_object for error in ex.errors for error_object in CreateErrorObjects(error)]
+
+    if isinstance(ex, AntlrError):
+        return [
+            {
+                "message": ex.message,
+                "filename": str(ex.source),
+                "line": ex.location.line,
+                "column": ex.location.column,
+            },
+        ]
+
+    if isinstance(ex, SimpleSchemaGeneratorError):
+        error_objects: list[dict[str, Any]] = []
+
+        for error in ex.errors:
+            region = error.regions[0] if error.regions else None
+
+            error_objects.append(
+                {
+                    "message": error.message,
+                    "filename": None if region is None else str(region.filename),
+                    "line": None if region is None else region.begin.line,
+                    "column": None if region is None else region.begin.column,
+                },
+            )
+
+        return error_objects
+
+    return [{"message": str(ex), "filename": None, "line": None, "column": None}]
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Private Functions
+# |
+# ----------------------------------------------------------------------
+def _CreateSnapshot(
+    filenames: list[Path],
+) -> dict[Path, tuple[int, int]]:
+    snapshot: dict[Path, tuple[int, int]] = {}
+
+    for filename in filenames:
+        try:
+            stat = filename.stat()
+        except OSError:
+            # The file was removed after the workspace was listed; it is parsed (and the error reported)
+            # by the session.
+            snapshot[filename] = (-1, -1)
+            continue
+
+        snapshot[filename] = (stat.st_mtime_ns, stat.st_size)
+
+    return snapshot
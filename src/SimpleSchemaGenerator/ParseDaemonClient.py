@@ -0,0 +1,132 @@
+# ----------------------------------------------------------------------
+# |
+# |  ParseDaemonClient.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-16 23:59:58
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2026
+# |  Distributed under the MIT License.
+# |
+# ----------------------------------------------------------------------
+"""Contains functions to communicate with a ParseDaemon.
+
+This module doesn't import the parser, so that clients sending requests to a running daemon don't
+pay to import it.
+"""
+
+import getpass
+import json
+import os
+import socket
+import tempfile
+
+from pathlib import Path
+from typing import Any
+
+from SimpleSchemaGenerator import __version__
+
+
+# ----------------------------------------------------------------------
+class ParseDaemonError(Exception):
+    """Exception raised when a request sent to a ParseDaemon fails"""
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Public Functions
+# |
+# ----------------------------------------------------------------------
+def GetDefaultSocketPath() -> Path:
+    """Return the socket used by a daemon that was started without specifying one.
+
+    The socket is created in the user's runtime directory when it is available and in a directory
+    within the temporary directory that is private to the user otherwise.
+    """
+
+    # Clients only communicate with daemons started by the same user with the same version
+    socket_name = f"SimpleSchemaGenerator-{__version__}.sock"
+
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir) / socket_name
+
+    return Path(tempfile.gettempdir()) / f"SimpleSchemaGenerator-{getpass.getuser()}" / socket_name
+
+
+# ----------------------------------------------------------------------
+def SendRequest(
+    socket_path: Path,
+    method: str,
+    params: dict[str, Any] | None = None,
+    *,
+    timeout: float | None = None,
+) -> dict[str, Any]:
+    """Send a request to the daemon listening on the socket and return the result.
+
+    Raises OSError when a daemon isn't listening on the socket and ParseDaemonError when the request
+    fails or the socket was created by a different user.
+    """
+
+    if not hasattr(socket, "AF_UNIX"):  # pragma: no cover
+        raise OSError("Unix domain sockets are not supported on this platform.")  # noqa: EM101, TRY003
+
+    # Requests contain workspace paths, so they are only sent to daemons started by the current user
+    if socket_path.stat().st_uid != os.getuid():
+        raise ParseDaemonError(f"'{socket_path}' was not created by the current user.")  # noqa: EM102, TRY003
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(timeout)
+        client.connect(str(socket_path))
+
+        with client.makefile("rwb") as stream:
+            stream.write(
+                json.dumps({"id": 1, "method": method, "params": params or {}}).encode("utf-8") + b"\n"
+            )
+            stream.flush()
+
+            line = stream.readline()
+
+    if not line:
+        raise ParseDaemonError("The daemon closed the connection without responding.")  # noqa: EM101, TRY003
+
+    response = json.loads(line)
+
+    if "error" in response:
+        raise ParseDaemonError(response["error"])
+
+    return response["result"]
+
+
+# ----------------------------------------------------------------------
+def IsRunning(
+    socket_path: Path,
+    timeout: float = 1.0,
+) -> bool:
+    """Return True if a daemon is listening on the socket."""
+
+    try:
+        SendRequest(socket_path, "Status", timeout=timeout)
+    except (OSError, ValueError, ParseDaemonError):
+        return False
+
+    return True
+
+
+# ----------------------------------------------------------------------
+def FormatError(
+    error_object: dict[str, Any],
+) -> str:
+    """Return a single line that describes an error object created by `CreateErrorObjects`."""
+
+    if error_object["filename"] is None:
+        return error_object["message"]
+
+    return "{} ({} <Ln {}, Col {}>)".format(
+        error_object["message"],
+        error_object["filename"],
+        error_object["line"],
+        error_object["column"],
+    )
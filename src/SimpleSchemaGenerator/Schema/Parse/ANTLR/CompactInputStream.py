@@ -0,0 +1,56 @@
+# ----------------------------------------------------------------------
+# |
+# |  CompactInputStream.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-16 13:22:48
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2026
+# |  Distributed under the MIT License.
+# |
+# ----------------------------------------------------------------------
+"""Contains the CompactInputStream object"""
+
+import sys
+
+from array import array
+
+import antlr4  # type: ignore[import-untyped]
+
+
+# ----------------------------------------------------------------------
+class CompactInputStream(antlr4.InputStream):
+    """ANTLR InputStream that stores code points compactly.
+
+    The default InputStream stores each code point as an element in a list, which requires a pointer
+    (and potentially an int object) for each character. This stream stores ASCII content as bytes
+    and all other content as an array of 32-bit values; indexing either returns the code point as an
+    int, so the behavior of the stream is unchanged.
+    """
+
+    __slots__ = ()
+
+    # ----------------------------------------------------------------------
+    def _loadString(self) -> None:
+        self._index = 0
+
+        if self.strdata.isascii():
+            self.data = self.strdata.encode("ascii")
+        else:
+            data = array("I")
+            assert data.itemsize == 4, data.itemsize  # noqa: PLR2004
+
+            # Lone surrogates are valid in a str and are preserved as code points, as they are by the
+            # default InputStream.
+            data.frombytes(
+                self.strdata.encode(
+                    "utf-32-le" if sys.byteorder == "little" else "utf-32-be",
+                    "surrogatepass",
+                ),
+            )
+
+            self.data = data
+
+        self._size = len(self.data)
@@ -0,0 +1,146 @@
+# ----------------------------------------------------------------------
+# |
+# |  CostScheduler.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-17 10:04:37
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2026
+# |  Distributed under the MIT License.
+# |
+# ----------------------------------------------------------------------
+"""Contains the CostScheduler object"""
+
+import heapq
+import itertools
+import threading
+
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+
+from dbrownell_Common.ContextlibEx import ExitStack
+from dbrownell_Common import ExecuteTasks
+
+
+# ----------------------------------------------------------------------
+class CostScheduler:
+    """Enqueues the tasks that are expected to take the longest first.
+
+    The executor processes tasks in the order in which they were enqueued, so tasks are held here until
+    a worker is available to process them; the most expensive task is enqueued at that time.
+    """
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        enqueue_func: ExecuteTasks.YieldQueueExecutorTypes.EnqueueFuncType,
+        num_workers: int,
+    ) -> None:
+        self._enqueue_func = enqueue_func
+        self._num_workers = num_workers
+
+        self._lock = threading.Lock()
+
+        self._pending: list[
+            tuple[
+                int,  # negative include height
+                int,  # negative size
+                int,  # sequence number; preserves the order of tasks with the same cost
+                str,  # description
+                ExecuteTasks.YieldQueueExecutorTypes.PrepareFuncType,
+            ]
+        ] = []
+
+        self._sequence = itertools.count()
+        self._num_enqueued = 0
+        self._is_held = False
+
+    # ----------------------------------------------------------------------
+    def Add(
+        self,
+        description: str,
+        prepare_func: ExecuteTasks.YieldQueueExecutorTypes.PrepareFuncType,
+        *,
+        height: int,
+        size: int,
+    ) -> None:
+        with self._lock:
+            heapq.heappush(self._pending, (-height, -size, next(self._sequence), description, prepare_func))
+
+        self._EnqueueAvailable()
+
+    # ----------------------------------------------------------------------
+    @contextmanager
+    def Hold(self) -> Iterator[None]:
+        """Tasks added within this context aren't enqueued until all of them have been added."""
+
+        with self._lock:
+            assert not self._is_held
+            self._is_held = True
+
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._is_held = False
+
+            self._EnqueueAvailable()
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Private Methods
+    # |
+    # ----------------------------------------------------------------------
+    def _EnqueueAvailable(self) -> None:
+        while True:
+            with self._lock:
+                if self._is_held or not self._pending or self._num_enqueued >= self._num_workers:
+                    return
+
+                _, _, _, description, prepare_func = heapq.heappop(self._pending)
+                self._num_enqueued += 1
+
+            self._enqueue_func(description, self._CreatePrepareFunc(prepare_func))
+
+    # ----------------------------------------------------------------------
+    def _OnTaskComplete(self) -> None:
+        with self._lock:
+            assert self._num_enqueued > 0
+            self._num_enqueued -= 1
+
+        self._EnqueueAvailable()
+
+    # ----------------------------------------------------------------------
+    def _CreatePrepareFunc(
+        self,
+        prepare_func: ExecuteTasks.YieldQueueExecutorTypes.PrepareFuncType,
+    ) -> ExecuteTasks.YieldQueueExecutorTypes.PrepareFuncType:
+        # ----------------------------------------------------------------------
+        def Prepare(
+            on_simple_status_func: Callable[[str], None],
+        ) -> tuple[int, ExecuteTasks.YieldQueueExecutorTypes.ExecuteFuncType]:
+            try:
+                prepare_result = prepare_func(on_simple_status_func)
+            except Exception:
+                self._OnTaskComplete()
+                raise
+
+            assert isinstance(prepare_result, tuple), prepare_result
+            num_steps, execute_func = prepare_result
+
+            # ----------------------------------------------------------------------
+            def Execute(
+                status: ExecuteTasks.Status,
+            ) -> str | None:
+                with ExitStack(self._OnTaskComplete):
+                    return execute_func(status)
+
+            # ----------------------------------------------------------------------
+
+            return num_steps, Execute
+
+        # ----------------------------------------------------------------------
+
+        return Prepare
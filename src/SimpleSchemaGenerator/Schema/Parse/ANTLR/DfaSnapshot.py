@@ -0,0 +1,412 @@
+# ----------------------------------------------------------------------
+# |
+# |  DfaSnapshot.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-16 10:41:53
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2026
+# |  Distributed under the MIT License.
+# |
+# ----------------------------------------------------------------------
+"""Saves and loads the ANTLR prediction DFA state so that new processes don't start cold.
+
+ANTLR builds the DFAs used during prediction lazily and stores them at the class level of the lexer
+and parser; this work is lost when the process exits. A snapshot captures the DFA states that have
+been created so far and can be loaded by a later process before it parses any content.
+
+Worker processes parse a subset of the content and build their own DFA states; each worker saves
+its states when it exits and the process that created the workers merges them (see
+`InitializeWorker` and `MergeWorkerSnapshots`).
+
+Snapshots must be saved (and merged) when no content is being parsed.
+"""
+
+import atexit
+import glob
+import importlib.metadata
+import io
+import os
+import pickle
+import sys
+import uuid
+
+from contextlib import suppress
+from pathlib import Path
+from typing import Any
+
+from antlr4.atn.ATNConfigSet import ATNConfigSet
+from antlr4.atn.ATNState import ATNState
+from antlr4.atn.LexerActionExecutor import LexerActionExecutor
+from antlr4.atn.SemanticContext import SemanticContext
+from antlr4.dfa.DFA import DFA
+from antlr4.dfa.DFAState import DFAState
+from antlr4.PredictionContext import PredictionContext
+
+from .Parse import GetGrammarVersion, SimpleSchemaLexer, SimpleSchemaParser
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Public Functions
+# |
+# ----------------------------------------------------------------------
+def SaveDfaSnapshot(
+    filename: Path,
+) -> None:
+    """Save the current lexer and parser DFA states to the file."""
+
+    buffer = io.BytesIO()
+
+    _Pickler(buffer).dump(
+        {
+            "version": _GetSnapshotVersion(),
+            "recognizers": {
+                recognizer.__name__: [_FlattenDfa(dfa) for dfa in recognizer.decisionsToDFA]
+                for recognizer in _RECOGNIZERS
+            },
+        },
+    )
+
+    filename.parent.mkdir(parents=True, exist_ok=True)
+
+    # Write to a temporary file and move it into place so that concurrent readers never see a partially
+    # written snapshot.
+    temp_filename = filename.parent / f"{filename.name}.{uuid.uuid4().hex}.tmp"
+
+    with temp_filename.open("wb") as f:
+        f.write(buffer.getvalue())
+
+    temp_filename.replace(filename)
+
+
+# ----------------------------------------------------------------------
+def LoadDfaSnapshot(
+    filename: Path,
+) -> bool:
+    """Load DFA states from a snapshot, returning False if the snapshot doesn't exist or can't be used.
+
+    Only DFAs that don't have any states are populated; states created by this process are never
+    replaced.
+    """
+
+    return _LoadDfaSnapshot(filename, merge=False)
+
+
+# ----------------------------------------------------------------------
+def MergeDfaSnapshot(
+    filename: Path,
+) -> bool:
+    """Merge DFA states from a snapshot, returning False if the snapshot doesn't exist or can't be used.
+
+    A DFA is replaced by the DFA in the snapshot when the snapshot's DFA has more states; this combines
+    the states created by different processes for each decision.
+    """
+
+    return _LoadDfaSnapshot(filename, merge=True)
+
+
+# ----------------------------------------------------------------------
+def InitializeWorker(
+    filename: Path,
+    pool_id: str,
+) -> None:
+    """Load the snapshot in a worker process and save the worker's DFA states when it exits.
+
+    This function is used as the initializer of a ProcessPoolExecutor; call `MergeWorkerSnapshots`
+    with the same `pool_id` once the pool has been shut down.
+    """
+
+    LoadDfaSnapshot(filename)
+
+    atexit.register(
+        _SaveWorkerSnapshot,
+        filename.parent / f"{filename.name}.{pool_id}.{os.getpid()}.worker",
+    )
+
+
+# ----------------------------------------------------------------------
+def MergeWorkerSnapshots(
+    filename: Path,
+    pool_id: str,
+) -> None:
+    """Merge the DFA states saved by worker processes (see `InitializeWorker`) into this process."""
+
+    for worker_filename in filename.parent.glob(f"{glob.escape(filename.name)}.{pool_id}.*.worker"):
+        MergeDfaSnapshot(worker_filename)
+        worker_filename.unlink(missing_ok=True)
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Private Types
+# |
+# ----------------------------------------------------------------------
+_RECOGNIZERS: list[Any] = [SimpleSchemaLexer, SimpleSchemaParser]
+
+# Increment this value when the snapshot format changes
+_SNAPSHOT_FORMAT_VERSION = 1
+
+
+# ----------------------------------------------------------------------
+class _Pickler(pickle.Pickler):
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        file: io.BytesIO,
+    ) -> None:
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    # ----------------------------------------------------------------------
+    def persistent_id(self, obj: object) -> tuple[str | int, ...] | None:
+        # The ATN is recreated by the generated code when it is imported, so ATN states (and the
+        # singletons that the runtime compares by identity) are stored by reference.
+        if isinstance(obj, ATNState):
+            if obj.atn is SimpleSchemaLexer.atn:
+                return ("lexer_state", obj.stateNumber)
+            if obj.atn is SimpleSchemaParser.atn:
+                return ("parser_state", obj.stateNumber)
+
+            raise pickle.PicklingError(f"Unexpected ATN state: {obj}")  # noqa: EM102, TRY003
+
+        if obj is PredictionContext.EMPTY:
+            return ("empty_prediction_context",)
+        if obj is SemanticContext.NONE:
+            return ("none_semantic_context",)
+
+        return None
+
+    # ----------------------------------------------------------------------
+    def reducer_override(self, obj: object) -> object:
+        # The executor's hash is based on a string, and string hashes differ from process to
+        # process; create a new executor when loading so that the hash is recalculated.
+        if isinstance(obj, LexerActionExecutor):
+            return LexerActionExecutor, (obj.lexerActions,)
+
+        return NotImplemented
+
+
+# ----------------------------------------------------------------------
+class _Unpickler(pickle.Unpickler):
+    # ----------------------------------------------------------------------
+    def persistent_load(self, pid: tuple[str | int, ...]) -> object:
+        if pid[0] == "lexer_state":
+            return SimpleSchemaLexer.atn.states[pid[1]]
+        if pid[0] == "parser_state":
+            return SimpleSchemaParser.atn.states[pid[1]]
+        if pid[0] == "empty_prediction_context":
+            return PredictionContext.EMPTY
+        if pid[0] == "none_semantic_context":
+            return SemanticContext.NONE
+
+        raise pickle.UnpicklingError(f"Unexpected persistent id: {pid}")  # noqa: EM102, TRY003
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Private Functions
+# |
+# ----------------------------------------------------------------------
+def _GetSnapshotVersion() -> str:
+    # Include the python version, as the hash algorithm for tuples may change between versions
+    return "{}-{}-{}-{}".format(
+        _SNAPSHOT_FORMAT_VERSION,
+        sys.version,
+        importlib.metadata.version("antlr4-python3-runtime"),
+        GetGrammarVersion(),
+    )
+
+
+# ----------------------------------------------------------------------
+def _LoadDfaSnapshot(
+    filename: Path,
+    *,
+    merge: bool,
+) -> bool:
+    try:
+        with filename.open("rb") as f:
+            content = f.read()
+    except OSError:
+        return False
+
+    try:
+        snapshot = _Unpickler(io.BytesIO(content)).load()
+
+        if not isinstance(snapshot, dict) or snapshot.get("version") != _GetSnapshotVersion():
+            return False
+
+        # Restore all of the DFAs before modifying any of them
+        restored_dfas: list[tuple[DFA, DFAState | None, dict[DFAState, DFAState]]] = []
+
+        for recognizer in _RECOGNIZERS:
+            for dfa, flattened_dfa in zip(
+                recognizer.decisionsToDFA,
+                snapshot["recognizers"][recognizer.__name__],
+                strict=True,
+            ):
+                restored_dfas.append(
+                    (
+                        dfa,
+                        *_RestoreDfa(
+                            flattened_dfa,
+                            # Lexer configuration hashes are based on strings, and string hashes
+                            # differ from process to process.
+                            reset_hashes=recognizer is SimpleSchemaLexer,
+                        ),
+                    ),
+                )
+
+    except Exception:
+        # The snapshot is corrupt or was written by an incompatible version of the code
+        return False
+
+    for dfa, s0, states in restored_dfas:
+        # When merging, keep the DFA with the most states for each decision
+        if (len(states) > len(dfa.states)) if merge else _IsEmpty(dfa):
+            dfa._states = states  # noqa: SLF001
+            dfa.s0 = s0
+
+    return True
+
+
+# ----------------------------------------------------------------------
+def _SaveWorkerSnapshot(
+    filename: Path,
+) -> None:
+    # The worker is exiting; the DFA states are lost if they can't be saved, but the content has
+    # already been parsed.
+    with suppress(OSError):
+        SaveDfaSnapshot(filename)
+
+
+# ----------------------------------------------------------------------
+def _IsEmpty(
+    dfa: DFA,
+) -> bool:
+    if dfa.states:
+        return False
+
+    if dfa.precedenceDfa:
+        return not any(dfa.s0.edges)
+
+    return dfa.s0 is None
+
+
+# ----------------------------------------------------------------------
+def _FlattenDfa(
+    dfa: DFA,
+) -> tuple[int | None, list[tuple[Any, ...]]]:
+    # States reference each other through their edges; pickling these references directly would
+    # recurse once for every state in a chain, so edges are stored as indexes into a list of states.
+    # Most edges are empty, so only the populated edges are stored.
+    states: list[DFAState] = []
+    state_indexes: dict[int, int] = {}
+
+    # ----------------------------------------------------------------------
+    def GetIndex(
+        state: DFAState | None,
+    ) -> int | None:
+        if state is None:
+            return None
+
+        index = state_indexes.get(id(state))
+
+        if index is None:
+            index = len(states)
+
+            states.append(state)
+            state_indexes[id(state)] = index
+
+        return index
+
+    # ----------------------------------------------------------------------
+
+    s0_index = GetIndex(dfa.s0)
+
+    for state in dfa.states:
+        GetIndex(state)
+
+    dfa_state_ids = {id(state) for state in dfa.states}
+
+    flattened_states: list[tuple[Any, ...]] = []
+
+    index = 0
+    while index < len(states):
+        state = states[index]
+        index += 1
+
+        flattened_states.append(
+            (
+                state.stateNumber,
+                state.configs,
+                None
+                if state.edges is None
+                else (
+                    len(state.edges),
+                    [(symbol, GetIndex(edge)) for symbol, edge in enumerate(state.edges) if edge is not None],
+                ),
+                state.isAcceptState,
+                state.prediction,
+                state.lexerActionExecutor,
+                state.requiresFullContext,
+                state.predicates,
+                id(state) in dfa_state_ids,
+            ),
+        )
+
+    return s0_index, flattened_states
+
+
+# ----------------------------------------------------------------------
+def _RestoreDfa(
+    flattened_dfa: tuple[int | None, list[tuple[Any, ...]]],
+    *,
+    reset_hashes: bool,
+) -> tuple[DFAState | None, dict[DFAState, DFAState]]:
+    s0_index, flattened_states = flattened_dfa
+
+    states: list[DFAState] = []
+
+    for (
+        state_number,
+        configs,
+        _,
+        is_accept_state,
+        prediction,
+        lexer_action_executor,
+        requires_full_context,
+        predicates,
+        _,
+    ) in flattened_states:
+        assert isinstance(configs, ATNConfigSet)
+
+        if reset_hashes:
+            configs.cachedHashCode = -1
+
+        state = DFAState(state_number, configs)
+
+        state.isAcceptState = is_accept_state
+        state.prediction = prediction
+        state.lexerActionExecutor = lexer_action_executor
+        state.requiresFullContext = requires_full_context
+        state.predicates = predicates
+
+        states.append(state)
+
+    dfa_states: dict[DFAState, DFAState] = {}
+
+    for state, (_, _, edges, *_, is_dfa_state) in zip(states, flattened_states, strict=True):
+        if edges is not None:
+            num_edges, populated_edges = edges
+
+            state.edges = [None] * num_edges
+
+            for symbol, edge_index in populated_edges:
+                state.edges[symbol] = states[edge_index]
+
+        if is_dfa_state:
+            dfa_states[state] = state
+
+    return None if s0_index is None else states[s0_index], dfa_states
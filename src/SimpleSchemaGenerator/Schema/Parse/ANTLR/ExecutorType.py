@@ -0,0 +1,29 @@
+# ----------------------------------------------------------------------
+# |
+# |  ExecutorType.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-16 23:59:59
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2026
+# |  Distributed under the MIT License.
+# |
+# ----------------------------------------------------------------------
+"""Contains the ExecutorType object"""
+
+from enum import StrEnum
+
+
+# ----------------------------------------------------------------------
+class ExecutorType(StrEnum):
+    """Specifies where files are lexed, parsed, and visited"""
+
+    # Files are parsed by worker threads in the current process; this has the lowest overhead, but
+    # the work is serialized by the GIL.
+    Thread = "thread"
+
+    # Files are parsed in worker processes and the resulting trees are sent back to the current
+    # process; this has higher overhead, but scales with the number of cores.
+    Process = "process"
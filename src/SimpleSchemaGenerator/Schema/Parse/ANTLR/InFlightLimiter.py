@@ -0,0 +1,126 @@
+# ----------------------------------------------------------------------
+# |
+# |  InFlightLimiter.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-17 10:02:14
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2026
+# |  Distributed under the MIT License.
+# |
+# ----------------------------------------------------------------------
+"""Contains the InFlightLimiter object"""
+
+import threading
+
+
+# ----------------------------------------------------------------------
+class InFlightLimiter:
+    """Limits the number of files (and the size of their content) that are being processed at once.
+
+    A file is in flight from the time that its content is loaded until its result has been handed
+    off. A file is always allowed when nothing else is in flight, even if its content exceeds the
+    size limit. When the size of the content is known before it is loaded, the bytes are acquired
+    first and updated once the content has been loaded (see `UpdateBytes`).
+    """
+
+    # ----------------------------------------------------------------------
+    @classmethod
+    def Create(
+        cls,
+        max_in_flight: int | None,
+        max_bytes_in_flight: int | None,
+    ) -> "InFlightLimiter | None":
+        if max_in_flight is None and max_bytes_in_flight is None:
+            return None
+
+        return cls(max_in_flight, max_bytes_in_flight)
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        max_in_flight: int | None,
+        max_bytes_in_flight: int | None,
+    ) -> None:
+        self.max_in_flight = max_in_flight
+        self.max_bytes_in_flight = max_bytes_in_flight
+
+        self._condition = threading.Condition()
+
+        self._num_in_flight = 0
+        self._num_bytes_in_flight = 0
+        self._is_cancelled = False
+
+    # ----------------------------------------------------------------------
+    def AcquireSlot(self) -> None:
+        """Wait until another file can be loaded; returns immediately once cancelled."""
+
+        with self._condition:
+            self._condition.wait_for(
+                lambda: (
+                    self._is_cancelled
+                    or self.max_in_flight is None
+                    or self._num_in_flight < self.max_in_flight
+                ),
+            )
+
+            self._num_in_flight += 1
+
+    # ----------------------------------------------------------------------
+    def AcquireBytes(
+        self,
+        num_bytes: int,
+    ) -> None:
+        """Wait until content of this size can be processed; returns immediately once cancelled."""
+
+        with self._condition:
+            self._condition.wait_for(
+                lambda: (
+                    self._is_cancelled
+                    or self.max_bytes_in_flight is None
+                    or self._num_bytes_in_flight == 0
+                    or self._num_bytes_in_flight + num_bytes <= self.max_bytes_in_flight
+                ),
+            )
+
+            self._num_bytes_in_flight += num_bytes
+
+    # ----------------------------------------------------------------------
+    def UpdateBytes(
+        self,
+        num_acquired_bytes: int,
+        num_bytes: int,
+    ) -> None:
+        """Replace bytes acquired for content before it was loaded with its actual size.
+
+        This doesn't wait, as the content has already been loaded.
+        """
+
+        with self._condition:
+            assert self._num_bytes_in_flight >= num_acquired_bytes
+
+            self._num_bytes_in_flight += num_bytes - num_acquired_bytes
+
+            self._condition.notify_all()
+
+    # ----------------------------------------------------------------------
+    def Release(
+        self,
+        num_bytes: int,
+    ) -> None:
+        with self._condition:
+            assert self._num_in_flight > 0
+            assert self._num_bytes_in_flight >= num_bytes
+
+            self._num_in_flight -= 1
+            self._num_bytes_in_flight -= num_bytes
+
+            self._condition.notify_all()
+
+    # ----------------------------------------------------------------------
+    def Cancel(self) -> None:
+        with self._condition:
+            self._is_cancelled = True
+            self._condition.notify_all()
@@ -13,22 +13,39 @@
 # ----------------------------------------------------------------------
 """Functionality that parses SimpleSchema files via ANTLR"""
 
+import asyncio
+import hashlib
 import itertools
+import multiprocessing
+import os
+import pickle
+import queue
+import re
 import sys
 import threading
-
-from collections.abc import Callable
-from functools import cached_property
+import time
+import uuid
+
+from collections.abc import Awaitable, Callable, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager, nullcontext, suppress
+from dataclasses import dataclass, field, is_dataclass, replace
+from functools import cache, cached_property, lru_cache
 from pathlib import Path, PurePath
-from typing import Any, cast, Optional, Protocol
+from typing import Any, cast, Protocol, Self
 
 import antlr4  # type: ignore[import-untyped]
 
-from antlr4.error.ErrorListener import ConsoleErrorListener
+from antlr4.atn.PredictionMode import PredictionMode
+from antlr4.error.ErrorListener import ConsoleErrorListener, ErrorListener
+from antlr4.error.ErrorStrategy import DefaultErrorStrategy
+from antlr4.error.Errors import ParseCancellationException
 from dbrownell_Common.ContextlibEx import ExitStack
 from dbrownell_Common import ExecuteTasks
 from dbrownell_Common import PathEx
 from dbrownell_Common.Streams.DoneManager import DoneManager
+from dbrownell_Common.Types import override
 
 from .Grammar.Elements.Common.ParseIdentifier import ParseIdentifier
 from .Grammar.Elements.Statements.ParseItemStatement import ParseItemStatement
@@ -42,7 +59,19 @@ from .Grammar.Elements.Types.ParseIdentifierType import ParseIdentifierType
 from .Grammar.Elements.Types.ParseTupleType import ParseTupleType
 from .Grammar.Elements.Types.ParseType import ParseType
 from .Grammar.Elements.Types.ParseVariantType import ParseVariantType
+from .CompactInputStream import CompactInputStream
+from .CostScheduler import CostScheduler
+from .ExecutorType import ExecutorType
+from .InFlightLimiter import InFlightLimiter
+from .ParseCache import ParseCache
+from .ParseOptions import ParseOptions, ScheduleType, TokenizerType
+from .ParseStats import FileParseStats
+from .RegexTokenizer import RegexTokenizer
+from .SessionCache import SessionCache
+from .StreamingTokenStream import StreamingTokenStream
+from .WorkspaceIndex import WorkspaceIndex
 from SimpleSchemaGenerator.Schema.Elements.Common.Cardinality import Cardinality
+from SimpleSchemaGenerator.Schema.Elements.Common.Element import Element
 from SimpleSchemaGenerator.Schema.Elements.Common.Metadata import Metadata, MetadataItem
 from SimpleSchemaGenerator.Schema.Elements.Common.TerminalElement import TerminalElement
 from SimpleSchemaGenerator.Schema.Elements.Expressions.BooleanExpression import BooleanExpression
@@ -59,7 +88,8 @@ from SimpleSchemaGenerator.Schema.Elements.Statements.ExtensionStatement import
 )
 from SimpleSchemaGenerator.Schema.Elements.Statements.RootStatement import RootStatement
 from SimpleSchemaGenerator.Schema.Elements.Statements.Statement import Statement
-from SimpleSchemaGenerator import Errors
+from SimpleSchemaGenerator.Schema.Visitors.ElementVisitor import ElementVisitorHelper, VisitResult
+from SimpleSchemaGenerator import __version__, Errors
 from SimpleSchemaGenerator.Common.Region import Location, Region
 
 sys.path.insert(0, str(PathEx.EnsureDir(Path(__file__).parent / "GeneratedCode")))
@@ -90,10 +120,40 @@ class AntlrError(Exception):
 
         super().__init__(f"{message} ({source} <{location}>)")
 
+        self.message = message
         self.source = source
         self.location = location
         self.ex = ex
 
+    # ----------------------------------------------------------------------
+    def __reduce__(self) -> tuple[type["AntlrError"], tuple[str, Path, int, int, None]]:
+        # The ANTLR exception references the recognizer and cannot be pickled
+        return self.__class__, (self.message, self.source, self.location.line, self.location.column, None)
+
+
+# ----------------------------------------------------------------------
+class ParseRecoveryError(Exception):
+    """Exception raised for a file that contains errors when parsing recovers from errors (see `max_errors`)"""
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        errors: list[Exception],
+        root: RootStatement,
+    ) -> None:
+        assert errors
+
+        super().__init__("\n".join(str(error) for error in errors))
+
+        self.errors = errors
+
+        # The statements that were parsed without errors
+        self.root = root
+
+    # ----------------------------------------------------------------------
+    def __reduce__(self) -> tuple[type["ParseRecoveryError"], tuple[list[Exception], RootStatement]]:
+        return self.__class__, (self.errors, self.root)
+
 
 # ----------------------------------------------------------------------
 DEFAULT_FILE_EXTENSIONS: list[str] = [
@@ -101,12 +161,354 @@ DEFAULT_FILE_EXTENSIONS: list[str] = [
 ]
 
 
+# ----------------------------------------------------------------------
+class ParseSession:
+    """Parses workspaces and incrementally reparses them as files change.
+
+    Include statements only depend on the existence of the included files (and not their content),
+    so a change to a file only requires that file to be reparsed; files that include it are
+    reparsed only when it is removed or created. Files are also reparsed when a file is created that
+    takes precedence over one that they include (for example, a file with the same name in the
+    directory of the including file). All other results are reused.
+
+    The session keeps its resources warm between calls: worker processes (when using
+    `ExecutorType.Process`) are started once and reused until `Close` is called, the workspace index
+    is refreshed rather than recreated (only directories that have changed are listed again), and the
+    results of files whose content hasn't changed are reused by subsequent calls to `Parse`.
+
+    Reused results are not copied: a file whose result is reused is returned as the same `RootStatement`
+    instance by every call until it is reparsed. Elements are frozen dataclasses, and callers must not
+    modify the results (including the lists they contain), as the changes would be visible in the
+    results returned by later calls. The dictionaries returned by `Parse` and `Update` are not shared.
+    """
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        file_extensions: list[str] | None = None,
+        *,
+        options: ParseOptions | None = None,
+    ) -> None:
+        self.file_extensions = file_extensions or DEFAULT_FILE_EXTENSIONS
+        self.options = options or ParseOptions()
+
+        self._workspace_names: list[Path] = []
+
+        # The files explicitly provided to `Parse`
+        self._content_funcs: dict[tuple[Path, PurePath], Callable[[], str]] = {}
+
+        self._results: dict[Path, dict[PurePath, None | Exception | RootStatement]] = {}
+
+        # Files included by each parsed file
+        self._includes: dict[tuple[Path, PurePath], set[tuple[Path, PurePath]]] = {}
+        self._includes_lock = threading.Lock()
+
+        # Paths that were checked while resolving the includes of each parsed file but didn't exist;
+        # an include may resolve to a different file when one of these paths is created.
+        self._missing_paths: dict[tuple[Path, PurePath], set[Path]] = {}
+
+        self._process_pool: ProcessPoolExecutor | None = None
+        self._workspace_index: WorkspaceIndex | None = None
+        self._session_cache = SessionCache(self.options.cache)
+
+    # ----------------------------------------------------------------------
+    def __enter__(self) -> Self:
+        return self
+
+    # ----------------------------------------------------------------------
+    def __exit__(self, *args) -> None:
+        self.Close()
+
+    # ----------------------------------------------------------------------
+    def Close(self) -> None:
+        """Shut down the worker processes (if any); they are started again if the session continues to be used."""
+
+        if self._process_pool is not None:
+            self._process_pool.shutdown(cancel_futures=True)
+            self._process_pool = None
+
+    # ----------------------------------------------------------------------
+    def Parse(
+        self,
+        dm: DoneManager,
+        workspaces: dict[
+            Path,  # workspace_root
+            dict[
+                PurePath,  # relative_path
+                Callable[[], str],  # get content
+            ],
+        ],
+        *,
+        raise_if_single_exception: bool = True,
+        cancel_event: threading.Event | None = None,
+    ) -> dict[
+        Path,  # workspace root
+        dict[
+            PurePath,  # relative path
+            Exception | RootStatement,
+        ],
+    ]:
+        """Parse all of the files in the workspaces, replacing any previous state.
+
+        Files that aren't parsed because parsing was cancelled (or stopped early with `fail_fast`) are
+        not included in the results; they are parsed by the next call to `Update`.
+        """
+
+        workspace_names = _ResolveWorkspaces(workspaces)
+
+        if workspace_names != self._workspace_names:
+            self._workspace_index = None
+
+        self._workspace_names = workspace_names
+
+        self._content_funcs = {
+            (workspace_root, relative_path): content_func
+            for workspace_root, sources in workspaces.items()
+            for relative_path, content_func in sources.items()
+        }
+
+        self._results = {
+            workspace_root: dict.fromkeys(sources) for workspace_root, sources in workspaces.items()
+        }
+
+        # The includes found by the previous parse are used to estimate the height of the include chain below each file
+        include_edges = self._includes
+        self._includes = {}
+        self._missing_paths = {}
+
+        return self._Execute(
+            dm,
+            list(self._content_funcs),
+            raise_if_single_exception=raise_if_single_exception,
+            cancel_event=cancel_event,
+            include_edges=include_edges,
+        )
+
+    # ----------------------------------------------------------------------
+    def Update(  # noqa: C901
+        self,
+        dm: DoneManager,
+        changed_filenames: Iterable[Path],
+        *,
+        raise_if_single_exception: bool = True,
+        cancel_event: threading.Event | None = None,
+    ) -> dict[
+        Path,  # workspace root
+        dict[
+            PurePath,  # relative path
+            Exception | RootStatement,
+        ],
+    ]:
+        """Reparse the files that have been modified, created, or removed since the last call to `Parse` or `Update`."""
+
+        to_parse: set[tuple[Path, PurePath]] = set()
+        new_paths: set[Path] = set()
+
+        for changed_filename in changed_filenames:
+            fullpath = changed_filename.resolve()
+
+            key = self._GetKey(fullpath)
+            if key is None:
+                continue
+
+            workspace_root, relative_path = key
+
+            if relative_path not in self._results[workspace_root]:
+                # The file may be within directories that were created along with it
+                new_paths.add(fullpath)
+                new_paths.update(fullpath.parents[: len(relative_path.parts) - 1])
+
+                continue
+
+            if key in self._content_funcs or (workspace_root / relative_path).is_file():
+                to_parse.add(key)
+                continue
+
+            # The included file was removed; the files that include it must be reparsed so that
+            # the error is reported.
+            del self._results[workspace_root][relative_path]
+            self._includes.pop(key, None)
+            self._missing_paths.pop(key, None)
+
+            for includer, includes in self._includes.items():
+                if key in includes:
+                    to_parse.add(includer)
+
+        if new_paths:
+            # A new file may satisfy an include statement that previously failed
+            for workspace_root, workspace_results in self._results.items():
+                for relative_path, result in workspace_results.items():
+                    if isinstance(result, Exception):
+                        to_parse.add((workspace_root, relative_path))
+
+            # A new file may take precedence over the file that an include statement resolved to
+            for includer, missing_paths in self._missing_paths.items():
+                if not missing_paths.isdisjoint(new_paths):
+                    to_parse.add(includer)
+
+        # Files that weren't parsed by a previous call that was cancelled
+        for workspace_root, workspace_results in self._results.items():
+            for relative_path, result in workspace_results.items():
+                if result is None:
+                    to_parse.add((workspace_root, relative_path))
+
+        # The includes found by the previous parse are used to estimate the height of the include chain below each file
+        include_edges = dict(self._includes)
+
+        for workspace_root, relative_path in to_parse:
+            self._results[workspace_root][relative_path] = None
+            self._includes.pop((workspace_root, relative_path), None)
+            self._missing_paths.pop((workspace_root, relative_path), None)
+
+        return self._Execute(
+            dm,
+            sorted(to_parse),
+            raise_if_single_exception=raise_if_single_exception,
+            cancel_event=cancel_event,
+            include_edges=include_edges,
+        )
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Private Methods
+    # |
+    # ----------------------------------------------------------------------
+    def _GetKey(
+        self,
+        filename: Path,
+    ) -> tuple[Path, PurePath] | None:
+        for workspace_name in self._workspace_names:
+            if PathEx.IsDescendant(filename, workspace_name):
+                relative_path = PathEx.CreateRelativePath(workspace_name, filename)
+                assert relative_path is not None
+
+                return workspace_name, relative_path
+
+        return None
+
+    # ----------------------------------------------------------------------
+    def _Execute(
+        self,
+        dm: DoneManager,
+        keys: list[tuple[Path, PurePath]],
+        *,
+        raise_if_single_exception: bool,
+        cancel_event: threading.Event | None,
+        include_edges: dict[tuple[Path, PurePath], set[tuple[Path, PurePath]]],
+    ) -> dict[Path, dict[PurePath, Exception | RootStatement]]:
+        tasks: list[tuple[Path, PurePath, Callable[[], str], bool]] = []
+
+        for workspace_root, relative_path in keys:
+            content_func = self._content_funcs.get((workspace_root, relative_path))
+
+            if content_func is None:
+                filename = workspace_root / relative_path
+                tasks.append(
+                    (workspace_root, relative_path, lambda filename=filename: _ReadFile(filename), True)
+                )
+            else:
+                tasks.append((workspace_root, relative_path, content_func, False))
+
+        # ----------------------------------------------------------------------
+        def OnFileComplete(
+            workspace_root: Path,
+            relative_path: PurePath,
+            result: Exception | RootStatement,  # noqa: ARG001
+            includes: list[tuple[Path, PurePath, Path]],
+            missing_paths: set[Path],
+        ) -> None:
+            with self._includes_lock:
+                self._includes[(workspace_root, relative_path)] = {
+                    (include_workspace_root, include_relative_path)
+                    for include_workspace_root, include_relative_path, _ in includes
+                }
+
+                if missing_paths:
+                    self._missing_paths[(workspace_root, relative_path)] = missing_paths
+
+        # ----------------------------------------------------------------------
+
+        if tasks:
+            if self.options.executor == ExecutorType.Process and self._process_pool is None:
+                self._process_pool = _CreateProcessPool(self.options.num_workers, self.options.dfa_snapshot)
+
+            if self._workspace_index is None or self._workspace_index.file_extensions != self.file_extensions:
+                self._workspace_index = WorkspaceIndex(self._workspace_names, self.file_extensions)
+            else:
+                self._workspace_index.Refresh()
+
+            _ExecuteParse(
+                dm,
+                self._results,
+                tasks,
+                self.file_extensions,
+                self._workspace_names,
+                self.options,
+                in_flight_limiter=InFlightLimiter.Create(
+                    self.options.max_in_flight,
+                    self.options.max_bytes_in_flight,
+                ),
+                on_file_complete_func=OnFileComplete,
+                cancel_event=cancel_event,
+                shared_process_pool=self._process_pool,
+                workspace_index=self._workspace_index,
+                include_edges=include_edges,
+                session_cache=self._session_cache,
+            )
+
+            # A pool whose worker process terminated abruptly can't be used again
+            if any(
+                isinstance(result, BrokenProcessPool)
+                for workspace_results in self._results.values()
+                for result in workspace_results.values()
+            ):
+                self.Close()
+
+        self._RemoveUnreachableFiles()
+        self._session_cache.Prune(self._results)
+
+        results = _FinalizeResults(
+            dm,
+            self._results,
+            raise_if_single_exception=raise_if_single_exception,
+            allow_unparsed=self.options.fail_fast or cancel_event is not None,
+        )
+
+        # Return a copy so that the caller's results aren't modified by subsequent updates
+        return {
+            workspace_root: dict(workspace_results) for workspace_root, workspace_results in results.items()
+        }
+
+    # ----------------------------------------------------------------------
+    def _RemoveUnreachableFiles(self) -> None:
+        reachable: set[tuple[Path, PurePath]] = set()
+        pending = list(self._content_funcs)
+
+        while pending:
+            key = pending.pop()
+
+            if key in reachable:
+                continue
+
+            reachable.add(key)
+            pending += self._includes.get(key, ())
+
+        for workspace_root, workspace_results in self._results.items():
+            for relative_path in list(workspace_results):
+                key = (workspace_root, relative_path)
+
+                if key not in reachable:
+                    del workspace_results[relative_path]
+                    self._includes.pop(key, None)
+                    self._missing_paths.pop(key, None)
+
+
 # ----------------------------------------------------------------------
 # |
 # |  Public Functions
 # |
 # ----------------------------------------------------------------------
-def Parse(  # noqa: C901, PLR0915
+def Parse(
     dm: DoneManager,
     workspaces: dict[
         Path,  # workspace_root
@@ -117,10 +519,12 @@ def Parse(  # noqa: C901, PLR0915
     ],
     file_extensions: list[str] | None = None,
     *,
-    single_threaded: bool = False,
-    quiet: bool = False,
+    single_threaded: bool | None = None,
+    quiet: bool | None = None,
     raise_if_single_exception: bool = True,
-    tab_width: int = 4,
+    tab_width: int | None = None,
+    options: ParseOptions | None = None,
+    cancel_event: threading.Event | None = None,
 ) -> dict[
     Path,  # workspace root
     dict[
@@ -128,24 +532,21 @@ def Parse(  # noqa: C901, PLR0915
         Exception | RootStatement,
     ],
 ]:
-    if file_extensions is None:
-        file_extensions = DEFAULT_FILE_EXTENSIONS
+    """Parse the workspaces and any files that they include (see `ParseOptions` for the options that control how they are parsed).
 
-    # Ensure that the workspaces paths are fully resolved
-    for workspace_name, workspace_value in list(workspaces.items()):
-        resolved_workspace_name = workspace_name.resolve()
+    `single_threaded`, `quiet`, and `tab_width` override the corresponding values in `options` when
+    they are provided.
 
-        if resolved_workspace_name != workspace_name:
-            workspaces[resolved_workspace_name] = workspace_value
-            del workspaces[workspace_name]
+    When `cancel_event` is set, parsing stops; files that haven't started parsing are skipped and files
+    being parsed are interrupted. Files that aren't parsed are not included in the results.
+    """
 
-    workspace_names: list[Path] = list(workspaces.keys())
+    options = _ResolveOptions(options, single_threaded=single_threaded, quiet=quiet, tab_width=tab_width)
 
-    # Sort the names so we search from the longest path to the shortest path
-    workspace_names.sort(
-        key=lambda value: len(str(value)),
-        reverse=True,
-    )
+    if file_extensions is None:
+        file_extensions = DEFAULT_FILE_EXTENSIONS
+
+    workspace_names = _ResolveWorkspaces(workspaces)
 
     # Prepare the results
     results: dict[
@@ -155,7 +556,6 @@ def Parse(  # noqa: C901, PLR0915
             None | Exception | RootStatement,
         ],
     ] = {}
-    results_lock = threading.Lock()
 
     for workspace_root, sources in workspaces.items():
         these_results: dict[PurePath, None | Exception | RootStatement] = {}
@@ -165,164 +565,577 @@ def Parse(  # noqa: C901, PLR0915
 
         results[workspace_root] = these_results
 
-    # Enqueue the tasks
-    with ExecuteTasks.YieldQueueExecutor(
+    _ExecuteParse(
         dm,
-        "Parsing...",
-        quiet=quiet,
-        max_num_threads=1 if single_threaded else None,
-    ) as enqueue_func:
-        # This variable is used in PrepareTask, but cannot be created until PrepareTask
-        # has been defined.
-        create_include_statement_func: _CreateIncludeStatementFuncType | None = None
+        results,
+        [
+            (workspace_root, relative_path, content_func, False)
+            for workspace_root, sources in workspaces.items()
+            for relative_path, content_func in sources.items()
+        ],
+        file_extensions,
+        workspace_names,
+        options,
+        in_flight_limiter=InFlightLimiter.Create(options.max_in_flight, options.max_bytes_in_flight),
+        cancel_event=cancel_event,
+    )
 
-        # ----------------------------------------------------------------------
-        def PrepareTask(
-            workspace_root: Path,
-            relative_path: PurePath,
-            content_func: Callable[[], str],
-            *,
-            is_included_file: bool,
-        ) -> tuple[int, ExecuteTasks.YieldQueueExecutorTypes.ExecuteFuncType]:
-            content = content_func()
+    return _FinalizeResults(
+        dm,
+        results,
+        raise_if_single_exception=raise_if_single_exception,
+        allow_unparsed=options.fail_fast or cancel_event is not None,
+    )
 
-            # ----------------------------------------------------------------------
-            def Execute(
-                status: ExecuteTasks.Status,
-            ) -> str | None:
-                result: None | Exception | RootStatement = None
 
-                # ----------------------------------------------------------------------
-                def OnExit() -> None:
-                    assert result is not None
-                    assert results[workspace_root][relative_path] is None
-                    results[workspace_root][relative_path] = result
+# ----------------------------------------------------------------------
+def ParseIter(
+    dm: DoneManager,
+    workspaces: dict[
+        Path,  # workspace_root
+        dict[
+            PurePath,  # relative_path
+            Callable[[], str],  # get content
+        ],
+    ],
+    file_extensions: list[str] | None = None,
+    *,
+    single_threaded: bool | None = None,
+    quiet: bool | None = None,
+    tab_width: int | None = None,
+    options: ParseOptions | None = None,
+) -> Iterator[
+    tuple[
+        Path,  # workspace root
+        PurePath,  # relative path
+        Exception | RootStatement,
+    ]
+]:
+    """Parse the workspaces, yielding results as soon as each file has been parsed.
 
-                # ----------------------------------------------------------------------
+    Results are not retained once they have been yielded. Files that have not started parsing when the
+    iterator is closed (or, when `fail_fast` is True, when a file fails to parse) are not parsed.
 
-                with ExitStack(OnExit):
-                    try:
-                        fullpath = workspace_root / relative_path
+    When `max_in_flight` or `max_bytes_in_flight` is provided, results that haven't been consumed
+    count against those limits, so parsing pauses when the results aren't consumed quickly enough.
 
-                        # Parse the object
-                        antlr_stream = antlr4.InputStream(content)
+    `single_threaded`, `quiet`, and `tab_width` override the corresponding values in `options` (see `Parse`).
+    """
 
-                        lexer = SimpleSchemaLexer(antlr_stream)
+    options = _ResolveOptions(options, single_threaded=single_threaded, quiet=quiet, tab_width=tab_width)
 
-                        # Initialize instance variables that we have explicitly added to the ANTLR
-                        # grammar file
-                        lexer.CustomInitialization()
+    if file_extensions is None:
+        file_extensions = DEFAULT_FILE_EXTENSIONS
 
-                        tokens = antlr4.CommonTokenStream(lexer)
+    workspace_names = _ResolveWorkspaces(workspaces)
 
-                        tokens.fill()
+    # Entries remain None, as they are only used to determine which files have been encountered
+    results: dict[Path, dict[PurePath, None | Exception | RootStatement]] = {
+        workspace_root: dict.fromkeys(sources) for workspace_root, sources in workspaces.items()
+    }
 
-                        parser = SimpleSchemaParser(tokens)
+    in_flight_limiter = InFlightLimiter.Create(options.max_in_flight, options.max_bytes_in_flight)
 
-                        parser.removeErrorListener(ConsoleErrorListener.INSTANCE)
-                        parser.addErrorListener(_ErrorListener(fullpath))
+    # Files remain in flight until their results have been added to the queue, so the queue is
+    # bounded when in-flight work is limited.
+    result_queue: queue.Queue[tuple[Path, PurePath, Exception | RootStatement] | None] = queue.Queue(
+        maxsize=0 if in_flight_limiter is None else 1,
+    )
+    cancel_event = threading.Event()
+    execute_exceptions: list[Exception] = []
 
-                        ast = parser.entry_point__()
-                        assert ast
+    # ----------------------------------------------------------------------
+    def OnFileComplete(
+        workspace_root: Path,
+        relative_path: PurePath,
+        result: Exception | RootStatement,
+        includes: list[tuple[Path, PurePath, Path]],  # noqa: ARG001
+        missing_paths: set[Path],  # noqa: ARG001
+    ) -> None:
+        result_queue.put((workspace_root, relative_path, result))
 
-                        assert create_include_statement_func is not None
+    # ----------------------------------------------------------------------
+    def Execute() -> None:
+        try:
+            _ExecuteParse(
+                dm,
+                results,
+                [
+                    (workspace_root, relative_path, content_func, False)
+                    for workspace_root, sources in workspaces.items()
+                    for relative_path, content_func in sources.items()
+                ],
+                file_extensions,
+                workspace_names,
+                options,
+                in_flight_limiter=in_flight_limiter,
+                on_file_complete_func=OnFileComplete,
+                retain_results=False,
+                cancel_event=cancel_event,
+            )
+        except Exception as ex:
+            execute_exceptions.append(ex)
+        finally:
+            result_queue.put(None)
 
-                        visitor = _SimpleSchemaVisitor(
-                            content,
-                            fullpath,
-                            lambda line: cast(None, status.OnProgress(line, None)),
-                            create_include_statement_func,
-                            is_included_file=is_included_file,
-                            tab_width=tab_width,
-                        )
+    # ----------------------------------------------------------------------
 
-                        ast.accept(visitor)
+    thread = threading.Thread(target=Execute)
+    thread.start()
 
-                        result = visitor.root
+    is_complete = False
 
-                    except Exception as ex:
-                        result = ex
-                        raise
+    try:
+        while True:
+            item = result_queue.get()
+            if item is None:
+                is_complete = True
+                break
 
-                return None
+            yield item
 
-            # ----------------------------------------------------------------------
+    finally:
+        cancel_event.set()
 
-            return len(content.split("\n")), Execute
+        if in_flight_limiter is not None:
+            in_flight_limiter.Cancel()
 
-        # ----------------------------------------------------------------------
+        # Discard results that are waiting to be added to the (bounded) queue
+        while not is_complete:
+            is_complete = result_queue.get() is None
 
-        create_include_statement_func = _CreateIncludeStatementFuncFactory(
-            file_extensions,
-            workspace_names,
-            results,
-            results_lock,
-            enqueue_func,
-            PrepareTask,
-        )
+        thread.join()
 
-        is_single_workspace = len(workspaces) == 1
+    if execute_exceptions:
+        raise execute_exceptions[0]
 
-        for workspace_root, sources in workspaces.items():
-            for relative_path, content_func in sources.items():
-                enqueue_func(
-                    str(relative_path if is_single_workspace else workspace_root / relative_path),
-                    lambda on_simple_status_func,  # noqa: ARG005
-                    workspace_root=workspace_root,
-                    relative_path=relative_path,
-                    content_func=content_func: PrepareTask(
-                        workspace_root,
-                        relative_path,
-                        content_func,
-                        is_included_file=False,
-                    ),
-                )
 
-    if dm.result != 0 and raise_if_single_exception:
-        exceptions: list[Exception] = []
+# ----------------------------------------------------------------------
+async def ParseAsync(  # noqa: C901, PLR0915
+    dm: DoneManager,
+    workspaces: dict[
+        Path,  # workspace_root
+        dict[
+            PurePath,  # relative_path
+            Callable[[], Awaitable[str]],  # get content
+        ],
+    ],
+    file_extensions: list[str] | None = None,
+    *,
+    single_threaded: bool | None = None,
+    quiet: bool | None = None,
+    raise_if_single_exception: bool = True,
+    tab_width: int | None = None,
+    options: ParseOptions | None = None,
+) -> dict[
+    Path,  # workspace root
+    dict[
+        PurePath,  # relative path
+        Exception | RootStatement,
+    ],
+]:
+    """Parse workspaces whose content is provided asynchronously.
 
-        for workspace_results in results.values():
-            exceptions += [result for result in workspace_results.values() if isinstance(result, Exception)]
+    Content is fetched concurrently and each file is parsed by a worker thread as soon as its content
+    is available. If the coroutine is cancelled, pending fetches are cancelled and files that have not
+    started parsing are not parsed.
 
-        if len(exceptions) == 1:
-            raise exceptions[0]
+    When `fail_fast` is True, files that haven't started parsing when a file fails to parse are not
+    parsed and are not included in the results.
 
-    for workspace_root, workspace_results in results.items():
-        for relative_path, result in workspace_results.items():
-            assert result is not None, (workspace_root, relative_path)
+    When `max_in_flight` or `max_bytes_in_flight` is provided, content is not fetched until there is
+    capacity for it; fetched content counts against those limits until the file has been parsed.
 
-    return cast(dict[Path, dict[PurePath, Exception | RootStatement]], results)
+    `single_threaded`, `quiet`, and `tab_width` override the corresponding values in `options` (see `Parse`).
+    """
 
+    options = _ResolveOptions(options, single_threaded=single_threaded, quiet=quiet, tab_width=tab_width)
 
-# ----------------------------------------------------------------------
-# |
-# |  Private Types
-# |
-# ----------------------------------------------------------------------
-class _ErrorListener(antlr4.DiagnosticErrorListener):
-    # ----------------------------------------------------------------------
-    def __init__(
-        self,
-        source: Path,
-        *args,
-        **kwargs,
-    ) -> None:
-        super().__init__(*args, **kwargs)
+    if file_extensions is None:
+        file_extensions = DEFAULT_FILE_EXTENSIONS
 
-        self._source = source
+    workspace_names = _ResolveWorkspaces(workspaces)
+
+    results: dict[Path, dict[PurePath, None | Exception | RootStatement]] = {
+        workspace_root: dict.fromkeys(sources) for workspace_root, sources in workspaces.items()
+    }
+
+    num_tasks = sum(len(sources) for sources in workspaces.values())
+
+    loop = asyncio.get_running_loop()
+
+    # Tasks are added to the queue as their content becomes available; None indicates cancellation
+    task_queue: queue.Queue[tuple[Path, PurePath, Callable[[], str], bool] | None] = queue.Queue()
+
+    # Files that are skipped once parsing is cancelled never complete, so wake `StartFetches` (which may
+    # be waiting for capacity) when parsing is cancelled.
+    capacity_event = asyncio.Event()
+    cancel_event = _NotifyingEvent(lambda: loop.call_soon_threadsafe(capacity_event.set))
+
+    in_flight_limiter = InFlightLimiter.Create(options.max_in_flight, options.max_bytes_in_flight)
+
+    # Fetched files that have not been parsed; only modified by the event loop
+    fetched_sizes: dict[tuple[Path, PurePath], int] = {}
+    num_fetches_in_flight = 0
+
+    fetch_tasks: list[asyncio.Task[None]] = []
 
     # ----------------------------------------------------------------------
-    def syntaxError(
-        self,
-        recognizer: SimpleSchemaParser,  # noqa: ARG002
-        offendingSymbol: antlr4.Token,  # noqa: ARG002, N803
-        line: int,
-        column: int,
-        msg: str,
-        e: antlr4.RecognitionException,
-    ) -> None:
-        if e is not None:
-            raise AntlrError(msg, self._source, line, column + 1, e)
+    def HasFetchCapacity() -> bool:
+        if options.max_in_flight is not None and num_fetches_in_flight >= options.max_in_flight:
+            return False
+
+        if (  # noqa: SIM103
+            options.max_bytes_in_flight is not None
+            and num_fetches_in_flight != 0
+            and sum(fetched_sizes.values()) >= options.max_bytes_in_flight
+        ):
+            return False
+
+        return True
+
+    # ----------------------------------------------------------------------
+    def OnFetchedFileComplete(
+        workspace_root: Path,
+        relative_path: PurePath,
+    ) -> None:
+        nonlocal num_fetches_in_flight
+
+        fetched_sizes.pop((workspace_root, relative_path), None)
+        num_fetches_in_flight -= 1
+
+        capacity_event.set()
+
+    # ----------------------------------------------------------------------
+    def OnFileComplete(
+        workspace_root: Path,
+        relative_path: PurePath,
+        result: Exception | RootStatement,  # noqa: ARG001
+        includes: list[tuple[Path, PurePath, Path]],  # noqa: ARG001
+        missing_paths: set[Path],  # noqa: ARG001
+    ) -> None:
+        if in_flight_limiter is not None and relative_path in workspaces.get(workspace_root, {}):
+            loop.call_soon_threadsafe(OnFetchedFileComplete, workspace_root, relative_path)
+
+    # ----------------------------------------------------------------------
+    async def StartFetches() -> None:
+        nonlocal num_fetches_in_flight
+
+        for workspace_root, sources in workspaces.items():
+            for relative_path, get_content_func in sources.items():
+                while not HasFetchCapacity() and not cancel_event.is_set():
+                    capacity_event.clear()
+                    await capacity_event.wait()
+
+                if cancel_event.is_set():
+                    # A file failed to parse and `fail_fast` is True, so the remaining files won't be parsed
+                    task_queue.put(None)
+                    return
+
+                num_fetches_in_flight += 1
+                fetch_tasks.append(
+                    asyncio.create_task(Fetch(workspace_root, relative_path, get_content_func))
+                )
+
+    # ----------------------------------------------------------------------
+    async def Fetch(
+        workspace_root: Path,
+        relative_path: PurePath,
+        get_content_func: Callable[[], Awaitable[str]],
+    ) -> None:
+        try:
+            content = await get_content_func()
+            fetched_sizes[(workspace_root, relative_path)] = len(content)
+        except Exception as ex:
+            # ----------------------------------------------------------------------
+            def RaiseFetchException(
+                fetch_exception: Exception = ex,
+            ) -> str:
+                raise fetch_exception
+
+            # ----------------------------------------------------------------------
+
+            task_queue.put((workspace_root, relative_path, RaiseFetchException, False))
+            return
+
+        task_queue.put((workspace_root, relative_path, lambda: content, False))
+
+    # ----------------------------------------------------------------------
+    def GetTasks() -> Iterator[tuple[Path, PurePath, Callable[[], str], bool]]:
+        for _ in range(num_tasks):
+            task = task_queue.get()
+            if task is None:
+                break
+
+            yield task
+
+    # ----------------------------------------------------------------------
+
+    parse_future = loop.run_in_executor(
+        None,
+        lambda: _ExecuteParse(
+            dm,
+            results,
+            GetTasks(),
+            file_extensions,
+            workspace_names,
+            options,
+            in_flight_limiter=in_flight_limiter,
+            on_file_complete_func=OnFileComplete,
+            cancel_event=cancel_event,
+        ),
+    )
+
+    try:
+        await StartFetches()
+        await asyncio.gather(*fetch_tasks)
+        await asyncio.shield(parse_future)
+
+    except asyncio.CancelledError:
+        cancel_event.set()
+
+        if in_flight_limiter is not None:
+            in_flight_limiter.Cancel()
+
+        for fetch_task in fetch_tasks:
+            fetch_task.cancel()
+
+        task_queue.put(None)
+
+        # Wait for work that has already started to complete
+        await parse_future
+        raise
+
+    return _FinalizeResults(
+        dm,
+        results,
+        raise_if_single_exception=raise_if_single_exception,
+        allow_unparsed=options.fail_fast,
+    )
+
+
+# ----------------------------------------------------------------------
+def CreateWorkspaces(
+    workspace_roots: list[Path],
+    file_extensions: list[str] | None = None,
+) -> dict[
+    Path,  # workspace_root
+    dict[
+        PurePath,  # relative_path
+        Callable[[], str],  # get content
+    ],
+]:
+    """Return the workspaces for all of the files within the workspace roots that have one of the file extensions.
+
+    Directories that are themselves workspace roots are only included in their own workspace.
+    """
+
+    file_extensions = file_extensions or DEFAULT_FILE_EXTENSIONS
+
+    workspaces: dict[Path, dict[PurePath, Callable[[], str]]] = {}
+
+    for workspace_root in workspace_roots:
+        sources: dict[PurePath, Callable[[], str]] = {}
+
+        for root, directories, filenames in os.walk(workspace_root):
+            root_path = Path(root)
+
+            directories[:] = sorted(
+                directory for directory in directories if root_path / directory not in workspace_roots
+            )
+
+            for filename in sorted(filenames):
+                if not any(filename.endswith(file_extension) for file_extension in file_extensions):
+                    continue
+
+                fullpath = root_path / filename
+
+                sources[PurePath(fullpath.relative_to(workspace_root))] = lambda fullpath=fullpath: _ReadFile(
+                    fullpath
+                )
+
+        workspaces[workspace_root] = sources
+
+    return workspaces
+
+
+# ----------------------------------------------------------------------
+@cache
+def GetGrammarVersion() -> str:
+    """Return a value that changes whenever the grammar changes."""
+
+    hasher = hashlib.sha256()
+
+    for recognizer in [SimpleSchemaLexer, SimpleSchemaParser]:
+        hasher.update(str(sys.modules[recognizer.__module__].serializedATN()).encode("utf-8"))
+
+    return hasher.hexdigest()
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Private Types
+# |
+# ----------------------------------------------------------------------
+# Comments and whitespace that may appear before or between include statements
+_HEADER_SKIP_REGEX = re.compile(r"(?:\s+|#/.*?/#|#[^\r\n]*)*", re.DOTALL)
+
+# A (conservative) subset of the include statement syntax; header scanning stops at the first
+# statement that doesn't match.
+_HEADER_INCLUDE_STATEMENT_REGEX = re.compile(
+    r"""
+    from[ \t]+
+    (?P<path>[/.A-Za-z0-9_@$&]+)
+    [ \t]+import[ \t]+
+    (?:
+        (?P<star>\*)
+        | (?P<grouped>\(\s*)?(?P<item>[_@$&]?[A-Za-z][A-Za-z0-9_]*)
+    )
+    """,
+    re.VERBOSE,
+)
+
+_HEADER_INCLUDE_PATH_PART_REGEX = re.compile(r"[_@$&]?[A-Za-z][A-Za-z0-9_]*|\.\.")
+
+# Content that may contain newlines that don't end a statement is matched as a single token
+_CHUNK_TOKEN_REGEX = re.compile(
+    r"""
+    "{3}.*?"{3}
+    | '{3}.*?'{3}
+    | "(?:\\.|[^"\\])*"
+    | '(?:\\.|[^'\\])*'
+    | \#/.*?/\#
+    | \#[^\n]*
+    | \\\r?\n
+    | [()\[\]{}\n]
+    """,
+    re.DOTALL | re.VERBOSE,
+)
+
+# Lines that begin with anything else continue the previous statement (for example, the cardinality or
+# metadata of a structure); include statements are never split from the statements that precede them.
+_CHUNK_STATEMENT_START_REGEX = re.compile(r"(?!from\b)[_@$&]?[A-Za-z]")
+
+# Appended to each chunk but the last and removed from its results, so that the final statement in the
+# chunk is terminated as it is when the content is parsed in its entirety; the tokens that terminate a
+# statement are positioned at the newline that precedes the next statement, but at the end of the
+# content when there isn't a next statement.
+_CHUNK_SENTINEL_STATEMENT = "ChunkSentinel: String\n"
+
+# Parsing resumes at a line that begins with a statement after an error
+_RECOVERY_STATEMENT_START_REGEX = re.compile(r"^[_@$&]?[A-Za-z]", re.MULTILINE)
+
+# Identifies each call to `_ExecuteParse` (see `_GetProcessWorkspaceIndex`)
+_WORKSPACE_INDEX_GENERATIONS = itertools.count()
+
+
+# ----------------------------------------------------------------------
+class _ErrorListener(ErrorListener):
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        source: Path,
+        *args,
+        **kwargs,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+
+        self._source = source
+
+    # ----------------------------------------------------------------------
+    def syntaxError(
+        self,
+        recognizer: SimpleSchemaParser,  # noqa: ARG002
+        offendingSymbol: antlr4.Token,  # noqa: ARG002, N803
+        line: int,
+        column: int,
+        msg: str,
+        e: antlr4.RecognitionException,
+    ) -> None:
+        if e is not None:
+            raise AntlrError(msg, self._source, line, column + 1, e)
+
+
+# ----------------------------------------------------------------------
+class _LexerErrorCollector(ErrorListener):
+    """Collects the errors reported by a lexer whose tokens may be discarded, so that they are only reported if the tokens are used"""
+
+    # ----------------------------------------------------------------------
+    def __init__(self) -> None:
+        super().__init__()
+
+        self._errors: list[tuple[Any, ...]] = []
+
+    # ----------------------------------------------------------------------
+    def syntaxError(
+        self,
+        recognizer: SimpleSchemaLexer,
+        offendingSymbol: antlr4.Token,  # noqa: N803
+        line: int,
+        column: int,
+        msg: str,
+        e: antlr4.RecognitionException,
+    ) -> None:
+        self._errors.append((recognizer, offendingSymbol, line, column, msg, e))
+
+    # ----------------------------------------------------------------------
+    def Report(
+        self,
+        error_listener: ErrorListener,
+    ) -> None:
+        for error in self._errors:
+            error_listener.syntaxError(*error)
+
+
+# ----------------------------------------------------------------------
+class _CancelledError(Exception):
+    """Exception raised when parsing is interrupted because it has been cancelled"""
+
+
+# ----------------------------------------------------------------------
+class _TimeoutError(AntlrError):
+    """Exception raised when parsing is interrupted because the file has taken too long to parse"""
+
+    # ----------------------------------------------------------------------
+    @classmethod
+    def Create(
+        cls,
+        timeout: float,
+        source: Path,
+        line: int,
+        column: int,
+    ) -> "_TimeoutError":
+        return cls(f"The file did not finish parsing within {timeout} seconds", source, line, column, None)
+
+
+# ----------------------------------------------------------------------
+class _InterruptListener(antlr4.ParseTreeListener):
+    """Interrupts parsing at rule boundaries when parsing is cancelled or the file has taken too long to parse"""
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        source: Path,
+        cancel_event: threading.Event | None,
+        timeout: float | None,
+    ) -> None:
+        self._source = source
+        self._cancel_event = cancel_event
+        self._timeout = timeout
+
+        self._deadline = None if timeout is None else time.perf_counter() + timeout
+
+    # ----------------------------------------------------------------------
+    def enterEveryRule(
+        self,
+        ctx: antlr4.ParserRuleContext,
+    ) -> None:
+        if self._cancel_event is not None and self._cancel_event.is_set():
+            raise _CancelledError
+
+        if self._deadline is not None and time.perf_counter() > self._deadline:
+            assert self._timeout is not None
+            raise _TimeoutError.Create(self._timeout, self._source, ctx.start.line, ctx.start.column + 1)
 
 
 # ----------------------------------------------------------------------
@@ -370,20 +1183,69 @@ class _VisitorMixin:
         self._current_line: int = 0
         self._stack: list[Any] = []
 
+        # Populated when elements are created while the content is being parsed (see
+        # `CreateParseListener`); the stack size when each active rule was entered.
+        self._rule_stack_indexes: list[int] | None = None
+
     # ----------------------------------------------------------------------
     @cached_property
     def root(self) -> RootStatement:
-        if not self._stack:
-            region = Region(self.filename, Location(1, 1), Location(1, 1))
-        else:
-            region = Region(
-                self.filename,
-                self._stack[0].region.begin,
-                self._stack[-1].region.end,
-            )
-
         assert all(isinstance(item, Statement) for item in self._stack)
-        return RootStatement(region, cast(list[Statement], self._stack))
+        return _CreateRootStatement(self.filename, cast(list[Statement], self._stack))
+
+    # ----------------------------------------------------------------------
+    def CreateParseListener(
+        self,
+        file_stats: FileParseStats | None = None,
+    ) -> "_ParseListener":
+        """Return a listener that creates elements as the content is parsed.
+
+        Elements are created as each rule is exited rather than by visiting the parse tree once it has
+        been created; the children of each rule are released once the rule has been visited, so the
+        complete parse tree is never in memory.
+        """
+
+        assert self._rule_stack_indexes is None
+        self._rule_stack_indexes = []
+
+        if file_stats is not None:
+            return _TimedParseListener(self, file_stats)
+
+        return _ParseListener(self)
+
+    # ----------------------------------------------------------------------
+    @property
+    def stack_depth(self) -> int:
+        return len(self._stack)
+
+    # ----------------------------------------------------------------------
+    def OnEnterRule(self) -> None:
+        assert self._rule_stack_indexes is not None
+        self._rule_stack_indexes.append(len(self._stack))
+
+    # ----------------------------------------------------------------------
+    def OnExitRule(
+        self,
+        ctx: antlr4.ParserRuleContext,
+    ) -> None:
+        assert self._rule_stack_indexes is not None
+
+        ctx.accept(self)
+        self._rule_stack_indexes.pop()
+
+        # The children have been visited and are no longer needed
+        ctx.children = None
+
+    # ----------------------------------------------------------------------
+    def visitChildren(
+        self,
+        ctx: antlr4.RuleContext,
+    ) -> None:
+        if self._rule_stack_indexes is not None:
+            # The children were visited as they were parsed
+            return None
+
+        return super().visitChildren(ctx)  # type: ignore[misc]
 
     # ----------------------------------------------------------------------
     def CreateRegion(
@@ -436,9 +1298,12 @@ class _VisitorMixin:
     # |
     # ----------------------------------------------------------------------
     def _GetChildren(self, ctx: antlr4.RuleContext) -> list[Any]:
-        prev_num_stack_items = len(self._stack)
+        if self._rule_stack_indexes is None:
+            prev_num_stack_items = len(self._stack)
 
-        cast(SimpleSchemaVisitor, self).visitChildren(ctx)
+            self.visitChildren(ctx)
+        else:
+            prev_num_stack_items = self._rule_stack_indexes[-1]
 
         results = self._stack[prev_num_stack_items:]
         del self._stack[prev_num_stack_items:]
@@ -456,74 +1321,328 @@ class _VisitorMixin:
 
 
 # ----------------------------------------------------------------------
-class _SimpleSchemaVisitor(SimpleSchemaVisitor, _VisitorMixin):
-    # ----------------------------------------------------------------------
-    # |
-    # |  Common
-    # |
-    # ----------------------------------------------------------------------
-    def visitIdentifier(self, ctx: SimpleSchemaParser.IdentifierContext) -> None:
-        region = self.CreateRegion(ctx)
-        value = ctx.IDENTIFIER().symbol.text
-
-        self._stack.append(ParseIdentifier(region, value))
+class _ParseListener(antlr4.ParseTreeListener):
+    """Forwards rule events to the visitor as content is parsed"""
 
     # ----------------------------------------------------------------------
-    def visitMetadata_clause(self, ctx: SimpleSchemaParser.Metadata_clauseContext) -> None:
-        children = self._GetChildren(ctx)
-        assert all(isinstance(child, MetadataItem) for child in children), children
+    def __init__(
+        self,
+        visitor: _VisitorMixin,
+    ) -> None:
+        self._visitor = visitor
 
-        self._stack.append(Metadata(self.CreateRegion(ctx), cast(list[MetadataItem], children)))
+        # Rules are exited as an exception propagates through the parser; elements shouldn't be
+        # created for these (likely incomplete) rules. This is the exception being handled (if any)
+        # when the listener was created, which is not an indication that parsing has failed.
+        self._initial_exception = sys.exc_info()[1]
+
+        # Errors encountered while creating elements are raised once the content has been parsed, so
+        # that syntax errors later in the content take precedence (as they would if the parse tree was
+        # visited after it was created). Events aren't forwarded to the visitor after an error.
+        self._deferred_exception: AntlrError | Errors.SimpleSchemaGeneratorError | None = None
 
     # ----------------------------------------------------------------------
-    def visitMetadata_clause_item(self, ctx: SimpleSchemaParser.Metadata_clause_itemContext) -> None:
-        children = self._GetChildren(ctx)
+    def RaiseDeferredException(self) -> None:
+        """Raise the error encountered while creating elements (if any); called once the content has been parsed without errors."""
 
-        assert len(children) == 2, children  # noqa: PLR2004
-        assert isinstance(children[0], ParseIdentifier), children
-        assert isinstance(children[1], Expression), children
+        if self._deferred_exception is not None:
+            raise self._deferred_exception
 
-        name = children[0].ToTerminalElement()
-        value = children[1]
+    # ----------------------------------------------------------------------
+    def enterEveryRule(
+        self,
+        ctx: antlr4.ParserRuleContext,  # noqa: ARG002
+    ) -> None:
+        if self._deferred_exception is not None:
+            return
 
-        self._stack.append(MetadataItem(self.CreateRegion(ctx), name, value))
+        self._visitor.OnEnterRule()
 
     # ----------------------------------------------------------------------
-    def visitCardinality_clause(self, ctx: SimpleSchemaParser.Cardinality_clauseContext) -> None:
-        children = self._GetChildren(ctx)
-
-        assert len(children) == 2, children  # noqa: PLR2004
+    def exitEveryRule(
+        self,
+        ctx: antlr4.ParserRuleContext,
+    ) -> None:
+        if self._deferred_exception is not None or sys.exc_info()[1] is not self._initial_exception:
+            return
 
-        assert isinstance(children[0], IntegerExpression), children
-        min_expression = cast(IntegerExpression, children[0])
+        try:
+            self._visitor.OnExitRule(ctx)
+        except (AntlrError, Errors.SimpleSchemaGeneratorError) as ex:
+            self._deferred_exception = ex
 
-        assert children[1] is None or isinstance(children[1], IntegerExpression), children
-        max_expression = cast(IntegerExpression | None, children[1])
 
-        self._stack.append(Cardinality(self.CreateRegion(ctx), min_expression, max_expression))
+# ----------------------------------------------------------------------
+class _TimedParseListener(_ParseListener):
+    """Parse listener that records the time spent creating elements"""
 
     # ----------------------------------------------------------------------
-    def visitCardinality_clause_optional(
-        self, ctx: SimpleSchemaParser.Cardinality_clause_optionalContext
+    def __init__(
+        self,
+        visitor: _VisitorMixin,
+        file_stats: FileParseStats,
     ) -> None:
-        region = self.CreateRegion(ctx)
+        super().__init__(visitor)
 
-        self._stack += [IntegerExpression(region, 0), IntegerExpression(region, 1)]
+        self._file_stats = file_stats
 
     # ----------------------------------------------------------------------
-    def visitCardinality_clause_zero_or_more(
-        self, ctx: SimpleSchemaParser.Cardinality_clause_zero_or_moreContext
+    def exitEveryRule(
+        self,
+        ctx: antlr4.ParserRuleContext,
     ) -> None:
-        self._stack += [IntegerExpression(self.CreateRegion(ctx), 0), None]
+        # The stack is at its deepest before the children of the rule are replaced by its elements
+        self._file_stats.max_stack_depth = max(self._file_stats.max_stack_depth, self._visitor.stack_depth)
+
+        start_time = time.perf_counter()
+        super().exitEveryRule(ctx)
+        self._file_stats.visit_time += time.perf_counter() - start_time
+
+
+# ----------------------------------------------------------------------
+class _TimedTokenSource:
+    """Token source that records the time spent producing tokens"""
 
     # ----------------------------------------------------------------------
-    def visitCardinality_clause_one_or_more(
-        self, ctx: SimpleSchemaParser.Cardinality_clause_one_or_moreContext
+    def __init__(
+        self,
+        token_source: "SimpleSchemaLexer | RegexTokenizer",
+        file_stats: FileParseStats,
     ) -> None:
-        self._stack += [IntegerExpression(self.CreateRegion(ctx), 1), None]
+        self._token_source = token_source
+        self._file_stats = file_stats
 
     # ----------------------------------------------------------------------
-    def visitCardinality_clause_fixed(self, ctx: SimpleSchemaParser.Cardinality_clause_fixedContext) -> None:
+    def nextToken(self) -> antlr4.Token:
+        start_time = time.perf_counter()
+        token = self._token_source.nextToken()
+        self._file_stats.lex_time += time.perf_counter() - start_time
+
+        self._file_stats.num_tokens += 1
+
+        return token
+
+    # ----------------------------------------------------------------------
+    def __getattr__(
+        self,
+        name: str,
+    ) -> Any:  # noqa: ANN401
+        # The parser accesses other attributes of the lexer when reporting errors
+        return getattr(self._token_source, name)
+
+
+# ----------------------------------------------------------------------
+class _ElementCounter(ElementVisitorHelper):
+    """Counts the elements created while parsing"""
+
+    # ----------------------------------------------------------------------
+    def __init__(self) -> None:
+        self.num_elements = 0
+
+    # ----------------------------------------------------------------------
+    @override
+    @contextmanager
+    def OnElement(
+        self,
+        element: Element,  # noqa: ARG002
+    ) -> Iterator[VisitResult]:
+        self.num_elements += 1
+        yield VisitResult.Continue
+
+
+# ----------------------------------------------------------------------
+class _NotifyingEvent(threading.Event):
+    """Event that invokes a function when it is set."""
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        on_set_func: Callable[[], None],
+    ) -> None:
+        super().__init__()
+
+        self._on_set_func = on_set_func
+
+    # ----------------------------------------------------------------------
+    @override
+    def set(self) -> None:
+        super().set()
+        self._on_set_func()
+
+
+# ----------------------------------------------------------------------
+@dataclass
+class _ContentIndexEntry:
+    # Set once the first file with this content has been parsed
+    complete_event: threading.Event = field(default_factory=threading.Event)
+
+    # None if the content couldn't be parsed
+    root: RootStatement | None = None
+
+
+# ----------------------------------------------------------------------
+class _ContentIndex:
+    """Identifies files with identical content (e.g. files copied into multiple workspaces) so that the content is only parsed once."""
+
+    # ----------------------------------------------------------------------
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: dict[tuple[bytes, bool], _ContentIndexEntry] = {}
+
+    # ----------------------------------------------------------------------
+    def GetOrAdd(
+        self,
+        content: str,
+        *,
+        is_included_file: bool,
+    ) -> tuple[_ContentIndexEntry, bool]:
+        """Return the entry for the content and True if the entry was added (the caller must complete it)."""
+
+        key = (hashlib.sha256(content.encode("utf-8")).digest(), is_included_file)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                return entry, False
+
+            entry = _ContentIndexEntry()
+            self._entries[key] = entry
+
+            return entry, True
+
+
+# ----------------------------------------------------------------------
+@dataclass
+class _ProvisionalInclude:
+    """A file included by a file that hasn't finished parsing.
+
+    The included file is parsed while the file that includes it is being parsed, but its result is only
+    committed once a file that includes it has been parsed successfully; otherwise, the result is
+    dropped.
+    """
+
+    # Set once the include has been confirmed or dropped
+    resolved_event: threading.Event = field(default_factory=threading.Event)
+
+    is_confirmed: bool = False
+
+
+# ----------------------------------------------------------------------
+class _DfaSnapshotProcessPool(ProcessPoolExecutor):
+    """Process pool whose workers load a DFA snapshot and whose DFA states are merged on shutdown."""
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        num_workers: int,
+        dfa_snapshot: Path,
+    ) -> None:
+        # Note that this content is imported here to avoid circular dependencies
+        from .DfaSnapshot import InitializeWorker
+
+        # Distinguishes the snapshots saved by these workers from those saved by other pools that
+        # use the same snapshot.
+        pool_id = uuid.uuid4().hex
+
+        # Use "spawn" rather than the platform default, as forking a process with running threads is
+        # not safe.
+        super().__init__(
+            max_workers=num_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=InitializeWorker,
+            initargs=(dfa_snapshot, pool_id),
+        )
+
+        self._dfa_snapshot = dfa_snapshot
+        self._pool_id = pool_id
+
+    # ----------------------------------------------------------------------
+    @override
+    def shutdown(
+        self,
+        wait: bool = True,  # noqa: FBT001, FBT002
+        *,
+        cancel_futures: bool = False,
+    ) -> None:
+        super().shutdown(wait=wait, cancel_futures=cancel_futures)
+
+        # The workers save their DFA states as they exit, so the states are only available once
+        # all of the workers have exited.
+        if wait:
+            from .DfaSnapshot import MergeWorkerSnapshots
+
+            MergeWorkerSnapshots(self._dfa_snapshot, self._pool_id)
+
+
+# ----------------------------------------------------------------------
+class _SimpleSchemaVisitor(_VisitorMixin, SimpleSchemaVisitor):
+    # ----------------------------------------------------------------------
+    # |
+    # |  Common
+    # |
+    # ----------------------------------------------------------------------
+    def visitIdentifier(self, ctx: SimpleSchemaParser.IdentifierContext) -> None:
+        region = self.CreateRegion(ctx)
+        value = ctx.IDENTIFIER().symbol.text
+
+        self._stack.append(ParseIdentifier(region, value))
+
+    # ----------------------------------------------------------------------
+    def visitMetadata_clause(self, ctx: SimpleSchemaParser.Metadata_clauseContext) -> None:
+        children = self._GetChildren(ctx)
+        assert all(isinstance(child, MetadataItem) for child in children), children
+
+        self._stack.append(Metadata(self.CreateRegion(ctx), cast(list[MetadataItem], children)))
+
+    # ----------------------------------------------------------------------
+    def visitMetadata_clause_item(self, ctx: SimpleSchemaParser.Metadata_clause_itemContext) -> None:
+        children = self._GetChildren(ctx)
+
+        assert len(children) == 2, children  # noqa: PLR2004
+        assert isinstance(children[0], ParseIdentifier), children
+        assert isinstance(children[1], Expression), children
+
+        name = children[0].ToTerminalElement()
+        value = children[1]
+
+        self._stack.append(MetadataItem(self.CreateRegion(ctx), name, value))
+
+    # ----------------------------------------------------------------------
+    def visitCardinality_clause(self, ctx: SimpleSchemaParser.Cardinality_clauseContext) -> None:
+        children = self._GetChildren(ctx)
+
+        assert len(children) == 2, children  # noqa: PLR2004
+
+        assert isinstance(children[0], IntegerExpression), children
+        min_expression = cast(IntegerExpression, children[0])
+
+        assert children[1] is None or isinstance(children[1], IntegerExpression), children
+        max_expression = cast(IntegerExpression | None, children[1])
+
+        self._stack.append(Cardinality(self.CreateRegion(ctx), min_expression, max_expression))
+
+    # ----------------------------------------------------------------------
+    def visitCardinality_clause_optional(
+        self, ctx: SimpleSchemaParser.Cardinality_clause_optionalContext
+    ) -> None:
+        region = self.CreateRegion(ctx)
+
+        self._stack += [IntegerExpression(region, 0), IntegerExpression(region, 1)]
+
+    # ----------------------------------------------------------------------
+    def visitCardinality_clause_zero_or_more(
+        self, ctx: SimpleSchemaParser.Cardinality_clause_zero_or_moreContext
+    ) -> None:
+        self._stack += [IntegerExpression(self.CreateRegion(ctx), 0), None]
+
+    # ----------------------------------------------------------------------
+    def visitCardinality_clause_one_or_more(
+        self, ctx: SimpleSchemaParser.Cardinality_clause_one_or_moreContext
+    ) -> None:
+        self._stack += [IntegerExpression(self.CreateRegion(ctx), 1), None]
+
+    # ----------------------------------------------------------------------
+    def visitCardinality_clause_fixed(self, ctx: SimpleSchemaParser.Cardinality_clause_fixedContext) -> None:
         children = self._GetChildren(ctx)
         assert len(children) == 1, children
         assert isinstance(children[0], IntegerExpression), children
@@ -791,6 +1910,10 @@ class _SimpleSchemaVisitor(SimpleSchemaVisitor, _VisitorMixin):
     def visitInclude_statement_from(self, ctx: SimpleSchemaParser.Include_statement_fromContext) -> None:
         entire_region = self.CreateRegion(ctx)
 
+        # The children may have been visited already (when elements are created while parsing), so get
+        # them before adding the root identifier.
+        children = self._GetChildren(ctx)
+
         # Look for the root identifier
         if (
             len(ctx.children) > 1
@@ -809,7 +1932,7 @@ class _SimpleSchemaVisitor(SimpleSchemaVisitor, _VisitorMixin):
             )
 
         # Process the elements
-        result = self.visitChildren(ctx)
+        self._stack += children
 
         # Look for the directory identifier
         if (
@@ -828,8 +1951,6 @@ class _SimpleSchemaVisitor(SimpleSchemaVisitor, _VisitorMixin):
                 ),
             )
 
-        return result
-
     # ----------------------------------------------------------------------
     def visitInclude_statement_from_parent_dir(
         self, ctx: SimpleSchemaParser.Include_statement_from_parent_dirContext
@@ -1151,119 +2272,1701 @@ class _SimpleSchemaVisitor(SimpleSchemaVisitor, _VisitorMixin):
 # |  Private Functions
 # |
 # ----------------------------------------------------------------------
-class _PrepareTaskFuncType(Protocol):
+def _ResolveOptions(
+    options: ParseOptions | None,
+    *,
+    single_threaded: bool | None,
+    quiet: bool | None,
+    tab_width: int | None,
+) -> ParseOptions:
+    # These arguments predate `ParseOptions` and continue to be supported by the public functions
+    overrides: dict[str, Any] = {
+        "single_threaded": single_threaded,
+        "quiet": quiet,
+        "tab_width": tab_width,
+    }
+
+    overrides = {key: value for key, value in overrides.items() if value is not None}
+
+    return replace(options or ParseOptions(), **overrides)
+
+
+# ----------------------------------------------------------------------
+class _OnFileCompleteFuncType(Protocol):
     def __call__(
         self,
         workspace_root: Path,
         relative_path: PurePath,
-        content_func: Callable[[], str],
-        *,
-        is_included_file: bool,
-    ) -> tuple[int, ExecuteTasks.YieldQueueExecutorTypes.ExecuteFuncType]: ...
+        result: Exception | RootStatement,
+        includes: list[tuple[Path, PurePath, Path]],  # (workspace_root, relative_path, filename)
+        missing_paths: set[Path],  # See `WorkspaceIndex.ResolveIncludeFilename`
+    ) -> None: ...
 
 
-def _CreateIncludeStatementFuncFactory(  # noqa: C901, PLR0915
-    file_extensions: list[str],
-    workspace_names: list[Path],
-    results: dict[Path, dict[PurePath, None | Exception | RootStatement]],
-    results_lock: threading.Lock,
-    enqueue_func: ExecuteTasks.YieldQueueExecutorTypes.EnqueueFuncType,
-    prepare_task_func: _PrepareTaskFuncType,
-) -> _CreateIncludeStatementFuncType:
-    # ----------------------------------------------------------------------
-    def ResolveIncludeFilename(
-        path: Path,
-        *,
-        allow_directory: bool,
-    ) -> Optional[Path]:  # noqa: UP007
-        path = path.resolve()
+# ----------------------------------------------------------------------
+class _OnIncludeFuncType(Protocol):
+    def __call__(
+        self,
+        workspace_root: Path,
+        relative_path: PurePath,
+        filename: Path,
+    ) -> None: ...
 
-        if path.is_file() or (allow_directory and path.is_dir()):
-            return path
 
-        for extension in file_extensions:
-            potential_path = path.parent / (path.name + extension)
-            if potential_path.is_file():
-                return potential_path
+# ----------------------------------------------------------------------
+def _ResolveWorkspaces(
+    workspaces: dict[Path, dict[PurePath, Callable[[], str]]],
+) -> list[Path]:
+    # Ensure that the workspaces paths are fully resolved
+    for workspace_name, workspace_value in list(workspaces.items()):
+        resolved_workspace_name = workspace_name.resolve()
 
-        return None
+        if resolved_workspace_name != workspace_name:
+            workspaces[resolved_workspace_name] = workspace_value
+            del workspaces[workspace_name]
 
-    # ----------------------------------------------------------------------
-    def Impl(  # noqa: C901, PLR0915
-        include_path: Path,
-        region: Region,
-        root_indicator: Region | None,
-        directory_indicator: Region | None,
-        filename_or_directory: TerminalElement[Path],
-        items: list[ParseIncludeStatementItem],
-        *,
-        is_star_include: bool,
-    ) -> ParseIncludeStatement:
-        root: Path | None = None
+    workspace_names: list[Path] = list(workspaces.keys())
 
-        search_paths: list[list[Path]] = []
+    # Sort the names so we search from the longest path to the shortest path
+    workspace_names.sort(
+        key=lambda value: len(str(value)),
+        reverse=True,
+    )
 
-        if root_indicator is None:
-            search_paths.append([include_path.parent])
+    return workspace_names
 
-        search_paths.append(workspace_names)
 
-        for potential_root in itertools.chain(*search_paths):
-            fullpath = ResolveIncludeFilename(
-                potential_root / filename_or_directory.value,
-                allow_directory=directory_indicator is not None,
-            )
+# ----------------------------------------------------------------------
+def _ExecuteParse(  # noqa: C901, PLR0913, PLR0915
+    dm: DoneManager,
+    results: dict[
+        Path,  # workspace root
+        dict[
+            PurePath,  # relative path
+            None | Exception | RootStatement,
+        ],
+    ],
+    tasks: Iterable[
+        tuple[
+            Path,  # workspace root
+            PurePath,  # relative path
+            Callable[[], str],  # get content
+            bool,  # is included file
+        ]
+    ],
+    file_extensions: list[str],
+    workspace_names: list[Path],
+    options: ParseOptions,
+    *,
+    in_flight_limiter: InFlightLimiter | None,
+    on_file_complete_func: _OnFileCompleteFuncType | None = None,
+    retain_results: bool = True,
+    cancel_event: threading.Event | None = None,
+    shared_process_pool: ProcessPoolExecutor | None = None,
+    workspace_index: WorkspaceIndex | None = None,
+    include_edges: dict[tuple[Path, PurePath], set[tuple[Path, PurePath]]] | None = None,
+    session_cache: SessionCache | None = None,
+) -> None:
+    """Parse the tasks and any files that they include; included files already in `results` are not parsed again.
+
+    Included files are parsed while the files that include them are being parsed (see
+    `_ProvisionalInclude`); an included file is only added to `results` once a file that includes it
+    has been parsed successfully.
+
+    When `retain_results` is False, entries in `results` remain None once the file has been parsed and
+    `on_file_complete_func` is the only way to access the result.
+
+    When `in_flight_limiter` is provided, a file's content isn't loaded until there is capacity for it;
+    the file remains in flight until `on_file_complete_func` returns.
+
+    When the schedule is `ScheduleType.Cost`, pending files are parsed in order of their estimated cost
+    rather than the order in which they were encountered. `include_edges` (the files included by each
+    file, as found by a previous parse) is used to estimate the height of each file's include chain
+    (the length of the longest chain of includes below it).
+
+    When `cancel_event` is set, files that haven't started parsing are skipped and files parsed by
+    worker threads are interrupted; their entries in `results` remain None. When `fail_fast` is True,
+    `cancel_event` is set once a file fails to parse (an event is created if one isn't provided).
+    Files parsed in worker processes run to completion, but are still subject to `file_timeout`.
+
+    When `dfa_snapshot` is provided, worker processes load the DFA states saved in the snapshot and
+    their DFA states are merged into this process when the process pool is shut down.
+
+    When `shared_process_pool`, `workspace_index`, or `session_cache` are provided, they are used rather
+    than creating new ones (or using the cache in `options`) for this call; all remain valid for
+    subsequent calls (see `ParseSession`).
+
+    When `retain_results` is True, content is only parsed once for all files with identical content;
+    the results for the other files are copies that reference their own filenames (see
+    `_RebindContent`). Results that aren't retained would otherwise be kept in memory for this purpose,
+    so every file is parsed when `retain_results` is False.
+    """
+
+    cache: ParseCache | SessionCache | None = options.cache if session_cache is None else session_cache
+
+    if options.fail_fast and cancel_event is None:
+        cancel_event = threading.Event()
 
-            if fullpath is not None and (directory_indicator is None or fullpath.is_dir()):
-                root = fullpath
-                break
+    results_lock = threading.Lock()
 
-        if root is None:
-            if directory_indicator is not None:
-                raise Errors.SimpleSchemaGeneratorError(
-                    Errors.ParseCreateIncludeStatementInvalidDirectory.Create(
-                        filename_or_directory.region,
-                        filename_or_directory.value,
-                    ),
-                )
+    num_threads = options.num_workers
+
+    # The file system is only examined once (at most) for each include search path
+    if workspace_index is None:
+        workspace_index = WorkspaceIndex(workspace_names, file_extensions)
+
+    workspace_index_generation = next(_WORKSPACE_INDEX_GENERATIONS)
+
+    content_index = _ContentIndex() if retain_results else None
+
+    # Provisional includes that haven't been confirmed or dropped; guarded by `results_lock`
+    pending_includes: dict[tuple[Path, PurePath], _ProvisionalInclude] = {}
+
+    with (
+        (
+            _YieldProcessPool(options.executor, num_threads, options.dfa_snapshot)
+            if shared_process_pool is None
+            else nullcontext(shared_process_pool)
+        ) as process_pool,
+        ExecuteTasks.YieldQueueExecutor(
+            dm,
+            "Parsing...",
+            quiet=options.quiet,
+            max_num_threads=num_threads,
+        ) as enqueue_func,
+    ):
+        scheduler = (
+            CostScheduler(enqueue_func, num_threads) if options.schedule == ScheduleType.Cost else None
+        )
 
-            raise Errors.SimpleSchemaGeneratorError(
-                Errors.ParseCreateIncludeStatementInvalidFilename.Create(
-                    filename_or_directory.region,
-                    filename_or_directory.value,
-                ),
+        include_heights = (
+            _CalculateIncludeHeights(include_edges) if scheduler is not None and include_edges else {}
+        )
+
+        # ----------------------------------------------------------------------
+        def Enqueue(
+            description: str,
+            workspace_root: Path,
+            relative_path: PurePath,
+            filename: Path,
+            prepare_func: ExecuteTasks.YieldQueueExecutorTypes.PrepareFuncType,
+        ) -> None:
+            if scheduler is None:
+                enqueue_func(description, prepare_func)
+                return
+
+            try:
+                size = filename.stat().st_size
+            except OSError:
+                # The content isn't on the file system
+                size = 0
+
+            scheduler.Add(
+                description,
+                prepare_func,
+                height=include_heights.get((workspace_root, relative_path), 0),
+                size=size,
             )
 
-        filename: Path | None = None
-        filename_region: Region | None = None
-        include_type: ParseIncludeStatementType | None = None
+        # ----------------------------------------------------------------------
+        def PrepareTask(  # noqa: C901, PLR0915
+            workspace_root: Path,
+            relative_path: PurePath,
+            content_func: Callable[[], str],
+            *,
+            is_included_file: bool,
+            provisional_include: _ProvisionalInclude | None = None,
+        ) -> tuple[int, ExecuteTasks.YieldQueueExecutorTypes.ExecuteFuncType]:
+            if cancel_event is not None and cancel_event.is_set():
+                # Don't load the content of a file that won't be parsed
+                return 0, lambda status: None  # noqa: ARG005
+
+            if (
+                provisional_include is not None
+                and provisional_include.resolved_event.is_set()
+                and not provisional_include.is_confirmed
+            ):
+                # The include has already been dropped
+                return 0, lambda status: None  # noqa: ARG005
+
+            content = ""
+            content_exception: Exception | None = None
+
+            # The number of bytes acquired before the content was loaded
+            num_reserved_bytes: int | None = None
+
+            if in_flight_limiter is not None:
+                in_flight_limiter.AcquireSlot()
+
+                if in_flight_limiter.max_bytes_in_flight is not None:
+                    # Use the size on the file system so that content that would exceed the limit isn't
+                    # loaded until there is capacity for it.
+                    with suppress(OSError):
+                        num_reserved_bytes = (workspace_root / relative_path).stat().st_size
+
+                    if num_reserved_bytes is not None:
+                        in_flight_limiter.AcquireBytes(num_reserved_bytes)
+
+            load_start_time = time.perf_counter()
+
+            try:
+                content = content_func()
+            except Exception as ex:
+                # Report the exception as the result for the file
+                content_exception = ex
+
+            load_time = time.perf_counter() - load_start_time
+
+            if in_flight_limiter is not None:
+                if num_reserved_bytes is None:
+                    # The content isn't on the file system, so its size isn't known until it is loaded
+                    in_flight_limiter.AcquireBytes(len(content))
+                else:
+                    in_flight_limiter.UpdateBytes(num_reserved_bytes, len(content))
 
-        if root.is_dir():
-            if is_star_include:
-                raise Errors.SimpleSchemaGeneratorError(
-                    Errors.ParseCreateIncludeStatementDirWithStar.Create(region, root)
-                )
+            num_lines = len(content.split("\n"))
 
-            filename = ResolveIncludeFilename(
-                root / items[0].element_name.value,
-                allow_directory=False,
-            )
+            # ----------------------------------------------------------------------
+            def Execute(  # noqa: C901, PLR0915
+                status: ExecuteTasks.Status,
+            ) -> str | None:
+                result: None | Exception | RootStatement = None
+                includes: list[tuple[Path, PurePath, Path]] = []
+                missing_paths: set[Path] = set()
 
-            filename_region = Region(
-                filename_or_directory.region.filename,
-                filename_or_directory.region.begin,
-                items[0].element_name.region.end,
-            )
+                # Files included by this file that are parsed while it is being parsed
+                provisional_includes: list[tuple[Path, PurePath, _ProvisionalInclude]] = []
 
-            if filename is None:
-                raise Errors.SimpleSchemaGeneratorError(
-                    Errors.ParseCreateIncludeStatementInvalidFilename.Create(
-                        filename_region,
-                        items[0].element_name.value,
-                    ),
-                )
+                # False if this file's include was dropped
+                is_committed = True
 
-            include_type = ParseIncludeStatementType.Module
+                file_stats = FileParseStats(load_time=load_time) if options.stats is not None else None
+
+                # ----------------------------------------------------------------------
+                def ReportInclude(
+                    include_args: tuple[Path, PurePath, Path],
+                ) -> None:
+                    include = OnInclude(*include_args, is_provisional=True)
+
+                    if include is not None:
+                        provisional_includes.append((include_args[0], include_args[1], include))
+
+                # ----------------------------------------------------------------------
+                def OnExit() -> None:
+                    if result is None:
+                        # Parsing was cancelled
+                        return
+
+                    if not is_committed:
+                        return
+
+                    if file_stats is not None:
+                        assert options.stats is not None
+                        options.stats.Add(workspace_root, relative_path, file_stats)
+
+                        status.OnInfo(f"{relative_path}: {file_stats}", verbose=True)
+
+                    if retain_results:
+                        with results_lock:
+                            assert results[workspace_root][relative_path] is None
+                            results[workspace_root][relative_path] = result
+
+                    if on_file_complete_func is not None:
+                        on_file_complete_func(workspace_root, relative_path, result, includes, missing_paths)
+
+                # ----------------------------------------------------------------------
+                def ReleaseInFlight() -> None:
+                    if in_flight_limiter is not None:
+                        in_flight_limiter.Release(len(content))
+
+                # ----------------------------------------------------------------------
+                def CompleteContentEntry() -> None:
+                    if content_entry is None or not is_content_entry_owner:
+                        return
+
+                    if isinstance(result, RootStatement):
+                        content_entry.root = result
+
+                    content_entry.complete_event.set()
+
+                # ----------------------------------------------------------------------
+                def ResolveIncludes() -> None:
+                    nonlocal is_committed
+
+                    if result is not None and provisional_include is not None:
+                        # Wait for the file that includes this one to confirm or drop the include
+                        provisional_include.resolved_event.wait()
+                        is_committed = provisional_include.is_confirmed
+
+                    # The includes of a file that was parsed successfully are confirmed. Recovered results
+                    # contain the include statements that were parsed, so their includes are confirmed
+                    # as well. Files that aren't confirmed (for example, files found by scanning the
+                    # header of content that couldn't be parsed) aren't part of the results.
+                    if is_committed and isinstance(result, (RootStatement, ParseRecoveryError)):
+                        for include_args in includes:
+                            OnInclude(*include_args)
+
+                    for include_workspace_root, include_relative_path, include in provisional_includes:
+                        DropProvisionalInclude(include_workspace_root, include_relative_path, include)
+
+                    if options.fail_fast and is_committed and isinstance(result, Exception):
+                        assert cancel_event is not None
+                        cancel_event.set()
+
+                # ----------------------------------------------------------------------
+
+                if cancel_event is not None and cancel_event.is_set():
+                    ReleaseInFlight()
+                    return None
+
+                content_entry: _ContentIndexEntry | None = None
+                is_content_entry_owner = False
+
+                # `CompleteContentEntry` is invoked before `ResolveIncludes`, which is invoked before
+                # `OnExit`, which is invoked before `ReleaseInFlight`.
+                with ExitStack(ReleaseInFlight, OnExit, ResolveIncludes, CompleteContentEntry):
+                    try:
+                        if content_exception is not None:
+                            raise content_exception  # noqa: TRY301
+
+                        fullpath = workspace_root / relative_path
+
+                        cache_key: str | None = None
+
+                        if cache is not None:
+                            cache_key = _CreateCacheKey(
+                                content,
+                                fullpath,
+                                file_extensions,
+                                workspace_names,
+                                tab_width=options.tab_width,
+                            )
+
+                            cached_result = _GetCachedResult(cache, cache_key, workspace_index)
+                            if cached_result is not None:
+                                result, includes, missing_paths = cached_result
+
+                                if file_stats is not None:
+                                    file_stats.is_cached = True
+
+                                for include_args in includes:
+                                    ReportInclude(include_args)
+
+                                status.OnProgress(num_lines, None)
+                                return None
+
+                        # Start parsing the files included by this one while it is being parsed
+                        for include_args in _ScanHeaderIncludes(
+                            content,
+                            fullpath,
+                            workspace_index,
+                            workspace_names,
+                        ):
+                            ReportInclude(include_args)
+
+                        # ----------------------------------------------------------------------
+                        def OnFileInclude(*args) -> None:
+                            # Includes are reported again when parsing falls back to LL prediction
+                            if args not in includes:
+                                includes.append(args)
+
+                            ReportInclude(args)
+
+                        # ----------------------------------------------------------------------
+
+                        if content_index is not None:
+                            content_entry, is_content_entry_owner = content_index.GetOrAdd(
+                                content,
+                                is_included_file=is_included_file,
+                            )
+
+                            if not is_content_entry_owner:
+                                # Wait for the file with identical content to be parsed; it was parsing
+                                # before this entry was found, so it doesn't depend on this file.
+                                content_entry.complete_event.wait()
+
+                                if content_entry.root is not None:
+                                    result = _RebindContent(
+                                        content_entry.root,
+                                        content,
+                                        fullpath,
+                                        _CreateIncludeStatementFuncFactory(
+                                            workspace_index,
+                                            workspace_names,
+                                            OnFileInclude,
+                                            missing_paths,
+                                        ),
+                                        is_included_file=is_included_file,
+                                        tab_width=options.tab_width,
+                                        tokenizer=options.tokenizer,
+                                        file_stats=file_stats,
+                                    )
+
+                        if result is not None:
+                            # The content was parsed for another file
+                            status.OnProgress(num_lines, None)
+
+                        elif process_pool is None:
+                            result = _ParseContent(
+                                content,
+                                fullpath,
+                                _CreateIncludeStatementFuncFactory(
+                                    workspace_index,
+                                    workspace_names,
+                                    OnFileInclude,
+                                    missing_paths,
+                                ),
+                                lambda line: cast(None, status.OnProgress(line, None)),
+                                is_included_file=is_included_file,
+                                tab_width=options.tab_width,
+                                antlr_diagnostics=options.antlr_diagnostics,
+                                tokenizer=options.tokenizer,
+                                file_stats=file_stats,
+                                cancel_event=cancel_event,
+                                file_timeout=options.file_timeout,
+                                max_errors=options.max_errors,
+                            )
+                        else:
+                            (
+                                process_result,
+                                process_includes,
+                                process_missing_paths,
+                                process_stats,
+                            ) = _ParseContentInProcessPool(
+                                process_pool,
+                                content,
+                                workspace_root,
+                                relative_path,
+                                file_extensions,
+                                workspace_names,
+                                lambda line: cast(None, status.OnProgress(line, None)),
+                                is_included_file=is_included_file,
+                                tab_width=options.tab_width,
+                                antlr_diagnostics=options.antlr_diagnostics,
+                                chunk_lines=options.chunk_lines,
+                                tokenizer=options.tokenizer,
+                                collect_stats=file_stats is not None,
+                                file_timeout=options.file_timeout,
+                                max_errors=options.max_errors,
+                                workspace_index_generation=workspace_index_generation,
+                            )
+
+                            if file_stats is not None:
+                                assert process_stats is not None
+                                file_stats.Accumulate(process_stats)
+
+                            # Includes discovered in the worker process are enqueued here, as the
+                            # worker process doesn't have access to the executor.
+                            for include_args in process_includes:
+                                includes.append(include_args)
+                                ReportInclude(include_args)
+
+                            missing_paths.update(process_missing_paths)
+
+                            status.OnProgress(num_lines, None)
+
+                            if isinstance(process_result, Exception):
+                                raise process_result  # noqa: TRY301
+
+                            result = process_result
+
+                        if cache is not None:
+                            assert cache_key is not None
+
+                            # The cache is best-effort; a result that can't be cached is still valid
+                            with suppress(OSError, pickle.PicklingError):
+                                cache.Set(cache_key, (result, includes, missing_paths))
+
+                    except _CancelledError:
+                        # The file wasn't completely parsed
+                        assert result is None
+                        return None
+
+                    except Exception as ex:
+                        result = ex
+
+                if is_committed and isinstance(result, Exception):
+                    raise result
+
+                return None
+
+            # ----------------------------------------------------------------------
+
+            return num_lines, Execute
+
+        # ----------------------------------------------------------------------
+        def OnInclude(
+            workspace_root: Path,
+            relative_path: PurePath,
+            filename: Path,
+            *,
+            is_provisional: bool = False,
+        ) -> _ProvisionalInclude | None:
+            # Determine if this is a file that should be enqueued for parsing
+            with results_lock:
+                workspace_results = results[workspace_root]
+
+                if relative_path in workspace_results:
+                    if not is_provisional:
+                        provisional_include = pending_includes.pop((workspace_root, relative_path), None)
+
+                        if provisional_include is not None:
+                            provisional_include.is_confirmed = True
+                            provisional_include.resolved_event.set()
+
+                    return None
+
+                workspace_results[relative_path] = None
+
+                if is_provisional:
+                    provisional_include = _ProvisionalInclude()
+                    pending_includes[(workspace_root, relative_path)] = provisional_include
+                else:
+                    provisional_include = None
+
+            Enqueue(
+                str(filename),
+                workspace_root,
+                relative_path,
+                filename,
+                lambda _: PrepareTask(
+                    workspace_root,
+                    relative_path,
+                    lambda: _ReadFile(filename),
+                    is_included_file=True,
+                    provisional_include=provisional_include,
+                ),
+            )
+
+            return provisional_include
+
+        # ----------------------------------------------------------------------
+        def DropProvisionalInclude(
+            workspace_root: Path,
+            relative_path: PurePath,
+            provisional_include: _ProvisionalInclude,
+        ) -> None:
+            with results_lock:
+                if pending_includes.get((workspace_root, relative_path)) is not provisional_include:
+                    # The include has been confirmed
+                    return
+
+                del pending_includes[(workspace_root, relative_path)]
+
+                # The file is enqueued again if another file includes it
+                del results[workspace_root][relative_path]
+
+            provisional_include.resolved_event.set()
+
+        # ----------------------------------------------------------------------
+
+        is_single_workspace = len(workspace_names) == 1
+
+        # Consider all of the tasks that are available up front before starting any of them; tasks
+        # that are provided over time are started as they become available.
+        if scheduler is not None and isinstance(tasks, list):
+            hold_context = scheduler.Hold()
+        else:
+            hold_context = nullcontext()
+
+        with hold_context:
+            for workspace_root, relative_path, content_func, is_included_file in tasks:
+                Enqueue(
+                    str(relative_path if is_single_workspace else workspace_root / relative_path),
+                    workspace_root,
+                    relative_path,
+                    workspace_root / relative_path,
+                    lambda on_simple_status_func,  # noqa: ARG005
+                    workspace_root=workspace_root,
+                    relative_path=relative_path,
+                    content_func=content_func,
+                    is_included_file=is_included_file: PrepareTask(
+                        workspace_root,
+                        relative_path,
+                        content_func,
+                        is_included_file=is_included_file,
+                    ),
+                )
+
+    if options.stats is not None:
+        dm.WriteVerbose(options.stats.CreateSummary())
+
+
+# ----------------------------------------------------------------------
+def _CalculateIncludeHeights(
+    include_edges: dict[tuple[Path, PurePath], set[tuple[Path, PurePath]]],
+) -> dict[tuple[Path, PurePath], int]:
+    """Return the length of the longest chain of includes below each file in the include graph."""
+
+    heights: dict[tuple[Path, PurePath], int] = {}
+
+    # Files on the current path; an include of one of these files is part of a cycle rather than a
+    # chain, so it doesn't contribute to the height of the file that includes it.
+    visiting: set[tuple[Path, PurePath]] = set()
+
+    for root_key, root_include_keys in include_edges.items():
+        if root_key in heights:
+            continue
+
+        visiting.add(root_key)
+        stack = [(root_key, iter(root_include_keys))]
+
+        while stack:
+            key, include_keys = stack[-1]
+
+            for include_key in include_keys:
+                if include_key not in heights and include_key not in visiting:
+                    visiting.add(include_key)
+                    stack.append((include_key, iter(include_edges.get(include_key, ()))))
+                    break
+            else:
+                stack.pop()
+                visiting.remove(key)
+
+                heights[key] = max(
+                    (
+                        heights[include_key] + 1
+                        for include_key in include_edges.get(key, ())
+                        if include_key in heights
+                    ),
+                    default=0,
+                )
+
+    return heights
+
+
+# ----------------------------------------------------------------------
+def _FinalizeResults(
+    dm: DoneManager,
+    results: dict[Path, dict[PurePath, None | Exception | RootStatement]],
+    *,
+    raise_if_single_exception: bool,
+    allow_unparsed: bool = False,
+) -> dict[Path, dict[PurePath, Exception | RootStatement]]:
+    if dm.result != 0 and raise_if_single_exception:
+        exceptions: list[Exception] = []
+
+        for workspace_results in results.values():
+            exceptions += [result for result in workspace_results.values() if isinstance(result, Exception)]
+
+        if len(exceptions) == 1:
+            raise exceptions[0]
+
+    if allow_unparsed:
+        # Remove the files that weren't parsed because parsing was cancelled
+        return {
+            workspace_root: {
+                relative_path: result
+                for relative_path, result in workspace_results.items()
+                if result is not None
+            }
+            for workspace_root, workspace_results in results.items()
+        }
+
+    for workspace_root, workspace_results in results.items():
+        for relative_path, result in workspace_results.items():
+            assert result is not None, (workspace_root, relative_path)
+
+    return cast(dict[Path, dict[PurePath, Exception | RootStatement]], results)
+
+
+# ----------------------------------------------------------------------
+def _ReadFile(
+    filename: Path,
+) -> str:
+    with filename.open(encoding="utf-8") as f:
+        return f.read()
+
+
+# ----------------------------------------------------------------------
+def _CreateRootStatement(
+    filename: Path,
+    statements: list[Statement],
+) -> RootStatement:
+    if not statements:
+        region = Region(filename, Location(1, 1), Location(1, 1))
+    else:
+        region = Region(filename, statements[0].region.begin, statements[-1].region.end)
+
+    return RootStatement(region, statements)
+
+
+# ----------------------------------------------------------------------
+@contextmanager
+def _YieldProcessPool(
+    executor: ExecutorType,
+    num_workers: int,
+    dfa_snapshot: Path | None = None,
+) -> Iterator[ProcessPoolExecutor | None]:
+    if executor == ExecutorType.Thread:
+        yield None
+        return
+
+    with _CreateProcessPool(num_workers, dfa_snapshot) as process_pool:
+        yield process_pool
+
+
+# ----------------------------------------------------------------------
+def _CreateProcessPool(
+    num_workers: int,
+    dfa_snapshot: Path | None = None,
+) -> ProcessPoolExecutor:
+    if dfa_snapshot is not None:
+        return _DfaSnapshotProcessPool(num_workers, dfa_snapshot)
+
+    # Use "spawn" rather than the platform default, as forking a process with running threads is
+    # not safe.
+    return ProcessPoolExecutor(
+        max_workers=num_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+
+# ----------------------------------------------------------------------
+def _CreateCacheKey(
+    content: str,
+    fullpath: Path,
+    file_extensions: list[str],
+    workspace_names: list[Path],
+    *,
+    tab_width: int,
+) -> str:
+    hasher = hashlib.sha256()
+
+    # Included filenames and regions are resolved relative to the file and the workspaces, so those
+    # values are part of the key along with the content.
+    hasher.update(
+        repr(
+            (
+                __version__,
+                GetGrammarVersion(),
+                tab_width,
+                str(fullpath),
+                file_extensions,
+                [str(workspace_name) for workspace_name in workspace_names],
+            ),
+        ).encode("utf-8"),
+    )
+
+    hasher.update(content.encode("utf-8"))
+
+    return hasher.hexdigest()
+
+
+# ----------------------------------------------------------------------
+def _GetCachedResult(
+    cache: ParseCache | SessionCache,
+    cache_key: str,
+    workspace_index: WorkspaceIndex,
+) -> tuple[RootStatement, list[tuple[Path, PurePath, Path]], set[Path]] | None:
+    cached_result = cache.Get(cache_key)
+
+    if (
+        not isinstance(cached_result, tuple)
+        or len(cached_result) != 3  # noqa: PLR2004
+        or not isinstance(cached_result[0], RootStatement)
+    ):
+        return None
+
+    # An included file that has since been removed is an error that should be reported by parsing
+    # the content again.
+    if not all(workspace_index.IsFile(filename) for _, _, filename in cached_result[1]):
+        return None
+
+    # A path checked before an include was resolved has since been created, so the include may now
+    # resolve to that file instead.
+    if any(workspace_index.Exists(missing_path) for missing_path in cached_result[2]):
+        return None
+
+    return cast(tuple[RootStatement, list[tuple[Path, PurePath, Path]], set[Path]], cached_result)
+
+
+# ----------------------------------------------------------------------
+def _RebindContent(
+    root: RootStatement,
+    content: str,
+    fullpath: Path,
+    create_include_statement_func: _CreateIncludeStatementFuncType,
+    *,
+    is_included_file: bool,
+    tab_width: int,
+    tokenizer: TokenizerType,
+    file_stats: FileParseStats | None,
+) -> RootStatement | None:
+    """Return a copy of a root parsed from identical content for `fullpath`, or None if the content must be parsed.
+
+    The regions within the copy reference `fullpath`. Include statements are resolved relative to the
+    file that contains them, so the include statements at the beginning of the content are parsed
+    again; these are the only statements that can depend on the location of the file.
+    """
+
+    num_include_statements = 0
+
+    while num_include_statements < len(root.statements) and isinstance(
+        root.statements[num_include_statements],
+        ParseIncludeStatement,
+    ):
+        num_include_statements += 1
+
+    statements: list[Statement] = []
+
+    if num_include_statements:
+        include_statements = root.statements[:num_include_statements]
+
+        header_end = include_statements[-1].region.end
+        header_content = content[: _GetLineStartOffset(content, header_end.line - 1) + header_end.column - 1]
+
+        try:
+            header_root = _ParseContent(
+                header_content,
+                fullpath,
+                create_include_statement_func,
+                lambda line: None,  # noqa: ARG005
+                is_included_file=is_included_file,
+                tab_width=tab_width,
+                antlr_diagnostics=False,
+                tokenizer=tokenizer,
+                file_stats=file_stats,
+            )
+        except Exception:
+            # Parse the content to report the error
+            return None
+
+        if [(statement.region.begin, statement.region.end) for statement in header_root.statements] != [
+            (statement.region.begin, statement.region.end) for statement in include_statements
+        ]:
+            return None
+
+        statements += header_root.statements
+
+    statements += _RebindRegions(root.statements[num_include_statements:], fullpath)
+
+    result = _CreateRootStatement(fullpath, statements)
+
+    if file_stats is not None:
+        element_counter = _ElementCounter()
+
+        result.Accept(element_counter)
+
+        file_stats.num_elements = element_counter.num_elements
+        file_stats.is_duplicate = True
+
+    return result
+
+
+# ----------------------------------------------------------------------
+def _RebindRegions(
+    statements: list[Statement],
+    filename: Path,
+) -> list[Statement]:
+    """Return copies of the statements where every region references `filename`.
+
+    Every element has a region, so every element is copied and the memory used by the elements grows
+    with each file that has the same content. Values that don't depend on the filename (locations,
+    names, literal values, resolved include filenames, etc.) are shared with the original elements
+    rather than copied. Elements are copied directly rather than serialized and deserialized.
+    """
+
+    copies: dict[int, object] = {}
+
+    # ----------------------------------------------------------------------
+    def Rebind(
+        value: Any,  # noqa: ANN401
+    ) -> Any:  # noqa: ANN401
+        if isinstance(value, Region):
+            return Region(filename, value.begin, value.end)
+
+        if isinstance(value, list):
+            return [Rebind(item) for item in value]
+
+        if isinstance(value, tuple):
+            return tuple(Rebind(item) for item in value)
+
+        if isinstance(value, dict):
+            return {key: Rebind(item) for key, item in value.items()}
+
+        # Elements (and the objects that they contain) are dataclasses; everything else is immutable
+        if isinstance(value, (Location, type)) or not is_dataclass(value):
+            return value
+
+        # Elements may be referenced more than once
+        value_copy = copies.get(id(value))
+
+        if value_copy is None:
+            value_copy = value.__class__.__new__(value.__class__)
+            value_copy.__dict__.update((key, Rebind(item)) for key, item in value.__dict__.items())
+
+            copies[id(value)] = value_copy
+
+        return value_copy
+
+    # ----------------------------------------------------------------------
+
+    return cast(list[Statement], Rebind(statements))
+
+
+# ----------------------------------------------------------------------
+def _ParseContent(  # noqa: PLR0913
+    content: str,
+    fullpath: Path,
+    create_include_statement_func: _CreateIncludeStatementFuncType,
+    on_progress_func: Callable[[int], None],
+    *,
+    is_included_file: bool,
+    tab_width: int,
+    antlr_diagnostics: bool,
+    tokenizer: TokenizerType = TokenizerType.Antlr,
+    line_offset: int = 0,
+    file_stats: FileParseStats | None = None,
+    cancel_event: threading.Event | None = None,
+    file_timeout: float | None = None,
+    max_errors: int | None = None,
+    report_lexer_errors: bool = True,
+) -> RootStatement:
+    if max_errors is not None:
+        return _ParseContentWithRecovery(
+            content,
+            fullpath,
+            create_include_statement_func,
+            on_progress_func,
+            max_errors=max_errors,
+            is_included_file=is_included_file,
+            tab_width=tab_width,
+            antlr_diagnostics=antlr_diagnostics,
+            tokenizer=tokenizer,
+            line_offset=line_offset,
+            file_stats=file_stats,
+            cancel_event=cancel_event,
+            file_timeout=file_timeout,
+        )
+
+    interrupt_listener: _InterruptListener | None = None
+
+    if cancel_event is not None or file_timeout is not None:
+        interrupt_listener = _InterruptListener(fullpath, cancel_event, file_timeout)
+
+    if file_stats is not None:
+        create_include_statement_func = _CreateTimedIncludeStatementFunc(
+            create_include_statement_func,
+            file_stats,
+        )
+
+    # ----------------------------------------------------------------------
+    def CreateVisitor() -> _SimpleSchemaVisitor:
+        return _SimpleSchemaVisitor(
+            content,
+            fullpath,
+            on_progress_func,
+            create_include_statement_func,
+            is_included_file=is_included_file,
+            tab_width=tab_width,
+        )
+
+    # ----------------------------------------------------------------------
+
+    start_time = time.perf_counter()
+
+    try:
+        if antlr_diagnostics:
+            visitor = CreateVisitor()
+
+            ast = _ParseWithDiagnostics(
+                content,
+                fullpath,
+                line_offset=line_offset,
+                file_stats=file_stats,
+                interrupt_listener=interrupt_listener,
+                report_lexer_errors=report_lexer_errors,
+            )
+            assert ast
+
+            visit_start_time = time.perf_counter()
+            ast.accept(visitor)
+
+            if file_stats is not None:
+                file_stats.visit_time += time.perf_counter() - visit_start_time
+        else:
+            visitor = _ParseTwoStage(
+                content,
+                fullpath,
+                CreateVisitor,
+                tokenizer=tokenizer,
+                line_offset=line_offset,
+                file_stats=file_stats,
+                interrupt_listener=interrupt_listener,
+                report_lexer_errors=report_lexer_errors,
+            )
+
+    finally:
+        if file_stats is not None:
+            # Includes are resolved while elements are created, and everything else happens while
+            # the content is parsed.
+            file_stats.visit_time -= file_stats.include_time
+            file_stats.parse_time += (
+                time.perf_counter()
+                - start_time
+                - file_stats.lex_time
+                - file_stats.visit_time
+                - file_stats.include_time
+            )
+
+    root = visitor.root
+
+    if file_stats is not None:
+        element_counter = _ElementCounter()
+
+        root.Accept(element_counter)
+        file_stats.num_elements += element_counter.num_elements
+
+    return root
+
+
+# ----------------------------------------------------------------------
+def _ParseContentWithRecovery(  # noqa: PLR0913
+    content: str,
+    fullpath: Path,
+    create_include_statement_func: _CreateIncludeStatementFuncType,
+    on_progress_func: Callable[[int], None],
+    *,
+    max_errors: int,
+    is_included_file: bool,
+    tab_width: int,
+    antlr_diagnostics: bool,
+    tokenizer: TokenizerType,
+    line_offset: int,
+    file_stats: FileParseStats | None,
+    cancel_event: threading.Event | None,
+    file_timeout: float | None,
+) -> RootStatement:
+    """Parse the content, continuing at the next top-level statement after an error; raises ParseRecoveryError if there are errors."""
+
+    deadline = None if file_timeout is None else time.perf_counter() + file_timeout
+
+    # ----------------------------------------------------------------------
+    def ParseImpl(
+        this_content: str,
+        this_line_offset: int,
+        *,
+        report_lexer_errors: bool,
+    ) -> RootStatement:
+        # `_ParseContent` can't populate the same statistics more than once
+        this_file_stats = None if file_stats is None else FileParseStats()
+
+        try:
+            return _ParseContent(
+                this_content,
+                fullpath,
+                create_include_statement_func,
+                on_progress_func,
+                is_included_file=is_included_file,
+                tab_width=tab_width,
+                antlr_diagnostics=antlr_diagnostics,
+                tokenizer=tokenizer,
+                line_offset=this_line_offset,
+                file_stats=this_file_stats,
+                cancel_event=cancel_event,
+                file_timeout=None if deadline is None else max(deadline - time.perf_counter(), 0.0),
+                report_lexer_errors=report_lexer_errors,
+            )
+        except _TimeoutError as ex:
+            # Report the timeout for the file rather than the time that remained
+            assert file_timeout is not None
+            raise _TimeoutError.Create(
+                file_timeout, ex.source, ex.location.line, ex.location.column
+            ) from None
+        finally:
+            if this_file_stats is not None:
+                assert file_stats is not None
+                file_stats.Accumulate(this_file_stats)
+
+    # ----------------------------------------------------------------------
+
+    # Most content doesn't contain errors. There is no time left to parse the content again if parsing
+    # timed out.
+    try:
+        return ParseImpl(content, line_offset, report_lexer_errors=True)
+    except _TimeoutError:
+        raise
+    except (AntlrError, Errors.SimpleSchemaGeneratorError) as ex:
+        content_exception = ex
+
+    # Parse each top-level statement on its own so that an error only impacts the statement that
+    # contains it. Chunks are processed from the end of this list.
+    chunks = [
+        (line_offset + chunk_line_offset, chunk_content)
+        for chunk_line_offset, chunk_content in reversed(_SplitContent(content, 1))
+    ]
+
+    statements: list[Statement] = []
+    errors: list[Exception] = []
+
+    while chunks and len(errors) < max_errors:
+        chunk_line_offset, chunk_content = chunks.pop()
+
+        try:
+            # Lexer errors were reported when all of the content was parsed
+            statements += ParseImpl(chunk_content, chunk_line_offset, report_lexer_errors=False).statements
+            continue
+        except _TimeoutError as ex:
+            # The remaining chunks can't be parsed in the time that is left
+            errors.append(ex)
+            break
+        except (AntlrError, Errors.SimpleSchemaGeneratorError) as ex:
+            errors.append(ex)
+
+            error_location = ex.location if isinstance(ex, AntlrError) else ex.errors[0].regions[0].begin
+
+        # Continue at the first statement that begins after the error; the statement may begin on the
+        # line with the error if the error is at the beginning of that line (for example, when the
+        # previous statement is incomplete). Brackets that aren't balanced are likely part of the
+        # error, so chunk boundaries are searched for again.
+        resume_offset = _GetLineStartOffset(chunk_content, error_location.line - chunk_line_offset - 1)
+
+        if error_location.column != 1 or resume_offset == 0:
+            resume_offset = _GetLineStartOffset(chunk_content, error_location.line - chunk_line_offset)
+
+        match = _RECOVERY_STATEMENT_START_REGEX.search(chunk_content, max(resume_offset, 1))
+        if match is None:
+            continue
+
+        resume_line_offset = chunk_line_offset + chunk_content.count("\n", 0, match.start())
+
+        chunks += [
+            (resume_line_offset + this_line_offset, this_content)
+            for this_line_offset, this_content in reversed(_SplitContent(chunk_content[match.start() :], 1))
+        ]
+
+    if not errors:
+        # Each statement is valid on its own, but the content isn't
+        errors.append(content_exception)
+
+    raise ParseRecoveryError(errors, _CreateRootStatement(fullpath, statements))
+
+
+# ----------------------------------------------------------------------
+def _GetLineStartOffset(
+    content: str,
+    line_index: int,
+) -> int:
+    """Return the offset of the beginning of the line (or the length of the content if there aren't enough lines)."""
+
+    if line_index <= 0:
+        return 0
+
+    offset = 0
+
+    for _ in range(line_index):
+        offset = content.find("\n", offset)
+        if offset == -1:
+            return len(content)
+
+        offset += 1
+
+    return offset
+
+
+# ----------------------------------------------------------------------
+def _CreateParser(
+    content: str,
+    token_stream_type: type[antlr4.CommonTokenStream],
+    *,
+    tokenizer: TokenizerType = TokenizerType.Antlr,
+    line_offset: int = 0,
+    file_stats: FileParseStats | None = None,
+    interrupt_listener: _InterruptListener | None = None,
+    lexer_error_listener: ErrorListener | None = None,
+) -> SimpleSchemaParser:
+    token_source: SimpleSchemaLexer | RegexTokenizer | _TimedTokenSource
+
+    if tokenizer == TokenizerType.Regex:
+        token_source = RegexTokenizer(content, line_offset=line_offset)
+    else:
+        token_source = SimpleSchemaLexer(CompactInputStream(content))
+
+        # Initialize instance variables that we have explicitly added to the ANTLR grammar file
+        token_source.CustomInitialization()
+
+        # Content that is a chunk of a larger file begins at a line other than the first
+        token_source.line += line_offset
+
+        # The lexer writes errors to the console by default
+        token_source.removeErrorListeners()
+
+        if lexer_error_listener is not None:
+            token_source.addErrorListener(lexer_error_listener)
+
+    if file_stats is not None:
+        token_source = _TimedTokenSource(token_source, file_stats)
+
+    parser = SimpleSchemaParser(token_stream_type(token_source))
+
+    parser.removeErrorListeners()
+
+    if interrupt_listener is not None:
+        parser.addParseListener(interrupt_listener)
+
+    return parser
+
+
+# ----------------------------------------------------------------------
+def _ParseTwoStage(
+    content: str,
+    fullpath: Path,
+    create_visitor_func: Callable[[], _SimpleSchemaVisitor],
+    *,
+    tokenizer: TokenizerType = TokenizerType.Antlr,
+    line_offset: int = 0,
+    file_stats: FileParseStats | None = None,
+    interrupt_listener: _InterruptListener | None = None,
+    report_lexer_errors: bool = True,
+) -> _SimpleSchemaVisitor:
+    # SLL prediction is significantly faster than full LL prediction and is sufficient for nearly
+    # all input. Bail at the first error, as the error may be the result of SLL's weaker prediction;
+    # in that case, parse again with full LL prediction so that valid content is still recognized
+    # and errors are reported exactly as they would have been without the first stage.
+    #
+    # The first stage lexes the content as the parser consumes it and doesn't buffer hidden tokens.
+    # Error messages include the text of hidden tokens, so the second stage lexes the content again
+    # with a standard token stream.
+    #
+    # The regex tokenizer raises ParseCancellationException when it encounters content that it can't
+    # tokenize exactly as the ANTLR lexer would; that content is tokenized by the ANTLR lexer in the
+    # second stage.
+    #
+    # Elements are created as the content is parsed in both stages; elements created by the first
+    # stage are discarded if it fails.
+    #
+    # Lexer errors are written to the console; errors encountered by the first stage are only written
+    # if the first stage succeeds, as the content is lexed again by the second stage.
+    lexer_error_collector = _LexerErrorCollector()
+
+    parser = _CreateParser(
+        content,
+        StreamingTokenStream,
+        tokenizer=tokenizer,
+        line_offset=line_offset,
+        file_stats=file_stats,
+        interrupt_listener=interrupt_listener,
+        lexer_error_listener=lexer_error_collector,
+    )
+
+    visitor = create_visitor_func()
+
+    parse_listener = visitor.CreateParseListener(file_stats)
+    parser.addParseListener(parse_listener)
+
+    parser._interp.predictionMode = PredictionMode.SLL  # noqa: SLF001
+    parser._errHandler = antlr4.BailErrorStrategy()  # noqa: SLF001
+
+    try:
+        parser.entry_point__()
+    except ParseCancellationException:
+        pass
+    else:
+        if report_lexer_errors:
+            lexer_error_collector.Report(ConsoleErrorListener.INSTANCE)
+
+        parse_listener.RaiseDeferredException()
+        return visitor
+
+    parser = _CreateParser(
+        content,
+        antlr4.CommonTokenStream,
+        line_offset=line_offset,
+        file_stats=file_stats,
+        interrupt_listener=interrupt_listener,
+        lexer_error_listener=ConsoleErrorListener.INSTANCE if report_lexer_errors else None,
+    )
+
+    visitor = create_visitor_func()
+
+    parse_listener = visitor.CreateParseListener(file_stats)
+    parser.addParseListener(parse_listener)
+
+    parser.addErrorListener(_ErrorListener(fullpath))
+    parser._interp.predictionMode = PredictionMode.LL  # noqa: SLF001
+    parser._errHandler = DefaultErrorStrategy()  # noqa: SLF001
+
+    parser.entry_point__()
+
+    parse_listener.RaiseDeferredException()
+    return visitor
+
+
+# ----------------------------------------------------------------------
+def _ParseWithDiagnostics(
+    content: str,
+    fullpath: Path,
+    *,
+    line_offset: int = 0,
+    file_stats: FileParseStats | None = None,
+    interrupt_listener: _InterruptListener | None = None,
+    report_lexer_errors: bool = True,
+) -> SimpleSchemaParser.Entry_point__Context:
+    # Report grammar ambiguities to the console; this is useful when making changes to the grammar,
+    # but is much slower than the two-stage parse.
+    parser = _CreateParser(
+        content,
+        antlr4.CommonTokenStream,
+        line_offset=line_offset,
+        file_stats=file_stats,
+        interrupt_listener=interrupt_listener,
+        lexer_error_listener=ConsoleErrorListener.INSTANCE if report_lexer_errors else None,
+    )
+
+    parser.addErrorListener(_ErrorListener(fullpath))
+    parser.addErrorListener(antlr4.DiagnosticErrorListener())
+    parser.addErrorListener(ConsoleErrorListener.INSTANCE)
+
+    parser._interp.predictionMode = PredictionMode.LL_EXACT_AMBIG_DETECTION  # noqa: SLF001
+
+    return parser.entry_point__()
+
+
+# ----------------------------------------------------------------------
+@lru_cache(maxsize=1)
+def _GetProcessWorkspaceIndex(
+    workspace_names: tuple[Path, ...],
+    file_extensions: tuple[str, ...],
+    generation: int,  # noqa: ARG001
+) -> WorkspaceIndex:
+    # The index is shared by all of the files parsed by the process during a call to `_ExecuteParse`;
+    # worker processes owned by a `ParseSession` outlive the call, so a new index is created for each
+    # call (the file system may have changed since the previous call).
+    return WorkspaceIndex(list(workspace_names), list(file_extensions))
+
+
+# ----------------------------------------------------------------------
+def _ParseContentInProcess(  # noqa: PLR0913
+    content: str,
+    workspace_root: Path,
+    relative_path: PurePath,
+    file_extensions: list[str],
+    workspace_names: list[Path],
+    *,
+    is_included_file: bool,
+    tab_width: int,
+    antlr_diagnostics: bool,
+    tokenizer: TokenizerType = TokenizerType.Antlr,
+    line_offset: int = 0,
+    collect_stats: bool = False,
+    file_timeout: float | None = None,
+    max_errors: int | None = None,
+    workspace_index_generation: int = 0,
+) -> tuple[
+    Exception | RootStatement,
+    list[tuple[Path, PurePath, Path]],  # Included files (workspace_root, relative_path, filename)
+    set[Path],  # Missing paths (see `WorkspaceIndex.ResolveIncludeFilename`)
+    FileParseStats | None,
+]:
+    """Parse content within a worker process; included files and statistics are returned rather than enqueued or recorded."""
+
+    includes: list[tuple[Path, PurePath, Path]] = []
+    missing_paths: set[Path] = set()
+
+    # ----------------------------------------------------------------------
+    def OnInclude(*args) -> None:
+        # Includes are reported again when parsing falls back to LL prediction
+        if args not in includes:
+            includes.append(args)
+
+    # ----------------------------------------------------------------------
+
+    create_include_statement_func = _CreateIncludeStatementFuncFactory(
+        _GetProcessWorkspaceIndex(
+            tuple(workspace_names),
+            tuple(file_extensions),
+            workspace_index_generation,
+        ),
+        workspace_names,
+        OnInclude,
+        missing_paths,
+    )
+
+    file_stats = FileParseStats() if collect_stats else None
+
+    result: Exception | RootStatement
+
+    try:
+        result = _ParseContent(
+            content,
+            workspace_root / relative_path,
+            create_include_statement_func,
+            lambda _: None,
+            is_included_file=is_included_file,
+            tab_width=tab_width,
+            antlr_diagnostics=antlr_diagnostics,
+            tokenizer=tokenizer,
+            line_offset=line_offset,
+            file_stats=file_stats,
+            file_timeout=file_timeout,
+            max_errors=max_errors,
+        )
+    except Exception as ex:
+        result = ex
+
+    return result, includes, missing_paths, file_stats
+
+
+# ----------------------------------------------------------------------
+def _ParseContentInProcessPool(  # noqa: PLR0913
+    process_pool: ProcessPoolExecutor,
+    content: str,
+    workspace_root: Path,
+    relative_path: PurePath,
+    file_extensions: list[str],
+    workspace_names: list[Path],
+    on_progress_func: Callable[[int], None],
+    *,
+    is_included_file: bool,
+    tab_width: int,
+    antlr_diagnostics: bool,
+    chunk_lines: int | None,
+    tokenizer: TokenizerType,
+    collect_stats: bool,
+    file_timeout: float | None = None,
+    max_errors: int | None = None,
+    workspace_index_generation: int = 0,
+) -> tuple[
+    Exception | RootStatement,
+    list[tuple[Path, PurePath, Path]],  # Included files (workspace_root, relative_path, filename)
+    set[Path],  # Missing paths (see `WorkspaceIndex.ResolveIncludeFilename`)
+    FileParseStats | None,
+]:
+    # ----------------------------------------------------------------------
+    def Submit(
+        this_content: str,
+        line_offset: int,
+    ) -> Future[
+        tuple[Exception | RootStatement, list[tuple[Path, PurePath, Path]], set[Path], FileParseStats | None]
+    ]:
+        return process_pool.submit(
+            _ParseContentInProcess,
+            this_content,
+            workspace_root,
+            relative_path,
+            file_extensions,
+            workspace_names,
+            is_included_file=is_included_file,
+            tab_width=tab_width,
+            antlr_diagnostics=antlr_diagnostics,
+            tokenizer=tokenizer,
+            line_offset=line_offset,
+            collect_stats=collect_stats,
+            file_timeout=file_timeout,
+            max_errors=max_errors,
+            workspace_index_generation=workspace_index_generation,
+        )
+
+    # ----------------------------------------------------------------------
+
+    chunks = _SplitContent(content, chunk_lines) if chunk_lines is not None else []
+
+    if len(chunks) > 1:
+        # Without the sentinel statement, a structure that ends a chunk would end after any blank lines
+        # or comments that follow it.
+        futures = [
+            Submit(
+                chunk_content if index == len(chunks) - 1 else chunk_content + _CHUNK_SENTINEL_STATEMENT,
+                line_offset,
+            )
+            for index, (line_offset, chunk_content) in enumerate(chunks)
+        ]
+
+        statements: list[Statement] = []
+        includes: list[tuple[Path, PurePath, Path]] = []
+        missing_paths: set[Path] = set()
+        file_stats = FileParseStats() if collect_stats else None
+
+        for index, ((line_offset, chunk_content), future) in enumerate(zip(chunks, futures, strict=True)):
+            chunk_result, chunk_includes, chunk_missing_paths, chunk_stats = future.result()
+
+            if file_stats is not None:
+                assert chunk_stats is not None
+                file_stats.Accumulate(chunk_stats)
+
+            if isinstance(chunk_result, Exception):
+                for pending_future in futures:
+                    pending_future.cancel()
+
+                break
+
+            chunk_statements = chunk_result.statements
+
+            if index != len(chunks) - 1:
+                assert chunk_statements
+                assert isinstance(chunk_statements[-1], ParseItemStatement)
+                chunk_statements = chunk_statements[:-1]
+
+            statements += chunk_statements
+            includes += chunk_includes
+            missing_paths |= chunk_missing_paths
+
+            on_progress_func(line_offset + chunk_content.count("\n"))
+
+        else:
+            return (
+                _CreateRootStatement(workspace_root / relative_path, statements),
+                includes,
+                missing_paths,
+                file_stats,
+            )
+
+    # The content is parsed in its entirety when it can't be split or when a chunk fails, so that
+    # errors are reported exactly as they would have been without chunking. Statistics only reflect
+    # the final parse.
+    return Submit(content, 0).result()
+
+
+# ----------------------------------------------------------------------
+def _SplitContent(
+    content: str,
+    chunk_lines: int,
+) -> list[tuple[int, str]]:
+    """Split the content into chunks that begin with a top-level statement; returns (line offset, content) for each chunk.
+
+    Top-level statements begin at the first column, so chunk boundaries can be found without lexing the
+    content; newlines within strings, comments, and paired brackets are skipped. The first chunk
+    contains all of the include statements.
+    """
+
+    chunks: list[tuple[int, str]] = []
+
+    chunk_start = 0
+    chunk_line_offset = 0
+    nesting_level = 0
+
+    for match in _CHUNK_TOKEN_REGEX.finditer(content):
+        value = match.group()
+
+        if value in ("(", "[", "{"):
+            nesting_level += 1
+            continue
+
+        if value in (")", "]", "}"):
+            nesting_level = max(nesting_level - 1, 0)
+            continue
+
+        if value != "\n" or nesting_level != 0:
+            continue
+
+        offset = match.end()
+
+        if _CHUNK_STATEMENT_START_REGEX.match(content, offset) is None:
+            continue
+
+        line_offset = chunk_line_offset + content.count("\n", chunk_start, offset)
+
+        if line_offset - chunk_line_offset < chunk_lines:
+            continue
+
+        chunks.append((chunk_line_offset, content[chunk_start:offset]))
+
+        chunk_start = offset
+        chunk_line_offset = line_offset
+
+    chunks.append((chunk_line_offset, content[chunk_start:]))
+
+    return chunks
+
+
+# ----------------------------------------------------------------------
+def _CreateTimedIncludeStatementFunc(
+    create_include_statement_func: _CreateIncludeStatementFuncType,
+    file_stats: FileParseStats,
+) -> _CreateIncludeStatementFuncType:
+    # ----------------------------------------------------------------------
+    def Impl(*args, **kwargs) -> ParseIncludeStatement:
+        start_time = time.perf_counter()
+
+        try:
+            return create_include_statement_func(*args, **kwargs)
+        finally:
+            file_stats.include_time += time.perf_counter() - start_time
+
+    # ----------------------------------------------------------------------
+
+    return Impl
+
+
+# ----------------------------------------------------------------------
+def _CreateIncludeStatementFuncFactory(
+    workspace_index: WorkspaceIndex,
+    workspace_names: list[Path],
+    on_include_func: _OnIncludeFuncType,
+    missing_paths: set[Path] | None = None,
+) -> _CreateIncludeStatementFuncType:
+    # Paths that were checked while resolving includes but don't exist are added to `missing_paths`;
+    # an include may resolve to a different file if any of them are created.
+
+    # ----------------------------------------------------------------------
+    def Impl(
+        include_path: Path,
+        region: Region,
+        root_indicator: Region | None,
+        directory_indicator: Region | None,
+        filename_or_directory: TerminalElement[Path],
+        items: list[ParseIncludeStatementItem],
+        *,
+        is_star_include: bool,
+    ) -> ParseIncludeStatement:
+        root = _ResolveIncludeRoot(
+            workspace_index,
+            workspace_names,
+            include_path,
+            filename_or_directory.value,
+            is_root=root_indicator is not None,
+            is_directory=directory_indicator is not None,
+            missing_paths=missing_paths,
+        )
+
+        if root is None:
+            if directory_indicator is not None:
+                raise Errors.SimpleSchemaGeneratorError(
+                    Errors.ParseCreateIncludeStatementInvalidDirectory.Create(
+                        filename_or_directory.region,
+                        filename_or_directory.value,
+                    ),
+                )
+
+            raise Errors.SimpleSchemaGeneratorError(
+                Errors.ParseCreateIncludeStatementInvalidFilename.Create(
+                    filename_or_directory.region,
+                    filename_or_directory.value,
+                ),
+            )
+
+        filename: Path | None = None
+        filename_region: Region | None = None
+        include_type: ParseIncludeStatementType | None = None
+
+        if workspace_index.IsDir(root):
+            if is_star_include:
+                raise Errors.SimpleSchemaGeneratorError(
+                    Errors.ParseCreateIncludeStatementDirWithStar.Create(region, root)
+                )
+
+            filename = workspace_index.ResolveIncludeFilename(
+                root / items[0].element_name.value,
+                allow_directory=False,
+                missing_paths=missing_paths,
+            )
+
+            filename_region = Region(
+                filename_or_directory.region.filename,
+                filename_or_directory.region.begin,
+                items[0].element_name.region.end,
+            )
+
+            if filename is None:
+                raise Errors.SimpleSchemaGeneratorError(
+                    Errors.ParseCreateIncludeStatementInvalidFilename.Create(
+                        filename_region,
+                        items[0].element_name.value,
+                    ),
+                )
+
+            include_type = ParseIncludeStatementType.Module
             items = []
 
         else:
@@ -1277,17 +3980,12 @@ def _CreateIncludeStatementFuncFactory(  # noqa: C901, PLR0915
             filename_region = filename_or_directory.region
 
         assert filename is not None
-        assert filename.is_file(), filename
+        assert workspace_index.IsFile(filename), filename
         assert filename_region is not None
         assert include_type is not None
 
         # Get the workspace associated with the file
-        workspace: Path | None = None
-
-        for workspace_name in workspace_names:
-            if PathEx.IsDescendant(filename, workspace_name):
-                workspace = workspace_name
-                break
+        workspace = workspace_index.GetWorkspace(filename)
 
         if workspace is None:
             raise Errors.SimpleSchemaGeneratorError(
@@ -1298,33 +3996,7 @@ def _CreateIncludeStatementFuncFactory(  # noqa: C901, PLR0915
         relative_path = PathEx.CreateRelativePath(workspace, filename)
         assert relative_path is not None
 
-        # Determine if this is a file that should be enqueued for parsing
-        should_enqueue = False
-
-        with results_lock:
-            workspace_results = results[workspace]
-
-            if relative_path not in workspace_results:
-                workspace_results[relative_path] = None
-                should_enqueue = True
-
-        if should_enqueue:
-            # ----------------------------------------------------------------------
-            def GetContent() -> str:
-                with filename.open(encoding="utf-8") as f:
-                    return f.read()
-
-            # ----------------------------------------------------------------------
-
-            enqueue_func(
-                str(filename),
-                lambda _: prepare_task_func(
-                    workspace,
-                    relative_path,
-                    GetContent,
-                    is_included_file=True,
-                ),
-            )
+        on_include_func(workspace, relative_path, filename)
 
         return ParseIncludeStatement(
             region,
@@ -1336,3 +4008,122 @@ def _CreateIncludeStatementFuncFactory(  # noqa: C901, PLR0915
     # ----------------------------------------------------------------------
 
     return Impl
+
+
+# ----------------------------------------------------------------------
+def _ResolveIncludeRoot(
+    workspace_index: WorkspaceIndex,
+    workspace_names: list[Path],
+    include_path: Path,
+    filename_or_directory: Path,
+    *,
+    is_root: bool,
+    is_directory: bool,
+    missing_paths: set[Path] | None = None,
+) -> Path | None:
+    search_paths: list[list[Path]] = []
+
+    if not is_root:
+        search_paths.append([include_path.parent])
+
+    search_paths.append(workspace_names)
+
+    for potential_root in itertools.chain(*search_paths):
+        fullpath = workspace_index.ResolveIncludeFilename(
+            potential_root / filename_or_directory,
+            allow_directory=is_directory,
+            missing_paths=missing_paths,
+        )
+
+        if fullpath is not None and (not is_directory or workspace_index.IsDir(fullpath)):
+            return fullpath
+
+    return None
+
+
+# ----------------------------------------------------------------------
+def _ScanHeaderIncludes(
+    content: str,
+    include_path: Path,
+    workspace_index: WorkspaceIndex,
+    workspace_names: list[Path],
+) -> list[tuple[Path, PurePath, Path]]:
+    """Return the files included by the content without lexing or parsing it.
+
+    Include statements must appear before any other statement, so the header can be scanned as soon
+    as the content is available; this allows included files to be parsed while the content is still
+    being lexed and parsed. The scan is an optimization only, so anything unexpected ends the scan and
+    errors are left for the parser to report.
+    """
+
+    includes: list[tuple[Path, PurePath, Path]] = []
+
+    offset = 0
+
+    while True:
+        offset = _HEADER_SKIP_REGEX.match(content, offset).end()  # type: ignore[union-attr]
+
+        match = _HEADER_INCLUDE_STATEMENT_REGEX.match(content, offset)
+        if match is None:
+            break
+
+        # Move to the end of the statement
+        if match.group("grouped"):
+            offset = content.find(")", match.end())
+            if offset == -1:
+                break
+        else:
+            offset = match.end()
+
+        offset = content.find("\n", offset)
+        if offset == -1:
+            offset = len(content)
+
+        # Convert the path
+        path = match.group("path")
+
+        is_root = path.startswith("/")
+        if is_root:
+            path = path[1:]
+
+        is_directory = path.endswith("/")
+        if is_directory:
+            path = path[:-1]
+
+        parts = path.removeprefix("./").split("/")
+
+        if not all(_HEADER_INCLUDE_PATH_PART_REGEX.fullmatch(part) for part in parts):
+            break
+
+        # Resolve the filename
+        filename = _ResolveIncludeRoot(
+            workspace_index,
+            workspace_names,
+            include_path,
+            Path(*parts),
+            is_root=is_root,
+            is_directory=is_directory,
+        )
+
+        if filename is not None and workspace_index.IsDir(filename):
+            if match.group("star"):
+                continue
+
+            filename = workspace_index.ResolveIncludeFilename(
+                filename / match.group("item"),
+                allow_directory=False,
+            )
+
+        if filename is None:
+            continue
+
+        workspace = workspace_index.GetWorkspace(filename)
+        if workspace is None:
+            continue
+
+        relative_path = PathEx.CreateRelativePath(workspace, filename)
+        assert relative_path is not None
+
+        includes.append((workspace, relative_path, filename))
+
+    return includes
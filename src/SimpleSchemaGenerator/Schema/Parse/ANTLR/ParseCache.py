@@ -0,0 +1,206 @@
+# ----------------------------------------------------------------------
+# |
+# |  ParseCache.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-16 09:12:41
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2026
+# |  Distributed under the MIT License.
+# |
+# ----------------------------------------------------------------------
+"""Contains the ParseCache object"""
+
+import os
+import pickle
+import shutil
+import threading
+import uuid
+
+from collections import OrderedDict
+from pathlib import Path
+
+
+# ----------------------------------------------------------------------
+class ParseCache:
+    """Persistent, size-limited cache of parse results that evicts the least recently used entries.
+
+    The size and order of use of each entry is kept in memory; the order is initialized from the
+    modification times of the entries (which are updated on access) when the cache is first used, so
+    entries accessed by other processes after that time may be evicted before entries accessed here.
+    Once the cache exceeds `max_size`, entries are evicted until it is below `EVICTION_RATIO` of
+    `max_size` so that the next few entries can be written without evicting again.
+    """
+
+    DEFAULT_MAX_SIZE = 512 * 1024 * 1024
+    EVICTION_RATIO = 0.9
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        cache_dir: Path,
+        max_size: int = DEFAULT_MAX_SIZE,
+    ) -> None:
+        if max_size <= 0:
+            raise ValueError(f"Invalid max_size value: {max_size}")  # noqa: EM102, TRY003
+
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+
+        self._lock = threading.Lock()
+
+        # Populated on first use; ordered from least to most recently used
+        self._entry_sizes: OrderedDict[Path, int] | None = None
+        self._total_size = 0
+
+    # ----------------------------------------------------------------------
+    @property
+    def total_size(self) -> int:
+        with self._lock:
+            self._InitEntrySizes()
+            return self._total_size
+
+    # ----------------------------------------------------------------------
+    def Get(
+        self,
+        key: str,
+    ) -> object | None:
+        """Return the value associated with the key, or None if the value is not in the cache."""
+
+        filename = self._GetFilename(key)
+
+        try:
+            with filename.open("rb") as f:
+                content = f.read()
+
+            # Mark the entry as recently used
+            os.utime(filename)
+
+        except OSError:
+            return None
+
+        with self._lock:
+            if self._entry_sizes is not None:
+                if filename in self._entry_sizes:
+                    self._entry_sizes.move_to_end(filename)
+                else:
+                    # The entry was written by another process
+                    self._entry_sizes[filename] = len(content)
+                    self._total_size += len(content)
+
+        try:
+            return pickle.loads(content)  # noqa: S301
+        except Exception:
+            # The entry is corrupt or was written by an incompatible version of the code
+            with self._lock:
+                self._RemoveEntry(filename)
+
+            return None
+
+    # ----------------------------------------------------------------------
+    def Set(
+        self,
+        key: str,
+        value: object,
+    ) -> None:
+        content = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+        if len(content) > self.max_size:
+            return
+
+        filename = self._GetFilename(key)
+        filename.parent.mkdir(parents=True, exist_ok=True)
+
+        # Write to a temporary file and move it into place so that concurrent readers never see a
+        # partially written entry.
+        temp_filename = filename.parent / f"{filename.name}.{uuid.uuid4().hex}.tmp"
+
+        try:
+            with temp_filename.open("wb") as f:
+                f.write(content)
+
+            with self._lock:
+                self._InitEntrySizes()
+                assert self._entry_sizes is not None
+
+                temp_filename.replace(filename)
+
+                self._total_size -= self._entry_sizes.pop(filename, 0)
+                self._entry_sizes[filename] = len(content)
+                self._total_size += len(content)
+
+                if self._total_size > self.max_size:
+                    self._Evict()
+
+        finally:
+            # The temporary file only remains if the entry couldn't be written
+            temp_filename.unlink(missing_ok=True)
+
+    # ----------------------------------------------------------------------
+    def Invalidate(self) -> None:
+        """Remove all entries from the cache."""
+
+        with self._lock:
+            if self.cache_dir.is_dir():
+                shutil.rmtree(self.cache_dir)
+
+            self._entry_sizes = OrderedDict()
+            self._total_size = 0
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Private Methods
+    # |
+    # ----------------------------------------------------------------------
+    def _GetFilename(
+        self,
+        key: str,
+    ) -> Path:
+        return self.cache_dir / key[:2] / key
+
+    # ----------------------------------------------------------------------
+    def _InitEntrySizes(self) -> None:
+        if self._entry_sizes is not None:
+            return
+
+        entries: list[tuple[float, Path, int]] = []
+
+        if self.cache_dir.is_dir():
+            for filename in self.cache_dir.glob("*/*"):
+                if filename.suffix == ".tmp":
+                    continue
+
+                try:
+                    stat_result = filename.stat()
+                except OSError:
+                    # The entry was removed by another process
+                    continue
+
+                entries.append((stat_result.st_mtime, filename, stat_result.st_size))
+
+        # The modification time is updated on access
+        entries.sort()
+
+        self._entry_sizes = OrderedDict((filename, size) for _, filename, size in entries)
+        self._total_size = sum(self._entry_sizes.values())
+
+    # ----------------------------------------------------------------------
+    def _Evict(self) -> None:
+        assert self._entry_sizes is not None
+
+        target_size = int(self.max_size * self.EVICTION_RATIO)
+
+        while self._entry_sizes and self._total_size > target_size:
+            self._RemoveEntry(next(iter(self._entry_sizes)))
+
+    # ----------------------------------------------------------------------
+    def _RemoveEntry(
+        self,
+        filename: Path,
+    ) -> None:
+        filename.unlink(missing_ok=True)
+
+        if self._entry_sizes is not None:
+            self._total_size -= self._entry_sizes.pop(filename, 0)
@@ -0,0 +1,143 @@
+# ----------------------------------------------------------------------
+# |
+# |  ParseOptions.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-17 11:02:37
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2026
+# |  Distributed under the MIT License.
+# |
+# ----------------------------------------------------------------------
+"""Contains the ParseOptions object"""
+
+import multiprocessing
+
+from dataclasses import dataclass
+from enum import StrEnum
+from pathlib import Path
+
+from .ExecutorType import ExecutorType
+from .ParseCache import ParseCache
+from .ParseStats import ParseStats
+
+
+# ----------------------------------------------------------------------
+class TokenizerType(StrEnum):
+    """Specifies how content is tokenized during the first (SLL) stage of the parse"""
+
+    # The lexer generated by ANTLR
+    Antlr = "antlr"
+
+    # A tokenizer based on a single regular expression that produces the same tokens as the lexer
+    # generated by ANTLR, but is significantly faster. Content that it is unable to tokenize (and all
+    # content parsed with LL prediction) is tokenized by the lexer generated by ANTLR.
+    Regex = "regex"
+
+
+# ----------------------------------------------------------------------
+class ScheduleType(StrEnum):
+    """Specifies the order in which files are parsed"""
+
+    # Files are parsed in the order in which they are provided; included files are parsed in the order
+    # in which they are encountered.
+    Fifo = "fifo"
+
+    # Files that are expected to take the longest are parsed first, so that a large file isn't the
+    # only work remaining once everything else has been parsed. Files at the top of long include
+    # chains are parsed first, as the chain below them is on the critical path; files whose chains
+    # have the same height are parsed from largest to smallest (sizes are read from the file system,
+    # so the content isn't loaded early).
+    #
+    # The height of a file (the length of the longest chain of includes below it) is estimated from
+    # the includes found when a `ParseSession` last parsed it; without this information, a file is
+    # considered to have no includes.
+    Cost = "cost"
+
+
+# ----------------------------------------------------------------------
+@dataclass(frozen=True)
+class ParseOptions:
+    """Options that control how files are parsed; shared by `Parse`, `ParseIter`, `ParseAsync`, and `ParseSession`.
+
+    `num_jobs` is the number of threads (or worker processes, when using `ExecutorType.Process`) used to
+    parse files; it defaults to the number of CPUs and is ignored when `single_threaded` is True.
+
+    When `cache` is provided, results are read from and written to the cache so that files whose
+    content hasn't changed aren't parsed again.
+
+    When `chunk_lines` is provided, files with more lines than this are split at top-level statements
+    and the chunks are parsed concurrently by worker processes. Chunks are only parsed in worker
+    processes, so `chunk_lines` requires `ExecutorType.Process`.
+
+    When `stats` is provided, it is populated with the time spent parsing each file and a summary is
+    written as verbose output.
+
+    When `max_in_flight` or `max_bytes_in_flight` is provided, a file's content isn't loaded until
+    fewer than this many files (or bytes of content) are being processed.
+
+    When `fail_fast` is True, parsing stops once a file fails to parse; files that aren't parsed are
+    not included in the results.
+
+    When `file_timeout` is provided, a file that takes longer than this (in seconds) to parse is
+    reported as an error.
+
+    When `max_errors` is provided, parsing continues at the next top-level statement after an error
+    so that up to this many errors are reported for each file. The result for a file that contains
+    errors is a `ParseRecoveryError` exception that contains the errors and the statements that were parsed.
+
+    When `dfa_snapshot` is provided, worker processes (when using `ExecutorType.Process`) load the ANTLR
+    DFA states saved in the snapshot (see `SaveDfaSnapshot`) before parsing any content, so that they
+    don't start cold. The DFA states created by the workers are merged into this process when the
+    workers exit, so that a snapshot saved afterwards includes them.
+    """
+
+    # ----------------------------------------------------------------------
+    single_threaded: bool = False
+    num_jobs: int | None = None
+    quiet: bool = False
+    tab_width: int = 4
+    antlr_diagnostics: bool = False
+    executor: ExecutorType = ExecutorType.Thread
+    cache: ParseCache | None = None
+    chunk_lines: int | None = None
+    tokenizer: TokenizerType = TokenizerType.Antlr
+    stats: ParseStats | None = None
+    max_in_flight: int | None = None
+    max_bytes_in_flight: int | None = None
+    schedule: ScheduleType = ScheduleType.Fifo
+    fail_fast: bool = False
+    file_timeout: float | None = None
+    max_errors: int | None = None
+    dfa_snapshot: Path | None = None
+
+    # ----------------------------------------------------------------------
+    def __post_init__(self) -> None:
+        if self.num_jobs is not None and self.num_jobs <= 0:
+            raise ValueError(f"Invalid num_jobs value: {self.num_jobs}")  # noqa: EM102, TRY003
+        if self.max_in_flight is not None and self.max_in_flight <= 0:
+            raise ValueError(f"Invalid max_in_flight value: {self.max_in_flight}")  # noqa: EM102, TRY003
+        if self.max_bytes_in_flight is not None and self.max_bytes_in_flight <= 0:
+            raise ValueError(f"Invalid max_bytes_in_flight value: {self.max_bytes_in_flight}")  # noqa: EM102, TRY003
+        if self.max_errors is not None and self.max_errors <= 0:
+            raise ValueError(f"Invalid max_errors value: {self.max_errors}")  # noqa: EM102, TRY003
+
+        # Chunks are parsed concurrently by worker processes; there aren't any worker processes when
+        # parsing with threads, so the value would otherwise be ignored.
+        if self.chunk_lines is not None and self.executor != ExecutorType.Process:
+            raise ValueError("'chunk_lines' can only be used with 'ExecutorType.Process'.")  # noqa: EM101, TRY003
+
+    # ----------------------------------------------------------------------
+    @property
+    def num_workers(self) -> int:
+        """The number of threads (or worker processes) used to parse files"""
+
+        if self.single_threaded:
+            return 1
+
+        if self.num_jobs is None:
+            return multiprocessing.cpu_count()
+
+        return self.num_jobs
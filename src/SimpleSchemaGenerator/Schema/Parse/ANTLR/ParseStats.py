@@ -0,0 +1,211 @@
+# ----------------------------------------------------------------------
+# |
+# |  ParseStats.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-16 23:27:52
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2026
+# |  Distributed under the MIT License.
+# |
+# ----------------------------------------------------------------------
+"""Contains the FileParseStats and ParseStats objects"""
+
+import threading
+
+from dataclasses import asdict, dataclass, fields
+from pathlib import Path, PurePath
+from typing import Any
+
+
+# ----------------------------------------------------------------------
+@dataclass
+class FileParseStats:
+    """Time (in seconds) spent in each phase of parsing a file, along with information about its content.
+
+    Lexing, parsing, and visiting are interleaved, so each time only includes the work done by that
+    phase. When the content is parsed again with LL prediction, the time spent by both stages is
+    included. When the content is identical to that of another file parsed at the same time, only its
+    include statements are parsed (`is_duplicate`).
+    """
+
+    load_time: float = 0.0
+    lex_time: float = 0.0
+    parse_time: float = 0.0
+    visit_time: float = 0.0
+    include_time: float = 0.0
+
+    num_tokens: int = 0
+    num_elements: int = 0
+    max_stack_depth: int = 0
+
+    is_cached: bool = False
+    is_duplicate: bool = False
+
+    # ----------------------------------------------------------------------
+    @property
+    def total_time(self) -> float:
+        return self.load_time + self.lex_time + self.parse_time + self.visit_time + self.include_time
+
+    # ----------------------------------------------------------------------
+    def __str__(self) -> str:
+        if self.is_cached:
+            return f"{self.total_time:.3f}s (load {self.load_time:.3f}s, cached)"
+
+        if self.is_duplicate:
+            return f"{self.total_time:.3f}s (load {self.load_time:.3f}s, duplicate)"
+
+        return "{:.3f}s (load {:.3f}s, lex {:.3f}s, parse {:.3f}s, visit {:.3f}s, include {:.3f}s; {} tokens, {} elements, max stack depth {})".format(
+            self.total_time,
+            self.load_time,
+            self.lex_time,
+            self.parse_time,
+            self.visit_time,
+            self.include_time,
+            self.num_tokens,
+            self.num_elements,
+            self.max_stack_depth,
+        )
+
+    # ----------------------------------------------------------------------
+    def Accumulate(
+        self,
+        other: "FileParseStats",
+    ) -> None:
+        """Add the values of `other` to these values (used when a file is parsed in chunks)."""
+
+        for field in fields(self):
+            if field.name in ["is_cached", "is_duplicate"]:
+                continue
+
+            if field.name == "max_stack_depth":
+                self.max_stack_depth = max(self.max_stack_depth, other.max_stack_depth)
+            else:
+                setattr(self, field.name, getattr(self, field.name) + getattr(other, field.name))
+
+
+# ----------------------------------------------------------------------
+class ParseStats:
+    """Statistics collected for each file parsed; provide an instance to `Parse` to populate it."""
+
+    # ----------------------------------------------------------------------
+    def __init__(self) -> None:
+        self.files: dict[
+            Path,  # workspace root
+            dict[
+                PurePath,  # relative path
+                FileParseStats,
+            ],
+        ] = {}
+
+        self._lock = threading.Lock()
+
+    # ----------------------------------------------------------------------
+    def Add(
+        self,
+        workspace_root: Path,
+        relative_path: PurePath,
+        file_stats: FileParseStats,
+    ) -> None:
+        with self._lock:
+            self.files.setdefault(workspace_root, {})[relative_path] = file_stats
+
+    # ----------------------------------------------------------------------
+    def GetTotals(
+        self,
+        workspace_root: Path | None = None,
+    ) -> FileParseStats:
+        """Return the sum of the statistics for all files (or all files within the workspace)."""
+
+        totals = FileParseStats()
+
+        with self._lock:
+            for this_workspace_root, workspace_files in self.files.items():
+                if workspace_root is not None and this_workspace_root != workspace_root:
+                    continue
+
+                for file_stats in workspace_files.values():
+                    totals.Accumulate(file_stats)
+
+        return totals
+
+    # ----------------------------------------------------------------------
+    def GetSlowestFiles(
+        self,
+        max_num_files: int = 10,
+        workspace_root: Path | None = None,
+    ) -> list[tuple[Path, PurePath, FileParseStats]]:
+        """Return the files that took the longest to load and parse, slowest first."""
+
+        with self._lock:
+            all_files = [
+                (this_workspace_root, relative_path, file_stats)
+                for this_workspace_root, workspace_files in self.files.items()
+                if workspace_root is None or this_workspace_root == workspace_root
+                for relative_path, file_stats in workspace_files.items()
+            ]
+
+        all_files.sort(key=lambda value: value[2].total_time, reverse=True)
+
+        return all_files[:max_num_files]
+
+    # ----------------------------------------------------------------------
+    def CreateSummary(
+        self,
+        max_num_files: int = 5,
+    ) -> str:
+        """Return a description of the time spent parsing each workspace and its slowest files."""
+
+        with self._lock:
+            workspace_roots = list(self.files)
+
+        lines: list[str] = []
+
+        for workspace_root in workspace_roots:
+            num_files = len(self.files[workspace_root])
+
+            lines.append(
+                "{} ({} file{}): {}".format(
+                    workspace_root,
+                    num_files,
+                    "" if num_files == 1 else "s",
+                    self.GetTotals(workspace_root),
+                ),
+            )
+
+            for _, relative_path, file_stats in self.GetSlowestFiles(max_num_files, workspace_root):
+                lines.append(f"    {relative_path}: {file_stats}")
+
+        return "\n".join(lines)
+
+    # ----------------------------------------------------------------------
+    def CreateJsonObject(self) -> dict[str, Any]:
+        """Return a JSON-serializable object that contains the statistics for each file, workspace, and all files."""
+
+        # ----------------------------------------------------------------------
+        def CreateStatsObject(
+            file_stats: FileParseStats,
+        ) -> dict[str, Any]:
+            return {**asdict(file_stats), "total_time": file_stats.total_time}
+
+        # ----------------------------------------------------------------------
+
+        with self._lock:
+            workspace_roots = list(self.files)
+
+        return {
+            "totals": CreateStatsObject(self.GetTotals()),
+            "workspaces": [
+                {
+                    "workspace_root": str(workspace_root),
+                    "totals": CreateStatsObject(self.GetTotals(workspace_root)),
+                    "files": [
+                        {"relative_path": relative_path.as_posix(), **CreateStatsObject(file_stats)}
+                        for relative_path, file_stats in sorted(self.files[workspace_root].items())
+                    ],
+                }
+                for workspace_root in workspace_roots
+            ],
+        }
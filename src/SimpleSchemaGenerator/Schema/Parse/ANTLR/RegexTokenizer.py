@@ -0,0 +1,257 @@
+# ----------------------------------------------------------------------
+# |
+# |  RegexTokenizer.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-16 22:41:09
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2026
+# |  Distributed under the MIT License.
+# |
+# ----------------------------------------------------------------------
+"""Contains the RegexTokenizer object"""
+
+import re
+
+from collections.abc import Iterator
+
+import antlr4  # type: ignore[import-untyped]
+
+from antlr4.error.Errors import ParseCancellationException
+from antlr4.Token import CommonToken
+from antlr_denter.DenterHelper import DenterHelper  # type: ignore[import-untyped]
+
+from .GeneratedCode.SimpleSchemaParser import SimpleSchemaParser
+
+
+# ----------------------------------------------------------------------
+class RegexTokenizer:
+    """Token source that produces the same tokens as SimpleSchemaLexer without simulating the lexer ATN.
+
+    Tokens are matched with a single regular expression. The alternatives are ordered so that the first
+    alternative to match is the token that the ANTLR lexer would have matched (the longest match, with
+    ties resolved by rule order). Indentation is handled by the same denter used by the ANTLR lexer.
+
+    Content that isn't tokenized exactly as the ANTLR lexer would tokenize it (for example, identifiers
+    that begin with an emoji, unterminated strings, or content that the ANTLR lexer reports as an error)
+    raises ParseCancellationException; parse the content with SimpleSchemaLexer when this happens.
+    """
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        content: str,
+        *,
+        line_offset: int = 0,
+    ) -> None:
+        self._denter = _Denter(self._Tokenize(content, line_offset + 1))
+
+    # ----------------------------------------------------------------------
+    def nextToken(self) -> antlr4.Token:
+        return self._denter.next_token()
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Private Methods
+    # |
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _Tokenize(  # noqa: C901
+        content: str,
+        line: int,
+    ) -> Iterator[CommonToken]:
+        # ----------------------------------------------------------------------
+        def CreateToken(
+            token_type: int,
+            channel: int,
+            start: int,
+            stop: int,
+            text: str,
+        ) -> CommonToken:
+            token = CommonToken(type=token_type, channel=channel, start=start, stop=stop)
+
+            token.line = line
+            token.column = column
+            token.text = text
+
+            return token
+
+        # ----------------------------------------------------------------------
+
+        column = 0
+        nested_pair_ctr = 0
+
+        for match in _TOKEN_REGEX.finditer(content):
+            kind = match.lastgroup
+            text = match.group()
+            start = match.start()
+
+            token: CommonToken | None = None
+
+            if kind == "IDENTIFIER":
+                token = CreateToken(
+                    _KEYWORD_TYPES.get(text, SimpleSchemaParser.IDENTIFIER),
+                    antlr4.Token.DEFAULT_CHANNEL,
+                    start,
+                    match.end() - 1,
+                    text,
+                )
+
+            elif kind == "HORIZONTAL_WHITESPACE":
+                token = CreateToken(
+                    SimpleSchemaParser.HORIZONTAL_WHITESPACE,
+                    antlr4.Token.HIDDEN_CHANNEL,
+                    start,
+                    match.end() - 1,
+                    text,
+                )
+
+            elif kind == "NEWLINE":
+                if nested_pair_ctr == 0:
+                    token_type = SimpleSchemaParser.NEWLINE
+                    channel = antlr4.Token.DEFAULT_CHANNEL
+                else:
+                    token_type = SimpleSchemaParser.NESTED_NEWLINE
+                    channel = antlr4.Token.HIDDEN_CHANNEL
+
+                token = CreateToken(token_type, channel, start, match.end() - 1, text)
+
+            elif kind == "PUNCTUATION":
+                token_type = _PUNCTUATION_TYPES[text]
+
+                if token_type in (SimpleSchemaParser.LPAREN, SimpleSchemaParser.LBRACK):
+                    nested_pair_ctr += 1
+                elif token_type in (SimpleSchemaParser.RPAREN, SimpleSchemaParser.RBRACK):
+                    nested_pair_ctr -= 1
+
+                token = CreateToken(token_type, antlr4.Token.DEFAULT_CHANNEL, start, match.end() - 1, text)
+
+            elif kind == "DIGITS":
+                token = CreateToken(
+                    SimpleSchemaParser.INTEGER if text.isdigit() else SimpleSchemaParser.IDENTIFIER,
+                    antlr4.Token.DEFAULT_CHANNEL,
+                    start,
+                    match.end() - 1,
+                    text,
+                )
+
+            elif kind == "STAR":
+                token = CreateToken(
+                    _PUNCTUATION_TYPES[text] if len(text) == 1 else SimpleSchemaParser.IDENTIFIER,
+                    antlr4.Token.DEFAULT_CHANNEL,
+                    start,
+                    match.end() - 1,
+                    text,
+                )
+
+            elif kind == "LINE_CONTINUATION":
+                token = CreateToken(
+                    SimpleSchemaParser.LINE_CONTINUATION,
+                    antlr4.Token.HIDDEN_CHANNEL,
+                    start,
+                    match.end() - 1,
+                    text,
+                )
+
+            elif kind == "UNSUPPORTED":
+                raise ParseCancellationException(  # noqa: TRY003
+                    f"Content at line {line}, column {column + 1} must be tokenized by the ANTLR lexer."  # noqa: EM102
+                )
+
+            elif kind not in ("MULTI_LINE_COMMENT", "SINGLE_LINE_COMMENT"):
+                token = CreateToken(
+                    getattr(SimpleSchemaParser, kind),  # type: ignore[arg-type]
+                    antlr4.Token.DEFAULT_CHANNEL,
+                    start,
+                    match.end() - 1,
+                    text,
+                )
+
+            if token is not None:
+                yield token
+
+            # Update the position
+            num_newlines = text.count("\n")
+
+            if num_newlines:
+                line += num_newlines
+                column = len(text) - text.rfind("\n") - 1
+            else:
+                column += len(text)
+
+        yield CreateToken(
+            antlr4.Token.EOF, antlr4.Token.DEFAULT_CHANNEL, len(content), len(content) - 1, "<EOF>"
+        )
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Private Types
+# |
+# ----------------------------------------------------------------------
+class _Denter(DenterHelper):
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        tokens: Iterator[CommonToken],
+    ) -> None:
+        super().__init__(
+            SimpleSchemaParser.NEWLINE,
+            SimpleSchemaParser.INDENT,
+            SimpleSchemaParser.DEDENT,
+            should_ignore_eof=False,
+        )
+
+        self._tokens = tokens
+
+    # ----------------------------------------------------------------------
+    def pull_token(self) -> CommonToken:
+        return next(self._tokens)
+
+
+# ----------------------------------------------------------------------
+def _GetLiteralTypes() -> dict[str, int]:
+    literal_types: dict[str, int] = {}
+
+    for token_type, literal_name in enumerate(SimpleSchemaParser.literalNames):
+        if literal_name.startswith("'"):
+            literal_types[literal_name[1:-1]] = token_type
+
+    return literal_types
+
+
+# ----------------------------------------------------------------------
+_LITERAL_TYPES = _GetLiteralTypes()
+
+_KEYWORD_TYPES = {text: token_type for text, token_type in _LITERAL_TYPES.items() if text.isidentifier()}
+_PUNCTUATION_TYPES = {
+    text: token_type for text, token_type in _LITERAL_TYPES.items() if not text.isidentifier()
+}
+
+# The ANTLR lexer matches the longest token (ties are resolved by rule order), while a regular
+# expression matches the first alternative; the alternatives are ordered so that these are the same.
+# Note that '#', '*', and digits are emoji, so identifiers may begin with them. Unterminated triple-quoted
+# strings are not matched as strings.
+_TOKEN_REGEX = re.compile(
+    r"""
+    (?P<NEWLINE>\r?\n[ \t]*)
+    | (?P<HORIZONTAL_WHITESPACE>[ \t]+)
+    | (?P<IDENTIFIER>[a-zA-Z][a-zA-Z0-9_]*|[_@$&][a-zA-Z0-9\#*][a-zA-Z0-9_]*)
+    | (?P<NUMBER>-?[0-9]*\.[0-9]+)
+    | (?P<DIGITS>[0-9][a-zA-Z0-9_]*)
+    | (?P<INTEGER>-[0-9]+)
+    | (?P<STAR>\*[a-zA-Z0-9_]*)
+    | (?P<MULTI_LINE_COMMENT>\#/(?:(?!/\#)[^\n])*\n.*?/\#)
+    | (?P<SINGLE_LINE_COMMENT>\#[^\r\n]*)
+    | (?P<TRIPLE_DOUBLE_QUOTE_STRING>"{3}.*?"{3})
+    | (?P<TRIPLE_SINGLE_QUOTE_STRING>'{3}.*?'{3})
+    | (?P<DOUBLE_QUOTE_STRING>"(?!"{2})(?:[^"\\]|\\.)*")
+    | (?P<SINGLE_QUOTE_STRING>'(?!'{2})(?:[^'\\]|\\.)*')
+    | (?P<PUNCTUATION>->|::|\.\.|[{},:?+./=|()\[\]])
+    | (?P<LINE_CONTINUATION>\\\r?\n[ \t]*)
+    | (?P<UNSUPPORTED>.)
+    """,
+    re.DOTALL | re.VERBOSE,
+)
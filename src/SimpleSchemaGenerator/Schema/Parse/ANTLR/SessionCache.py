@@ -0,0 +1,98 @@
+# ----------------------------------------------------------------------
+# |
+# |  SessionCache.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-17 10:06:52
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2026
+# |  Distributed under the MIT License.
+# |
+# ----------------------------------------------------------------------
+"""Contains the SessionCache object"""
+
+import threading
+
+from pathlib import Path, PurePath
+
+from .ParseCache import ParseCache
+from SimpleSchemaGenerator.Schema.Elements.Statements.RootStatement import RootStatement
+
+
+# ----------------------------------------------------------------------
+class SessionCache:
+    """In-memory cache of the results parsed by a `ParseSession`, backed by a persistent cache (if any).
+
+    Entries are removed once their results are no longer part of the session's results, so the memory
+    used is bounded by the size of the results themselves. Entries are validated in the same way as
+    those in the persistent cache (see `_GetCachedResult` in Parse.py), as the file system may have
+    changed since they were added; this includes files that would now take precedence over an
+    included file.
+
+    Values are not copied: `Get` returns the instance provided to `Set` (or read from the persistent
+    cache), so the session returns the same `RootStatement` for a file until it is reparsed. `Prune`
+    relies on this, as it matches entries to the results still in use by identity.
+    """
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        persistent_cache: ParseCache | None,
+    ) -> None:
+        self.persistent_cache = persistent_cache
+
+        self._lock = threading.Lock()
+        self._entries: dict[str, tuple[object, ...]] = {}
+
+    # ----------------------------------------------------------------------
+    def Get(
+        self,
+        key: str,
+    ) -> object | None:
+        with self._lock:
+            entry = self._entries.get(key)
+
+        if entry is not None:
+            return entry
+
+        if self.persistent_cache is None:
+            return None
+
+        value = self.persistent_cache.Get(key)
+
+        if isinstance(value, tuple) and value:
+            with self._lock:
+                self._entries[key] = value
+
+        return value
+
+    # ----------------------------------------------------------------------
+    def Set(
+        self,
+        key: str,
+        value: tuple[object, ...],
+    ) -> None:
+        with self._lock:
+            self._entries[key] = value
+
+        if self.persistent_cache is not None:
+            self.persistent_cache.Set(key, value)
+
+    # ----------------------------------------------------------------------
+    def Prune(
+        self,
+        results: dict[Path, dict[PurePath, None | Exception | RootStatement]],
+    ) -> None:
+        """Remove the entries whose results are no longer in use."""
+
+        in_use = {
+            id(result)
+            for workspace_results in results.values()
+            for result in workspace_results.values()
+            if isinstance(result, RootStatement)
+        }
+
+        with self._lock:
+            self._entries = {key: entry for key, entry in self._entries.items() if id(entry[0]) in in_use}
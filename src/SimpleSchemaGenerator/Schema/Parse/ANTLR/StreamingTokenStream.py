@@ -0,0 +1,182 @@
+# ----------------------------------------------------------------------
+# |
+# |  StreamingTokenStream.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-16 13:51:07
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2026
+# |  Distributed under the MIT License.
+# |
+# ----------------------------------------------------------------------
+"""Contains the StreamingTokenStream object"""
+
+import antlr4  # type: ignore[import-untyped]
+
+from antlr4.error.Errors import IllegalStateException  # type: ignore[import-untyped]
+from antlr4.Lexer import TokenSource  # type: ignore[import-untyped]
+
+
+# ----------------------------------------------------------------------
+class StreamingTokenStream(antlr4.CommonTokenStream):
+    """Token stream that pulls tokens from the lexer as the parser needs them, drops tokens on other channels, and releases tokens once they have been consumed.
+
+    The parser never sees tokens on other channels (whitespace, nested newlines, etc.), so they don't
+    need to be buffered. Tokens before the current token are released once no prediction is in
+    progress (the parser marks the stream when it begins a prediction and seeks back to the marked
+    token when it is complete), so the tokens in memory are bounded by the lookahead required by the
+    grammar rather than the size of the content.
+
+    Released tokens can't be accessed again, and ANTLR error messages include the text of all of the
+    tokens associated with the error; use a CommonTokenStream when errors are reported.
+    """
+
+    # Tokens are released in batches so that the tokens that remain are moved infrequently
+    _RELEASE_BATCH_SIZE = 256
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        token_source: TokenSource,
+    ) -> None:
+        super().__init__(token_source)
+
+        # The index of the first token in `self.tokens`
+        self._offset = 0
+
+        # The indexes marked by predictions that are in progress
+        self._markers: list[int] = []
+
+    # ----------------------------------------------------------------------
+    def mark(self) -> int:
+        self.lazyInit()
+
+        self._markers.append(self.index)
+        return len(self._markers)
+
+    # ----------------------------------------------------------------------
+    def release(
+        self,
+        marker: int,
+    ) -> None:
+        # Markers are released in the reverse order in which they were created
+        assert marker == len(self._markers), (marker, len(self._markers))
+        self._markers.pop()
+
+    # ----------------------------------------------------------------------
+    def seek(
+        self,
+        index: int,
+    ) -> None:
+        self.lazyInit()
+
+        assert index >= self._offset, ("The token has been released", index, self._offset)
+        self.index = index
+
+    # ----------------------------------------------------------------------
+    def get(
+        self,
+        index: int,
+    ) -> antlr4.Token:
+        self.lazyInit()
+
+        assert index >= self._offset, ("The token has been released", index, self._offset)
+        return self.tokens[index - self._offset]
+
+    # ----------------------------------------------------------------------
+    def consume(self) -> None:
+        if self.LA(1) == antlr4.Token.EOF:
+            raise IllegalStateException("cannot consume EOF")  # noqa: EM101, TRY003
+
+        if self.sync(self.index + 1):
+            self.index += 1
+
+        if self._markers:
+            return
+
+        # The previous token remains available, as the parser uses it as the stop token of the rule
+        # that it exits.
+        num_released = self.index - 1 - self._offset
+
+        if num_released >= self._RELEASE_BATCH_SIZE:
+            del self.tokens[:num_released]
+            self._offset += num_released
+
+    # ----------------------------------------------------------------------
+    def adjustSeekIndex(
+        self,
+        i: int,
+    ) -> int:
+        # All of the buffered tokens are on the channel
+        return i
+
+    # ----------------------------------------------------------------------
+    def LB(
+        self,
+        k: int,
+    ) -> antlr4.Token | None:
+        index = self.index - k
+
+        if k == 0 or index < 0:
+            return None
+
+        return self.get(index)
+
+    # ----------------------------------------------------------------------
+    def LT(
+        self,
+        k: int,
+    ) -> antlr4.Token | None:
+        self.lazyInit()
+
+        if k == 0:
+            return None
+
+        if k < 0:
+            return self.LB(-k)
+
+        index = self.index + k - 1
+
+        # The EOF token is returned for indexes beyond the end of the content
+        if not self.sync(index):
+            return self.tokens[-1]
+
+        return self.tokens[index - self._offset]
+
+    # ----------------------------------------------------------------------
+    def sync(
+        self,
+        i: int,
+    ) -> bool:
+        num_needed = i - (self._offset + len(self.tokens)) + 1
+
+        if num_needed > 0:
+            return self.fetch(num_needed) >= num_needed
+
+        return True
+
+    # ----------------------------------------------------------------------
+    def fetch(
+        self,
+        n: int,
+    ) -> int:
+        if self.fetchedEOF:
+            return 0
+
+        for index in range(n):
+            while True:
+                token = self.tokenSource.nextToken()
+
+                if token.channel == self.channel or token.type == antlr4.Token.EOF:
+                    break
+
+            token.tokenIndex = self._offset + len(self.tokens)
+            self.tokens.append(token)
+
+            if token.type == antlr4.Token.EOF:
+                self.fetchedEOF = True
+                return index + 1
+
+        return n
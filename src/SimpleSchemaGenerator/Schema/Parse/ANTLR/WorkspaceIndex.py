@@ -0,0 +1,328 @@
+# ----------------------------------------------------------------------
+# |
+# |  WorkspaceIndex.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-16 12:14:36
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2026
+# |  Distributed under the MIT License.
+# |
+# ----------------------------------------------------------------------
+"""Contains the WorkspaceIndex object"""
+
+import os
+import sys
+
+from enum import auto, Enum
+from pathlib import Path
+
+
+# ----------------------------------------------------------------------
+class WorkspaceIndex:
+    """In-memory index of the workspaces used to resolve include statements.
+
+    Directories are listed (once) the first time that they are needed, and the results of all
+    lookups (including those that fail) are cached, so the index must be refreshed (or discarded)
+    when the file system changes. Paths that contain symbolic links or are outside of the workspaces
+    are resolved using the file system.
+    """
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        workspace_names: list[Path],
+        file_extensions: list[str],
+    ) -> None:
+        self.file_extensions = file_extensions
+
+        # Default file systems on these platforms are case-insensitive
+        self._is_case_insensitive = sys.platform in ["darwin", "win32"]
+
+        # Trie of path parts, where the workspace is stored under the `None` key
+        self._workspace_trie: dict[str | None, dict] = {}
+
+        for workspace_name in workspace_names:
+            node = self._workspace_trie
+
+            for part in workspace_name.parts:
+                node = node.setdefault(self._GetKey(part), {})
+
+            node[None] = workspace_name  # type: ignore[assignment]
+
+        self._listings: dict[Path, dict[str, tuple[_EntryType, str]]] = {}
+        self._listing_mtimes: dict[Path, int | None] = {}
+        self._resolved_filenames: dict[tuple[Path, bool], tuple[Path | None, tuple[Path, ...]]] = {}
+
+    # ----------------------------------------------------------------------
+    def GetWorkspace(
+        self,
+        path: Path,
+    ) -> Path | None:
+        """Return the workspace that contains the path."""
+
+        workspace: Path | None = None
+        node = self._workspace_trie
+
+        for part in path.parts:
+            node = node.get(self._GetKey(part))  # type: ignore[assignment]
+            if node is None:
+                break
+
+            workspace = node.get(None, workspace)  # type: ignore[arg-type]
+
+        return workspace
+
+    # ----------------------------------------------------------------------
+    def IsFile(
+        self,
+        path: Path,
+    ) -> bool:
+        return self._GetEntryType(path) == _EntryType.File
+
+    # ----------------------------------------------------------------------
+    def IsDir(
+        self,
+        path: Path,
+    ) -> bool:
+        return self._GetEntryType(path) == _EntryType.Directory
+
+    # ----------------------------------------------------------------------
+    def Exists(
+        self,
+        path: Path,
+    ) -> bool:
+        return self._GetEntryType(path) is not None
+
+    # ----------------------------------------------------------------------
+    def ResolveIncludeFilename(
+        self,
+        path: Path,
+        *,
+        allow_directory: bool,
+        missing_paths: set[Path] | None = None,
+    ) -> Path | None:
+        """Return the fully resolved file (or directory) that corresponds to the path.
+
+        The path may omit the file extension. Names within the workspaces are returned with the casing
+        used by the file system, so that the same file is always identified by the same path.
+
+        When `missing_paths` is provided, the candidates that were checked and don't exist are added to
+        it; these are the paths that would take precedence over the result if they were created.
+        """
+
+        key = (path, allow_directory)
+
+        entry = self._resolved_filenames.get(key)
+        if entry is None:
+            entry = self._ResolveIncludeFilenameImpl(path, allow_directory=allow_directory)
+            self._resolved_filenames[key] = entry
+
+        result, these_missing_paths = entry
+
+        if missing_paths is not None:
+            missing_paths.update(these_missing_paths)
+
+        return result
+
+    # ----------------------------------------------------------------------
+    def Refresh(self) -> bool:
+        """Discard the listings of directories that have changed since they were listed.
+
+        Directories are compared by modification time, which changes when entries are added, removed,
+        or renamed. The results of previous lookups are always discarded, as they may depend on paths
+        that are resolved using the file system. Returns True if any listings were discarded.
+        """
+
+        stale_directories = [
+            directory
+            for directory, mtime in self._listing_mtimes.items()
+            if self._GetModificationTime(directory) != mtime
+        ]
+
+        for directory in stale_directories:
+            del self._listings[directory]
+            del self._listing_mtimes[directory]
+
+        self._resolved_filenames.clear()
+
+        return bool(stale_directories)
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Private Methods
+    # |
+    # ----------------------------------------------------------------------
+    def _GetKey(
+        self,
+        name: str,
+    ) -> str:
+        return name.casefold() if self._is_case_insensitive else name
+
+    # ----------------------------------------------------------------------
+    def _ResolveIncludeFilenameImpl(
+        self,
+        path: Path,
+        *,
+        allow_directory: bool,
+    ) -> tuple[Path | None, tuple[Path, ...]]:
+        path = self._Resolve(path)
+
+        entry_type = self._GetEntryType(path)
+
+        if entry_type == _EntryType.File or (allow_directory and entry_type == _EntryType.Directory):
+            return path, ()
+
+        missing_paths: list[Path] = []
+
+        if entry_type is None:
+            missing_paths.append(path)
+
+        for extension in self.file_extensions:
+            potential_path = path.parent / (path.name + extension)
+
+            entry_type = self._GetEntryType(potential_path)
+
+            if entry_type == _EntryType.File:
+                return self._Resolve(potential_path), tuple(missing_paths)
+
+            if entry_type is None:
+                missing_paths.append(potential_path)
+
+        return None, tuple(missing_paths)
+
+    # ----------------------------------------------------------------------
+    def _Resolve(
+        self,
+        path: Path,
+    ) -> Path:
+        normalized_path = Path(os.path.normpath(path))
+
+        workspace = self.GetWorkspace(normalized_path)
+        if workspace is None:
+            return path.resolve()
+
+        # Symbolic links must be resolved by the file system
+        current = workspace
+
+        parts = normalized_path.parts[len(workspace.parts) :]
+
+        for index, part in enumerate(parts):
+            entry = self._GetListing(current).get(self._GetKey(part))
+
+            if entry is None:
+                return current.joinpath(*parts[index:])
+
+            entry_type, name = entry
+
+            if entry_type == _EntryType.SymLink:
+                return path.resolve()
+
+            # Use the casing of the name on the file system
+            current /= name
+
+        return current
+
+    # ----------------------------------------------------------------------
+    def _GetEntryType(
+        self,
+        path: Path,
+    ) -> "_EntryType | None":
+        workspace = self.GetWorkspace(path)
+
+        if workspace is not None:
+            parts = path.parts[len(workspace.parts) :]
+
+            if not parts:
+                return _EntryType.Directory
+
+            current = workspace
+
+            for index, part in enumerate(parts):
+                entry = self._GetListing(current).get(self._GetKey(part))
+
+                if entry is None:
+                    return None
+
+                entry_type, name = entry
+
+                if entry_type == _EntryType.SymLink:
+                    break
+
+                if index == len(parts) - 1:
+                    return entry_type
+
+                if entry_type != _EntryType.Directory:
+                    return None
+
+                current /= name
+
+        # The path is outside of the workspaces or contains symbolic links
+        if path.is_file():
+            return _EntryType.File
+        if path.is_dir():
+            return _EntryType.Directory
+
+        return None
+
+    # ----------------------------------------------------------------------
+    def _GetListing(
+        self,
+        directory: Path,
+    ) -> "dict[str, tuple[_EntryType, str]]":
+        listing = self._listings.get(directory)
+
+        if listing is None:
+            # Get the modification time before listing the directory so that changes made while the
+            # directory is being listed are detected by `Refresh`
+            mtime = self._GetModificationTime(directory)
+
+            listing = {}
+
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_symlink():
+                            entry_type = _EntryType.SymLink
+                        elif entry.is_dir(follow_symlinks=False):
+                            entry_type = _EntryType.Directory
+                        elif entry.is_file(follow_symlinks=False):
+                            entry_type = _EntryType.File
+                        else:
+                            entry_type = _EntryType.Other
+
+                        listing[self._GetKey(entry.name)] = (entry_type, entry.name)
+
+            except OSError:
+                pass
+
+            # Multiple threads may list the same directory; the results are the same, so any of them
+            # can be used.
+            self._listing_mtimes.setdefault(directory, mtime)
+            listing = self._listings.setdefault(directory, listing)
+
+        return listing
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _GetModificationTime(
+        directory: Path,
+    ) -> int | None:
+        try:
+            return directory.stat().st_mtime_ns
+        except OSError:
+            return None
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Private Types
+# |
+# ----------------------------------------------------------------------
+class _EntryType(Enum):
+    File = auto()
+    Directory = auto()
+    SymLink = auto()
+    Other = auto()
@@ -0,0 +1,584 @@
+# ----------------------------------------------------------------------
+# |
+# |  Watcher.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-16 23:59:53
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2026
+# |  Distributed under the MIT License.
+# |
+# ----------------------------------------------------------------------
+"""Contains objects that watch workspaces for changes and reparse the files that change"""
+
+import ctypes
+import ctypes.util
+import errno
+import io
+import os
+import select
+import struct
+import sys
+import threading
+import time
+
+from abc import ABC, abstractmethod
+from functools import cache
+from pathlib import Path
+from typing import Self, TextIO, TYPE_CHECKING
+
+from dbrownell_Common.Streams.DoneManager import DoneManager
+from dbrownell_Common.Types import override
+
+from SimpleSchemaGenerator.ParseDaemon import CreateErrorObjects
+from SimpleSchemaGenerator.ParseDaemonClient import FormatError
+from SimpleSchemaGenerator.Schema.Parse.ANTLR.Parse import (
+    CreateWorkspaces,
+    DEFAULT_FILE_EXTENSIONS,
+    ExecutorType,
+    ParseSession,
+)
+from SimpleSchemaGenerator.Schema.Parse.ANTLR.ParseOptions import ParseOptions
+
+if TYPE_CHECKING:
+    from SimpleSchemaGenerator.Schema.Elements.Statements.RootStatement import (
+        RootStatement,
+    )  # pragma: no cover
+
+
+# ----------------------------------------------------------------------
+class FileWatcher(ABC):
+    """Monitors directories for changes to the files that have one of the file extensions."""
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        file_extensions: list[str] | None,
+    ) -> None:
+        self.file_extensions = file_extensions or DEFAULT_FILE_EXTENSIONS
+
+    # ----------------------------------------------------------------------
+    def __enter__(self) -> Self:
+        return self
+
+    # ----------------------------------------------------------------------
+    def __exit__(self, *args) -> None:
+        self.Close()
+
+    # ----------------------------------------------------------------------
+    @abstractmethod
+    def Close(self) -> None:
+        """Release the resources used to monitor the directories."""
+        raise Exception("Abstract method")  # pragma: no cover  # noqa: EM101, TRY003
+
+    # ----------------------------------------------------------------------
+    def Wait(
+        self,
+        timeout: float | None = None,
+        *,
+        settle_seconds: float = 0.1,
+    ) -> set[Path]:
+        """Wait for files to change and return the files that have changed (or an empty set if the timeout elapses).
+
+        Changes tend to arrive in bursts (an editor saving a file, a branch being checked out, etc.),
+        so once a change is detected, changes continue to be collected until none have been detected
+        for `settle_seconds`.
+
+        Directories are returned when they are removed or moved, as the files within them are not
+        reported individually.
+        """
+
+        changes = self._Read(timeout)
+
+        if changes:
+            while True:
+                additional_changes = self._Read(settle_seconds)
+                if not additional_changes:
+                    break
+
+                changes |= additional_changes
+
+        return changes
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Protected Methods
+    # |
+    # ----------------------------------------------------------------------
+    @abstractmethod
+    def _Read(
+        self,
+        timeout: float | None,
+    ) -> set[Path]:
+        """Return the changes detected within the timeout."""
+        raise Exception("Abstract method")  # pragma: no cover  # noqa: EM101, TRY003
+
+    # ----------------------------------------------------------------------
+    def _IsMatch(
+        self,
+        filename: str,
+    ) -> bool:
+        return any(filename.endswith(file_extension) for file_extension in self.file_extensions)
+
+
+# ----------------------------------------------------------------------
+class InotifyFileWatcher(FileWatcher):
+    """Monitors directories with inotify (Linux only)."""
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def IsAvailable() -> bool:
+        return _LoadInotifyLibrary() is not None
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        workspace_roots: list[Path],
+        file_extensions: list[str] | None = None,
+    ) -> None:
+        super().__init__(file_extensions)
+
+        library = _LoadInotifyLibrary()
+        if library is None:
+            msg = "inotify is not available on this system."
+            raise OSError(msg)
+
+        fd = library.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            error = ctypes.get_errno()
+            raise OSError(error, os.strerror(error))
+
+        self._library = library
+        self._fd: int | None = fd
+
+        self._workspace_roots = workspace_roots
+
+        self._directories: dict[int, Path] = {}
+
+        try:
+            for workspace_root in workspace_roots:
+                self._AddDirectory(workspace_root)
+        except:
+            self.Close()
+            raise
+
+    # ----------------------------------------------------------------------
+    @override
+    def Close(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Protected Methods
+    # |
+    # ----------------------------------------------------------------------
+    @override
+    def _Read(
+        self,
+        timeout: float | None,
+    ) -> set[Path]:
+        assert self._fd is not None
+
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return set()
+
+        changes: set[Path] = set()
+
+        while True:
+            try:
+                data = os.read(self._fd, _READ_SIZE)
+            except BlockingIOError:
+                break
+
+            offset = 0
+
+            while offset < len(data):
+                watch_descriptor, mask, _, name_length = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+
+                name = os.fsdecode(data[offset : offset + name_length].rstrip(b"\0"))
+                offset += name_length
+
+                if mask & _IN_Q_OVERFLOW:
+                    # Events were lost, so report the workspace roots
+                    changes.update(self._workspace_roots)
+                    continue
+
+                if mask & _IN_IGNORED:
+                    self._directories.pop(watch_descriptor, None)
+                    continue
+
+                directory = self._directories.get(watch_descriptor)
+                if directory is None or not name:
+                    continue
+
+                path = directory / name
+
+                if mask & _IN_ISDIR:
+                    if mask & (_IN_CREATE | _IN_MOVED_TO):
+                        changes |= self._AddDirectory(path)
+                    elif mask & _IN_MOVED_FROM:
+                        self._RemoveDirectory(path)
+                        changes.add(path)
+                    elif mask & _IN_DELETE:
+                        changes.add(path)
+
+                elif self._IsMatch(name):
+                    changes.add(path)
+
+        return changes
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Private Methods
+    # |
+    # ----------------------------------------------------------------------
+    def _AddDirectory(
+        self,
+        directory: Path,
+    ) -> set[Path]:
+        """Watch the directory and its descendants; returns the files that they contain."""
+
+        watch_descriptor = self._library.inotify_add_watch(self._fd, os.fsencode(directory), _WATCH_MASK)
+
+        if watch_descriptor < 0:
+            error = ctypes.get_errno()
+
+            # The directory was removed before it could be watched
+            if error in (errno.ENOENT, errno.ENOTDIR):
+                return set()
+
+            raise OSError(error, os.strerror(error), str(directory))
+
+        self._directories[watch_descriptor] = directory
+
+        filenames: set[Path] = set()
+
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            return filenames
+
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                filenames |= self._AddDirectory(Path(entry.path))
+            elif self._IsMatch(entry.name):
+                filenames.add(Path(entry.path))
+
+        return filenames
+
+    # ----------------------------------------------------------------------
+    def _RemoveDirectory(
+        self,
+        directory: Path,
+    ) -> None:
+        # The directory continues to be watched at its new location, so stop watching it (and its
+        # descendants) explicitly.
+        for watch_descriptor, watched_directory in list(self._directories.items()):
+            if watched_directory == directory or directory in watched_directory.parents:
+                self._library.inotify_rm_watch(self._fd, watch_descriptor)
+                del self._directories[watch_descriptor]
+
+
+# ----------------------------------------------------------------------
+class PollingFileWatcher(FileWatcher):
+    """Monitors directories by periodically comparing the modification times and sizes of their files."""
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        workspace_roots: list[Path],
+        file_extensions: list[str] | None = None,
+        *,
+        poll_interval: float = 0.5,
+    ) -> None:
+        super().__init__(file_extensions)
+
+        self.poll_interval = poll_interval
+
+        self._workspace_roots = workspace_roots
+        self._snapshot = self._Scan()
+
+    # ----------------------------------------------------------------------
+    @override
+    def Close(self) -> None:
+        # Nothing to release, as the directories are only accessed while being scanned
+        pass
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Protected Methods
+    # |
+    # ----------------------------------------------------------------------
+    @override
+    def _Read(
+        self,
+        timeout: float | None,
+    ) -> set[Path]:
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            snapshot = self._Scan()
+
+            changes = {
+                filename
+                for filename in snapshot.keys() | self._snapshot.keys()
+                if snapshot.get(filename) != self._snapshot.get(filename)
+            }
+
+            self._snapshot = snapshot
+
+            if changes:
+                return changes
+
+            sleep_seconds = self.poll_interval
+
+            if deadline is not None:
+                sleep_seconds = min(sleep_seconds, deadline - time.monotonic())
+                if sleep_seconds <= 0:
+                    return set()
+
+            time.sleep(sleep_seconds)
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Private Methods
+    # |
+    # ----------------------------------------------------------------------
+    def _Scan(self) -> dict[Path, tuple[int, int]]:
+        snapshot: dict[Path, tuple[int, int]] = {}
+
+        for workspace_root in self._workspace_roots:
+            for root, _, filenames in os.walk(workspace_root):
+                for filename in filenames:
+                    if not self._IsMatch(filename):
+                        continue
+
+                    fullpath = Path(root) / filename
+
+                    try:
+                        stat = fullpath.stat()
+                    except OSError:
+                        continue
+
+                    snapshot[fullpath] = (stat.st_mtime_ns, stat.st_size)
+
+        return snapshot
+
+
+# ----------------------------------------------------------------------
+class WorkspaceWatcher:
+    """Parses the files within workspaces and reparses the affected files whenever files change.
+
+    A change to a file only requires that file to be reparsed; the files that include it are reparsed
+    when it is created or removed (see `ParseSession`). The errors and the time taken by each build are
+    written to the output stream.
+    """
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        workspace_roots: list[Path],
+        output_stream: TextIO,
+        file_extensions: list[str] | None = None,
+        *,
+        polling: bool = False,
+        poll_interval: float = 0.5,
+        settle_seconds: float = 0.1,
+        executor: ExecutorType = ExecutorType.Thread,
+        single_threaded: bool = False,
+    ) -> None:
+        self.workspace_roots = [workspace_root.resolve() for workspace_root in workspace_roots]
+        self.file_extensions = file_extensions
+        self.settle_seconds = settle_seconds
+
+        self._output_stream = output_stream
+
+        self._session = ParseSession(
+            file_extensions,
+            options=ParseOptions(
+                quiet=True,
+                executor=executor,
+                single_threaded=single_threaded,
+            ),
+        )
+
+        self._file_watcher = CreateFileWatcher(
+            self.workspace_roots,
+            file_extensions,
+            polling=polling,
+            poll_interval=poll_interval,
+        )
+
+        self._root_filenames: set[Path] = set()
+        self._results: dict[Path, Exception | RootStatement] = {}
+
+    # ----------------------------------------------------------------------
+    def __enter__(self) -> Self:
+        return self
+
+    # ----------------------------------------------------------------------
+    def __exit__(self, *args) -> None:
+        self.Close()
+
+    # ----------------------------------------------------------------------
+    def Close(self) -> None:
+        self._file_watcher.Close()
+        self._session.Close()
+
+    # ----------------------------------------------------------------------
+    def Run(
+        self,
+        stop_event: threading.Event | None = None,
+    ) -> None:
+        """Build the workspaces and rebuild them as files change until the stop event is set."""
+
+        self.Build()
+
+        while stop_event is None or not stop_event.is_set():
+            changed_filenames = self._file_watcher.Wait(
+                _STOP_EVENT_POLL_SECONDS,
+                settle_seconds=self.settle_seconds,
+            )
+
+            if changed_filenames:
+                self.Build(changed_filenames)
+
+    # ----------------------------------------------------------------------
+    def Build(
+        self,
+        changed_filenames: set[Path] | None = None,
+    ) -> int:
+        """Parse the changed files (or all of the files if None) and return the number of errors."""
+
+        start_time = time.perf_counter()
+
+        with DoneManager.Create(io.StringIO(), "", line_prefix="") as dm:
+            if changed_filenames is not None and all(
+                filename in self._root_filenames and filename.is_file() for filename in changed_filenames
+            ):
+                results = self._session.Update(dm, changed_filenames, raise_if_single_exception=False)
+            else:
+                # Files were created or removed; the results of files whose content hasn't changed are
+                # reused by the session.
+                workspaces = CreateWorkspaces(self.workspace_roots, self.file_extensions)
+
+                self._root_filenames = {
+                    workspace_root / relative_path
+                    for workspace_root, sources in workspaces.items()
+                    for relative_path in sources
+                }
+
+                results = self._session.Parse(dm, workspaces, raise_if_single_exception=False)
+
+        elapsed_seconds = time.perf_counter() - start_time
+
+        previous_results = self._results
+
+        self._results = {
+            workspace_root / relative_path: result
+            for workspace_root, workspace_results in results.items()
+            for relative_path, result in workspace_results.items()
+        }
+
+        num_parsed = sum(
+            1 for filename, result in self._results.items() if previous_results.get(filename) is not result
+        )
+
+        error_objects = [
+            error_object
+            for _, result in sorted(self._results.items())
+            if isinstance(result, Exception)
+            for error_object in CreateErrorObjects(result)
+        ]
+
+        for error_object in error_objects:
+            self._output_stream.write(f"{FormatError(error_object)}\n")
+
+        self._output_stream.write(
+            "[{}] Parsed {} of {} files in {:.1f}ms; {} errors\n".format(
+                time.strftime("%H:%M:%S"),
+                num_parsed,
+                len(self._results),
+                elapsed_seconds * 1000,
+                len(error_objects),
+            ),
+        )
+
+        self._output_stream.flush()
+
+        return len(error_objects)
+
+
+# ----------------------------------------------------------------------
+def CreateFileWatcher(
+    workspace_roots: list[Path],
+    file_extensions: list[str] | None = None,
+    *,
+    polling: bool = False,
+    poll_interval: float = 0.5,
+) -> FileWatcher:
+    """Create a FileWatcher that uses inotify when it is available and polling when it is not."""
+
+    if not polling and InotifyFileWatcher.IsAvailable():
+        try:
+            return InotifyFileWatcher(workspace_roots, file_extensions)
+        except OSError:
+            # The limit on the number of watches may have been reached
+            pass
+
+    return PollingFileWatcher(workspace_roots, file_extensions, poll_interval=poll_interval)
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Private Data
+# |
+# ----------------------------------------------------------------------
+_STOP_EVENT_POLL_SECONDS = 0.5
+
+_READ_SIZE = 64 * 1024
+
+# struct inotify_event { int wd; uint32_t mask; uint32_t cookie; uint32_t len; char name[]; }
+_EVENT_HEADER = struct.Struct("iIII")
+
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ONLYDIR = 0x01000000
+_IN_ISDIR = 0x40000000
+
+_WATCH_MASK = (
+    _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE | _IN_ONLYDIR
+)
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Private Functions
+# |
+# ----------------------------------------------------------------------
+@cache
+def _LoadInotifyLibrary() -> ctypes.CDLL | None:
+    if not sys.platform.startswith("linux"):
+        return None  # pragma: no cover
+
+    try:
+        library = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+    except OSError:  # pragma: no cover
+        return None
+
+    if not hasattr(library, "inotify_init1"):
+        return None  # pragma: no cover
+
+    return library
@@ -13,6 +13,7 @@
 # ----------------------------------------------------------------------
 """Unit tests for Errors.py"""
 
+import pickle
 import textwrap
 
 from enum import auto, Enum
@@ -195,3 +196,39 @@ def test_CreateErrorType():
 
     assert error.message == "a: 1, b: two, l: ['1', '2', '3'], p: foo, e: a"
     assert error.regions == [region]
+
+
+# ----------------------------------------------------------------------
+def test_Pickle():
+    region = Region.Create(Path("foo"), 1, 2, 3, 4)
+    error_type = CreateErrorType("The value is {value}.", value=int)
+
+    ex = SimpleSchemaGeneratorError(error_type.Create(region, 10))
+
+    ex.errors.append(Error.Create("Another error", region))
+    ex.errors.append(error_type.Create(region, 20))
+
+    restored_ex = pickle.loads(pickle.dumps(ex))
+
+    assert type(restored_ex) is SimpleSchemaGeneratorError
+    assert str(restored_ex) == str(ex)
+    assert len(restored_ex.errors) == len(ex.errors)
+
+    for restored_error, error in zip(restored_ex.errors, ex.errors, strict=True):
+        assert type(restored_error) is type(error)
+        assert restored_error == error
+
+    assert restored_ex.errors[0].value == 10
+    assert restored_ex.errors[0].message == "The value is 10."
+    assert restored_ex.errors[2].value == 20
+    assert restored_ex.errors[2].regions == [region]
+
+
+# ----------------------------------------------------------------------
+def test_CreateErrorTypeIsCached():
+    assert CreateErrorType("The value is {value}.", value=int) is CreateErrorType(
+        "The value is {value}.", value=int
+    )
+    assert CreateErrorType("The value is {value}.", value=int) is not CreateErrorType(
+        "The value is {value}.", value=str
+    )
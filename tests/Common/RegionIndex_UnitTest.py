@@ -0,0 +1,120 @@
+# ----------------------------------------------------------------------
+# |
+# |  RegionIndex_UnitTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-16 23:59:48
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2026
+# |  Distributed under the MIT License.
+# |
+# ----------------------------------------------------------------------
+"""Unit tests for RegionIndex.py"""
+
+from pathlib import Path
+
+from SimpleSchemaGenerator.Common.Location import Location
+from SimpleSchemaGenerator.Common.Region import Region
+from SimpleSchemaGenerator.Common.RegionIndex import *
+
+
+# ----------------------------------------------------------------------
+def _CreateRegion(
+    begin_line: int,
+    begin_column: int,
+    end_line: int,
+    end_column: int,
+) -> Region:
+    return Region.Create(Path("File"), begin_line, begin_column, end_line, end_column)
+
+
+# ----------------------------------------------------------------------
+def test_Empty():
+    index = RegionIndex([])
+
+    assert len(index) == 0
+    assert index.Find(Location(1, 1)) == []
+    assert index.FindInnermost(Location(1, 1)) is None
+
+
+# ----------------------------------------------------------------------
+def test_Nested():
+    index = RegionIndex(
+        [
+            (_CreateRegion(1, 1, 10, 1), "root"),
+            (_CreateRegion(1, 1, 5, 1), "first"),
+            (_CreateRegion(2, 5, 2, 10), "first.child"),
+            (_CreateRegion(3, 5, 4, 10), "first.other_child"),
+            (_CreateRegion(5, 1, 10, 1), "second"),
+            (_CreateRegion(6, 5, 6, 10), "second.child"),
+        ],
+    )
+
+    assert len(index) == 6
+
+    assert index.Find(Location(1, 1)) == ["first", "root"]
+    assert index.Find(Location(2, 5)) == ["first.child", "first", "root"]
+    assert index.Find(Location(2, 9)) == ["first.child", "first", "root"]
+    assert index.Find(Location(2, 10)) == ["first", "root"]
+    assert index.Find(Location(4, 1)) == ["first.other_child", "first", "root"]
+
+    # Regions don't contain their end
+    assert index.Find(Location(5, 1)) == ["second", "root"]
+    assert index.Find(Location(6, 7)) == ["second.child", "second", "root"]
+    assert index.Find(Location(9, 100)) == ["second", "root"]
+    assert index.Find(Location(10, 1)) == []
+
+    assert index.FindInnermost(Location(3, 6)) == "first.other_child"
+    assert index.FindInnermost(Location(20, 1)) is None
+
+
+# ----------------------------------------------------------------------
+def test_SameRegions():
+    # Values with the same region are nested in the order in which they were provided
+    region = _CreateRegion(1, 5, 1, 10)
+
+    index = RegionIndex(
+        [
+            (_CreateRegion(1, 1, 2, 1), "statement"),
+            (region, "type"),
+            (region, "cardinality"),
+            (region, "identifier"),
+        ],
+    )
+
+    assert index.Find(Location(1, 6)) == ["identifier", "cardinality", "type", "statement"]
+    assert index.Find(Location(1, 2)) == ["statement"]
+
+
+# ----------------------------------------------------------------------
+def test_EmptyRegions():
+    index = RegionIndex(
+        [
+            (_CreateRegion(1, 1, 3, 1), "outer"),
+            (_CreateRegion(2, 1, 2, 1), "empty"),
+            (_CreateRegion(2, 1, 2, 5), "after_empty"),
+        ],
+    )
+
+    # An empty region is nested within the other regions that begin at the same location
+    assert index.Find(Location(2, 1)) == ["empty", "after_empty", "outer"]
+    assert index.Find(Location(2, 2)) == ["after_empty", "outer"]
+
+
+# ----------------------------------------------------------------------
+def test_Unsorted():
+    index = RegionIndex(
+        [
+            (_CreateRegion(5, 1, 6, 1), "last"),
+            (_CreateRegion(1, 1, 2, 1), "first"),
+            (_CreateRegion(3, 1, 4, 1), "middle"),
+            (_CreateRegion(3, 2, 3, 4), "middle.child"),
+        ],
+    )
+
+    assert index.Find(Location(1, 3)) == ["first"]
+    assert index.Find(Location(3, 3)) == ["middle.child", "middle"]
+    assert index.Find(Location(4, 1)) == []
+    assert index.Find(Location(5, 1)) == ["last"]
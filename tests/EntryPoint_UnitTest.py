@@ -6,10 +6,50 @@
 # ----------------------------------------------------------------------
 """Unit tests for EntryPoint.py"""
 
+import json
+import subprocess
+import sys
+import threading
+
+from unittest.mock import patch
+
+import pytest
+
 from typer.testing import CliRunner
 
 from SimpleSchemaGenerator import __version__
 from SimpleSchemaGenerator.EntryPoint import app
+from SimpleSchemaGenerator.ParseDaemon import ParseDaemon
+from SimpleSchemaGenerator.ParseDaemonClient import ParseDaemonError, SendRequest
+from SimpleSchemaGenerator.Watcher import FileWatcher
+
+
+# ----------------------------------------------------------------------
+@pytest.fixture
+def workspace(tmp_path):
+    workspace = tmp_path.resolve() / "workspace"
+    workspace.mkdir()
+
+    (workspace / "Valid.SimpleSchema").write_text("value: Integer\n", encoding="utf-8")
+
+    return workspace
+
+
+# ----------------------------------------------------------------------
+def test_ImportDoesNotLoadParser():
+    # Commands that send requests to a running daemon shouldn't pay to import the parser
+    result = subprocess.run(  # noqa: S603
+        [
+            sys.executable,
+            "-c",
+            "import sys; import SimpleSchemaGenerator.EntryPoint; print('SimpleSchemaGenerator.Schema.Parse.ANTLR.Parse' in sys.modules, 'antlr4' in sys.modules)",
+        ],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+    assert result.stdout == "False False\n"
 
 
 # ----------------------------------------------------------------------
@@ -17,3 +57,241 @@ def test_Version():
     result = CliRunner().invoke(app, ["Version"])
     assert result.exit_code == 0
     assert result.stdout == __version__
+
+
+# ----------------------------------------------------------------------
+class TestParse:
+    # ----------------------------------------------------------------------
+    def test_Standard(self, workspace):
+        result = CliRunner().invoke(app, ["Parse", str(workspace)])
+        assert result.exit_code == 0, result.output
+        assert result.stdout == "1 files, 0 errors\n"
+
+    # ----------------------------------------------------------------------
+    def test_Errors(self, workspace):
+        (workspace / "Invalid.SimpleSchema").write_text("one: Integer\ntwo: Integer (\n", encoding="utf-8")
+
+        result = CliRunner().invoke(app, ["Parse", str(workspace)])
+        assert result.exit_code == 1
+        assert result.stdout == (
+            "no viable alternative at input 'two: Integer (' ({} <Ln 2, Col 14>)\n2 files, 1 errors\n"
+        ).format(workspace / "Invalid.SimpleSchema")
+
+    # ----------------------------------------------------------------------
+    def test_FailFast(self, workspace):
+        for index in range(4):
+            (workspace / f"Invalid{index}.SimpleSchema").write_text("value: Integer (\n", encoding="utf-8")
+
+        result = CliRunner().invoke(app, ["Parse", str(workspace), "--fail-fast", "--jobs", "1"])
+        assert result.exit_code == 1
+        assert result.stdout.endswith(" files, 1 errors\n")
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.parametrize("executor", ["thread", "process"])
+    def test_Executor(self, workspace, executor):
+        result = CliRunner().invoke(app, ["Parse", str(workspace), "--executor", executor, "--jobs", "2"])
+        assert result.exit_code == 0, result.output
+        assert result.stdout == "1 files, 0 errors\n"
+
+    # ----------------------------------------------------------------------
+    def test_CacheDir(self, workspace, tmp_path):
+        cache_dir = tmp_path / "cache"
+
+        for _ in range(2):
+            result = CliRunner().invoke(app, ["Parse", str(workspace), "--cache-dir", str(cache_dir)])
+            assert result.exit_code == 0, result.output
+            assert result.stdout == "1 files, 0 errors\n"
+
+        assert any(cache_dir.iterdir())
+
+    # ----------------------------------------------------------------------
+    def test_StatsJson(self, workspace, tmp_path):
+        stats_filename = tmp_path / "output" / "stats.json"
+
+        result = CliRunner().invoke(app, ["Parse", str(workspace), "--stats-json", str(stats_filename)])
+        assert result.exit_code == 0, result.output
+
+        content = json.loads(stats_filename.read_text(encoding="utf-8"))
+
+        assert content["num_files"] == 1
+        assert content["num_errors"] == 0
+        assert content["totals"]["total_time"] > 0
+        assert content["workspaces"][0]["workspace_root"] == str(workspace)
+        assert [file_info["relative_path"] for file_info in content["workspaces"][0]["files"]] == [
+            "Valid.SimpleSchema",
+        ]
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.parametrize("executor", ["thread", "process"])
+    def test_DfaSnapshot(self, workspace, tmp_path, executor):
+        dfa_snapshot = tmp_path / "snapshot"
+
+        for _ in range(2):
+            result = CliRunner().invoke(
+                app,
+                ["Parse", str(workspace), "--executor", executor, "--dfa-snapshot", str(dfa_snapshot)],
+            )
+
+            assert result.exit_code == 0, result.output
+            assert result.stdout == "1 files, 0 errors\n"
+
+            # The snapshot is saved once the files have been parsed and loaded by the next invocation
+            assert dfa_snapshot.is_file()
+
+    # ----------------------------------------------------------------------
+    def test_ErrorInvalidJobs(self, workspace):
+        result = CliRunner().invoke(app, ["Parse", str(workspace), "--jobs", "0"])
+        assert result.exit_code != 0
+
+
+# ----------------------------------------------------------------------
+def test_Validate(workspace, tmp_path):
+    # The daemon isn't running, so the files are parsed in this process
+    socket_args = ["--socket", str(tmp_path / "daemon.sock")]
+
+    result = CliRunner().invoke(app, ["Validate", str(workspace), *socket_args])
+    assert result.exit_code == 0, result.output
+    assert result.stdout == "1 files, 0 errors\n"
+
+    (workspace / "Invalid.SimpleSchema").write_text("one: Integer\ntwo: Integer (\n", encoding="utf-8")
+
+    result = CliRunner().invoke(app, ["Validate", str(workspace), *socket_args])
+    assert result.exit_code == 1
+    assert result.stdout == (
+        "no viable alternative at input 'two: Integer (' ({} <Ln 2, Col 14>)\n2 files, 1 errors\n"
+    ).format(workspace / "Invalid.SimpleSchema")
+
+
+# ----------------------------------------------------------------------
+def test_ValidateDaemonError(workspace):
+    # A daemon that can't process the request (for example, one started by a different version) is
+    # ignored and the files are parsed in this process.
+    with patch(
+        "SimpleSchemaGenerator.EntryPoint.SendRequest",
+        side_effect=ParseDaemonError("'Validate' is not a supported method."),
+    ) as send_request_mock:
+        result = CliRunner().invoke(app, ["Validate", str(workspace)])
+
+    assert send_request_mock.call_count == 1
+
+    assert result.exit_code == 0, result.output
+    assert result.stdout == "1 files, 0 errors\n"
+
+
+# ----------------------------------------------------------------------
+def test_ValidateDfaSnapshot(workspace, tmp_path):
+    dfa_snapshot = tmp_path / "snapshot"
+
+    result = CliRunner().invoke(
+        app,
+        ["Validate", str(workspace), "--no-daemon", "--dfa-snapshot", str(dfa_snapshot)],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert dfa_snapshot.is_file()
+
+
+# ----------------------------------------------------------------------
+@pytest.mark.skipif(sys.platform == "win32", reason="Unix domain sockets are not available on Windows")
+def test_ValidateWithDaemon(workspace, tmp_path):
+    socket_path = tmp_path / "daemon.sock"
+
+    with ParseDaemon() as daemon:
+        listening_event = threading.Event()
+
+        thread = threading.Thread(target=daemon.ServeSocket, args=(socket_path, listening_event.set))
+        thread.start()
+
+        try:
+            assert listening_event.wait(30)
+
+            result = CliRunner().invoke(app, ["Validate", str(workspace), "--socket", str(socket_path)])
+            assert result.exit_code == 0, result.output
+            assert result.stdout == "1 files, 0 errors\n"
+
+            # The request was processed by the daemon
+            assert SendRequest(socket_path, "Status")["workspaces"] == [[str(workspace)]]
+
+            # The request isn't sent to the daemon
+            result = CliRunner().invoke(
+                app,
+                ["Validate", str(workspace), "--socket", str(socket_path), "--no-daemon"],
+            )
+            assert result.exit_code == 0, result.output
+
+        finally:
+            SendRequest(socket_path, "Shutdown")
+            thread.join(30)
+
+
+# ----------------------------------------------------------------------
+def test_DaemonStdio(workspace):
+    result = CliRunner().invoke(
+        app,
+        ["Daemon", "--stdio"],
+        input="\n".join(
+            [
+                json.dumps({"id": 1, "method": "Validate", "params": {"workspaces": [str(workspace)]}}),
+                json.dumps({"id": 2, "method": "Shutdown"}),
+            ],
+        ),
+    )
+
+    assert result.exit_code == 0, result.output
+    assert [json.loads(line) for line in result.stdout.splitlines()] == [
+        {"id": 1, "result": {"success": True, "num_files": 1, "errors": []}},
+        {"id": 2, "result": {}},
+    ]
+
+
+# ----------------------------------------------------------------------
+def test_DaemonDfaSnapshot(workspace, tmp_path):
+    dfa_snapshot = tmp_path / "snapshot"
+
+    result = CliRunner().invoke(
+        app,
+        ["Daemon", "--stdio", "--dfa-snapshot", str(dfa_snapshot)],
+        input=json.dumps({"id": 1, "method": "Validate", "params": {"workspaces": [str(workspace)]}}),
+    )
+
+    assert result.exit_code == 0, result.output
+
+    # The snapshot is saved once the daemon exits
+    assert dfa_snapshot.is_file()
+
+
+# ----------------------------------------------------------------------
+def test_LanguageServer():
+    messages = [
+        {"jsonrpc": "2.0", "id": 1, "method": "initialize", "params": {}},
+        {"jsonrpc": "2.0", "id": 2, "method": "shutdown"},
+        {"jsonrpc": "2.0", "method": "exit"},
+    ]
+
+    contents = [json.dumps(message).encode("utf-8") for message in messages]
+
+    result = CliRunner().invoke(
+        app,
+        ["LanguageServer", "--stdio", "--max-errors", "5"],
+        input=b"".join(
+            f"Content-Length: {len(content)}\r\n\r\n".encode("ascii") + content for content in contents
+        ),
+    )
+
+    assert result.exit_code == 0, result.output
+    assert '"hoverProvider": true' in result.stdout
+    assert result.stdout.endswith('{"jsonrpc": "2.0", "id": 2, "result": null}')
+
+    # The server exits with an error when the input stream is closed before a shutdown request
+    assert CliRunner().invoke(app, ["LanguageServer"], input=b"").exit_code == 1
+
+
+# ----------------------------------------------------------------------
+def test_Watch(workspace):
+    # Stop watching once the initial build is complete
+    with patch.object(FileWatcher, "Wait", side_effect=KeyboardInterrupt):
+        result = CliRunner().invoke(app, ["Watch", str(workspace), "--polling"])
+
+    assert result.exit_code == 0, result.output
+    assert "] Parsed 1 of 1 files in " in result.stdout
+    assert result.stdout.endswith("; 0 errors\n")
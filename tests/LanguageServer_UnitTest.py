@@ -0,0 +1,486 @@
+# ----------------------------------------------------------------------
+# |
+# |  LanguageServer_UnitTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-16 23:59:48
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2026
+# |  Distributed under the MIT License.
+# |
+# ----------------------------------------------------------------------
+"""Unit tests for LanguageServer.py."""
+
+import io
+import json
+import re
+import time
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from SimpleSchemaGenerator import __version__
+from SimpleSchemaGenerator.LanguageServer import *
+
+
+# ----------------------------------------------------------------------
+@pytest.fixture
+def workspace(tmp_path) -> Path:
+    workspace = tmp_path.resolve() / "workspace"
+    (workspace / "Sub").mkdir(parents=True)
+
+    (workspace / "Lib.SimpleSchema").write_text(
+        "Base ->\n    base_value: Integer\n\nOther ->\n    Nested ->\n        nested_value: String\n",
+        encoding="utf-8",
+    )
+
+    (workspace / "Sub" / "Module.SimpleSchema").write_text("value: Integer\n", encoding="utf-8")
+
+    (workspace / "Main.SimpleSchema").write_text(
+        "\n".join(
+            [
+                "from Lib import (",  # 0
+                "    Base as B,",  # 1
+                ")",  # 2
+                "from Lib import *",  # 3
+                "from Sub/ import Module",  # 4
+                "",  # 5
+                "Thing: B ->",  # 6
+                "    Inner ->",  # 7
+                "        v: Integer",  # 8
+                "    a: Inner",  # 9
+                "    b: Other.Nested",  # 10
+                "    c: ::Thing",  # 11
+                "",  # 12
+                "d: B",  # 13
+                "",
+            ],
+        ),
+        encoding="utf-8",
+    )
+
+    return workspace
+
+
+# ----------------------------------------------------------------------
+def _CreateMessage(
+    message: dict[str, Any],
+) -> bytes:
+    content = json.dumps({"jsonrpc": "2.0", **message}).encode("utf-8")
+    return f"Content-Length: {len(content)}\r\n\r\n".encode("ascii") + content
+
+
+# ----------------------------------------------------------------------
+def _ParseMessages(
+    content: bytes,
+) -> list[dict[str, Any]]:
+    return [json.loads(value) for value in re.split(rb"Content-Length: \d+\r\n\r\n", content) if value]
+
+
+# ----------------------------------------------------------------------
+def _Serve(
+    messages: list[dict[str, Any]],
+    **kwargs,
+) -> tuple[int, list[dict[str, Any]]]:
+    output_stream = io.BytesIO()
+
+    exit_code = LanguageServer(
+        io.BytesIO(b"".join(_CreateMessage(message) for message in messages)),
+        output_stream,
+        **kwargs,
+    ).Serve()
+
+    return exit_code, _ParseMessages(output_stream.getvalue())
+
+
+# ----------------------------------------------------------------------
+def _Open(
+    filename: Path,
+    text: str | None = None,
+) -> dict[str, Any]:
+    return {
+        "method": "textDocument/didOpen",
+        "params": {
+            "textDocument": {
+                "uri": filename.as_uri(),
+                "languageId": "SimpleSchema",
+                "version": 1,
+                "text": filename.read_text(encoding="utf-8") if text is None else text,
+            },
+        },
+    }
+
+
+# ----------------------------------------------------------------------
+def _Change(
+    filename: Path,
+    text: str,
+) -> dict[str, Any]:
+    return {
+        "method": "textDocument/didChange",
+        "params": {
+            "textDocument": {"uri": filename.as_uri(), "version": 2},
+            "contentChanges": [{"text": text}],
+        },
+    }
+
+
+# ----------------------------------------------------------------------
+def _Request(
+    request_id: int,
+    method: str,
+    filename: Path,
+    line: int,
+    character: int,
+) -> dict[str, Any]:
+    return {
+        "id": request_id,
+        "method": method,
+        "params": {
+            "textDocument": {"uri": filename.as_uri()},
+            "position": {"line": line, "character": character},
+        },
+    }
+
+
+# ----------------------------------------------------------------------
+def _CreateRange(
+    line: int,
+    begin_character: int,
+    end_character: int,
+) -> dict[str, Any]:
+    return {
+        "start": {"line": line, "character": begin_character},
+        "end": {"line": line, "character": end_character},
+    }
+
+
+# ----------------------------------------------------------------------
+def test_Lifecycle(workspace):
+    exit_code, responses = _Serve(
+        [
+            {"id": 1, "method": "initialize", "params": {"rootUri": workspace.as_uri()}},
+            {"method": "initialized", "params": {}},
+            {"id": 2, "method": "Unknown"},
+            {"id": 3, "method": "shutdown"},
+            {"id": 4, "method": "textDocument/hover"},
+            {"method": "exit"},
+            # Messages after exit are not processed
+            {"id": 5, "method": "shutdown"},
+        ],
+    )
+
+    assert exit_code == 0
+
+    assert responses == [
+        {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "result": {
+                "capabilities": {
+                    "textDocumentSync": {"openClose": True, "change": 1},
+                    "hoverProvider": True,
+                    "definitionProvider": True,
+                },
+                "serverInfo": {"name": "SimpleSchemaGenerator", "version": __version__},
+            },
+        },
+        {
+            "jsonrpc": "2.0",
+            "id": 2,
+            "error": {"code": -32601, "message": "'Unknown' is not a supported method."},
+        },
+        {"jsonrpc": "2.0", "id": 3, "result": None},
+        {"jsonrpc": "2.0", "id": 4, "error": {"code": -32600, "message": "The server has been shut down."}},
+    ]
+
+
+# ----------------------------------------------------------------------
+def test_ExitWithoutShutdown():
+    # The input stream is closed without a shutdown request
+    assert _Serve([{"id": 1, "method": "initialize", "params": {}}])[0] == 1
+
+
+# ----------------------------------------------------------------------
+def test_InvalidMessages():
+    output_stream = io.BytesIO()
+
+    LanguageServer(
+        io.BytesIO(b"Content-Length: 8\r\n\r\n{invalid" + _CreateMessage({"id": 1, "method": "shutdown"})),
+        output_stream,
+    ).Serve()
+
+    responses = _ParseMessages(output_stream.getvalue())
+
+    assert len(responses) == 2
+    assert responses[0]["id"] is None
+    assert responses[0]["error"]["code"] == -32700
+    assert responses[1] == {"jsonrpc": "2.0", "id": 1, "result": None}
+
+
+# ----------------------------------------------------------------------
+def test_Diagnostics(workspace):
+    filename = workspace / "Invalid.SimpleSchema"
+    filename.write_text("one: Integer\ntwo: Integer (\n", encoding="utf-8")
+
+    _, responses = _Serve(
+        [
+            {"id": 1, "method": "initialize", "params": {"rootUri": workspace.as_uri()}},
+            _Open(filename),
+            # Requests process pending changes before they are answered
+            _Request(2, "textDocument/hover", filename, 0, 0),
+            _Change(filename, "one: Integer\ntwo: Integer\n"),
+            _Request(3, "textDocument/hover", filename, 0, 0),
+        ],
+        debounce_seconds=60,
+    )
+
+    assert [response.get("method", response.get("id")) for response in responses] == [
+        1,
+        "textDocument/publishDiagnostics",
+        2,
+        "textDocument/publishDiagnostics",
+        3,
+    ]
+
+    assert responses[1]["params"] == {
+        "uri": filename.as_uri(),
+        "diagnostics": [
+            {
+                "range": _CreateRange(1, 13, 13),
+                "severity": 1,
+                "source": "SimpleSchema",
+                "message": "no viable alternative at input 'two: Integer ('",
+            },
+        ],
+    }
+
+    # The diagnostics are cleared once the errors have been fixed
+    assert responses[3]["params"] == {"uri": filename.as_uri(), "diagnostics": []}
+
+
+# ----------------------------------------------------------------------
+@pytest.mark.parametrize(
+    ("kwargs", "expected_lines"),
+    [
+        ({}, [1, 3]),
+        ({"max_errors": 1}, [1]),
+        ({"max_errors": None}, [1]),
+    ],
+)
+def test_MultipleDiagnostics(tmp_path, kwargs, expected_lines):
+    filename = tmp_path.resolve() / "Invalid.SimpleSchema"
+    filename.write_text("one: Integer\ntwo: Integer (\nthree: Integer\nfour: String (\n", encoding="utf-8")
+
+    _, responses = _Serve(
+        [
+            {"id": 1, "method": "initialize", "params": {}},
+            _Open(filename),
+            _Request(2, "textDocument/hover", filename, 0, 0),
+        ],
+        **kwargs,
+    )
+
+    assert responses[1]["method"] == "textDocument/publishDiagnostics"
+    assert [diagnostic["range"]["start"]["line"] for diagnostic in responses[1]["params"]["diagnostics"]] == (
+        expected_lines
+    )
+
+
+# ----------------------------------------------------------------------
+def test_SyntaxErrors(tmp_path):
+    filename = tmp_path.resolve() / "Invalid.SimpleSchema"
+    filename.write_text(
+        "Base ->\n    value: Integer\n\none: Integer (\nthing: Base\ntwo: String (\nother: Base\n",
+        encoding="utf-8",
+    )
+
+    _, responses = _Serve(
+        [
+            {"id": 1, "method": "initialize", "params": {}},
+            _Open(filename),
+            _Request(2, "textDocument/hover", filename, 4, 8),
+            _Request(3, "textDocument/definition", filename, 6, 8),
+        ],
+    )
+
+    assert len(responses[1]["params"]["diagnostics"]) == 2
+
+    # Statements that follow the errors are still available
+    assert responses[2:] == [
+        {
+            "jsonrpc": "2.0",
+            "id": 2,
+            "result": {
+                "contents": {
+                    "kind": "markdown",
+                    "value": "```SimpleSchema\nBase ->\n    value: Integer\n```\n\nInvalid.SimpleSchema, line 1",
+                },
+                "range": _CreateRange(4, 7, 11),
+            },
+        },
+        {
+            "jsonrpc": "2.0",
+            "id": 3,
+            "result": {"uri": filename.as_uri(), "range": _CreateRange(0, 0, 4)},
+        },
+    ]
+
+
+# ----------------------------------------------------------------------
+@pytest.mark.parametrize(
+    ("line", "character", "expected"),
+    [
+        # Package include
+        (13, 3, ("Lib.SimpleSchema", _CreateRange(0, 0, 4))),
+        (6, 7, ("Lib.SimpleSchema", _CreateRange(0, 0, 4))),
+        (1, 4, ("Lib.SimpleSchema", _CreateRange(0, 0, 4))),
+        (1, 12, ("Lib.SimpleSchema", _CreateRange(0, 0, 4))),
+        # Star include
+        (10, 8, ("Lib.SimpleSchema", _CreateRange(3, 0, 5))),
+        (10, 14, ("Lib.SimpleSchema", _CreateRange(4, 4, 10))),
+        # Enclosing structure
+        (9, 8, ("Main.SimpleSchema", _CreateRange(7, 4, 9))),
+        # Global reference
+        (11, 10, ("Main.SimpleSchema", _CreateRange(6, 0, 5))),
+        # Definitions
+        (6, 2, ("Main.SimpleSchema", _CreateRange(6, 0, 5))),
+        (9, 4, ("Main.SimpleSchema", _CreateRange(9, 4, 5))),
+        # Included files
+        (0, 6, ("Lib.SimpleSchema", _CreateRange(0, 0, 0))),
+        (4, 11, ("Sub/Module.SimpleSchema", _CreateRange(0, 0, 0))),
+        # Not found
+        (8, 12, None),
+        (5, 0, None),
+        (10, 12, None),
+    ],
+)
+def test_Definition(workspace, line, character, expected):
+    filename = workspace / "Main.SimpleSchema"
+
+    _, responses = _Serve(
+        [
+            {"id": 1, "method": "initialize", "params": {"rootUri": workspace.as_uri()}},
+            _Open(filename),
+            _Request(2, "textDocument/definition", filename, line, character),
+        ],
+    )
+
+    assert responses[-1]["id"] == 2
+
+    if expected is None:
+        assert responses[-1]["result"] is None
+    else:
+        assert responses[-1]["result"] == {
+            "uri": (workspace / expected[0]).as_uri(),
+            "range": expected[1],
+        }
+
+
+# ----------------------------------------------------------------------
+def test_Hover(workspace):
+    filename = workspace / "Main.SimpleSchema"
+
+    _, responses = _Serve(
+        [
+            {"id": 1, "method": "initialize", "params": {"rootUri": workspace.as_uri()}},
+            _Open(filename),
+            _Request(2, "textDocument/hover", filename, 13, 3),
+            _Request(3, "textDocument/hover", filename, 8, 12),
+            _Request(4, "textDocument/hover", filename, 5, 0),
+        ],
+    )
+
+    assert responses[-3:] == [
+        {
+            "jsonrpc": "2.0",
+            "id": 2,
+            "result": {
+                "contents": {
+                    "kind": "markdown",
+                    "value": "```SimpleSchema\nBase ->\n    base_value: Integer\n```\n\nLib.SimpleSchema, line 1",
+                },
+                "range": _CreateRange(13, 3, 4),
+            },
+        },
+        {
+            "jsonrpc": "2.0",
+            "id": 3,
+            "result": {
+                "contents": {"kind": "markdown", "value": "`Integer`"},
+                "range": _CreateRange(8, 11, 18),
+            },
+        },
+        {"jsonrpc": "2.0", "id": 4, "result": None},
+    ]
+
+
+# ----------------------------------------------------------------------
+def test_Utf16Positions(tmp_path):
+    # The emoji is a single code point, but 2 UTF-16 code units
+    filename = tmp_path.resolve() / "Emoji.SimpleSchema"
+    filename.write_text("\U0001f600 ->\n    pass\n\nvalue: \U0001f600\n", encoding="utf-8")
+
+    _, responses = _Serve(
+        [
+            {"id": 1, "method": "initialize", "params": {}},
+            _Open(filename),
+            # The position is within the emoji
+            _Request(2, "textDocument/definition", filename, 3, 8),
+            _Change(filename, "\U0001f600 ->\n    pass\n\nvalue: \U0001f600 (\n"),
+            _Request(3, "textDocument/definition", filename, 0, 0),
+        ],
+    )
+
+    assert responses[1]["result"] == {"uri": filename.as_uri(), "range": _CreateRange(0, 0, 2)}
+
+    assert responses[2]["method"] == "textDocument/publishDiagnostics"
+    assert responses[2]["params"]["diagnostics"][0]["range"] == _CreateRange(3, 10, 10)
+
+
+# ----------------------------------------------------------------------
+def test_Debounce(workspace):
+    main_filename = workspace / "Main.SimpleSchema"
+    lib_filename = workspace / "Lib.SimpleSchema"
+
+    output_stream = io.BytesIO()
+
+    server = LanguageServer(io.BytesIO(), output_stream, debounce_seconds=0.2)
+
+    server._ProcessMessage(  # noqa: SLF001
+        {"id": 1, "method": "initialize", "params": {"rootUri": workspace.as_uri()}},
+    )
+    server._ProcessMessage(_Open(main_filename))  # noqa: SLF001
+
+    # Wait for the debounced parse
+    time.sleep(1.0)
+
+    with server._lock:  # noqa: SLF001
+        lib_result = server._results[lib_filename]  # noqa: SLF001
+
+    text = main_filename.read_text(encoding="utf-8")
+
+    for index in range(5):
+        server._ProcessMessage(_Change(main_filename, f"{text}e{index}: Integer (\n"))  # noqa: SLF001
+
+    time.sleep(1.0)
+
+    # Only the last change was parsed
+    diagnostics = [
+        message
+        for message in _ParseMessages(output_stream.getvalue())
+        if message.get("method") == "textDocument/publishDiagnostics"
+    ]
+
+    assert len(diagnostics) == 1
+    assert diagnostics[0]["params"]["diagnostics"][0]["message"] == (
+        "no viable alternative at input 'e4: Integer ('"
+    )
+
+    # The included file wasn't parsed again
+    with server._lock:  # noqa: SLF001
+        assert server._results[lib_filename] is lib_result  # noqa: SLF001
@@ -0,0 +1,478 @@
+# ----------------------------------------------------------------------
+# |
+# |  ParseDaemon_UnitTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-16 23:59:31
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2026
+# |  Distributed under the MIT License.
+# |
+# ----------------------------------------------------------------------
+"""Unit tests for ParseDaemon.py."""
+
+import io
+import json
+import os
+import sys
+import tempfile
+import threading
+
+from pathlib import Path
+
+import pytest
+
+from SimpleSchemaGenerator import __version__
+from SimpleSchemaGenerator.Common.Error import Error, SimpleSchemaGeneratorError
+from SimpleSchemaGenerator.Common.Region import Region
+from SimpleSchemaGenerator.ParseDaemon import *
+from SimpleSchemaGenerator.ParseDaemonClient import *
+from SimpleSchemaGenerator.Schema.Elements.Statements.RootStatement import RootStatement
+from SimpleSchemaGenerator.Schema.Parse.ANTLR.Parse import AntlrError, ParseRecoveryError, ParseSession
+
+
+# ----------------------------------------------------------------------
+@pytest.fixture
+def workspace(tmp_path) -> Path:
+    workspace = tmp_path.resolve() / "workspace"
+    workspace.mkdir()
+
+    (workspace / "Valid.SimpleSchema").write_text("value: Integer\n", encoding="utf-8")
+    (workspace / "Invalid.SimpleSchema").write_text("one: Integer\ntwo: Integer (\n", encoding="utf-8")
+
+    return workspace
+
+
+# ----------------------------------------------------------------------
+@pytest.fixture
+def valid_workspace(tmp_path) -> Path:
+    workspace = tmp_path.resolve() / "valid_workspace"
+    workspace.mkdir()
+
+    (workspace / "Valid.SimpleSchema").write_text("value: Integer\n", encoding="utf-8")
+
+    return workspace
+
+
+# ----------------------------------------------------------------------
+def test_Parse(workspace):
+    with ParseDaemon() as daemon:
+        result = daemon.Parse([workspace])
+
+    assert result == {
+        "files": [
+            {
+                "workspace": str(workspace),
+                "relative_path": "Invalid.SimpleSchema",
+                "errors": [
+                    {
+                        "message": "no viable alternative at input 'two: Integer ('",
+                        "filename": str(workspace / "Invalid.SimpleSchema"),
+                        "line": 2,
+                        "column": 14,
+                    },
+                ],
+            },
+            {
+                "workspace": str(workspace),
+                "relative_path": "Valid.SimpleSchema",
+                "errors": [],
+            },
+        ],
+    }
+
+
+# ----------------------------------------------------------------------
+def test_Validate(workspace, valid_workspace):
+    with ParseDaemon() as daemon:
+        result = daemon.Validate([workspace])
+
+        assert result["success"] is False
+        assert result["num_files"] == 2
+        assert [error["line"] for error in result["errors"]] == [2]
+
+        assert daemon.Validate([valid_workspace]) == {"success": True, "num_files": 1, "errors": []}
+
+
+# ----------------------------------------------------------------------
+def test_SessionReused(workspace):
+    with ParseDaemon() as daemon:
+        daemon.Parse([workspace])
+
+        session = daemon._sessions[(workspace,)]  # noqa: SLF001
+        results = dict(session._results[workspace])  # noqa: SLF001
+
+        (workspace / "Invalid.SimpleSchema").write_text("fixed: Integer\n", encoding="utf-8")
+
+        assert daemon.Validate([workspace])["success"] is True
+
+        assert daemon._sessions == {(workspace,): session}  # noqa: SLF001
+
+        # The unchanged file wasn't parsed again
+        new_results = session._results[workspace]  # noqa: SLF001
+
+        assert isinstance(new_results[Path("Valid.SimpleSchema")], RootStatement)
+        assert new_results[Path("Valid.SimpleSchema")] is results[Path("Valid.SimpleSchema")]
+
+
+# ----------------------------------------------------------------------
+def test_OnlyChangedFilesRead(workspace, monkeypatch):
+    parse_module = sys.modules[ParseSession.__module__]
+    original_read_file = parse_module._ReadFile
+
+    read: list[str] = []
+
+    # ----------------------------------------------------------------------
+    def ReadFile(filename):
+        read.append(filename.name)
+        return original_read_file(filename)
+
+    # ----------------------------------------------------------------------
+
+    monkeypatch.setattr(parse_module, "_ReadFile", ReadFile)
+
+    with ParseDaemon() as daemon:
+        daemon.Parse([workspace])
+        assert sorted(read) == ["Invalid.SimpleSchema", "Valid.SimpleSchema"]
+
+        # Nothing has changed
+        read.clear()
+
+        assert len(daemon.Parse([workspace])["files"]) == 2
+        assert read == []
+
+        # A file was modified
+        (workspace / "Invalid.SimpleSchema").write_text("fixed: Integer\n", encoding="utf-8")
+
+        assert daemon.Validate([workspace])["success"] is True
+        assert read == ["Invalid.SimpleSchema"]
+
+        # A file was created, so all of the files are read
+        read.clear()
+
+        (workspace / "New.SimpleSchema").write_text("new: Integer\n", encoding="utf-8")
+
+        assert daemon.Validate([workspace]) == {"success": True, "num_files": 3, "errors": []}
+        assert sorted(read) == ["Invalid.SimpleSchema", "New.SimpleSchema", "Valid.SimpleSchema"]
+
+
+# ----------------------------------------------------------------------
+def test_MaxSessions(tmp_path, monkeypatch):
+    workspaces: list[Path] = []
+
+    for index in range(3):
+        workspace = tmp_path.resolve() / f"workspace{index}"
+        workspace.mkdir()
+
+        (workspace / "Valid.SimpleSchema").write_text("value: Integer\n", encoding="utf-8")
+
+        workspaces.append(workspace)
+
+    closed: list[ParseSession] = []
+
+    original_close = ParseSession.Close
+
+    # ----------------------------------------------------------------------
+    def Close(self):
+        closed.append(self)
+        original_close(self)
+
+    # ----------------------------------------------------------------------
+
+    monkeypatch.setattr(ParseSession, "Close", Close)
+
+    with ParseDaemon(max_sessions=2) as daemon:
+        daemon.Parse([workspaces[0]])
+        daemon.Parse([workspaces[1]])
+
+        session0 = daemon._sessions[(workspaces[0],)]  # noqa: SLF001
+        session1 = daemon._sessions[(workspaces[1],)]  # noqa: SLF001
+
+        # Using the first session makes the second session the least recently used
+        daemon.Parse([workspaces[0]])
+        daemon.Parse([workspaces[2]])
+
+        assert list(daemon._sessions) == [(workspaces[0],), (workspaces[2],)]  # noqa: SLF001
+        assert closed == [session1]
+
+        assert daemon._sessions[(workspaces[0],)] is session0  # noqa: SLF001
+
+    assert len(closed) == 3
+
+
+# ----------------------------------------------------------------------
+def test_InvalidMaxSessions():
+    with pytest.raises(ValueError, match="Invalid max_sessions value: 0"):
+        ParseDaemon(max_sessions=0)
+
+
+# ----------------------------------------------------------------------
+def test_ProcessRequest(workspace):
+    with ParseDaemon() as daemon:
+        assert daemon.ProcessRequest({"id": 1, "method": "Status"}) == {
+            "id": 1,
+            "result": {"version": __version__, "pid": os.getpid(), "workspaces": []},
+        }
+
+        response = daemon.ProcessRequest(
+            {"id": "two", "method": "Validate", "params": {"workspaces": [str(workspace)]}}
+        )
+
+        assert response["id"] == "two"
+        assert response["result"]["success"] is False
+
+        response = daemon.ProcessRequest(
+            {"id": 3, "method": "Parse", "params": {"workspaces": [str(workspace)]}}
+        )
+
+        assert response["id"] == 3
+        assert len(response["result"]["files"]) == 2
+
+        assert daemon.ProcessRequest({"id": 4, "method": "Status"})["result"]["workspaces"] == [
+            [str(workspace)]
+        ]
+
+        assert daemon.is_shutdown is False
+        assert daemon.ProcessRequest({"id": 5, "method": "Shutdown"}) == {"id": 5, "result": {}}
+        assert daemon.is_shutdown is True
+
+
+# ----------------------------------------------------------------------
+def test_StatusWaitsForParse(valid_workspace):
+    with ParseDaemon() as daemon:
+        responses: list[dict] = []
+
+        # ----------------------------------------------------------------------
+        def GetStatus() -> None:
+            responses.append(daemon.ProcessRequest({"id": 1, "method": "Status"}))
+
+        # ----------------------------------------------------------------------
+
+        # Hold the lock as a request that is being processed would
+        with daemon._lock:  # noqa: SLF001
+            thread = threading.Thread(target=GetStatus)
+            thread.start()
+
+            thread.join(0.2)
+            assert thread.is_alive()
+
+            daemon._sessions[(valid_workspace,)] = ParseSession()  # noqa: SLF001
+
+        thread.join()
+
+        assert responses[0]["result"]["workspaces"] == [[str(valid_workspace)]]
+
+
+# ----------------------------------------------------------------------
+def test_ProcessRequestErrors(workspace):
+    with ParseDaemon() as daemon:
+        assert daemon.ProcessRequest([1, 2, 3]) == {"id": None, "error": "Requests must be JSON objects."}
+
+        assert daemon.ProcessRequest({"id": 1, "method": "Unknown"}) == {
+            "id": 1,
+            "error": "'Unknown' is not a supported method.",
+        }
+
+        assert daemon.ProcessRequest({"id": 2, "method": "Parse", "params": [1]}) == {
+            "id": 2,
+            "error": "Request parameters must be JSON objects.",
+        }
+
+        assert daemon.ProcessRequest({"id": 3, "method": "Parse", "params": {"workspaces": "invalid"}}) == {
+            "id": 3,
+            "error": "'workspaces' must be a list of directories.",
+        }
+
+        assert daemon.ProcessRequest(
+            {"id": 4, "method": "Validate", "params": {"workspaces": [str(workspace / "Missing")]}}
+        ) == {
+            "id": 4,
+            "error": f"'{workspace / 'Missing'}' is not a valid directory.",
+        }
+
+
+# ----------------------------------------------------------------------
+def test_ServeStream(valid_workspace):
+    input_stream = io.StringIO(
+        "\n".join(
+            [
+                json.dumps({"id": 1, "method": "Validate", "params": {"workspaces": [str(valid_workspace)]}}),
+                "",
+                "{invalid",
+                json.dumps({"id": 2, "method": "Shutdown"}),
+                # Requests after Shutdown are not processed
+                json.dumps({"id": 3, "method": "Status"}),
+            ],
+        ),
+    )
+
+    output_stream = io.StringIO()
+
+    with ParseDaemon() as daemon:
+        daemon.ServeStream(input_stream, output_stream)
+
+    responses = [json.loads(line) for line in output_stream.getvalue().splitlines()]
+
+    assert len(responses) == 3
+
+    assert responses[0] == {"id": 1, "result": {"success": True, "num_files": 1, "errors": []}}
+
+    assert responses[1]["id"] is None
+    assert responses[1]["error"].startswith("Invalid JSON: ")
+
+    assert responses[2] == {"id": 2, "result": {}}
+
+
+# ----------------------------------------------------------------------
+@pytest.mark.skipif(sys.platform == "win32", reason="Unix domain sockets are not available on Windows")
+def test_ServeSocket(tmp_path, valid_workspace):
+    socket_path = tmp_path / "daemon.sock"
+
+    # A socket left behind by a daemon that didn't exit cleanly is replaced
+    socket_path.write_text("", encoding="utf-8")
+
+    assert IsRunning(socket_path) is False
+
+    with ParseDaemon() as daemon:
+        listening_event = threading.Event()
+
+        thread = threading.Thread(target=daemon.ServeSocket, args=(socket_path, listening_event.set))
+        thread.start()
+
+        try:
+            assert listening_event.wait(30)
+
+            assert IsRunning(socket_path) is True
+            assert socket_path.stat().st_mode & 0o777 == 0o600
+
+            assert SendRequest(socket_path, "Validate", {"workspaces": [str(valid_workspace)]}) == {
+                "success": True,
+                "num_files": 1,
+                "errors": [],
+            }
+
+            with pytest.raises(ParseDaemonError, match="'Unknown' is not a supported method."):
+                SendRequest(socket_path, "Unknown")
+
+            with pytest.raises(ParseDaemonError, match="A daemon is already listening on"):
+                ParseDaemon().ServeSocket(socket_path)
+
+        finally:
+            SendRequest(socket_path, "Shutdown")
+            thread.join(30)
+
+    assert not thread.is_alive()
+    assert not socket_path.exists()
+    assert IsRunning(socket_path) is False
+
+    with pytest.raises(OSError):  # noqa: PT011
+        SendRequest(socket_path, "Status")
+
+
+# ----------------------------------------------------------------------
+@pytest.mark.skipif(sys.platform == "win32", reason="Unix domain sockets are not available on Windows")
+def test_SendRequestDifferentUser(tmp_path, monkeypatch):
+    socket_path = tmp_path / "daemon.sock"
+    socket_path.write_text("", encoding="utf-8")
+
+    monkeypatch.setattr("os.getuid", lambda: socket_path.stat().st_uid + 1)
+
+    with pytest.raises(ParseDaemonError, match="was not created by the current user"):
+        SendRequest(socket_path, "Status")
+
+    assert IsRunning(socket_path) is False
+
+
+# ----------------------------------------------------------------------
+@pytest.mark.skipif(sys.platform == "win32", reason="Unix domain sockets are not available on Windows")
+def test_ServeSocketCreatesPrivateDirectory(tmp_path, valid_workspace):
+    socket_path = tmp_path / "private" / "daemon.sock"
+
+    with ParseDaemon() as daemon:
+        listening_event = threading.Event()
+
+        thread = threading.Thread(target=daemon.ServeSocket, args=(socket_path, listening_event.set))
+        thread.start()
+
+        try:
+            assert listening_event.wait(30)
+            assert socket_path.parent.stat().st_mode & 0o777 == 0o700
+
+            assert SendRequest(socket_path, "Validate", {"workspaces": [str(valid_workspace)]})["success"]
+
+        finally:
+            SendRequest(socket_path, "Shutdown")
+            thread.join(30)
+
+
+# ----------------------------------------------------------------------
+def test_GetDefaultSocketPath(monkeypatch):
+    monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+
+    socket_path = GetDefaultSocketPath()
+
+    assert socket_path.suffix == ".sock"
+    assert __version__ in socket_path.name
+
+    # The socket is within a directory that is specific to the user
+    assert socket_path.parent.parent == Path(tempfile.gettempdir())
+
+    monkeypatch.setenv("XDG_RUNTIME_DIR", "/run/user/1234")
+
+    assert GetDefaultSocketPath() == Path("/run/user/1234") / socket_path.name
+
+
+# ----------------------------------------------------------------------
+class TestCreateErrorObjects:
+    # ----------------------------------------------------------------------
+    def test_AntlrError(self):
+        assert CreateErrorObjects(AntlrError("The message", Path("File"), 1, 2, None)) == [
+            {"message": "The message", "filename": "File", "line": 1, "column": 2},
+        ]
+
+    # ----------------------------------------------------------------------
+    def test_SimpleSchemaGeneratorError(self):
+        assert CreateErrorObjects(
+            SimpleSchemaGeneratorError(Error("The message", Region.Create(Path("File"), 3, 4, 5, 6)))
+        ) == [
+            {"message": "The message", "filename": "File", "line": 3, "column": 4},
+        ]
+
+        assert CreateErrorObjects(SimpleSchemaGeneratorError(Error("No region", []))) == [
+            {"message": "No region", "filename": None, "line": None, "column": None},
+        ]
+
+    # ----------------------------------------------------------------------
+    def test_ParseRecoveryError(self):
+        assert CreateErrorObjects(
+            ParseRecoveryError(
+                [
+                    AntlrError("One", Path("File"), 1, 2, None),
+                    AntlrError("Two", Path("File"), 3, 4, None),
+                ],
+                RootStatement(Region.Create(Path("File"), 1, 1, 1, 1), []),
+            ),
+        ) == [
+            {"message": "One", "filename": "File", "line": 1, "column": 2},
+            {"message": "Two", "filename": "File", "line": 3, "column": 4},
+        ]
+
+    # ----------------------------------------------------------------------
+    def test_Exception(self):
+        assert CreateErrorObjects(ValueError("The message")) == [
+            {"message": "The message", "filename": None, "line": None, "column": None},
+        ]
+
+
+# ----------------------------------------------------------------------
+def test_FormatError():
+    assert (
+        FormatError({"message": "The message", "filename": "File", "line": 1, "column": 2})
+        == "The message (File <Ln 1, Col 2>)"
+    )
+
+    assert (
+        FormatError({"message": "No region", "filename": None, "line": None, "column": None}) == "No region"
+    )
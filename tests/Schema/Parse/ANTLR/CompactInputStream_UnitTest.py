@@ -0,0 +1,92 @@
+# ----------------------------------------------------------------------
+# |
+# |  CompactInputStream_UnitTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-16 13:22:48
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2026
+# |  Distributed under the MIT License.
+# |
+# ----------------------------------------------------------------------
+"""Unit tests for CompactInputStream.py."""
+
+from array import array
+from pathlib import Path
+
+import antlr4
+import pytest
+
+from SimpleSchemaGenerator.Schema.Parse.ANTLR.CompactInputStream import *
+from SimpleSchemaGenerator.Schema.Parse.ANTLR.Parse import SimpleSchemaLexer
+
+
+# ----------------------------------------------------------------------
+sample_schemas = (
+    Path(__file__).parent.parent.parent.parent.parent / "src" / "SimpleSchemaGenerator" / "SampleSchemas"
+)
+
+
+# ----------------------------------------------------------------------
+@pytest.mark.parametrize(
+    "content",
+    [
+        "",
+        "value: String\n",
+        "välue: String # Ünïcödé\n",
+        "\U0001f600: String\n",
+        "value: String # \ud800\n",
+    ],
+)
+def test_Stream(content):
+    expected = antlr4.InputStream(content)
+    stream = CompactInputStream(content)
+
+    assert stream.size == expected.size
+    assert str(stream) == content
+
+    for index in range(len(content) + 1):
+        stream.seek(index)
+        expected.seek(index)
+
+        assert stream.index == expected.index
+
+        for offset in [-1, 1, 2]:
+            assert stream.LA(offset) == expected.LA(offset)
+
+        assert stream.getText(index, index + 2) == expected.getText(index, index + 2)
+
+    stream.reset()
+    assert stream.index == 0
+
+
+# ----------------------------------------------------------------------
+def test_Storage():
+    assert isinstance(CompactInputStream("value").data, bytes)
+    assert isinstance(CompactInputStream("välue").data, array)
+
+
+# ----------------------------------------------------------------------
+@pytest.mark.parametrize(
+    "filename", sorted(sample_schemas.glob("*.SimpleSchema")), ids=lambda value: value.name
+)
+def test_Tokens(filename):
+    content = filename.read_text(encoding="utf-8")
+
+    # ----------------------------------------------------------------------
+    def GetTokens(
+        stream: antlr4.InputStream,
+    ) -> list[tuple[int, str, int, int, int]]:
+        lexer = SimpleSchemaLexer(stream)
+        lexer.CustomInitialization()
+
+        tokens = antlr4.CommonTokenStream(lexer)
+        tokens.fill()
+
+        return [(token.type, token.text, token.line, token.column, token.channel) for token in tokens.tokens]
+
+    # ----------------------------------------------------------------------
+
+    assert GetTokens(CompactInputStream(content)) == GetTokens(antlr4.InputStream(content))
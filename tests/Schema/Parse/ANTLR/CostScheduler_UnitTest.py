@@ -0,0 +1,85 @@
+# ----------------------------------------------------------------------
+# |
+# |  CostScheduler_UnitTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-17 10:34:22
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2026
+# |  Distributed under the MIT License.
+# |
+# ----------------------------------------------------------------------
+"""Unit tests for CostScheduler.py."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from SimpleSchemaGenerator.Schema.Parse.ANTLR.CostScheduler import *
+
+
+# ----------------------------------------------------------------------
+class TestCostScheduler:
+    # ----------------------------------------------------------------------
+    def test_Order(self):
+        enqueued: list[tuple[str, object]] = []
+
+        scheduler = CostScheduler(
+            lambda description, prepare_func: enqueued.append((description, prepare_func)), 1
+        )
+
+        with scheduler.Hold():
+            scheduler.Add("small", self._CreatePrepareFunc(), height=0, size=1)
+            scheduler.Add("large", self._CreatePrepareFunc(), height=0, size=100)
+            scheduler.Add("high", self._CreatePrepareFunc(), height=1, size=1)
+            scheduler.Add("also small", self._CreatePrepareFunc(), height=0, size=1)
+
+            # Nothing is enqueued until all of the tasks have been added
+            assert not enqueued
+
+        order: list[str] = []
+
+        while enqueued:
+            # Only one task is enqueued at a time, as there is a single worker
+            assert len(enqueued) == 1
+
+            description, prepare_func = enqueued.pop()
+            order.append(description)
+
+            _, execute_func = prepare_func(lambda _: None)
+            execute_func(Mock())
+
+        assert order == ["high", "large", "small", "also small"]
+
+    # ----------------------------------------------------------------------
+    def test_PrepareException(self):
+        enqueued: list[tuple[str, object]] = []
+
+        scheduler = CostScheduler(
+            lambda description, prepare_func: enqueued.append((description, prepare_func)), 1
+        )
+
+        # ----------------------------------------------------------------------
+        def RaisePrepare(on_simple_status_func):  # noqa: ARG001
+            raise Exception("Prepare")
+
+        # ----------------------------------------------------------------------
+
+        scheduler.Add("one", RaisePrepare, height=0, size=1)
+        scheduler.Add("two", self._CreatePrepareFunc(), height=0, size=1)
+
+        description, prepare_func = enqueued.pop()
+        assert description == "one"
+
+        with pytest.raises(Exception, match="Prepare"):
+            prepare_func(lambda _: None)
+
+        # The failed task no longer occupies the worker
+        assert [description for description, _ in enqueued] == ["two"]
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _CreatePrepareFunc():
+        return lambda on_simple_status_func: (1, lambda status: None)
@@ -0,0 +1,258 @@
+# ----------------------------------------------------------------------
+# |
+# |  DfaSnapshot_UnitTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-16 11:07:26
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2026
+# |  Distributed under the MIT License.
+# |
+# ----------------------------------------------------------------------
+"""Unit tests for DfaSnapshot.py."""
+
+import sys
+
+from pathlib import Path, PurePath
+from typing import cast
+
+import pytest
+
+from antlr4.dfa.DFA import DFA
+from dbrownell_Common import PathEx
+from dbrownell_Common.ContextlibEx import ExitStack
+from dbrownell_Common.Streams.DoneManager import DoneManager
+from dbrownell_Common.TestHelpers.StreamTestHelpers import GenerateDoneManagerAndContent
+
+from SimpleSchemaGenerator.Schema.Elements.Statements.RootStatement import RootStatement
+from SimpleSchemaGenerator.Schema.Parse.ANTLR.DfaSnapshot import *
+from SimpleSchemaGenerator.Schema.Parse.ANTLR.Parse import (
+    _CreateProcessPool,
+    Parse,
+    SimpleSchemaLexer,
+    SimpleSchemaParser,
+)
+from SimpleSchemaGenerator.Schema.Parse.ANTLR.ParseOptions import ParseOptions
+
+sys.path.insert(0, str(PathEx.EnsureDir(Path(__file__).parent.parent.parent)))
+with ExitStack(lambda: sys.path.pop(0)):
+    from TestHelpers import YamlVisitor
+
+
+# ----------------------------------------------------------------------
+sample_schemas = PathEx.EnsureDir(
+    Path(__file__).parent.parent.parent.parent.parent / "src" / "SimpleSchemaGenerator" / "SampleSchemas"
+)
+
+
+# ----------------------------------------------------------------------
+@pytest.fixture
+def empty_dfas(monkeypatch) -> None:
+    """Replace the DFAs with empty DFAs so that the tests behave as if they were run in a new process."""
+
+    for recognizer in [SimpleSchemaLexer, SimpleSchemaParser]:
+        monkeypatch.setattr(
+            recognizer,
+            "decisionsToDFA",
+            [DFA(state, index) for index, state in enumerate(recognizer.atn.decisionToState)],
+        )
+
+
+# ----------------------------------------------------------------------
+@pytest.mark.usefixtures("empty_dfas")
+def test_SaveAndLoad(tmp_path, monkeypatch):
+    results = _ParseSampleSchemas()
+    num_states = _GetNumStates()
+
+    assert num_states > 0
+
+    SaveDfaSnapshot(tmp_path / "snapshot")
+
+    # Start over with empty DFAs
+    for recognizer in [SimpleSchemaLexer, SimpleSchemaParser]:
+        monkeypatch.setattr(
+            recognizer,
+            "decisionsToDFA",
+            [DFA(state, index) for index, state in enumerate(recognizer.atn.decisionToState)],
+        )
+
+    assert _GetNumStates() == 0
+
+    assert LoadDfaSnapshot(tmp_path / "snapshot") is True
+    assert _GetNumStates() == num_states
+
+    # The loaded states are sufficient to parse the content again and the results are the same
+    assert _ParseSampleSchemas() == results
+    assert _GetNumStates() == num_states
+
+
+# ----------------------------------------------------------------------
+@pytest.mark.usefixtures("empty_dfas")
+def test_ExistingStatesNotReplaced(tmp_path):
+    _ParseSampleSchemas()
+    SaveDfaSnapshot(tmp_path / "snapshot")
+
+    original_dfas = [(dfa.s0, dict(dfa.states)) for dfa in SimpleSchemaParser.decisionsToDFA]
+
+    assert LoadDfaSnapshot(tmp_path / "snapshot") is True
+
+    for dfa, (original_s0, original_states) in zip(
+        SimpleSchemaParser.decisionsToDFA, original_dfas, strict=True
+    ):
+        assert dfa.s0 is original_s0
+        assert dfa.states == original_states
+
+
+# ----------------------------------------------------------------------
+def test_LoadMissing(tmp_path):
+    assert LoadDfaSnapshot(tmp_path / "snapshot") is False
+
+
+# ----------------------------------------------------------------------
+def test_LoadCorrupt(tmp_path):
+    (tmp_path / "snapshot").write_bytes(b"not a snapshot")
+
+    assert LoadDfaSnapshot(tmp_path / "snapshot") is False
+
+
+# ----------------------------------------------------------------------
+@pytest.mark.usefixtures("empty_dfas")
+def test_LoadDifferentVersion(tmp_path, monkeypatch):
+    SaveDfaSnapshot(tmp_path / "snapshot")
+
+    monkeypatch.setattr(
+        "SimpleSchemaGenerator.Schema.Parse.ANTLR.DfaSnapshot._GetSnapshotVersion",
+        lambda: "different version",
+    )
+
+    assert LoadDfaSnapshot(tmp_path / "snapshot") is False
+
+
+# ----------------------------------------------------------------------
+@pytest.mark.usefixtures("empty_dfas")
+@pytest.mark.parametrize("load_snapshot", [True, False])
+def test_WorkerProcesses(tmp_path, monkeypatch, load_snapshot):
+    _ParseSampleSchemas()
+    num_states = _GetNumStates()
+
+    SaveDfaSnapshot(tmp_path / "snapshot")
+
+    # The worker saves its own snapshot so that its states can be examined in this process
+    with _CreateProcessPool(1, tmp_path / "snapshot" if load_snapshot else None) as process_pool:
+        process_pool.submit(SaveDfaSnapshot, tmp_path / "worker_snapshot").result()
+
+    # Start over with empty DFAs
+    for recognizer in [SimpleSchemaLexer, SimpleSchemaParser]:
+        monkeypatch.setattr(
+            recognizer,
+            "decisionsToDFA",
+            [DFA(state, index) for index, state in enumerate(recognizer.atn.decisionToState)],
+        )
+
+    assert LoadDfaSnapshot(tmp_path / "worker_snapshot") is True
+    assert _GetNumStates() == (num_states if load_snapshot else 0)
+
+
+# ----------------------------------------------------------------------
+@pytest.mark.usefixtures("empty_dfas")
+def test_Merge(tmp_path, monkeypatch):
+    SaveDfaSnapshot(tmp_path / "empty_snapshot")
+
+    _ParseSampleSchemas()
+    num_states = _GetNumStates()
+
+    SaveDfaSnapshot(tmp_path / "snapshot")
+
+    # Start over with empty DFAs and create some (but not all) of the states
+    for recognizer in [SimpleSchemaLexer, SimpleSchemaParser]:
+        monkeypatch.setattr(
+            recognizer,
+            "decisionsToDFA",
+            [DFA(state, index) for index, state in enumerate(recognizer.atn.decisionToState)],
+        )
+
+    Parse(
+        cast(DoneManager, next(GenerateDoneManagerAndContent())),
+        {sample_schemas: {PurePath("Simple.SimpleSchema"): lambda: "value: String\n"}},
+        options=ParseOptions(single_threaded=True),
+    )
+
+    assert 0 < _GetNumStates() < num_states
+
+    # DFAs with fewer states are replaced by the DFAs in the snapshot
+    assert MergeDfaSnapshot(tmp_path / "snapshot") is True
+    assert _GetNumStates() == num_states
+
+    # DFAs with more states are not replaced
+    assert MergeDfaSnapshot(tmp_path / "empty_snapshot") is True
+    assert _GetNumStates() == num_states
+
+
+# ----------------------------------------------------------------------
+@pytest.mark.usefixtures("empty_dfas")
+def test_WorkerStatesMerged(tmp_path, monkeypatch):
+    _ParseSampleSchemas()
+    num_states = _GetNumStates()
+
+    SaveDfaSnapshot(tmp_path / "states")
+
+    # Start over with empty DFAs
+    for recognizer in [SimpleSchemaLexer, SimpleSchemaParser]:
+        monkeypatch.setattr(
+            recognizer,
+            "decisionsToDFA",
+            [DFA(state, index) for index, state in enumerate(recognizer.atn.decisionToState)],
+        )
+
+    assert _GetNumStates() == 0
+
+    # The worker starts without a snapshot and creates states (loading them here is a stand-in for
+    # parsing content); its states are merged into this process when the pool is shut down.
+    with _CreateProcessPool(1, tmp_path / "snapshot") as process_pool:
+        assert process_pool.submit(LoadDfaSnapshot, tmp_path / "states").result() is True
+
+    assert _GetNumStates() == num_states
+
+    # The snapshots saved by the workers are removed once they have been merged
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["states"]
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+def _ParseSampleSchemas() -> dict[PurePath, str]:
+    dm_and_content = GenerateDoneManagerAndContent()
+
+    results = Parse(
+        cast(DoneManager, next(dm_and_content)),
+        {
+            sample_schemas: {
+                PurePath(filename.name): lambda filename=filename: filename.read_text(encoding="utf-8")
+                for filename in sample_schemas.glob("*.SimpleSchema")
+            },
+        },
+        options=ParseOptions(single_threaded=True),
+    )
+
+    yaml_results: dict[PurePath, str] = {}
+
+    for relative_path, result in results[sample_schemas.resolve()].items():
+        assert isinstance(result, RootStatement), result
+
+        visitor = YamlVisitor()
+        result.Accept(visitor)
+
+        yaml_results[relative_path] = visitor.yaml_string
+
+    return yaml_results
+
+
+# ----------------------------------------------------------------------
+def _GetNumStates() -> int:
+    return sum(
+        len(dfa.states)
+        for recognizer in [SimpleSchemaLexer, SimpleSchemaParser]
+        for dfa in recognizer.decisionsToDFA
+    )
@@ -0,0 +1,131 @@
+# ----------------------------------------------------------------------
+# |
+# |  InFlightLimiter_UnitTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-17 10:31:09
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2026
+# |  Distributed under the MIT License.
+# |
+# ----------------------------------------------------------------------
+"""Unit tests for InFlightLimiter.py."""
+
+import threading
+
+from SimpleSchemaGenerator.Schema.Parse.ANTLR.InFlightLimiter import *
+
+
+# ----------------------------------------------------------------------
+def test_Create():
+    assert InFlightLimiter.Create(None, None) is None
+
+    limiter = InFlightLimiter.Create(2, None)
+    assert limiter is not None
+    assert limiter.max_in_flight == 2
+    assert limiter.max_bytes_in_flight is None
+
+
+# ----------------------------------------------------------------------
+def test_AcquireSlot():
+    limiter = InFlightLimiter(1, None)
+
+    limiter.AcquireSlot()
+    limiter.AcquireBytes(10)
+
+    acquired = threading.Event()
+
+    # ----------------------------------------------------------------------
+    def Acquire() -> None:
+        limiter.AcquireSlot()
+        acquired.set()
+
+    # ----------------------------------------------------------------------
+
+    thread = threading.Thread(target=Acquire)
+    thread.start()
+
+    assert not acquired.wait(0.1)
+
+    limiter.Release(10)
+    thread.join()
+
+    assert acquired.is_set()
+
+
+# ----------------------------------------------------------------------
+def test_AcquireBytes():
+    limiter = InFlightLimiter(None, 10)
+
+    # Content that exceeds the limit is allowed when nothing else is in flight
+    limiter.AcquireSlot()
+    limiter.AcquireBytes(100)
+
+    acquired = threading.Event()
+
+    # ----------------------------------------------------------------------
+    def Acquire() -> None:
+        limiter.AcquireSlot()
+        limiter.AcquireBytes(5)
+        acquired.set()
+
+    # ----------------------------------------------------------------------
+
+    thread = threading.Thread(target=Acquire)
+    thread.start()
+
+    assert not acquired.wait(0.1)
+
+    limiter.Release(100)
+    thread.join()
+
+    assert acquired.is_set()
+
+
+# ----------------------------------------------------------------------
+def test_UpdateBytes():
+    limiter = InFlightLimiter(None, 10)
+
+    limiter.AcquireSlot()
+    limiter.AcquireBytes(4)
+
+    # The update doesn't wait, even though the limit is exceeded
+    limiter.UpdateBytes(4, 20)
+
+    acquired = threading.Event()
+
+    # ----------------------------------------------------------------------
+    def Acquire() -> None:
+        limiter.AcquireSlot()
+        limiter.AcquireBytes(5)
+        acquired.set()
+
+    # ----------------------------------------------------------------------
+
+    thread = threading.Thread(target=Acquire)
+    thread.start()
+
+    assert not acquired.wait(0.1)
+
+    limiter.Release(20)
+    thread.join()
+
+    assert acquired.is_set()
+
+
+# ----------------------------------------------------------------------
+def test_Cancel():
+    limiter = InFlightLimiter(1, None)
+
+    limiter.AcquireSlot()
+
+    thread = threading.Thread(target=limiter.AcquireSlot)
+    thread.start()
+
+    limiter.Cancel()
+    thread.join()
+
+    # Waits return immediately once cancelled
+    limiter.AcquireSlot()
@@ -0,0 +1,206 @@
+# ----------------------------------------------------------------------
+# |
+# |  ParseCache_UnitTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-16 09:48:03
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2026
+# |  Distributed under the MIT License.
+# |
+# ----------------------------------------------------------------------
+"""Unit tests for ParseCache.py."""
+
+import os
+
+import pytest
+
+from SimpleSchemaGenerator.Schema.Parse.ANTLR.ParseCache import *
+
+
+# ----------------------------------------------------------------------
+def test_Standard(tmp_path):
+    cache = ParseCache(tmp_path / "cache")
+
+    assert cache.Get("abcdef") is None
+
+    cache.Set("abcdef", {"one": 1, "two": [2]})
+
+    assert cache.Get("abcdef") == {"one": 1, "two": [2]}
+    assert cache.total_size > 0
+
+
+# ----------------------------------------------------------------------
+def test_Persisted(tmp_path):
+    ParseCache(tmp_path).Set("abcdef", "value")
+
+    cache = ParseCache(tmp_path)
+
+    assert cache.Get("abcdef") == "value"
+    assert cache.total_size == (tmp_path / "ab" / "abcdef").stat().st_size
+
+
+# ----------------------------------------------------------------------
+def test_Overwrite(tmp_path):
+    cache = ParseCache(tmp_path)
+
+    cache.Set("abcdef", "a" * 100)
+    cache.Set("abcdef", "b")
+
+    assert cache.Get("abcdef") == "b"
+    assert cache.total_size == (tmp_path / "ab" / "abcdef").stat().st_size
+
+
+# ----------------------------------------------------------------------
+def test_Eviction(tmp_path):
+    value = "x" * 1000
+
+    cache = ParseCache(tmp_path, max_size=2500)
+
+    cache.Set("aaaaaa", value)
+    cache.Set("bbbbbb", value)
+
+    # Ensure that the modification times are distinct and in a well-known order
+    os.utime(tmp_path / "aa" / "aaaaaa", (1000, 1000))
+    os.utime(tmp_path / "bb" / "bbbbbb", (2000, 2000))
+
+    # Accessing "aaaaaa" makes "bbbbbb" the least recently used entry
+    assert cache.Get("aaaaaa") == value
+
+    cache.Set("cccccc", value)
+
+    assert cache.Get("aaaaaa") == value
+    assert cache.Get("bbbbbb") is None
+    assert cache.Get("cccccc") == value
+    assert cache.total_size <= 2500
+
+
+# ----------------------------------------------------------------------
+def test_EvictionOrderPersisted(tmp_path):
+    value = "x" * 1000
+
+    cache = ParseCache(tmp_path, max_size=2500)
+
+    cache.Set("aaaaaa", value)
+    cache.Set("bbbbbb", value)
+
+    # The order of use is initialized from the modification times when the cache is first used
+    os.utime(tmp_path / "aa" / "aaaaaa", (2000, 2000))
+    os.utime(tmp_path / "bb" / "bbbbbb", (1000, 1000))
+
+    cache = ParseCache(tmp_path, max_size=2500)
+
+    cache.Set("cccccc", value)
+
+    assert cache.Get("aaaaaa") == value
+    assert cache.Get("bbbbbb") is None
+    assert cache.Get("cccccc") == value
+
+
+# ----------------------------------------------------------------------
+def test_EvictionBatch(tmp_path):
+    value = "x" * 1000
+
+    cache = ParseCache(tmp_path, max_size=10000)
+
+    for index in range(9):
+        cache.Set(f"{index}aaaaa", value)
+
+    assert cache.total_size <= 10000
+
+    # Entries are evicted until the cache is below the low-water mark
+    cache.Set("9aaaaa", value)
+
+    assert cache.total_size <= 10000 * ParseCache.EVICTION_RATIO
+    assert cache.Get("0aaaaa") is None
+    assert cache.Get("1aaaaa") is None
+    assert cache.Get("9aaaaa") == value
+
+    # The entries were evicted in least recently used order
+    assert all(cache.Get(f"{index}aaaaa") == value for index in range(2, 10))
+
+
+# ----------------------------------------------------------------------
+def test_EntryWrittenByAnotherProcess(tmp_path):
+    cache = ParseCache(tmp_path)
+
+    assert cache.total_size == 0
+
+    ParseCache(tmp_path).Set("abcdef", "value")
+
+    assert cache.Get("abcdef") == "value"
+    assert cache.total_size == (tmp_path / "ab" / "abcdef").stat().st_size
+
+
+# ----------------------------------------------------------------------
+def test_ValueTooLarge(tmp_path):
+    cache = ParseCache(tmp_path, max_size=10)
+
+    cache.Set("abcdef", "x" * 100)
+
+    assert cache.Get("abcdef") is None
+    assert cache.total_size == 0
+
+
+# ----------------------------------------------------------------------
+def test_Corrupt(tmp_path):
+    cache = ParseCache(tmp_path)
+
+    cache.Set("abcdef", "value")
+    (tmp_path / "ab" / "abcdef").write_bytes(b"not a pickle")
+
+    assert cache.Get("abcdef") is None
+    assert not (tmp_path / "ab" / "abcdef").exists()
+    assert cache.total_size == 0
+
+
+# ----------------------------------------------------------------------
+def test_WriteError(tmp_path):
+    cache = ParseCache(tmp_path)
+
+    # The entry can't be moved into place when a directory exists at its location
+    (tmp_path / "ab" / "abcdef").mkdir(parents=True)
+
+    with pytest.raises(OSError):
+        cache.Set("abcdef", "value")
+
+    assert [filename.name for filename in (tmp_path / "ab").iterdir()] == ["abcdef"]
+
+
+# ----------------------------------------------------------------------
+def test_EntryRemovedByAnotherProcess(tmp_path):
+    ParseCache(tmp_path).Set("abcdef", "value")
+
+    # An entry that is found but can't be read (here, a dangling link) is ignored
+    (tmp_path / "gh").mkdir()
+    (tmp_path / "gh" / "ghijkl").symlink_to(tmp_path / "does_not_exist")
+
+    cache = ParseCache(tmp_path)
+
+    assert cache.total_size == (tmp_path / "ab" / "abcdef").stat().st_size
+
+    cache.Set("mnopqr", "value")
+    assert cache.Get("mnopqr") == "value"
+
+
+# ----------------------------------------------------------------------
+def test_Invalidate(tmp_path):
+    cache = ParseCache(tmp_path / "cache")
+
+    cache.Set("abcdef", "value")
+    cache.Invalidate()
+
+    assert cache.Get("abcdef") is None
+    assert cache.total_size == 0
+    assert not (tmp_path / "cache").exists()
+
+    cache.Set("abcdef", "new value")
+    assert cache.Get("abcdef") == "new value"
+
+
+# ----------------------------------------------------------------------
+def test_InvalidMaxSize(tmp_path):
+    with pytest.raises(ValueError, match="Invalid max_size value: 0"):
+        ParseCache(tmp_path, max_size=0)
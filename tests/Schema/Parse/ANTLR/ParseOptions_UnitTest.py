@@ -0,0 +1,68 @@
+# ----------------------------------------------------------------------
+# |
+# |  ParseOptions_UnitTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-17 11:28:49
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2026
+# |  Distributed under the MIT License.
+# |
+# ----------------------------------------------------------------------
+"""Unit tests for ParseOptions.py."""
+
+import dataclasses
+import multiprocessing
+import re
+
+import pytest
+
+from SimpleSchemaGenerator.Schema.Parse.ANTLR.ExecutorType import ExecutorType
+from SimpleSchemaGenerator.Schema.Parse.ANTLR.ParseOptions import *
+
+
+# ----------------------------------------------------------------------
+def test_Defaults():
+    options = ParseOptions()
+
+    assert options.single_threaded is False
+    assert options.num_jobs is None
+    assert options.executor == ExecutorType.Thread
+    assert options.tokenizer == TokenizerType.Antlr
+    assert options.schedule == ScheduleType.Fifo
+    assert options.cache is None
+    assert options.max_errors is None
+
+
+# ----------------------------------------------------------------------
+def test_Frozen():
+    options = ParseOptions()
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        options.quiet = True  # type: ignore[misc]
+
+
+# ----------------------------------------------------------------------
+def test_NumWorkers():
+    assert ParseOptions().num_workers == multiprocessing.cpu_count()
+    assert ParseOptions(num_jobs=3).num_workers == 3
+    assert ParseOptions(num_jobs=3, single_threaded=True).num_workers == 1
+
+
+# ----------------------------------------------------------------------
+@pytest.mark.parametrize("arg_name", ["num_jobs", "max_in_flight", "max_bytes_in_flight", "max_errors"])
+def test_InvalidValue(arg_name):
+    with pytest.raises(ValueError, match=re.escape(f"Invalid {arg_name} value: 0")):
+        ParseOptions(**{arg_name: 0})
+
+
+# ----------------------------------------------------------------------
+def test_ChunkLines():
+    assert ParseOptions(executor=ExecutorType.Process, chunk_lines=10).chunk_lines == 10
+
+    with pytest.raises(
+        ValueError, match=re.escape("'chunk_lines' can only be used with 'ExecutorType.Process'.")
+    ):
+        ParseOptions(chunk_lines=10)
@@ -0,0 +1,135 @@
+# ----------------------------------------------------------------------
+# |
+# |  ParseStats_UnitTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-16 23:27:52
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2026
+# |  Distributed under the MIT License.
+# |
+# ----------------------------------------------------------------------
+"""Unit tests for ParseStats.py."""
+
+import json
+
+from pathlib import Path, PurePath
+
+import pytest
+
+from SimpleSchemaGenerator.Schema.Parse.ANTLR.ParseStats import *
+
+
+# ----------------------------------------------------------------------
+def test_FileParseStats():
+    file_stats = FileParseStats(
+        load_time=1.0,
+        lex_time=2.0,
+        parse_time=3.0,
+        visit_time=4.0,
+        include_time=5.0,
+        num_tokens=6,
+        num_elements=7,
+        max_stack_depth=8,
+    )
+
+    assert file_stats.total_time == 15.0
+    assert str(file_stats) == (
+        "15.000s (load 1.000s, lex 2.000s, parse 3.000s, visit 4.000s, include 5.000s; "
+        "6 tokens, 7 elements, max stack depth 8)"
+    )
+
+    assert str(FileParseStats(load_time=0.5, is_cached=True)) == "0.500s (load 0.500s, cached)"
+    assert str(FileParseStats(load_time=0.5, lex_time=0.25, is_duplicate=True)) == (
+        "0.750s (load 0.500s, duplicate)"
+    )
+
+
+# ----------------------------------------------------------------------
+def test_Accumulate():
+    file_stats = FileParseStats(lex_time=1.0, num_tokens=2, max_stack_depth=10)
+
+    file_stats.Accumulate(
+        FileParseStats(lex_time=3.0, num_tokens=4, max_stack_depth=5, is_cached=True, is_duplicate=True)
+    )
+
+    assert file_stats == FileParseStats(lex_time=4.0, num_tokens=6, max_stack_depth=10)
+
+
+# ----------------------------------------------------------------------
+class TestParseStats:
+    # ----------------------------------------------------------------------
+    @staticmethod
+    @pytest.fixture
+    def stats() -> ParseStats:
+        stats = ParseStats()
+
+        stats.Add(Path("workspace1"), PurePath("one"), FileParseStats(parse_time=1.0, num_tokens=1))
+        stats.Add(Path("workspace1"), PurePath("two"), FileParseStats(parse_time=3.0, num_tokens=2))
+        stats.Add(Path("workspace2"), PurePath("three"), FileParseStats(parse_time=2.0, num_tokens=4))
+
+        return stats
+
+    # ----------------------------------------------------------------------
+    def test_GetTotals(self, stats):
+        assert stats.GetTotals() == FileParseStats(parse_time=6.0, num_tokens=7)
+        assert stats.GetTotals(Path("workspace1")) == FileParseStats(parse_time=4.0, num_tokens=3)
+
+    # ----------------------------------------------------------------------
+    def test_GetSlowestFiles(self, stats):
+        assert [
+            (workspace_root, relative_path) for workspace_root, relative_path, _ in stats.GetSlowestFiles()
+        ] == [
+            (Path("workspace1"), PurePath("two")),
+            (Path("workspace2"), PurePath("three")),
+            (Path("workspace1"), PurePath("one")),
+        ]
+
+        assert [relative_path for _, relative_path, _ in stats.GetSlowestFiles(1, Path("workspace1"))] == [
+            PurePath("two"),
+        ]
+
+    # ----------------------------------------------------------------------
+    def test_CreateSummary(self, stats):
+        assert stats.CreateSummary(1) == "\n".join(
+            [
+                f"workspace1 (2 files): {stats.GetTotals(Path('workspace1'))}",
+                f"    two: {stats.files[Path('workspace1')][PurePath('two')]}",
+                f"workspace2 (1 file): {stats.GetTotals(Path('workspace2'))}",
+                f"    three: {stats.files[Path('workspace2')][PurePath('three')]}",
+            ],
+        )
+
+    # ----------------------------------------------------------------------
+    def test_CreateJsonObject(self, stats):
+        json_object = stats.CreateJsonObject()
+
+        # The object can be serialized
+        assert json.loads(json.dumps(json_object)) == json_object
+
+        assert json_object["totals"]["parse_time"] == 6.0
+        assert json_object["totals"]["num_tokens"] == 7
+        assert json_object["totals"]["total_time"] == 6.0
+
+        assert [workspace["workspace_root"] for workspace in json_object["workspaces"]] == [
+            "workspace1",
+            "workspace2",
+        ]
+
+        assert json_object["workspaces"][0]["totals"]["num_tokens"] == 3
+        assert json_object["workspaces"][0]["files"][1] == {
+            "relative_path": "two",
+            "load_time": 0.0,
+            "lex_time": 0.0,
+            "parse_time": 3.0,
+            "visit_time": 0.0,
+            "include_time": 0.0,
+            "num_tokens": 2,
+            "num_elements": 0,
+            "max_stack_depth": 0,
+            "is_cached": False,
+            "is_duplicate": False,
+            "total_time": 3.0,
+        }
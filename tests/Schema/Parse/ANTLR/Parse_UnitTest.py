@@ -13,13 +13,18 @@
 # ----------------------------------------------------------------------
 """Unit tests for Parse.py."""
 
+import asyncio
+import dataclasses
 import re
 import sys
 import textwrap
+import threading
+import time
 
 from contextlib import contextmanager
 from pathlib import Path, PurePath
-from typing import Callable, cast, Iterator
+from typing import Any, Awaitable, Callable, cast, Iterator
+from unittest.mock import ANY
 
 import pytest
 
@@ -29,8 +34,10 @@ from dbrownell_Common.TestHelpers.StreamTestHelpers import GenerateDoneManagerAn
 from dbrownell_Common.Types import override
 
 from SimpleSchemaGenerator.Schema.Parse.ANTLR.Parse import *
+from SimpleSchemaGenerator.Schema.Parse.ANTLR.ParseOptions import ParseOptions
+from SimpleSchemaGenerator.Schema.Parse.ANTLR.ParseStats import ParseStats
 from SimpleSchemaGenerator.Schema.Elements.Common.Element import Element
-from SimpleSchemaGenerator.Schema.Visitors.ElementVisitor import VisitResult
+from SimpleSchemaGenerator.Schema.Visitors.ElementVisitor import ElementVisitorHelper, VisitResult
 
 sys.path.insert(0, str(PathEx.EnsureDir(Path(__file__).parent.parent.parent)))
 with ExitStack(lambda: sys.path.pop(0)):
@@ -465,6 +472,2919 @@ class TestImport:
             _Execute(workspaces)
 
 
+# ----------------------------------------------------------------------
+class TestProcessExecutor:
+    # ----------------------------------------------------------------------
+    def test_SampleSchemas(self):
+        workspaces = {
+            sample_schemas: {
+                PurePath(filename.name): lambda filename=filename: filename.read_text(encoding="utf-8")
+                for filename in sample_schemas.glob("*.SimpleSchema")
+            },
+        }
+
+        thread_results = _Execute(workspaces)
+        process_results = _Execute(workspaces, executor=ExecutorType.Process)
+
+        assert thread_results.keys() == process_results.keys()
+
+        for workspace_root, thread_workspace_results in thread_results.items():
+            process_workspace_results = process_results[workspace_root]
+
+            assert thread_workspace_results.keys() == process_workspace_results.keys()
+
+            for relative_path, thread_result in thread_workspace_results.items():
+                process_result = process_workspace_results[relative_path]
+
+                assert isinstance(thread_result, RootStatement), thread_result
+                assert isinstance(process_result, RootStatement), process_result
+
+                assert _ToYaml(process_result) == _ToYaml(thread_result)
+
+    # ----------------------------------------------------------------------
+    def test_Include(self, tmp_path):
+        (tmp_path / "Included.SimpleSchema").write_text("included: String\n", encoding="utf-8")
+
+        results = _Execute(
+            {
+                tmp_path: {
+                    PurePath("Root.SimpleSchema"): lambda: textwrap.dedent(
+                        """\
+                        from Included import *
+
+                        value: Integer
+                        """,
+                    ),
+                },
+            },
+            executor=ExecutorType.Process,
+            single_threaded=True,
+        )
+
+        workspace_results = results[tmp_path.resolve()]
+
+        assert len(workspace_results) == 2
+        assert isinstance(workspace_results[PurePath("Root.SimpleSchema")], RootStatement)
+        assert isinstance(workspace_results[PurePath("Included.SimpleSchema")], RootStatement)
+
+    # ----------------------------------------------------------------------
+    def test_ErrorInvalidSyntax(self):
+        with pytest.raises(
+            AntlrError,
+            match=re.escape(
+                f"no viable alternative at input 'value: String {{indentmetadata1: \"value\"newLinededentdedent' ({_SINGLE_CONTENT_FILENAME} <Ln 4, Col 1>)"
+            ),
+        ):
+            _ExecuteSingleContent(
+                textwrap.dedent(
+                    """\
+                    InvalidObject ->
+                        value: String {
+                            metadata1: "value"
+                    """,
+                ),
+                executor=ExecutorType.Process,
+            )
+
+    # ----------------------------------------------------------------------
+    def test_ErrorInvalidStructureBase(self):
+        with pytest.raises(
+            Errors.SimpleSchemaGeneratorError,
+            match=re.escape(
+                f"Base types must be identifiers. ({_SINGLE_CONTENT_FILENAME}, Ln 1, Col 9 -> Ln 1, Col 27)"
+            ),
+        ):
+            _ExecuteSingleContent(
+                textwrap.dedent(
+                    """\
+                    Object: (Integer | Number) ->
+                        pass
+                    """,
+                ),
+                executor=ExecutorType.Process,
+            )
+
+
+# ----------------------------------------------------------------------
+class TestChunks:
+    # ----------------------------------------------------------------------
+    def test_SplitContent(self):
+        content = textwrap.dedent(
+            '''\
+            from Included import *
+
+            one: String
+            two: String {
+            three: 1
+            }
+            four: String { description: """
+            five
+            """ }
+            #/
+            six
+            /#
+            Seven ->
+                pass
+            ? { eight: 8 }
+
+            nine: String \\
+            ten: String
+            ''',
+        )
+
+        chunks = sys.modules[Parse.__module__]._SplitContent(content, 1)
+
+        assert "".join(chunk_content for _, chunk_content in chunks) == content
+        assert [(line_offset, chunk_content.split("\n")[0]) for line_offset, chunk_content in chunks] == [
+            (0, "from Included import *"),
+            (2, "one: String"),
+            (3, "two: String {"),
+            (6, 'four: String { description: """'),
+            (12, "Seven ->"),
+            (16, "nine: String \\"),
+        ]
+
+    # ----------------------------------------------------------------------
+    def test_SplitContentMinLines(self):
+        content = "".join(f"item{index}: String\n" for index in range(10))
+
+        chunks = sys.modules[Parse.__module__]._SplitContent(content, 4)
+
+        assert [line_offset for line_offset, _ in chunks] == [0, 4, 8]
+
+    # ----------------------------------------------------------------------
+    def test_SampleSchemas(self):
+        workspaces = {
+            sample_schemas: {
+                PurePath(filename.name): lambda filename=filename: filename.read_text(encoding="utf-8")
+                for filename in sample_schemas.glob("*.SimpleSchema")
+            },
+        }
+
+        results = _Execute(workspaces)
+        chunked_results = _Execute(workspaces, executor=ExecutorType.Process, chunk_lines=1)
+
+        for workspace_root, workspace_results in results.items():
+            chunked_workspace_results = chunked_results[workspace_root]
+
+            assert workspace_results.keys() == chunked_workspace_results.keys()
+
+            for relative_path, result in workspace_results.items():
+                chunked_result = cast(RootStatement, chunked_workspace_results[relative_path])
+                result = cast(RootStatement, result)
+
+                assert _ToYaml(chunked_result) == _ToYaml(result)
+                assert _GetRegions(chunked_result) == _GetRegions(result)
+
+    # ----------------------------------------------------------------------
+    def test_RegionsAtChunkBoundaries(self):
+        # The structure ends where it does when the content is parsed in its entirety, rather than
+        # after the comment that follows it.
+        content = textwrap.dedent(
+            """\
+            Basic ->
+                value: String
+
+            # comment
+            Empty ->
+                pass
+            """,
+        )
+
+        result = _ExecuteSingleContent(content)
+        chunked_result = _ExecuteSingleContent(content, executor=ExecutorType.Process, chunk_lines=1)
+
+        assert _GetRegions(chunked_result) == _GetRegions(result)
+        assert _GetRegions(chunked_result)[1] == (
+            "ParseStructureStatement",
+            f"{_SINGLE_CONTENT_FILENAME}, Ln 1, Col 1 -> Ln 4, Col 10",
+        )
+
+    # ----------------------------------------------------------------------
+    def test_ErrorInvalidSyntax(self):
+        # Errors are reported by parsing the content in its entirety
+        with pytest.raises(
+            AntlrError,
+            match=re.escape(
+                f"no viable alternative at input 'value: String {{indentmetadata1: \"value\"newLinededentdedent' ({_SINGLE_CONTENT_FILENAME} <Ln 6, Col 1>)"
+            ),
+        ):
+            _ExecuteSingleContent(
+                textwrap.dedent(
+                    """\
+                    first: String
+
+                    InvalidObject ->
+                        value: String {
+                            metadata1: "value"
+                    """,
+                ),
+                executor=ExecutorType.Process,
+                chunk_lines=1,
+            )
+
+    # ----------------------------------------------------------------------
+    def test_ErrorThreadExecutor(self):
+        # Chunks are only parsed by worker processes
+        with pytest.raises(
+            ValueError, match=re.escape("'chunk_lines' can only be used with 'ExecutorType.Process'.")
+        ):
+            _ExecuteSingleContent("first: String\n", chunk_lines=1)
+
+        with pytest.raises(
+            ValueError, match=re.escape("'chunk_lines' can only be used with 'ExecutorType.Process'.")
+        ):
+            ParseOptions(chunk_lines=1)
+
+
+# ----------------------------------------------------------------------
+class TestTokenizer:
+    # ----------------------------------------------------------------------
+    def test_SampleSchemas(self, monkeypatch):
+        workspaces = {
+            sample_schemas: {
+                PurePath(filename.name): lambda filename=filename: filename.read_text(encoding="utf-8")
+                for filename in sample_schemas.glob("*.SimpleSchema")
+            },
+        }
+
+        results = _Execute(workspaces)
+
+        # The ANTLR lexer is only used when falling back to LL prediction
+        monkeypatch.setattr(
+            "SimpleSchemaGenerator.Schema.Parse.ANTLR.Parse._ErrorListener",
+            lambda *args, **kwargs: pytest.fail("LL prediction was used"),
+        )
+
+        regex_results = _Execute(workspaces, tokenizer=TokenizerType.Regex)
+
+        for workspace_root, workspace_results in results.items():
+            regex_workspace_results = regex_results[workspace_root]
+
+            assert workspace_results.keys() == regex_workspace_results.keys()
+
+            for relative_path, result in workspace_results.items():
+                assert _ToYaml(cast(RootStatement, regex_workspace_results[relative_path])) == _ToYaml(
+                    cast(RootStatement, result)
+                )
+
+    # ----------------------------------------------------------------------
+    def test_Fallback(self):
+        # Identifiers that begin with an emoji are tokenized by the ANTLR lexer
+        content = textwrap.dedent(
+            """\
+            \U0001f600Value: String
+            value: String
+            """,
+        )
+
+        assert _ToYaml(_ExecuteSingleContent(content, tokenizer=TokenizerType.Regex)) == _ToYaml(
+            _ExecuteSingleContent(content)
+        )
+
+    # ----------------------------------------------------------------------
+    def test_ErrorInvalidSyntax(self):
+        with pytest.raises(
+            AntlrError,
+            match=re.escape(
+                f"no viable alternative at input 'value: String {{indentmetadata1: \"value\"newLinededentdedent' ({_SINGLE_CONTENT_FILENAME} <Ln 4, Col 1>)"
+            ),
+        ):
+            _ExecuteSingleContent(
+                textwrap.dedent(
+                    """\
+                    InvalidObject ->
+                        value: String {
+                            metadata1: "value"
+                    """,
+                ),
+                tokenizer=TokenizerType.Regex,
+            )
+
+
+# ----------------------------------------------------------------------
+class TestPredictionMode:
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _CreateSampleSchemasWorkspaces() -> dict[Path, dict[PurePath, Callable[[], str]]]:
+        return {
+            sample_schemas: {
+                PurePath(filename.name): lambda filename=filename: filename.read_text(encoding="utf-8")
+                for filename in sample_schemas.glob("*.SimpleSchema")
+            },
+        }
+
+    # ----------------------------------------------------------------------
+    def test_NoFallback(self, monkeypatch):
+        # The error listener is only created when falling back to LL prediction
+        monkeypatch.setattr(
+            "SimpleSchemaGenerator.Schema.Parse.ANTLR.Parse._ErrorListener",
+            lambda *args, **kwargs: pytest.fail("LL prediction was used"),
+        )
+
+        results = _Execute(self._CreateSampleSchemasWorkspaces())
+
+        for workspace_results in results.values():
+            for result in workspace_results.values():
+                assert isinstance(result, RootStatement), result
+
+    # ----------------------------------------------------------------------
+    def test_Diagnostics(self):
+        workspaces = self._CreateSampleSchemasWorkspaces()
+
+        results = _Execute(workspaces)
+        diagnostics_results = _Execute(workspaces, antlr_diagnostics=True)
+
+        for workspace_root, workspace_results in results.items():
+            diagnostics_workspace_results = diagnostics_results[workspace_root]
+
+            assert workspace_results.keys() == diagnostics_workspace_results.keys()
+
+            for relative_path, result in workspace_results.items():
+                assert _ToYaml(cast(RootStatement, diagnostics_workspace_results[relative_path])) == _ToYaml(
+                    cast(RootStatement, result)
+                )
+
+    # ----------------------------------------------------------------------
+    def test_DiagnosticsErrorInvalidSyntax(self):
+        with pytest.raises(
+            AntlrError,
+            match=re.escape(
+                f"no viable alternative at input 'value: String {{indentmetadata1: \"value\"newLinededentdedent' ({_SINGLE_CONTENT_FILENAME} <Ln 4, Col 1>)"
+            ),
+        ):
+            _ExecuteSingleContent(
+                textwrap.dedent(
+                    """\
+                    InvalidObject ->
+                        value: String {
+                            metadata1: "value"
+                    """,
+                ),
+                antlr_diagnostics=True,
+            )
+
+
+# ----------------------------------------------------------------------
+class TestParseListener:
+    # ----------------------------------------------------------------------
+    def test_FallbackIncludes(self, tmp_path, monkeypatch):
+        (tmp_path / "Included.SimpleSchema").write_text("included: String\n", encoding="utf-8")
+
+        parse_module = sys.modules[Parse.__module__]
+
+        original_create_parser = parse_module._CreateParser
+        num_first_stage_parses = 0
+
+        # ----------------------------------------------------------------------
+        def CreateParser(content, token_stream_type, **kwargs):
+            parser = original_create_parser(content, token_stream_type, **kwargs)
+
+            if token_stream_type is parse_module.StreamingTokenStream:
+                original_entry_point = parser.entry_point__
+
+                # ----------------------------------------------------------------------
+                def EntryPoint():
+                    nonlocal num_first_stage_parses
+
+                    # Fail once all of the elements have been created
+                    original_entry_point()
+                    num_first_stage_parses += 1
+
+                    raise parse_module.ParseCancellationException("First stage")
+
+                # ----------------------------------------------------------------------
+
+                parser.entry_point__ = EntryPoint
+
+            return parser
+
+        # ----------------------------------------------------------------------
+
+        monkeypatch.setattr(parse_module, "_CreateParser", CreateParser)
+
+        result, includes, _, _ = parse_module._ParseContentInProcess(
+            "from Included import *\n\nvalue: Integer\n",
+            tmp_path,
+            PurePath("Root.SimpleSchema"),
+            DEFAULT_FILE_EXTENSIONS,
+            [tmp_path],
+            is_included_file=False,
+            tab_width=4,
+            antlr_diagnostics=False,
+        )
+
+        assert num_first_stage_parses == 1
+        assert isinstance(result, RootStatement), result
+        assert len(result.statements) == 2
+
+        # Elements created by the first stage are discarded
+        assert includes == [(tmp_path, PurePath("Included.SimpleSchema"), tmp_path / "Included.SimpleSchema")]
+
+    # ----------------------------------------------------------------------
+    def test_ParseWhileHandlingException(self):
+        content = textwrap.dedent(
+            """\
+            Object ->
+                value: String {
+                    metadata1: "value"
+                }
+            """,
+        )
+
+        expected = _ToYaml(_ExecuteSingleContent(content))
+
+        try:
+            raise ValueError("Ignore me")  # noqa: TRY301
+        except ValueError:
+            assert _ToYaml(_ExecuteSingleContent(content)) == expected
+
+    # ----------------------------------------------------------------------
+    def test_ErrorWhileParsing(self):
+        # The first element error is raised rather than any errors encountered while exiting the
+        # remaining rules.
+        with pytest.raises(
+            Errors.SimpleSchemaGeneratorError,
+            match=re.escape("'DoesNotExist' is not a valid filename."),
+        ):
+            _ExecuteSingleContent(
+                textwrap.dedent(
+                    """\
+                    from DoesNotExist import *
+
+                    Object ->
+                        value: String
+                    """,
+                ),
+            )
+
+    # ----------------------------------------------------------------------
+    def test_SyntaxErrorAfterElementError(self):
+        # Syntax errors take precedence over errors encountered while creating elements, even when
+        # the syntax error comes later in the content.
+        with pytest.raises(
+            AntlrError,
+            match=re.escape(
+                f"no viable alternative at input 'Baz: (\\nnewLine' ({_SINGLE_CONTENT_FILENAME} <Ln 6, Col 1>)"
+            ),
+        ):
+            _ExecuteSingleContent("from DoesNotExist import Foo\n\nBar: Int\n\nBaz: (\n")
+
+
+# ----------------------------------------------------------------------
+class TestParseIter:
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def Execute(
+        workspaces: dict[Path, dict[PurePath, Callable[[], str]]],
+        *,
+        expected_result: int = 0,
+        **kwargs,
+    ) -> list[tuple[Path, PurePath, Exception | RootStatement]]:
+        dm_and_content = GenerateDoneManagerAndContent()
+
+        dm = cast(DoneManager, next(dm_and_content))
+
+        results = list(ParseIter(dm, workspaces, **kwargs))
+
+        assert dm.result == expected_result
+        return results
+
+    # ----------------------------------------------------------------------
+    def test_SampleSchemas(self):
+        workspaces = {
+            sample_schemas: {
+                PurePath(filename.name): lambda filename=filename: filename.read_text(encoding="utf-8")
+                for filename in sample_schemas.glob("*.SimpleSchema")
+            },
+        }
+
+        expected = {
+            (workspace_root, relative_path): _ToYaml(cast(RootStatement, result))
+            for workspace_root, workspace_results in _Execute(workspaces).items()
+            for relative_path, result in workspace_results.items()
+        }
+
+        results = self.Execute(workspaces)
+
+        assert len(results) == len(expected)
+        assert {
+            (workspace_root, relative_path): _ToYaml(cast(RootStatement, result))
+            for workspace_root, relative_path, result in results
+        } == expected
+
+    # ----------------------------------------------------------------------
+    def test_Include(self, tmp_path):
+        (tmp_path / "Included.SimpleSchema").write_text("included: String\n", encoding="utf-8")
+
+        results = self.Execute(
+            {
+                tmp_path: {
+                    PurePath("Root.SimpleSchema"): lambda: "from Included import *\n",
+                },
+            },
+            # Included files may be parsed before the file that includes them when running with
+            # multiple threads.
+            options=ParseOptions(single_threaded=True),
+        )
+
+        assert [(workspace_root, relative_path) for workspace_root, relative_path, _ in results] == [
+            (tmp_path.resolve(), PurePath("Root.SimpleSchema")),
+            (tmp_path.resolve(), PurePath("Included.SimpleSchema")),
+        ]
+
+        assert all(isinstance(result, RootStatement) for _, _, result in results)
+
+    # ----------------------------------------------------------------------
+    def test_Error(self, tmp_path):
+        results = self.Execute(
+            {
+                tmp_path: {
+                    PurePath("Valid.SimpleSchema"): lambda: "value: Integer\n",
+                    PurePath("Invalid.SimpleSchema"): lambda: "value: Integer {\n",
+                },
+            },
+            options=ParseOptions(single_threaded=True),
+            expected_result=ExecuteTasks.CATASTROPHIC_TASK_FAILURE_RESULT,
+        )
+
+        assert len(results) == 2
+        assert isinstance(results[0][2], RootStatement)
+        assert isinstance(results[1][2], AntlrError)
+
+    # ----------------------------------------------------------------------
+    def test_Close(self, tmp_path, monkeypatch):
+        parsed: list[Path] = []
+
+        original_parse_content = sys.modules[ParseIter.__module__]._ParseContent
+
+        # ----------------------------------------------------------------------
+        def ParseContent(content, fullpath, *args, **kwargs):
+            parsed.append(fullpath)
+            return original_parse_content(content, fullpath, *args, **kwargs)
+
+        # ----------------------------------------------------------------------
+
+        monkeypatch.setattr(sys.modules[ParseIter.__module__], "_ParseContent", ParseContent)
+
+        release_event = threading.Event()
+
+        # ----------------------------------------------------------------------
+        def GetBlockedContent() -> str:
+            release_event.wait()
+            return "value: Integer\n"
+
+        # ----------------------------------------------------------------------
+
+        dm_and_content = GenerateDoneManagerAndContent()
+
+        results_iter = ParseIter(
+            cast(DoneManager, next(dm_and_content)),
+            {
+                tmp_path: {
+                    PurePath("First.SimpleSchema"): lambda: "value: Integer\n",
+                    PurePath("Second.SimpleSchema"): GetBlockedContent,
+                },
+            },
+            options=ParseOptions(single_threaded=True),
+        )
+
+        assert next(results_iter)[1] == PurePath("First.SimpleSchema")
+
+        close_thread = threading.Thread(target=results_iter.close)
+        close_thread.start()
+
+        # Give the iterator time to cancel the remaining work before the second file is available
+        time.sleep(0.1)
+        release_event.set()
+
+        close_thread.join()
+
+        assert parsed == [tmp_path.resolve() / "First.SimpleSchema"]
+
+
+# ----------------------------------------------------------------------
+class TestParseAsync:
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def Execute(
+        workspaces: dict[Path, dict[PurePath, Callable[[], Awaitable[str]]]],
+        *,
+        expected_result: int = 0,
+        **kwargs,
+    ) -> dict[Path, dict[PurePath, Exception | RootStatement]]:
+        dm_and_content = GenerateDoneManagerAndContent()
+
+        dm = cast(DoneManager, next(dm_and_content))
+
+        results = asyncio.run(ParseAsync(dm, workspaces, **kwargs))
+
+        assert dm.result == expected_result
+        return results
+
+    # ----------------------------------------------------------------------
+    def test_SampleSchemas(self):
+        # ----------------------------------------------------------------------
+        def CreateGetContentFunc(
+            filename: Path,
+        ) -> Callable[[], Awaitable[str]]:
+            async def Impl() -> str:
+                await asyncio.sleep(0)
+                return filename.read_text(encoding="utf-8")
+
+            return Impl
+
+        # ----------------------------------------------------------------------
+
+        filenames = list(sample_schemas.glob("*.SimpleSchema"))
+
+        expected = _Execute(
+            {
+                sample_schemas: {
+                    PurePath(filename.name): lambda filename=filename: filename.read_text(encoding="utf-8")
+                    for filename in filenames
+                },
+            },
+        )
+
+        results = self.Execute(
+            {
+                sample_schemas: {
+                    PurePath(filename.name): CreateGetContentFunc(filename) for filename in filenames
+                },
+            },
+        )
+
+        assert results.keys() == expected.keys()
+
+        for workspace_root, workspace_results in results.items():
+            assert {
+                relative_path: _ToYaml(cast(RootStatement, result))
+                for relative_path, result in workspace_results.items()
+            } == {
+                relative_path: _ToYaml(cast(RootStatement, result))
+                for relative_path, result in expected[workspace_root].items()
+            }
+
+    # ----------------------------------------------------------------------
+    def test_ParseWhileFetching(self, tmp_path, monkeypatch):
+        parse_module = sys.modules[ParseAsync.__module__]
+        original_parse_content = parse_module._ParseContent
+
+        loop: asyncio.AbstractEventLoop | None = None
+        parsed_event: asyncio.Event | None = None
+
+        # ----------------------------------------------------------------------
+        def ParseContent(*args, **kwargs):
+            result = original_parse_content(*args, **kwargs)
+
+            assert loop is not None
+            assert parsed_event is not None
+            loop.call_soon_threadsafe(parsed_event.set)
+
+            return result
+
+        # ----------------------------------------------------------------------
+        async def GetSlowContent() -> str:
+            assert parsed_event is not None
+
+            # The fast content is parsed while this content is still being fetched
+            await asyncio.wait_for(parsed_event.wait(), timeout=10)
+            return "slow: Integer\n"
+
+        # ----------------------------------------------------------------------
+        async def GetFastContent() -> str:
+            return "fast: Integer\n"
+
+        # ----------------------------------------------------------------------
+        async def Execute() -> dict[Path, dict[PurePath, Exception | RootStatement]]:
+            nonlocal loop
+            nonlocal parsed_event
+
+            loop = asyncio.get_running_loop()
+            parsed_event = asyncio.Event()
+
+            dm_and_content = GenerateDoneManagerAndContent()
+
+            return await ParseAsync(
+                cast(DoneManager, next(dm_and_content)),
+                {
+                    tmp_path: {
+                        PurePath("Slow.SimpleSchema"): GetSlowContent,
+                        PurePath("Fast.SimpleSchema"): GetFastContent,
+                    },
+                },
+                options=ParseOptions(single_threaded=True),
+            )
+
+        # ----------------------------------------------------------------------
+
+        monkeypatch.setattr(parse_module, "_ParseContent", ParseContent)
+
+        results = asyncio.run(Execute())[tmp_path.resolve()]
+
+        assert isinstance(results[PurePath("Slow.SimpleSchema")], RootStatement)
+        assert isinstance(results[PurePath("Fast.SimpleSchema")], RootStatement)
+
+    # ----------------------------------------------------------------------
+    def test_FetchError(self, tmp_path):
+        # ----------------------------------------------------------------------
+        async def GetContent() -> str:
+            raise ValueError("The content is not available")
+
+        # ----------------------------------------------------------------------
+
+        with pytest.raises(ValueError, match=re.escape("The content is not available")):
+            self.Execute(
+                {tmp_path: {PurePath("Filename.SimpleSchema"): GetContent}},
+            )
+
+        results = self.Execute(
+            {tmp_path: {PurePath("Filename.SimpleSchema"): GetContent}},
+            raise_if_single_exception=False,
+            expected_result=ExecuteTasks.CATASTROPHIC_TASK_FAILURE_RESULT,
+        )
+
+        assert isinstance(results[tmp_path.resolve()][PurePath("Filename.SimpleSchema")], ValueError)
+
+    # ----------------------------------------------------------------------
+    def test_Cancel(self, tmp_path):
+        # ----------------------------------------------------------------------
+        async def GetContent() -> str:
+            await asyncio.Event().wait()
+            return ""
+
+        # ----------------------------------------------------------------------
+        async def Execute() -> None:
+            dm_and_content = GenerateDoneManagerAndContent()
+
+            task = asyncio.create_task(
+                ParseAsync(
+                    cast(DoneManager, next(dm_and_content)),
+                    {tmp_path: {PurePath("Filename.SimpleSchema"): GetContent}},
+                ),
+            )
+
+            await asyncio.sleep(0.1)
+            task.cancel()
+
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        # ----------------------------------------------------------------------
+
+        asyncio.run(Execute())
+
+
+# ----------------------------------------------------------------------
+class TestScanHeaderIncludes:
+    # ----------------------------------------------------------------------
+    @staticmethod
+    @pytest.fixture
+    def workspace(tmp_path) -> Path:
+        workspace = tmp_path.resolve() / "workspace"
+
+        for relative_path in [
+            "Root/File.SimpleSchema",
+            "Sibling.SimpleSchema",
+            "Star.SimpleSchema",
+            "Dir/Item.SimpleSchema",
+            "Dir/Grouped.SimpleSchema",
+            "Parent.SimpleSchema",
+        ]:
+            filename = workspace / relative_path
+
+            filename.parent.mkdir(parents=True, exist_ok=True)
+            filename.write_text("", encoding="utf-8")
+
+        return workspace
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def Execute(
+        workspace: Path,
+        content: str,
+    ) -> list[PurePath]:
+        parse_module = sys.modules[Parse.__module__]
+
+        workspace_names = [workspace]
+
+        return [
+            relative_path
+            for _, relative_path, _ in parse_module._ScanHeaderIncludes(
+                textwrap.dedent(content),
+                workspace / "Root" / "File.SimpleSchema",
+                parse_module.WorkspaceIndex(workspace_names, DEFAULT_FILE_EXTENSIONS),
+                workspace_names,
+            )
+        ]
+
+    # ----------------------------------------------------------------------
+    def test_Standard(self, workspace):
+        assert self.Execute(
+            workspace,
+            """\
+            # Comment
+            #/
+            Multi-line comment
+            /#
+
+            from Sibling import Value
+            from /Star import *
+            from Dir/ import Item
+            from /Dir/ import (
+                Grouped,
+                Other,
+            )
+            from ./File import Value as Alias
+            from ../Parent import *
+
+            value: Integer
+            """,
+        ) == [
+            PurePath("Sibling.SimpleSchema"),
+            PurePath("Star.SimpleSchema"),
+            PurePath("Dir/Item.SimpleSchema"),
+            PurePath("Dir/Grouped.SimpleSchema"),
+            PurePath("Root/File.SimpleSchema"),
+            PurePath("Parent.SimpleSchema"),
+        ]
+
+    # ----------------------------------------------------------------------
+    def test_Unresolved(self, workspace):
+        # Errors are reported by the parser
+        assert self.Execute(
+            workspace,
+            """\
+            from DoesNotExist import *
+            from Dir/ import *
+            from Dir/ import DoesNotExist
+            from Sibling import *
+            """,
+        ) == [PurePath("Sibling.SimpleSchema")]
+
+    # ----------------------------------------------------------------------
+    def test_StopAtBody(self, workspace):
+        assert self.Execute(
+            workspace,
+            """\
+            from Sibling import *
+
+            value: Integer
+
+            from Star import *
+            """,
+        ) == [PurePath("Sibling.SimpleSchema")]
+
+    # ----------------------------------------------------------------------
+    def test_StopAtUnexpected(self, workspace):
+        assert self.Execute(
+            workspace,
+            """\
+            from Sibling import *
+            from Dir/./Item import *
+            from Star import *
+            """,
+        ) == [PurePath("Sibling.SimpleSchema")]
+
+    # ----------------------------------------------------------------------
+    def test_IncludedBeforeParse(self, monkeypatch, tmp_path):
+        (tmp_path / "Included.SimpleSchema").write_text("included: String\n", encoding="utf-8")
+
+        parse_module = sys.modules[Parse.__module__]
+
+        read_file = parse_module._ReadFile
+        parse_content = parse_module._ParseContent
+
+        included_read_event = threading.Event()
+
+        # ----------------------------------------------------------------------
+        def ReadFile(filename: Path) -> str:
+            included_read_event.set()
+            return read_file(filename)
+
+        # ----------------------------------------------------------------------
+        def ParseContent(content, fullpath, *args, **kwargs):
+            if fullpath.name == "Root.SimpleSchema":
+                # The included file is discovered before the content is parsed
+                assert included_read_event.wait(5)
+
+            return parse_content(content, fullpath, *args, **kwargs)
+
+        # ----------------------------------------------------------------------
+        async def GetRootContent() -> str:
+            return "from Included import *\n\nvalue: Integer\n"
+
+        # ----------------------------------------------------------------------
+        async def GetOtherContent() -> str:
+            # Idle worker threads exit once all of the content has been provided, so keep them available
+            # until the included file has been read.
+            for _ in range(500):
+                if included_read_event.is_set():
+                    break
+
+                await asyncio.sleep(0.01)
+
+            return "other: String\n"
+
+        # ----------------------------------------------------------------------
+
+        monkeypatch.setattr(f"{Parse.__module__}._ReadFile", ReadFile)
+        monkeypatch.setattr(f"{Parse.__module__}._ParseContent", ParseContent)
+
+        dm_and_content = GenerateDoneManagerAndContent()
+
+        results = asyncio.run(
+            ParseAsync(
+                cast(DoneManager, next(dm_and_content)),
+                {
+                    tmp_path: {
+                        PurePath("Root.SimpleSchema"): GetRootContent,
+                        PurePath("Other.SimpleSchema"): GetOtherContent,
+                    },
+                },
+                options=ParseOptions(num_jobs=2),
+            ),
+        )[tmp_path.resolve()]
+
+        assert isinstance(results[PurePath("Root.SimpleSchema")], RootStatement)
+        assert isinstance(results[PurePath("Included.SimpleSchema")], RootStatement)
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.parametrize("executor", [ExecutorType.Thread, ExecutorType.Process])
+    @pytest.mark.parametrize("single_threaded", [True, False])
+    def test_FailingIncluder(self, tmp_path, executor, single_threaded):
+        (tmp_path / "Included.SimpleSchema").write_text(
+            "from Nested import *\n\nincluded: Integer {\n", encoding="utf-8"
+        )
+        (tmp_path / "Nested.SimpleSchema").write_text("nested: Integer {\n", encoding="utf-8")
+
+        dm_and_content = GenerateDoneManagerAndContent()
+
+        results = Parse(
+            cast(DoneManager, next(dm_and_content)),
+            {
+                tmp_path: {
+                    PurePath("Root.SimpleSchema"): lambda: "from Included import *\n\nvalue: Integer {\n"
+                }
+            },
+            single_threaded=single_threaded,
+            raise_if_single_exception=False,
+            options=ParseOptions(executor=executor),
+        )[tmp_path.resolve()]
+
+        # Files included by a file that can't be parsed are parsed while it is being parsed, but aren't
+        # part of the results and their errors aren't reported.
+        assert list(results) == [PurePath("Root.SimpleSchema")]
+        assert isinstance(results[PurePath("Root.SimpleSchema")], AntlrError)
+
+        content = cast(str, next(dm_and_content))
+
+        assert "Root.SimpleSchema" in content
+        assert "Included.SimpleSchema" not in content
+        assert "Nested.SimpleSchema" not in content
+
+    # ----------------------------------------------------------------------
+    def test_IncludedByFailingAndSuccessfulIncluders(self, tmp_path):
+        (tmp_path / "Included.SimpleSchema").write_text("included: String\n", encoding="utf-8")
+
+        results = _Execute(
+            {
+                tmp_path: {
+                    PurePath("Invalid.SimpleSchema"): lambda: "from Included import *\n\nvalue: Integer {\n",
+                    PurePath("Valid.SimpleSchema"): lambda: "from Included import *\n\nvalue: Integer\n",
+                },
+            },
+            raise_if_single_exception=False,
+            expected_result=ExecuteTasks.CATASTROPHIC_TASK_FAILURE_RESULT,
+        )[tmp_path.resolve()]
+
+        # The file is part of the results as long as one of the files that include it is valid
+        assert isinstance(results[PurePath("Invalid.SimpleSchema")], AntlrError)
+        assert isinstance(results[PurePath("Valid.SimpleSchema")], RootStatement)
+        assert isinstance(results[PurePath("Included.SimpleSchema")], RootStatement)
+
+
+# ----------------------------------------------------------------------
+class TestCache:
+    # ----------------------------------------------------------------------
+    @staticmethod
+    @pytest.fixture
+    def workspace(tmp_path) -> Path:
+        workspace = tmp_path / "workspace"
+        workspace.mkdir()
+
+        (workspace / "Root.SimpleSchema").write_text(
+            textwrap.dedent(
+                """\
+                from Included import *
+
+                value: Integer
+                """,
+            ),
+            encoding="utf-8",
+        )
+
+        (workspace / "Included.SimpleSchema").write_text("included: String\n", encoding="utf-8")
+
+        return workspace
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def Execute(
+        workspace: Path,
+        cache: ParseCache,
+        *,
+        expected_result: int = 0,
+    ) -> dict[PurePath, Exception | RootStatement]:
+        dm_and_content = GenerateDoneManagerAndContent()
+
+        dm = cast(DoneManager, next(dm_and_content))
+
+        results = Parse(
+            dm,
+            {
+                workspace: {
+                    PurePath("Root.SimpleSchema"): lambda: (workspace / "Root.SimpleSchema").read_text(
+                        encoding="utf-8"
+                    ),
+                },
+            },
+            raise_if_single_exception=False,
+            options=ParseOptions(cache=cache),
+        )
+
+        assert dm.result == expected_result
+        return results[workspace.resolve()]
+
+    # ----------------------------------------------------------------------
+    def test_Hit(self, tmp_path, workspace, monkeypatch):
+        cache = ParseCache(tmp_path / "cache")
+
+        results = self.Execute(workspace, cache)
+
+        assert len(results) == 2
+        expected = {
+            relative_path: _ToYaml(cast(RootStatement, root)) for relative_path, root in results.items()
+        }
+
+        # All content should be retrieved from the cache
+        monkeypatch.setattr(
+            "SimpleSchemaGenerator.Schema.Parse.ANTLR.Parse._ParseContent",
+            lambda *args, **kwargs: pytest.fail("Content was parsed"),
+        )
+
+        results = self.Execute(workspace, ParseCache(tmp_path / "cache"))
+
+        assert {
+            relative_path: _ToYaml(cast(RootStatement, root)) for relative_path, root in results.items()
+        } == expected
+
+    # ----------------------------------------------------------------------
+    def test_ContentChanged(self, tmp_path, workspace):
+        cache = ParseCache(tmp_path / "cache")
+
+        self.Execute(workspace, cache)
+
+        (workspace / "Included.SimpleSchema").write_text("new_included: Number\n", encoding="utf-8")
+
+        results = self.Execute(workspace, cache)
+
+        assert "new_included" in _ToYaml(cast(RootStatement, results[PurePath("Included.SimpleSchema")]))
+
+    # ----------------------------------------------------------------------
+    def test_IncludeRemoved(self, tmp_path, workspace):
+        cache = ParseCache(tmp_path / "cache")
+
+        self.Execute(workspace, cache)
+
+        (workspace / "Included.SimpleSchema").unlink()
+
+        results = self.Execute(
+            workspace, cache, expected_result=ExecuteTasks.CATASTROPHIC_TASK_FAILURE_RESULT
+        )
+
+        assert len(results) == 1
+        assert isinstance(results[PurePath("Root.SimpleSchema")], Errors.SimpleSchemaGeneratorError)
+
+    # ----------------------------------------------------------------------
+    def test_IncludeShadowed(self, tmp_path):
+        workspace = tmp_path / "shadowed"
+        (workspace / "sub").mkdir(parents=True)
+
+        (workspace / "B.SimpleSchema").write_text("b: String\n", encoding="utf-8")
+        (workspace / "sub" / "A.SimpleSchema").write_text("from B import Foo\n", encoding="utf-8")
+
+        cache = ParseCache(tmp_path / "cache")
+
+        # ----------------------------------------------------------------------
+        def Execute() -> dict[PurePath, Exception | RootStatement]:
+            dm_and_content = GenerateDoneManagerAndContent()
+
+            return Parse(
+                cast(DoneManager, next(dm_and_content)),
+                {
+                    workspace: {
+                        PurePath("sub/A.SimpleSchema"): lambda: (
+                            workspace / "sub" / "A.SimpleSchema"
+                        ).read_text(encoding="utf-8"),
+                    },
+                },
+                options=ParseOptions(cache=cache),
+            )[workspace.resolve()]
+
+        # ----------------------------------------------------------------------
+
+        assert sorted(Execute()) == [PurePath("B.SimpleSchema"), PurePath("sub/A.SimpleSchema")]
+
+        # Files in the directory of the including file take precedence over files in the workspace
+        (workspace / "sub" / "B.SimpleSchema").write_text("sub_b: String\n", encoding="utf-8")
+
+        assert sorted(Execute()) == [PurePath("sub/A.SimpleSchema"), PurePath("sub/B.SimpleSchema")]
+
+    # ----------------------------------------------------------------------
+    def test_ErrorsNotCached(self, tmp_path, workspace):
+        cache = ParseCache(tmp_path / "cache")
+
+        (workspace / "Included.SimpleSchema").write_text("invalid", encoding="utf-8")
+
+        self.Execute(workspace, cache, expected_result=ExecuteTasks.CATASTROPHIC_TASK_FAILURE_RESULT)
+
+        # Only the root file was cached
+        assert len(list((tmp_path / "cache").glob("*/*"))) == 1
+
+    # ----------------------------------------------------------------------
+    def test_CacheNotWritable(self, tmp_path, workspace):
+        # Entries can't be written when the cache dir is a file
+        (tmp_path / "cache").write_text("", encoding="utf-8")
+
+        results = self.Execute(workspace, ParseCache(tmp_path / "cache"))
+
+        assert len(results) == 2
+        assert all(isinstance(root, RootStatement) for root in results.values())
+
+    # ----------------------------------------------------------------------
+    def test_Invalidate(self, tmp_path, workspace):
+        cache = ParseCache(tmp_path / "cache")
+
+        self.Execute(workspace, cache)
+        assert len(list((tmp_path / "cache").glob("*/*"))) == 2
+
+        cache.Invalidate()
+        assert not list((tmp_path / "cache").glob("*/*"))
+
+
+# ----------------------------------------------------------------------
+class TestStats:
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _CreateSampleSchemasWorkspaces() -> dict[Path, dict[PurePath, Callable[[], str]]]:
+        return {
+            sample_schemas: {
+                PurePath(filename.name): lambda filename=filename: filename.read_text(encoding="utf-8")
+                for filename in sample_schemas.glob("*.SimpleSchema")
+            },
+        }
+
+    # ----------------------------------------------------------------------
+    def test_SampleSchemas(self):
+        workspaces = self._CreateSampleSchemasWorkspaces()
+
+        stats = ParseStats()
+        _Execute(workspaces, stats=stats)
+
+        assert stats.files.keys() == workspaces.keys()
+        assert stats.files[sample_schemas].keys() == workspaces[sample_schemas].keys()
+
+        for relative_path, file_stats in stats.files[sample_schemas].items():
+            assert not file_stats.is_cached
+            assert file_stats.load_time >= 0
+            assert file_stats.lex_time > 0
+            assert file_stats.parse_time > 0
+            assert file_stats.visit_time > 0
+            assert file_stats.num_tokens > 0
+            assert file_stats.num_elements > 0
+            assert file_stats.max_stack_depth >= 0
+
+            if relative_path.name == "Import.SimpleSchema":
+                assert file_stats.include_time > 0
+            else:
+                assert file_stats.include_time == 0
+
+        # Elements are counted in the resulting tree
+        assert stats.files[sample_schemas][PurePath("Empty.SimpleSchema")].num_elements == 1
+
+        slowest_files = stats.GetSlowestFiles(3)
+
+        assert len(slowest_files) == 3
+        assert slowest_files[0][2].total_time >= slowest_files[-1][2].total_time
+
+    # ----------------------------------------------------------------------
+    def test_ProcessExecutor(self):
+        workspaces = self._CreateSampleSchemasWorkspaces()
+
+        thread_stats = ParseStats()
+        _Execute(workspaces, stats=thread_stats)
+
+        process_stats = ParseStats()
+        _Execute(workspaces, executor=ExecutorType.Process, stats=process_stats)
+
+        for relative_path, thread_file_stats in thread_stats.files[sample_schemas].items():
+            process_file_stats = process_stats.files[sample_schemas][relative_path]
+
+            assert process_file_stats.num_tokens == thread_file_stats.num_tokens
+            assert process_file_stats.num_elements == thread_file_stats.num_elements
+            assert process_file_stats.max_stack_depth == thread_file_stats.max_stack_depth
+
+    # ----------------------------------------------------------------------
+    def test_Chunks(self):
+        stats = ParseStats()
+
+        _Execute(
+            self._CreateSampleSchemasWorkspaces(),
+            executor=ExecutorType.Process,
+            chunk_lines=1,
+            stats=stats,
+        )
+
+        for file_stats in stats.files[sample_schemas].values():
+            assert file_stats.num_tokens > 0
+            assert file_stats.num_elements > 0
+
+    # ----------------------------------------------------------------------
+    def test_Diagnostics(self):
+        stats = ParseStats()
+
+        _Execute(self._CreateSampleSchemasWorkspaces(), antlr_diagnostics=True, stats=stats)
+
+        for file_stats in stats.files[sample_schemas].values():
+            assert file_stats.lex_time > 0
+            assert file_stats.visit_time > 0
+            assert file_stats.num_tokens > 0
+
+    # ----------------------------------------------------------------------
+    def test_Cached(self, tmp_path):
+        workspace = tmp_path / "workspace"
+        workspace.mkdir()
+
+        (workspace / "Root.SimpleSchema").write_text("value: Integer\n", encoding="utf-8")
+
+        cache = ParseCache(tmp_path / "cache")
+
+        for expected_is_cached in [False, True]:
+            dm_and_content = GenerateDoneManagerAndContent()
+            stats = ParseStats()
+
+            Parse(
+                cast(DoneManager, next(dm_and_content)),
+                {
+                    workspace: {
+                        PurePath("Root.SimpleSchema"): lambda: (workspace / "Root.SimpleSchema").read_text(
+                            encoding="utf-8"
+                        ),
+                    },
+                },
+                options=ParseOptions(cache=cache, stats=stats),
+            )
+
+            assert stats.files[workspace][PurePath("Root.SimpleSchema")].is_cached is expected_is_cached
+
+    # ----------------------------------------------------------------------
+    def test_Error(self):
+        stats = ParseStats()
+
+        _Execute(
+            {
+                _SINGLE_CONTENT_FILENAME.parent: {
+                    PurePath(_SINGLE_CONTENT_FILENAME.name): lambda: "value: (\n"
+                }
+            },
+            raise_if_single_exception=False,
+            stats=stats,
+            expected_result=-123,
+        )
+
+        file_stats = stats.files[_SINGLE_CONTENT_FILENAME.parent][PurePath(_SINGLE_CONTENT_FILENAME.name)]
+
+        assert file_stats.num_tokens > 0
+        assert file_stats.num_elements == 0
+
+    # ----------------------------------------------------------------------
+    def test_Summary(self):
+        dm_and_content = GenerateDoneManagerAndContent(verbose=True)
+
+        Parse(
+            cast(DoneManager, next(dm_and_content)),
+            self._CreateSampleSchemasWorkspaces(),
+            options=ParseOptions(stats=ParseStats()),
+        )
+
+        content = cast(str, next(dm_and_content))
+
+        assert f"{sample_schemas} (10 files): " in content
+        # The slowest files vary from run to run, but there are always more than the number listed
+        assert len(re.findall(r"^\s+\S+\.SimpleSchema: ", content, re.MULTILINE)) == 5
+
+
+# ----------------------------------------------------------------------
+class TestInFlight:
+    # ----------------------------------------------------------------------
+    @staticmethod
+    @contextmanager
+    def _TrackInFlight(
+        monkeypatch,
+        num_files: int,
+    ) -> Iterator[tuple[dict[Path, dict[PurePath, Callable[[], str]]], list[int]]]:
+        """Yield workspaces along with a list whose first item is the max number of files loaded but not parsed."""
+
+        parse_module = sys.modules[Parse.__module__]
+        original_parse_content = parse_module._ParseContent
+
+        lock = threading.Lock()
+        num_in_flight = 0
+        max_num_in_flight = [0]
+
+        # ----------------------------------------------------------------------
+        def GetContent(
+            index: int,
+        ) -> str:
+            nonlocal num_in_flight
+
+            with lock:
+                num_in_flight += 1
+                max_num_in_flight[0] = max(max_num_in_flight[0], num_in_flight)
+
+            # Identical content is only parsed once, so each file's content is different
+            return f"value{index}: Integer\n"
+
+        # ----------------------------------------------------------------------
+        def ParseContent(*args, **kwargs):
+            nonlocal num_in_flight
+
+            time.sleep(0.01)
+            result = original_parse_content(*args, **kwargs)
+
+            with lock:
+                num_in_flight -= 1
+
+            return result
+
+        # ----------------------------------------------------------------------
+
+        monkeypatch.setattr(parse_module, "_ParseContent", ParseContent)
+
+        yield (
+            {
+                Path.cwd(): {
+                    PurePath(f"File{index}.SimpleSchema"): lambda index=index: GetContent(index)
+                    for index in range(num_files)
+                },
+            },
+            max_num_in_flight,
+        )
+
+    # ----------------------------------------------------------------------
+    def test_SampleSchemas(self):
+        workspaces = {
+            sample_schemas: {
+                PurePath(filename.name): lambda filename=filename: filename.read_text(encoding="utf-8")
+                for filename in sample_schemas.glob("*.SimpleSchema")
+            },
+        }
+
+        results = _Execute(workspaces)
+        limited_results = _Execute(workspaces, max_in_flight=1, max_bytes_in_flight=1)
+
+        for workspace_root, workspace_results in results.items():
+            limited_workspace_results = limited_results[workspace_root]
+
+            assert workspace_results.keys() == limited_workspace_results.keys()
+
+            for relative_path, result in workspace_results.items():
+                assert _ToYaml(cast(RootStatement, limited_workspace_results[relative_path])) == _ToYaml(
+                    cast(RootStatement, result)
+                )
+
+    # ----------------------------------------------------------------------
+    def test_MaxInFlight(self, monkeypatch):
+        with self._TrackInFlight(monkeypatch, 8) as (workspaces, max_num_in_flight):
+            results = _Execute(workspaces, max_in_flight=2)
+
+        assert len(results[Path.cwd()]) == 8
+        assert max_num_in_flight[0] <= 2
+
+    # ----------------------------------------------------------------------
+    def test_MaxBytesInFlight(self, monkeypatch):
+        # Each file's content exceeds the limit, so only one file is in flight at a time
+        with self._TrackInFlight(monkeypatch, 8) as (workspaces, max_num_in_flight):
+            results = _Execute(workspaces, max_bytes_in_flight=1)
+
+        assert len(results[Path.cwd()]) == 8
+        assert max_num_in_flight[0] == 1
+
+    # ----------------------------------------------------------------------
+    def test_MaxBytesInFlightBeforeLoad(self, monkeypatch, tmp_path):
+        for index in range(2):
+            (tmp_path / f"File{index}.SimpleSchema").write_text(
+                f"value{index}: Integer\n" + "# padding\n" * 100, encoding="utf-8"
+            )
+
+        parse_module = sys.modules[Parse.__module__]
+        original_parse_content = parse_module._ParseContent
+
+        loaded: list[str] = []
+
+        # ----------------------------------------------------------------------
+        def ParseContent(content, fullpath, *args, **kwargs):
+            if fullpath.name == "File0.SimpleSchema":
+                # The second file's size on the file system exceeds the limit while this file is in
+                # flight, so its content isn't loaded.
+                time.sleep(0.2)
+                assert loaded == ["File0.SimpleSchema"]
+
+            return original_parse_content(content, fullpath, *args, **kwargs)
+
+        # ----------------------------------------------------------------------
+        def GetContent(filename: Path) -> str:
+            loaded.append(filename.name)
+            return filename.read_text(encoding="utf-8")
+
+        # ----------------------------------------------------------------------
+
+        monkeypatch.setattr(parse_module, "_ParseContent", ParseContent)
+
+        results = _Execute(
+            {
+                tmp_path: {
+                    PurePath(filename.name): lambda filename=filename: GetContent(filename)
+                    for filename in sorted(tmp_path.iterdir())
+                },
+            },
+            num_jobs=2,
+            max_bytes_in_flight=1000,
+        )
+
+        assert loaded == ["File0.SimpleSchema", "File1.SimpleSchema"]
+        assert all(isinstance(result, RootStatement) for result in results[tmp_path.resolve()].values())
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.parametrize("arg_name", ["max_in_flight", "max_bytes_in_flight"])
+    def test_ErrorInvalidValue(self, arg_name):
+        with pytest.raises(ValueError, match=re.escape(f"Invalid {arg_name} value: 0")):
+            _Execute({}, **{arg_name: 0})
+
+    # ----------------------------------------------------------------------
+    def test_ParseIter(self):
+        lock = threading.Lock()
+        num_loaded = 0
+
+        # ----------------------------------------------------------------------
+        def GetContent() -> str:
+            nonlocal num_loaded
+
+            with lock:
+                num_loaded += 1
+
+            return "value: Integer\n"
+
+        # ----------------------------------------------------------------------
+
+        dm_and_content = GenerateDoneManagerAndContent()
+
+        max_num_unconsumed = 0
+
+        for num_consumed, _ in enumerate(
+            ParseIter(
+                cast(DoneManager, next(dm_and_content)),
+                {Path.cwd(): {PurePath(f"File{index}.SimpleSchema"): GetContent for index in range(8)}},
+                options=ParseOptions(max_in_flight=1),
+            ),
+        ):
+            # Results that haven't been consumed prevent more files from being loaded
+            time.sleep(0.02)
+
+            with lock:
+                max_num_unconsumed = max(max_num_unconsumed, num_loaded - num_consumed)
+
+        assert num_loaded == 8
+        assert max_num_unconsumed <= 3
+
+    # ----------------------------------------------------------------------
+    def test_ParseIterClose(self):
+        dm_and_content = GenerateDoneManagerAndContent()
+
+        results_iter = ParseIter(
+            cast(DoneManager, next(dm_and_content)),
+            {
+                Path.cwd(): {
+                    PurePath(f"File{index}.SimpleSchema"): lambda: "value: Integer\n" for index in range(8)
+                }
+            },
+            options=ParseOptions(max_in_flight=1),
+        )
+
+        next(results_iter)
+
+        # Work waiting for capacity is cancelled rather than blocking the iterator
+        results_iter.close()
+
+    # ----------------------------------------------------------------------
+    def test_ParseAsync(self, monkeypatch):
+        num_fetches = 0
+
+        # ----------------------------------------------------------------------
+        async def GetContent() -> str:
+            nonlocal num_fetches
+
+            num_fetches += 1
+            await asyncio.sleep(0)
+
+            return "value: Integer\n"
+
+        # ----------------------------------------------------------------------
+
+        parse_module = sys.modules[Parse.__module__]
+        original_parse_content = parse_module._ParseContent
+
+        num_parsed = 0
+        max_num_in_flight = 0
+
+        # ----------------------------------------------------------------------
+        def ParseContent(*args, **kwargs):
+            nonlocal num_parsed, max_num_in_flight
+
+            max_num_in_flight = max(max_num_in_flight, num_fetches - num_parsed)
+
+            result = original_parse_content(*args, **kwargs)
+            num_parsed += 1
+
+            return result
+
+        # ----------------------------------------------------------------------
+
+        monkeypatch.setattr(parse_module, "_ParseContent", ParseContent)
+
+        dm_and_content = GenerateDoneManagerAndContent()
+
+        results = asyncio.run(
+            ParseAsync(
+                cast(DoneManager, next(dm_and_content)),
+                {Path.cwd(): {PurePath(f"File{index}.SimpleSchema"): GetContent for index in range(8)}},
+                options=ParseOptions(max_in_flight=2),
+            ),
+        )
+
+        assert len(results[Path.cwd()]) == 8
+        assert num_fetches == 8
+        assert max_num_in_flight <= 2
+
+
+# ----------------------------------------------------------------------
+class TestSchedule:
+    # ----------------------------------------------------------------------
+    @staticmethod
+    @pytest.fixture
+    def workspace(tmp_path) -> Path:
+        workspace = tmp_path / "workspace"
+        workspace.mkdir()
+
+        # Comments are used to vary the size of the files
+        (workspace / "Small.SimpleSchema").write_text("value: Integer\n", encoding="utf-8")
+        (workspace / "Medium.SimpleSchema").write_text(
+            "# {}\nvalue: Integer\n".format("x" * 100), encoding="utf-8"
+        )
+        (workspace / "Large.SimpleSchema").write_text(
+            "# {}\nvalue: Integer\n".format("x" * 1000), encoding="utf-8"
+        )
+        (workspace / "Includer.SimpleSchema").write_text(
+            "from Included import *\n# {}\n".format("x" * 5000), encoding="utf-8"
+        )
+        (workspace / "Included.SimpleSchema").write_text("value: Integer\n", encoding="utf-8")
+
+        return workspace
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def Execute(
+        monkeypatch,
+        workspace: Path,
+        filenames: list[str],
+        schedule: ScheduleType,
+    ) -> list[str]:
+        """Return the names of the files in the order in which they were parsed."""
+
+        parse_module = sys.modules[Parse.__module__]
+        original_parse_content = parse_module._ParseContent
+
+        parsed: list[str] = []
+
+        # ----------------------------------------------------------------------
+        def ParseContent(content, fullpath, *args, **kwargs):
+            parsed.append(fullpath.stem)
+            return original_parse_content(content, fullpath, *args, **kwargs)
+
+        # ----------------------------------------------------------------------
+
+        monkeypatch.setattr(parse_module, "_ParseContent", ParseContent)
+
+        dm_and_content = GenerateDoneManagerAndContent()
+
+        dm = cast(DoneManager, next(dm_and_content))
+
+        results = Parse(
+            dm,
+            {
+                workspace: {
+                    PurePath(filename): lambda filename=filename: (workspace / filename).read_text(
+                        encoding="utf-8"
+                    )
+                    for filename in filenames
+                },
+            },
+            options=ParseOptions(single_threaded=True, schedule=schedule),
+        )
+
+        assert dm.result == 0
+        assert all(isinstance(result, RootStatement) for result in results[workspace].values())
+
+        return parsed
+
+    # ----------------------------------------------------------------------
+    def test_SampleSchemas(self):
+        workspaces = {
+            sample_schemas: {
+                PurePath(filename.name): lambda filename=filename: filename.read_text(encoding="utf-8")
+                for filename in sample_schemas.glob("*.SimpleSchema")
+            },
+        }
+
+        results = _Execute(workspaces)
+        scheduled_results = _Execute(workspaces, schedule=ScheduleType.Cost)
+
+        for workspace_root, workspace_results in results.items():
+            scheduled_workspace_results = scheduled_results[workspace_root]
+
+            assert workspace_results.keys() == scheduled_workspace_results.keys()
+
+            for relative_path, result in workspace_results.items():
+                assert _ToYaml(cast(RootStatement, scheduled_workspace_results[relative_path])) == _ToYaml(
+                    cast(RootStatement, result)
+                )
+
+    # ----------------------------------------------------------------------
+    def test_Fifo(self, monkeypatch, workspace):
+        assert self.Execute(
+            monkeypatch,
+            workspace,
+            ["Small.SimpleSchema", "Includer.SimpleSchema", "Medium.SimpleSchema", "Large.SimpleSchema"],
+            ScheduleType.Fifo,
+        ) == ["Small", "Includer", "Medium", "Large", "Included"]
+
+    # ----------------------------------------------------------------------
+    def test_LargestFirst(self, monkeypatch, workspace):
+        assert self.Execute(
+            monkeypatch,
+            workspace,
+            ["Small.SimpleSchema", "Medium.SimpleSchema", "Large.SimpleSchema"],
+            ScheduleType.Cost,
+        ) == ["Large", "Medium", "Small"]
+
+    # ----------------------------------------------------------------------
+    def test_IncludesNotKnown(self, monkeypatch, workspace):
+        # Without a previous parse, the includes aren't known and all files are ordered by size
+        assert self.Execute(
+            monkeypatch,
+            workspace,
+            ["Small.SimpleSchema", "Includer.SimpleSchema", "Medium.SimpleSchema", "Large.SimpleSchema"],
+            ScheduleType.Cost,
+        ) == ["Includer", "Large", "Medium", "Small", "Included"]
+
+    # ----------------------------------------------------------------------
+    def test_SessionIncludeHeights(self, monkeypatch, workspace):
+        parse_module = sys.modules[Parse.__module__]
+        original_parse_content = parse_module._ParseContent
+
+        parsed: list[str] = []
+
+        # ----------------------------------------------------------------------
+        def ParseContent(content, fullpath, *args, **kwargs):
+            parsed.append(fullpath.stem)
+            return original_parse_content(content, fullpath, *args, **kwargs)
+
+        # ----------------------------------------------------------------------
+
+        monkeypatch.setattr(parse_module, "_ParseContent", ParseContent)
+
+        filenames = [workspace / "Includer.SimpleSchema", workspace / "Included.SimpleSchema"]
+
+        with ParseSession(options=ParseOptions(single_threaded=True, schedule=ScheduleType.Cost)) as session:
+            dm_and_content = GenerateDoneManagerAndContent()
+            session.Parse(cast(DoneManager, next(dm_and_content)), CreateWorkspaces([workspace]))
+
+            # Both files were provided up front, so the includes aren't known yet
+            assert parsed.index("Includer") < parsed.index("Included")
+
+            for filename in filenames:
+                filename.write_text(filename.read_text(encoding="utf-8") + "# Changed\n", encoding="utf-8")
+
+            parsed.clear()
+
+            dm_and_content = GenerateDoneManagerAndContent()
+            session.Update(cast(DoneManager, next(dm_and_content)), filenames)
+
+            # The includer is at the top of the include chain found by the previous parse
+            assert parsed == ["Includer", "Included"]
+
+    # ----------------------------------------------------------------------
+    def test_LongChainFirst(self, monkeypatch, workspace):
+        parse_module = sys.modules[Parse.__module__]
+        original_parse_content = parse_module._ParseContent
+
+        parsed: list[str] = []
+
+        # ----------------------------------------------------------------------
+        def ParseContent(content, fullpath, *args, **kwargs):
+            parsed.append(fullpath.stem)
+            return original_parse_content(content, fullpath, *args, **kwargs)
+
+        # ----------------------------------------------------------------------
+
+        monkeypatch.setattr(parse_module, "_ParseContent", ParseContent)
+
+        # The files in the chain are smaller than the standalone file
+        (workspace / "Chain1.SimpleSchema").write_text("from Chain2 import *\n", encoding="utf-8")
+        (workspace / "Chain2.SimpleSchema").write_text("from Chain3 import *\n", encoding="utf-8")
+        (workspace / "Chain3.SimpleSchema").write_text("value: Integer\n", encoding="utf-8")
+
+        filenames = [
+            workspace / "Large.SimpleSchema",
+            workspace / "Chain3.SimpleSchema",
+            workspace / "Chain2.SimpleSchema",
+            workspace / "Chain1.SimpleSchema",
+        ]
+
+        with ParseSession(options=ParseOptions(single_threaded=True, schedule=ScheduleType.Cost)) as session:
+            dm_and_content = GenerateDoneManagerAndContent()
+            session.Parse(
+                cast(DoneManager, next(dm_and_content)),
+                {
+                    workspace: {
+                        PurePath(filename.name): lambda filename=filename: filename.read_text(
+                            encoding="utf-8"
+                        )
+                        for filename in filenames
+                    },
+                },
+            )
+
+            # Without a previous parse, the largest file is parsed first
+            assert parsed[0] == "Large"
+
+            for filename in filenames:
+                filename.write_text(filename.read_text(encoding="utf-8") + "# Changed\n", encoding="utf-8")
+
+            parsed.clear()
+
+            dm_and_content = GenerateDoneManagerAndContent()
+            session.Update(cast(DoneManager, next(dm_and_content)), filenames)
+
+            # The root of the chain is parsed before the larger standalone file
+            assert parsed == ["Chain1", "Chain2", "Large", "Chain3"]
+
+    # ----------------------------------------------------------------------
+    def test_CalculateIncludeHeights(self):
+        parse_module = sys.modules[Parse.__module__]
+
+        root = Path.cwd()
+
+        heights = parse_module._CalculateIncludeHeights(
+            {
+                (root, PurePath("A")): {(root, PurePath("B")), (root, PurePath("C"))},
+                (root, PurePath("B")): {(root, PurePath("C"))},
+                (root, PurePath("C")): {(root, PurePath("D"))},
+                (root, PurePath("D")): set(),
+                # A cycle, which includes a chain
+                (root, PurePath("E")): {(root, PurePath("F"))},
+                (root, PurePath("F")): {(root, PurePath("E")), (root, PurePath("D"))},
+            },
+        )
+
+        assert {key: heights[key] for key in [(root, PurePath(name)) for name in "ABCD"]} == {
+            (root, PurePath("A")): 3,
+            (root, PurePath("B")): 2,
+            (root, PurePath("C")): 1,
+            (root, PurePath("D")): 0,
+        }
+
+        # The include that completes the cycle doesn't contribute to the height
+        assert heights[(root, PurePath("E"))] == 2
+        assert heights[(root, PurePath("F"))] == 1
+
+    # ----------------------------------------------------------------------
+    def test_InMemoryContent(self):
+        # The size of content that isn't on the file system is unknown, but the files are still parsed
+        results = _Execute(
+            {
+                Path.cwd(): {
+                    PurePath(f"File{index}.SimpleSchema"): lambda: "value: Integer\n" for index in range(8)
+                }
+            },
+            schedule=ScheduleType.Cost,
+        )
+
+        assert len(results[Path.cwd()]) == 8
+
+    # ----------------------------------------------------------------------
+    def test_Error(self, monkeypatch, workspace):
+        (workspace / "Invalid.SimpleSchema").write_text("value: Integer(\n", encoding="utf-8")
+
+        results = _Execute(
+            {
+                workspace: {
+                    PurePath(filename): lambda filename=filename: (workspace / filename).read_text(
+                        encoding="utf-8"
+                    )
+                    for filename in ["Small.SimpleSchema", "Invalid.SimpleSchema", "Large.SimpleSchema"]
+                },
+            },
+            single_threaded=True,
+            raise_if_single_exception=False,
+            schedule=ScheduleType.Cost,
+            expected_result=-123,
+        )
+
+        assert isinstance(results[workspace][PurePath("Invalid.SimpleSchema")], Exception)
+        assert isinstance(results[workspace][PurePath("Small.SimpleSchema")], RootStatement)
+        assert isinstance(results[workspace][PurePath("Large.SimpleSchema")], RootStatement)
+
+
+# ----------------------------------------------------------------------
+class TestCancellation:
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _CreateWorkspaces(
+        num_files: int,
+        invalid_index: int | None = None,
+    ) -> dict[Path, dict[PurePath, Callable[[], str]]]:
+        return {
+            Path.cwd(): {
+                PurePath(f"File{index}.SimpleSchema"): (
+                    (lambda: "value: Integer(\n") if index == invalid_index else (lambda: "value: Integer\n")
+                )
+                for index in range(num_files)
+            },
+        }
+
+    # ----------------------------------------------------------------------
+    def test_FailFast(self):
+        results = _Execute(
+            self._CreateWorkspaces(8, invalid_index=0),
+            single_threaded=True,
+            raise_if_single_exception=False,
+            fail_fast=True,
+            expected_result=-123,
+        )
+
+        # Files that weren't parsed are not included in the results
+        assert list(results[Path.cwd()]) == [PurePath("File0.SimpleSchema")]
+        assert isinstance(results[Path.cwd()][PurePath("File0.SimpleSchema")], AntlrError)
+
+    # ----------------------------------------------------------------------
+    def test_FailFastRaise(self):
+        with pytest.raises(AntlrError, match=re.escape("no viable alternative")):
+            _Execute(
+                self._CreateWorkspaces(8, invalid_index=0),
+                single_threaded=True,
+                fail_fast=True,
+                expected_result=-123,
+            )
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.parametrize("in_flight_args", [{"max_in_flight": 1}, {"max_bytes_in_flight": 1}])
+    def test_FailFastParseAsyncInFlight(self, in_flight_args):
+        # ----------------------------------------------------------------------
+        def CreateGetContentFunc(
+            get_content_func: Callable[[], str],
+        ) -> Callable[[], Awaitable[str]]:
+            async def Impl() -> str:
+                await asyncio.sleep(0)
+                return get_content_func()
+
+            return Impl
+
+        # ----------------------------------------------------------------------
+        async def Execute() -> dict[Path, dict[PurePath, Exception | RootStatement]]:
+            dm_and_content = GenerateDoneManagerAndContent()
+
+            return await ParseAsync(
+                cast(DoneManager, next(dm_and_content)),
+                {
+                    workspace_root: {
+                        relative_path: CreateGetContentFunc(get_content_func)
+                        for relative_path, get_content_func in sources.items()
+                    }
+                    for workspace_root, sources in self._CreateWorkspaces(4, invalid_index=0).items()
+                },
+                raise_if_single_exception=False,
+                options=ParseOptions(fail_fast=True, **in_flight_args),
+            )
+
+        # ----------------------------------------------------------------------
+
+        # The files skipped once parsing is cancelled don't wait for capacity that is never released
+        results = asyncio.run(asyncio.wait_for(Execute(), 30))
+
+        assert list(results[Path.cwd()]) == [PurePath("File0.SimpleSchema")]
+        assert isinstance(results[Path.cwd()][PurePath("File0.SimpleSchema")], AntlrError)
+
+    # ----------------------------------------------------------------------
+    def test_FailFastParseAsyncIncludedFile(self, tmp_path):
+        # The root file is interrupted rather than completed when the file that it includes fails to
+        # parse, so it never releases its capacity.
+        (tmp_path / "Invalid.SimpleSchema").write_text("value: Integer(\n", encoding="utf-8")
+
+        # ----------------------------------------------------------------------
+        async def GetIncluderContent() -> str:
+            return "from Invalid import *\n\n" + "".join(f"value{index}: Integer\n" for index in range(5000))
+
+        # ----------------------------------------------------------------------
+        async def GetContent() -> str:
+            return "value: Integer\n"
+
+        # ----------------------------------------------------------------------
+        async def Execute() -> dict[Path, dict[PurePath, Exception | RootStatement]]:
+            dm_and_content = GenerateDoneManagerAndContent()
+
+            return await ParseAsync(
+                cast(DoneManager, next(dm_and_content)),
+                {
+                    tmp_path: {
+                        PurePath("Includer.SimpleSchema"): GetIncluderContent,
+                        **{PurePath(f"File{index}.SimpleSchema"): GetContent for index in range(4)},
+                    },
+                },
+                raise_if_single_exception=False,
+                options=ParseOptions(fail_fast=True, max_in_flight=1),
+            )
+
+        # ----------------------------------------------------------------------
+
+        results = asyncio.run(asyncio.wait_for(Execute(), 30))
+
+        assert isinstance(results[tmp_path.resolve()][PurePath("Invalid.SimpleSchema")], AntlrError)
+        assert PurePath("File3.SimpleSchema") not in results[tmp_path.resolve()]
+
+    # ----------------------------------------------------------------------
+    def test_NoFailFast(self):
+        results = _Execute(
+            self._CreateWorkspaces(8, invalid_index=0),
+            single_threaded=True,
+            raise_if_single_exception=False,
+            expected_result=-123,
+        )
+
+        assert len(results[Path.cwd()]) == 8
+
+    # ----------------------------------------------------------------------
+    def test_CancelEvent(self):
+        num_loaded = 0
+
+        cancel_event = threading.Event()
+
+        # ----------------------------------------------------------------------
+        def GetContent() -> str:
+            nonlocal num_loaded
+
+            num_loaded += 1
+
+            if num_loaded == 2:  # noqa: PLR2004
+                cancel_event.set()
+
+            return "value: Integer\n"
+
+        # ----------------------------------------------------------------------
+
+        results = _Execute(
+            {Path.cwd(): {PurePath(f"File{index}.SimpleSchema"): GetContent for index in range(8)}},
+            single_threaded=True,
+            cancel_event=cancel_event,
+        )
+
+        # The content of files enqueued after cancellation is never loaded
+        assert num_loaded == 2
+        assert list(results[Path.cwd()]) == [PurePath("File0.SimpleSchema")]
+
+    # ----------------------------------------------------------------------
+    def test_InterruptRunning(self):
+        parse_module = sys.modules[Parse.__module__]
+
+        cancel_event = threading.Event()
+        cancel_event.set()
+
+        with pytest.raises(parse_module._CancelledError):
+            parse_module._ParseContent(
+                "value: Integer\n",
+                _SINGLE_CONTENT_FILENAME,
+                lambda *args, **kwargs: None,
+                lambda _: None,
+                is_included_file=False,
+                tab_width=4,
+                antlr_diagnostics=False,
+                cancel_event=cancel_event,
+            )
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.parametrize("executor", [ExecutorType.Thread, ExecutorType.Process])
+    def test_Timeout(self, executor):
+        with pytest.raises(
+            AntlrError,
+            match=re.escape(
+                f"The file did not finish parsing within 0 seconds ({_SINGLE_CONTENT_FILENAME} <Ln 1, Col 1>)"
+            ),
+        ):
+            _Execute(
+                {
+                    _SINGLE_CONTENT_FILENAME.parent: {
+                        PurePath(_SINGLE_CONTENT_FILENAME.name): lambda: "value: Integer\n"
+                    }
+                },
+                executor=executor,
+                file_timeout=0,
+                expected_result=-123,
+            )
+
+    # ----------------------------------------------------------------------
+    def test_TimeoutNotExceeded(self):
+        results = _Execute(self._CreateWorkspaces(8), file_timeout=60)
+
+        assert len(results[Path.cwd()]) == 8
+        assert all(isinstance(result, RootStatement) for result in results[Path.cwd()].values())
+
+    # ----------------------------------------------------------------------
+    def test_ParseSession(self):
+        session = ParseSession()
+
+        dm_and_content = GenerateDoneManagerAndContent()
+
+        cancel_event = threading.Event()
+        cancel_event.set()
+
+        results = session.Parse(
+            cast(DoneManager, next(dm_and_content)),
+            self._CreateWorkspaces(4),
+            cancel_event=cancel_event,
+        )
+
+        assert results == {Path.cwd(): {}}
+
+        # Files that weren't parsed are parsed by the next update
+        dm_and_content = GenerateDoneManagerAndContent()
+
+        results = session.Update(cast(DoneManager, next(dm_and_content)), [])
+
+        assert len(results[Path.cwd()]) == 4
+        assert all(isinstance(result, RootStatement) for result in results[Path.cwd()].values())
+
+
+# ----------------------------------------------------------------------
+class TestDuplicateContent:
+    _content = textwrap.dedent(
+        """\
+        from Common import *
+
+        value: Integer
+
+        Struct ->
+            a: Integer
+            b: String
+        """,
+    )
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    @pytest.fixture
+    def workspaces(tmp_path) -> list[Path]:
+        # The same file is copied into each workspace, but the files that it includes are different
+        workspaces: list[Path] = []
+
+        for index in range(3):
+            workspace = tmp_path.resolve() / f"Workspace{index}"
+            workspace.mkdir()
+
+            (workspace / "Common.SimpleSchema").write_text(f"common{index}: Integer\n", encoding="utf-8")
+            (workspace / "Shared.SimpleSchema").write_text(TestDuplicateContent._content, encoding="utf-8")
+
+            workspaces.append(workspace)
+
+        return workspaces
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _CreateWorkspaces(
+        workspaces: list[Path],
+    ) -> dict[Path, dict[PurePath, Callable[[], str]]]:
+        return {
+            workspace: {
+                PurePath("Shared.SimpleSchema"): lambda workspace=workspace: (
+                    workspace / "Shared.SimpleSchema"
+                ).read_text(encoding="utf-8"),
+            }
+            for workspace in workspaces
+        }
+
+    # ----------------------------------------------------------------------
+    @classmethod
+    def _Validate(
+        cls,
+        workspaces: list[Path],
+        results: dict[Path, dict[PurePath, Exception | RootStatement]],
+    ) -> None:
+        for workspace in workspaces:
+            root = results[workspace][PurePath("Shared.SimpleSchema")]
+            assert isinstance(root, RootStatement), root
+
+            # The result is the same as when the file is parsed on its own
+            assert _ToYaml(root) == _ToYaml(
+                cast(
+                    RootStatement,
+                    _Execute(cls._CreateWorkspaces([workspace]))[workspace][PurePath("Shared.SimpleSchema")],
+                ),
+            )
+
+            # The regions reference this file
+            assert _GetRegionFilenames(root) == {workspace / "Shared.SimpleSchema"}
+
+            # The include is resolved relative to this file
+            include_statement = root.statements[0]
+
+            assert isinstance(include_statement, ParseIncludeStatement)
+            assert include_statement.filename.value == workspace / "Common.SimpleSchema"
+
+            assert isinstance(results[workspace][PurePath("Common.SimpleSchema")], RootStatement)
+
+    # ----------------------------------------------------------------------
+    def test_Standard(self, workspaces, monkeypatch):
+        parse_module = sys.modules[Parse.__module__]
+        original_parse_content = parse_module._ParseContent
+
+        parsed_content: list[str] = []
+
+        # ----------------------------------------------------------------------
+        def ParseContent(*args, **kwargs):
+            parsed_content.append(args[0])
+            return original_parse_content(*args, **kwargs)
+
+        # ----------------------------------------------------------------------
+
+        monkeypatch.setattr(parse_module, "_ParseContent", ParseContent)
+
+        results = _Execute(self._CreateWorkspaces(workspaces))
+
+        monkeypatch.undo()
+
+        self._Validate(workspaces, results)
+
+        # The content is parsed once; only the include statement is parsed for the other files
+        assert parsed_content.count(self._content) == 1
+        assert parsed_content.count("from Common import *\n\n") == 2
+
+    # ----------------------------------------------------------------------
+    def test_ProcessExecutor(self, workspaces):
+        self._Validate(
+            workspaces, _Execute(self._CreateWorkspaces(workspaces), executor=ExecutorType.Process)
+        )
+
+    # ----------------------------------------------------------------------
+    def test_NoIncludes(self, workspaces):
+        for workspace in workspaces:
+            (workspace / "Shared.SimpleSchema").write_text("value: Integer\n", encoding="utf-8")
+
+        results = _Execute(self._CreateWorkspaces(workspaces))
+
+        for workspace in workspaces:
+            root = results[workspace][PurePath("Shared.SimpleSchema")]
+
+            assert isinstance(root, RootStatement), root
+            assert _GetRegionFilenames(root) == {workspace / "Shared.SimpleSchema"}
+
+    # ----------------------------------------------------------------------
+    def test_Stats(self, workspaces):
+        stats = ParseStats()
+
+        _Execute(self._CreateWorkspaces(workspaces), stats=stats)
+
+        shared_stats = [stats.files[workspace][PurePath("Shared.SimpleSchema")] for workspace in workspaces]
+
+        assert [file_stats.is_duplicate for file_stats in shared_stats].count(False) == 1
+        assert len({file_stats.num_elements for file_stats in shared_stats}) == 1
+
+    # ----------------------------------------------------------------------
+    def test_SharedValues(self, workspaces):
+        results = _Execute(self._CreateWorkspaces(workspaces))
+
+        roots = [
+            cast(RootStatement, results[workspace][PurePath("Shared.SimpleSchema")])
+            for workspace in workspaces
+        ]
+
+        item_statements = [cast(ParseItemStatement, root.statements[1]) for root in roots]
+
+        # Elements are copied, but the values that don't depend on the filename are shared
+        assert item_statements[0] is not item_statements[1]
+        assert item_statements[0].name is not item_statements[1].name
+        assert item_statements[0].region.begin is item_statements[1].region.begin
+        assert item_statements[0].name.value is item_statements[1].name.value
+
+    # ----------------------------------------------------------------------
+    def test_IncludeResolvedDifferently(self, workspaces):
+        # The included file isn't in the same directory, so it is found in the first workspace
+        (workspaces[1] / "Common.SimpleSchema").unlink()
+
+        results = _Execute(self._CreateWorkspaces(workspaces))
+
+        for workspace, expected_include_workspace in [
+            (workspaces[0], workspaces[0]),
+            (workspaces[1], workspaces[0]),
+            (workspaces[2], workspaces[2]),
+        ]:
+            root = results[workspace][PurePath("Shared.SimpleSchema")]
+            assert isinstance(root, RootStatement), root
+
+            include_statement = root.statements[0]
+
+            assert isinstance(include_statement, ParseIncludeStatement)
+            assert include_statement.filename.value == expected_include_workspace / "Common.SimpleSchema"
+            assert include_statement.region.filename == workspace / "Shared.SimpleSchema"
+
+    # ----------------------------------------------------------------------
+    def test_ErrorInvalidSyntax(self, workspaces):
+        for workspace in workspaces:
+            (workspace / "Shared.SimpleSchema").write_text("value: Integer(\n", encoding="utf-8")
+
+        results = _Execute(
+            self._CreateWorkspaces(workspaces),
+            raise_if_single_exception=False,
+            expected_result=-123,
+        )
+
+        # Each file reports its own error
+        for workspace in workspaces:
+            result = results[workspace][PurePath("Shared.SimpleSchema")]
+
+            assert isinstance(result, AntlrError)
+            assert result.source == workspace / "Shared.SimpleSchema"
+
+
+# ----------------------------------------------------------------------
+class TestErrorRecovery:
+    _content = textwrap.dedent(
+        """\
+        one: Integer
+        two: Integer(
+        three: Integer
+
+        Struct ->
+            a: Integer
+            b: Integer ]
+            c: Integer
+
+        four: (Integer
+        five: String
+        six: Integer {
+        """,
+    )
+
+    # ----------------------------------------------------------------------
+    @classmethod
+    def Execute(
+        cls,
+        content: str | None = None,
+        *,
+        executor: ExecutorType = ExecutorType.Thread,
+        max_errors: int = 100,
+        file_timeout: float | None = None,
+    ) -> Exception | RootStatement:
+        if content is None:
+            content = cls._content
+
+        results = _Execute(
+            {_SINGLE_CONTENT_FILENAME.parent: {PurePath(_SINGLE_CONTENT_FILENAME.name): lambda: content}},
+            raise_if_single_exception=False,
+            executor=executor,
+            max_errors=max_errors,
+            file_timeout=file_timeout,
+            expected_result=-123,
+        )
+
+        return results[_SINGLE_CONTENT_FILENAME.parent][PurePath(_SINGLE_CONTENT_FILENAME.name)]
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _GetNames(
+        root: RootStatement,
+    ) -> list[str]:
+        return [cast(Any, statement).name.value for statement in root.statements]
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.parametrize("executor", [ExecutorType.Thread, ExecutorType.Process])
+    def test_MultipleErrors(self, executor):
+        result = self.Execute(executor=executor)
+
+        assert isinstance(result, ParseRecoveryError)
+
+        assert [
+            (cast(AntlrError, error).location.line, cast(AntlrError, error).location.column)
+            for error in result.errors
+        ] == [(2, 13), (7, 16), (11, 1), (13, 1)]
+
+        assert str(result.errors[0]) == textwrap.dedent(
+            f"""\
+            no viable alternative at input 'two: Integer(' ({_SINGLE_CONTENT_FILENAME} <Ln 2, Col 13>)"""
+        )
+
+        # Statements that don't contain errors are parsed
+        assert self._GetNames(result.root) == ["one", "three", "five"]
+
+    # ----------------------------------------------------------------------
+    def test_MaxErrors(self):
+        result = self.Execute(max_errors=2)
+
+        assert isinstance(result, ParseRecoveryError)
+        assert len(result.errors) == 2
+        assert self._GetNames(result.root) == ["one", "three"]
+
+    # ----------------------------------------------------------------------
+    def test_NoErrors(self):
+        workspaces = {
+            sample_schemas: {
+                PurePath(filename.name): lambda filename=filename: filename.read_text(encoding="utf-8")
+                for filename in sample_schemas.glob("*.SimpleSchema")
+            },
+        }
+
+        results = _Execute(workspaces)
+        recovery_results = _Execute(workspaces, max_errors=10)
+
+        for workspace_root, workspace_results in results.items():
+            recovery_workspace_results = recovery_results[workspace_root]
+
+            assert workspace_results.keys() == recovery_workspace_results.keys()
+
+            for relative_path, result in workspace_results.items():
+                assert _ToYaml(cast(RootStatement, recovery_workspace_results[relative_path])) == _ToYaml(
+                    cast(RootStatement, result)
+                )
+
+    # ----------------------------------------------------------------------
+    def test_VisitorError(self):
+        result = self.Execute(
+            textwrap.dedent(
+                """\
+                one: Integer
+                Struct: (Integer | Number) ->
+                    pass
+                two: Integer
+                """,
+            ),
+        )
+
+        assert isinstance(result, ParseRecoveryError)
+        assert len(result.errors) == 1
+        assert isinstance(result.errors[0], Errors.SimpleSchemaGeneratorError)
+        assert self._GetNames(result.root) == ["one", "two"]
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.parametrize("executor", [ExecutorType.Thread, ExecutorType.Process])
+    def test_Timeout(self, executor):
+        # The timeout isn't treated as a syntax error, so the content isn't parsed again
+        result = self.Execute(
+            "value: Integer\n" * 3000 + "invalid: Integer(\n",
+            executor=executor,
+            max_errors=5,
+            file_timeout=0,
+        )
+
+        assert isinstance(result, AntlrError)
+        assert str(result) == (
+            f"The file did not finish parsing within 0 seconds ({_SINGLE_CONTENT_FILENAME} <Ln 1, Col 1>)"
+        )
+
+    # ----------------------------------------------------------------------
+    def test_TimeoutWhileRecovering(self, monkeypatch):
+        parse_module = sys.modules[Parse.__module__]
+        original_parse_content = parse_module._ParseContent
+
+        num_calls = 0
+
+        # ----------------------------------------------------------------------
+        def ParseContent(*args, **kwargs):
+            nonlocal num_calls
+
+            num_calls += 1
+
+            # Time runs out after the content and the first two statements are parsed (the first call
+            # is the one that recovers from errors)
+            if num_calls > 4:  # noqa: PLR2004
+                kwargs["file_timeout"] = 0
+
+            return original_parse_content(*args, **kwargs)
+
+        # ----------------------------------------------------------------------
+
+        monkeypatch.setattr(parse_module, "_ParseContent", ParseContent)
+
+        result = self.Execute(file_timeout=60)
+
+        assert isinstance(result, ParseRecoveryError)
+
+        # The timeout is reported once and the remaining statements aren't parsed
+        assert [str(error) for error in result.errors] == [
+            f"no viable alternative at input 'two: Integer(' ({_SINGLE_CONTENT_FILENAME} <Ln 2, Col 13>)",
+            f"The file did not finish parsing within 60 seconds ({_SINGLE_CONTENT_FILENAME} <Ln 3, Col 1>)",
+        ]
+
+        assert self._GetNames(result.root) == ["one"]
+        assert num_calls == 5  # noqa: PLR2004
+
+    # ----------------------------------------------------------------------
+    def test_ErrorInvalidValue(self):
+        with pytest.raises(ValueError, match=re.escape("Invalid max_errors value: 0")):
+            _Execute({}, max_errors=0)
+
+
+# ----------------------------------------------------------------------
+class TestLexerErrors:
+    # ----------------------------------------------------------------------
+    @pytest.mark.parametrize("max_errors", [None, 5])
+    @pytest.mark.parametrize("tokenizer", [TokenizerType.Antlr, TokenizerType.Regex])
+    @pytest.mark.parametrize(
+        ("content", "expected_result"),
+        [
+            # The first stage succeeds
+            ("one: Integer\n~\ntwo: Integer\n", 0),
+            # The first stage fails and the content is lexed again by the second stage
+            ("one: Integer ~\ntwo: Integer (\nthree: Integer\n", -123),
+        ],
+    )
+    def test_ReportedOnce(self, capsys, content, expected_result, tokenizer, max_errors):
+        _Execute(
+            {_SINGLE_CONTENT_FILENAME.parent: {PurePath(_SINGLE_CONTENT_FILENAME.name): lambda: content}},
+            single_threaded=True,
+            raise_if_single_exception=False,
+            tokenizer=tokenizer,
+            max_errors=max_errors,
+            expected_result=expected_result,
+        )
+
+        assert capsys.readouterr().err.count("token recognition error at: '~'") == 1
+
+    # ----------------------------------------------------------------------
+    def test_Diagnostics(self, capsys):
+        _Execute(
+            {
+                _SINGLE_CONTENT_FILENAME.parent: {
+                    PurePath(_SINGLE_CONTENT_FILENAME.name): lambda: "one: Integer ~\ntwo: Integer (\n",
+                },
+            },
+            raise_if_single_exception=False,
+            antlr_diagnostics=True,
+            max_errors=5,
+            expected_result=-123,
+        )
+
+        assert capsys.readouterr().err.count("token recognition error at: '~'") == 1
+
+
+# ----------------------------------------------------------------------
+class TestParseSession:
+    # ----------------------------------------------------------------------
+    @staticmethod
+    @pytest.fixture
+    def workspace(tmp_path) -> Path:
+        workspace = tmp_path / "workspace"
+        workspace.mkdir()
+
+        (workspace / "Root1.SimpleSchema").write_text("from Included import *\n", encoding="utf-8")
+        (workspace / "Root2.SimpleSchema").write_text("value: Integer\n", encoding="utf-8")
+        (workspace / "Included.SimpleSchema").write_text("included: String\n", encoding="utf-8")
+
+        return workspace.resolve()
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def Parse(
+        session: ParseSession,
+        workspace: Path,
+    ) -> dict[PurePath, Exception | RootStatement]:
+        dm_and_content = GenerateDoneManagerAndContent()
+
+        results = session.Parse(
+            cast(DoneManager, next(dm_and_content)),
+            {
+                workspace: {
+                    PurePath(filename): lambda filename=filename: (workspace / filename).read_text(
+                        encoding="utf-8"
+                    )
+                    for filename in ["Root1.SimpleSchema", "Root2.SimpleSchema"]
+                },
+            },
+            raise_if_single_exception=False,
+        )
+
+        return results[workspace]
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def Update(
+        session: ParseSession,
+        workspace: Path,
+        *changed_filenames: str,
+        expected_result: int = 0,
+    ) -> dict[PurePath, Exception | RootStatement]:
+        dm_and_content = GenerateDoneManagerAndContent()
+
+        dm = cast(DoneManager, next(dm_and_content))
+
+        results = session.Update(
+            dm,
+            [workspace / changed_filename for changed_filename in changed_filenames],
+            raise_if_single_exception=False,
+        )
+
+        assert dm.result == expected_result
+        return results[workspace]
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    @pytest.fixture
+    def shadowed_workspace(tmp_path) -> Path:
+        workspace = tmp_path / "shadowed"
+        (workspace / "sub").mkdir(parents=True)
+
+        (workspace / "B.SimpleSchema").write_text("b: String\n", encoding="utf-8")
+        (workspace / "sub" / "A.SimpleSchema").write_text("from B import Foo\n", encoding="utf-8")
+
+        return workspace.resolve()
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def ParseShadowed(
+        session: ParseSession,
+        workspace: Path,
+    ) -> dict[PurePath, Exception | RootStatement]:
+        dm_and_content = GenerateDoneManagerAndContent()
+
+        results = session.Parse(
+            cast(DoneManager, next(dm_and_content)),
+            {
+                workspace: {
+                    PurePath("sub/A.SimpleSchema"): lambda: (workspace / "sub" / "A.SimpleSchema").read_text(
+                        encoding="utf-8"
+                    ),
+                },
+            },
+        )
+
+        return results[workspace]
+
+    # ----------------------------------------------------------------------
+    def test_Parse(self, workspace):
+        results = self.Parse(ParseSession(), workspace)
+
+        assert sorted(results) == [
+            PurePath("Included.SimpleSchema"),
+            PurePath("Root1.SimpleSchema"),
+            PurePath("Root2.SimpleSchema"),
+        ]
+
+        assert all(isinstance(result, RootStatement) for result in results.values())
+
+    # ----------------------------------------------------------------------
+    def test_UpdateRoot(self, workspace):
+        session = ParseSession()
+
+        original_results = self.Parse(session, workspace)
+
+        (workspace / "Root2.SimpleSchema").write_text("new_value: Number\n", encoding="utf-8")
+
+        results = self.Update(session, workspace, "Root2.SimpleSchema")
+
+        assert results[PurePath("Root2.SimpleSchema")] is not original_results[PurePath("Root2.SimpleSchema")]
+        assert "new_value" in _ToYaml(cast(RootStatement, results[PurePath("Root2.SimpleSchema")]))
+
+        # Unchanged files are reused
+        assert results[PurePath("Root1.SimpleSchema")] is original_results[PurePath("Root1.SimpleSchema")]
+        assert (
+            results[PurePath("Included.SimpleSchema")] is original_results[PurePath("Included.SimpleSchema")]
+        )
+
+    # ----------------------------------------------------------------------
+    def test_UpdateIncluded(self, workspace):
+        session = ParseSession()
+
+        original_results = self.Parse(session, workspace)
+
+        (workspace / "Included.SimpleSchema").write_text("new_included: Number\n", encoding="utf-8")
+
+        results = self.Update(session, workspace, "Included.SimpleSchema")
+
+        assert "new_included" in _ToYaml(cast(RootStatement, results[PurePath("Included.SimpleSchema")]))
+
+        # The include statement doesn't depend on the content of the included file
+        assert results[PurePath("Root1.SimpleSchema")] is original_results[PurePath("Root1.SimpleSchema")]
+        assert results[PurePath("Root2.SimpleSchema")] is original_results[PurePath("Root2.SimpleSchema")]
+
+    # ----------------------------------------------------------------------
+    def test_IncludedRemovedAndRestored(self, workspace):
+        session = ParseSession()
+
+        original_results = self.Parse(session, workspace)
+
+        included_content = (workspace / "Included.SimpleSchema").read_text(encoding="utf-8")
+        (workspace / "Included.SimpleSchema").unlink()
+
+        results = self.Update(
+            session,
+            workspace,
+            "Included.SimpleSchema",
+            expected_result=ExecuteTasks.CATASTROPHIC_TASK_FAILURE_RESULT,
+        )
+
+        assert PurePath("Included.SimpleSchema") not in results
+        assert isinstance(results[PurePath("Root1.SimpleSchema")], Errors.SimpleSchemaGeneratorError)
+        assert results[PurePath("Root2.SimpleSchema")] is original_results[PurePath("Root2.SimpleSchema")]
+
+        (workspace / "Included.SimpleSchema").write_text(included_content, encoding="utf-8")
+
+        results = self.Update(session, workspace, "Included.SimpleSchema")
+
+        assert isinstance(results[PurePath("Root1.SimpleSchema")], RootStatement)
+        assert isinstance(results[PurePath("Included.SimpleSchema")], RootStatement)
+        assert results[PurePath("Root2.SimpleSchema")] is original_results[PurePath("Root2.SimpleSchema")]
+
+    # ----------------------------------------------------------------------
+    def test_IncludeShadowedParse(self, shadowed_workspace):
+        session = ParseSession()
+
+        assert sorted(self.ParseShadowed(session, shadowed_workspace)) == [
+            PurePath("B.SimpleSchema"),
+            PurePath("sub/A.SimpleSchema"),
+        ]
+
+        # Files in the directory of the including file take precedence over files in the workspace
+        (shadowed_workspace / "sub" / "B.SimpleSchema").write_text("sub_b: String\n", encoding="utf-8")
+
+        assert sorted(self.ParseShadowed(session, shadowed_workspace)) == [
+            PurePath("sub/A.SimpleSchema"),
+            PurePath("sub/B.SimpleSchema"),
+        ]
+
+    # ----------------------------------------------------------------------
+    def test_IncludeShadowedUpdate(self, shadowed_workspace):
+        session = ParseSession()
+
+        original_results = self.ParseShadowed(session, shadowed_workspace)
+
+        (shadowed_workspace / "sub" / "B.SimpleSchema").write_text("sub_b: String\n", encoding="utf-8")
+
+        results = self.Update(session, shadowed_workspace, "sub/B.SimpleSchema")
+
+        assert sorted(results) == [PurePath("sub/A.SimpleSchema"), PurePath("sub/B.SimpleSchema")]
+        assert results[PurePath("sub/A.SimpleSchema")] is not original_results[PurePath("sub/A.SimpleSchema")]
+
+        # Files that can't be affected by the new file are reused
+        (shadowed_workspace / "C.SimpleSchema").write_text("c: String\n", encoding="utf-8")
+
+        updated_results = self.Update(session, shadowed_workspace, "C.SimpleSchema")
+        assert updated_results[PurePath("sub/A.SimpleSchema")] is results[PurePath("sub/A.SimpleSchema")]
+
+    # ----------------------------------------------------------------------
+    def test_IncludeRemovedFromRoot(self, workspace):
+        session = ParseSession()
+
+        self.Parse(session, workspace)
+
+        (workspace / "Root1.SimpleSchema").write_text("value: Integer\n", encoding="utf-8")
+
+        results = self.Update(session, workspace, "Root1.SimpleSchema")
+
+        # The included file is no longer referenced
+        assert sorted(results) == [PurePath("Root1.SimpleSchema"), PurePath("Root2.SimpleSchema")]
+
+    # ----------------------------------------------------------------------
+    def test_UnknownFiles(self, workspace, tmp_path):
+        session = ParseSession()
+
+        original_results = self.Parse(session, workspace)
+
+        results = self.Update(session, workspace, "Unrelated.SimpleSchema", "../Outside.SimpleSchema")
+
+        assert results == original_results
+
+    # ----------------------------------------------------------------------
+    def test_ResultsAreCopies(self, workspace):
+        session = ParseSession()
+
+        original_results = self.Parse(session, workspace)
+        original_keys = sorted(original_results)
+
+        (workspace / "Root1.SimpleSchema").write_text("value: Integer\n", encoding="utf-8")
+        self.Update(session, workspace, "Root1.SimpleSchema")
+
+        assert sorted(original_results) == original_keys
+
+    # ----------------------------------------------------------------------
+    def test_ResultsAreShared(self, workspace):
+        session = ParseSession()
+
+        original_results = self.Parse(session, workspace)
+
+        (workspace / "Root2.SimpleSchema").write_text("new_value: Number\n", encoding="utf-8")
+
+        updated_results = self.Update(session, workspace, "Root2.SimpleSchema")
+        parsed_results = self.Parse(session, workspace)
+
+        # Results that are reused are the same instances rather than copies...
+        original_root = original_results[PurePath("Root1.SimpleSchema")]
+
+        assert updated_results[PurePath("Root1.SimpleSchema")] is original_root
+        assert parsed_results[PurePath("Root1.SimpleSchema")] is original_root
+
+        # ...which can't be modified
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            original_root.statements = []  # type: ignore[misc]
+
+        # The dictionaries that contain them are not shared
+        assert updated_results is not original_results
+        assert parsed_results is not updated_results
+
+    # ----------------------------------------------------------------------
+    def test_ParseReusesResults(self, workspace):
+        session = ParseSession()
+
+        original_results = self.Parse(session, workspace)
+
+        (workspace / "Root2.SimpleSchema").write_text("new_value: Number\n", encoding="utf-8")
+
+        results = self.Parse(session, workspace)
+
+        assert results[PurePath("Root2.SimpleSchema")] is not original_results[PurePath("Root2.SimpleSchema")]
+        assert results[PurePath("Root2.SimpleSchema")].statements[0].name.value == "new_value"
+
+        # Files whose content hasn't changed aren't parsed again
+        assert results[PurePath("Root1.SimpleSchema")] is original_results[PurePath("Root1.SimpleSchema")]
+        assert (
+            results[PurePath("Included.SimpleSchema")] is original_results[PurePath("Included.SimpleSchema")]
+        )
+
+    # ----------------------------------------------------------------------
+    def test_ParseRefreshesWorkspaceIndex(self, workspace):
+        session = ParseSession()
+
+        (workspace / "Root2.SimpleSchema").write_text("from Other import *\n", encoding="utf-8")
+
+        results = self.Parse(session, workspace)
+        assert isinstance(results[PurePath("Root2.SimpleSchema")], Errors.SimpleSchemaGeneratorError)
+
+        workspace_index = session._workspace_index  # noqa: SLF001
+
+        (workspace / "Other.SimpleSchema").write_text("other: String\n", encoding="utf-8")
+
+        results = self.Parse(session, workspace)
+
+        assert isinstance(results[PurePath("Root2.SimpleSchema")], RootStatement)
+        assert isinstance(results[PurePath("Other.SimpleSchema")], RootStatement)
+        assert session._workspace_index is workspace_index  # noqa: SLF001
+
+    # ----------------------------------------------------------------------
+    def test_ProcessPool(self, workspace):
+        with ParseSession(options=ParseOptions(executor=ExecutorType.Process)) as session:
+            (workspace / "Root2.SimpleSchema").write_text("from Other import *\n", encoding="utf-8")
+
+            results = self.Parse(session, workspace)
+            assert isinstance(results[PurePath("Root2.SimpleSchema")], Errors.SimpleSchemaGeneratorError)
+
+            process_pool = session._process_pool  # noqa: SLF001
+            assert process_pool is not None
+
+            # Worker processes resolve the include with the current state of the file system
+            (workspace / "Other.SimpleSchema").write_text("other: String\n", encoding="utf-8")
+
+            results = self.Update(session, workspace, "Other.SimpleSchema")
+
+            assert isinstance(results[PurePath("Root2.SimpleSchema")], RootStatement)
+            assert isinstance(results[PurePath("Other.SimpleSchema")], RootStatement)
+
+            assert session._process_pool is process_pool  # noqa: SLF001
+
+        assert session._process_pool is None  # noqa: SLF001
+
+        # Worker processes are started again when needed
+        (workspace / "Root1.SimpleSchema").write_text("value: Integer\n", encoding="utf-8")
+
+        results = self.Update(session, workspace, "Root1.SimpleSchema")
+        assert isinstance(results[PurePath("Root1.SimpleSchema")], RootStatement)
+
+        session.Close()
+
+
+# ----------------------------------------------------------------------
+def test_CreateWorkspaces(tmp_path):
+    workspace = tmp_path / "workspace"
+    nested_workspace = workspace / "Nested"
+
+    (workspace / "Dir").mkdir(parents=True)
+    nested_workspace.mkdir()
+
+    (workspace / "One.SimpleSchema").write_text("one: Integer\n", encoding="utf-8")
+    (workspace / "Dir" / "Two.SimpleSchema").write_text("two: Integer\n", encoding="utf-8")
+    (workspace / "Dir" / "Ignored.txt").write_text("", encoding="utf-8")
+    (nested_workspace / "Three.SimpleSchema").write_text("three: Integer\n", encoding="utf-8")
+
+    workspaces = CreateWorkspaces([workspace, nested_workspace])
+
+    assert {workspace_root: sorted(sources) for workspace_root, sources in workspaces.items()} == {
+        workspace: [PurePath("Dir/Two.SimpleSchema"), PurePath("One.SimpleSchema")],
+        nested_workspace: [PurePath("Three.SimpleSchema")],
+    }
+
+    assert workspaces[workspace][PurePath("Dir/Two.SimpleSchema")]() == "two: Integer\n"
+
+    assert CreateWorkspaces([workspace], [".txt"]) == {workspace: {PurePath("Dir/Ignored.txt"): ANY}}
+
+
+# ----------------------------------------------------------------------
+@pytest.mark.parametrize("executor", [ExecutorType.Thread, ExecutorType.Process])
+def test_NumJobs(executor):
+    workspaces = {
+        Path.cwd(): {PurePath(f"File{index}.SimpleSchema"): lambda: "value: Integer\n" for index in range(4)},
+    }
+
+    results = _Execute(workspaces, num_jobs=2, executor=executor)
+
+    assert len(results[Path.cwd()]) == 4
+    assert all(isinstance(result, RootStatement) for result in results[Path.cwd()].values())
+
+    with pytest.raises(ValueError, match=re.escape("Invalid num_jobs value: 0")):
+        _Execute(workspaces, num_jobs=0)
+
+
+# ----------------------------------------------------------------------
+def test_OptionKeywords(monkeypatch):
+    execute_parse = sys.modules[Parse.__module__]._ExecuteParse
+    parse_options: list[ParseOptions] = []
+
+    # ----------------------------------------------------------------------
+    def ExecuteParse(*args, **kwargs):
+        parse_options.append(args[5])
+        return execute_parse(*args, **kwargs)
+
+    # ----------------------------------------------------------------------
+    async def GetContent() -> str:
+        return "value: Integer\n"
+
+    # ----------------------------------------------------------------------
+
+    monkeypatch.setattr(f"{Parse.__module__}._ExecuteParse", ExecuteParse)
+
+    workspaces = {Path.cwd(): {PurePath("File.SimpleSchema"): lambda: "value: Integer\n"}}
+
+    dm_and_content = GenerateDoneManagerAndContent()
+    dm = cast(DoneManager, next(dm_and_content))
+
+    Parse(dm, workspaces)
+    Parse(dm, workspaces, single_threaded=True, quiet=True, tab_width=8)
+    Parse(dm, workspaces, options=ParseOptions(num_jobs=2, tab_width=2))
+    Parse(dm, workspaces, tab_width=8, options=ParseOptions(num_jobs=2, tab_width=2))
+    list(ParseIter(dm, workspaces, single_threaded=True))
+    asyncio.run(ParseAsync(dm, {Path.cwd(): {PurePath("File.SimpleSchema"): GetContent}}, quiet=True))
+
+    assert dm.result == 0
+    assert parse_options == [
+        ParseOptions(),
+        ParseOptions(single_threaded=True, quiet=True, tab_width=8),
+        ParseOptions(num_jobs=2, tab_width=2),
+        ParseOptions(num_jobs=2, tab_width=8),
+        ParseOptions(single_threaded=True),
+        ParseOptions(quiet=True),
+    ]
+
+
+# ----------------------------------------------------------------------
+def test_ErrorGetContent():
+    # ----------------------------------------------------------------------
+    def GetContent() -> str:
+        raise ValueError("The content is not available")
+
+    # ----------------------------------------------------------------------
+
+    with pytest.raises(ValueError, match=re.escape("The content is not available")):
+        _Execute(
+            {_SINGLE_CONTENT_FILENAME.parent: {PurePath(_SINGLE_CONTENT_FILENAME.name): GetContent}},
+            expected_result=ExecuteTasks.CATASTROPHIC_TASK_FAILURE_RESULT,
+        )
+
+
 # ----------------------------------------------------------------------
 def test_ErrorInvalidSyntax():
     with pytest.raises(
@@ -789,8 +3709,21 @@ def _Execute(
     ],
     *,
     single_threaded: bool = False,
+    num_jobs: int | None = None,
     quiet: bool = False,
     raise_if_single_exception: bool = True,
+    executor: ExecutorType = ExecutorType.Thread,
+    antlr_diagnostics: bool = False,
+    chunk_lines: int | None = None,
+    tokenizer: TokenizerType = TokenizerType.Antlr,
+    stats: ParseStats | None = None,
+    max_in_flight: int | None = None,
+    max_bytes_in_flight: int | None = None,
+    schedule: ScheduleType = ScheduleType.Fifo,
+    fail_fast: bool = False,
+    file_timeout: float | None = None,
+    cancel_event: threading.Event | None = None,
+    max_errors: int | None = None,
     expected_result: int = 0,
     expected_content: str | None = None,
 ) -> dict[
@@ -810,6 +3743,21 @@ def _Execute(
         single_threaded=single_threaded,
         quiet=quiet,
         raise_if_single_exception=raise_if_single_exception,
+        options=ParseOptions(
+            num_jobs=num_jobs,
+            executor=executor,
+            antlr_diagnostics=antlr_diagnostics,
+            chunk_lines=chunk_lines,
+            tokenizer=tokenizer,
+            stats=stats,
+            max_in_flight=max_in_flight,
+            max_bytes_in_flight=max_bytes_in_flight,
+            schedule=schedule,
+            fail_fast=fail_fast,
+            file_timeout=file_timeout,
+            max_errors=max_errors,
+        ),
+        cancel_event=cancel_event,
     )
 
     assert dm.result == expected_result
@@ -821,6 +3769,64 @@ def _Execute(
     return result
 
 
+# ----------------------------------------------------------------------
+def _GetRegionFilenames(
+    root: RootStatement,
+) -> set[Path]:
+    # ----------------------------------------------------------------------
+    class Visitor(ElementVisitorHelper):
+        # ----------------------------------------------------------------------
+        def __init__(self) -> None:
+            self.filenames: set[Path] = set()
+
+        # ----------------------------------------------------------------------
+        @contextmanager
+        @override
+        def OnElement(
+            self,
+            element: Element,
+        ) -> Iterator[VisitResult]:
+            self.filenames.add(element.region.filename)
+            yield VisitResult.Continue
+
+    # ----------------------------------------------------------------------
+
+    visitor = Visitor()
+
+    root.Accept(visitor)
+
+    return visitor.filenames
+
+
+# ----------------------------------------------------------------------
+def _GetRegions(
+    root: RootStatement,
+) -> list[tuple[str, str]]:
+    # ----------------------------------------------------------------------
+    class Visitor(ElementVisitorHelper):
+        # ----------------------------------------------------------------------
+        def __init__(self) -> None:
+            self.regions: list[tuple[str, str]] = []
+
+        # ----------------------------------------------------------------------
+        @contextmanager
+        @override
+        def OnElement(
+            self,
+            element: Element,
+        ) -> Iterator[VisitResult]:
+            self.regions.append((type(element).__name__, str(element.region)))
+            yield VisitResult.Continue
+
+    # ----------------------------------------------------------------------
+
+    visitor = Visitor()
+
+    root.Accept(visitor)
+
+    return visitor.regions
+
+
 # ----------------------------------------------------------------------
 def _ExecuteSingleFile(
     schema_filename: Path,
@@ -842,15 +3848,35 @@ def _ExecuteSingleFile(
     return result
 
 
+# ----------------------------------------------------------------------
+def _ToYaml(
+    root: RootStatement,
+) -> str:
+    visitor = YamlVisitor()
+
+    root.Accept(visitor)
+
+    return visitor.yaml_string
+
+
 # ----------------------------------------------------------------------
 _SINGLE_CONTENT_FILENAME = Path.cwd() / "Filename.SimpleSchema"
 
 
 def _ExecuteSingleContent(
     content: str,
+    *,
+    executor: ExecutorType = ExecutorType.Thread,
+    antlr_diagnostics: bool = False,
+    chunk_lines: int | None = None,
+    tokenizer: TokenizerType = TokenizerType.Antlr,
 ) -> RootStatement:
     result = _Execute(
-        {_SINGLE_CONTENT_FILENAME.parent: {PurePath(_SINGLE_CONTENT_FILENAME.name): lambda: content}}
+        {_SINGLE_CONTENT_FILENAME.parent: {PurePath(_SINGLE_CONTENT_FILENAME.name): lambda: content}},
+        executor=executor,
+        antlr_diagnostics=antlr_diagnostics,
+        chunk_lines=chunk_lines,
+        tokenizer=tokenizer,
     )
 
     assert len(result) == 1
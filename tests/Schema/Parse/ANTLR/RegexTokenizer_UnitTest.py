@@ -0,0 +1,155 @@
+# ----------------------------------------------------------------------
+# |
+# |  RegexTokenizer_UnitTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-16 22:41:09
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2026
+# |  Distributed under the MIT License.
+# |
+# ----------------------------------------------------------------------
+"""Unit tests for RegexTokenizer.py."""
+
+import random
+
+from pathlib import Path
+
+import antlr4
+import pytest
+
+from antlr4.error.Errors import ParseCancellationException
+
+from SimpleSchemaGenerator.Schema.Parse.ANTLR.RegexTokenizer import *
+from SimpleSchemaGenerator.Schema.Parse.ANTLR.Parse import SimpleSchemaLexer
+
+
+# ----------------------------------------------------------------------
+sample_schemas = (
+    Path(__file__).parent.parent.parent.parent.parent / "src" / "SimpleSchemaGenerator" / "SampleSchemas"
+)
+
+
+# ----------------------------------------------------------------------
+def _GetExpectedTokens(
+    content: str,
+    line_offset: int = 0,
+) -> list[tuple[int, int, int, int, int, int, str]]:
+    lexer = SimpleSchemaLexer(antlr4.InputStream(content))
+    lexer.CustomInitialization()
+    lexer.removeErrorListeners()
+
+    lexer.line += line_offset
+
+    return _GetTokens(lexer)
+
+
+# ----------------------------------------------------------------------
+def _GetTokens(
+    token_source: SimpleSchemaLexer | RegexTokenizer,
+) -> list[tuple[int, int, int, int, int, int, str]]:
+    tokens: list[tuple[int, int, int, int, int, int, str]] = []
+
+    while True:
+        token = token_source.nextToken()
+
+        tokens.append(
+            (token.type, token.channel, token.start, token.stop, token.line, token.column, token.text)
+        )
+
+        if token.type == antlr4.Token.EOF:
+            break
+
+    return tokens
+
+
+# ----------------------------------------------------------------------
+@pytest.mark.parametrize(
+    "filename", sorted(sample_schemas.glob("*.SimpleSchema")), ids=lambda value: value.name
+)
+def test_SampleSchemas(filename):
+    content = filename.read_text(encoding="utf-8")
+
+    assert _GetTokens(RegexTokenizer(content)) == _GetExpectedTokens(content)
+
+
+# ----------------------------------------------------------------------
+@pytest.mark.parametrize(
+    "content",
+    [
+        "",
+        "\n\n",
+        "  leading: Whitespace\n",
+        "Object ->\n    one: String\n\n    two: String\n",
+        "Object ->\r\n\tone: String\r\n",
+        "Object ->\n    Nested ->\n        pass\nvalue: String\n",
+        "value: String { one: 1, two: -2, three: 3.0, four: -.4, five: 1..2 }\n",
+        "1abc: String\n*abc: String\n_1: String\n@value: String\n$value: String\n&value: String\n",
+        "value: String*\nvalue: String+\nvalue: String?\nvalue: String[1, 2]\n",
+        'value: String { one: "one", two: \'two\', three: "\\"three\\"", four: "\\\\" }\n',
+        "value: String { one: \"\"\"\nmulti\nline\n\"\"\", two: '''\nmulti\nline\n''' }\n",
+        "# Comment\nvalue: String # Comment\n#/\nMulti-line comment\n/#\n",
+        "value: (\n    String,\n    Integer,\n)\n",
+        "value: (String |\n    Integer)\n",
+        "value: String\n)\none: String\n",
+        "value: \\\n    String\n",
+        "from one.two import three as four, /five/six, ../seven, *\n",
+        "Base ::\n    pass\n",
+        "True False true false None pass\n",
+    ],
+)
+def test_Content(content):
+    assert _GetTokens(RegexTokenizer(content)) == _GetExpectedTokens(content)
+
+
+# ----------------------------------------------------------------------
+def test_LineOffset():
+    content = "Object ->\n    one: String\n"
+
+    assert _GetTokens(RegexTokenizer(content, line_offset=10)) == _GetExpectedTokens(content, 10)
+
+
+# ----------------------------------------------------------------------
+@pytest.mark.parametrize(
+    "content",
+    [
+        "\U0001f600: String\n",
+        'value: String { one: "unterminated }\n',
+        "value: String { one: '''unterminated }\n",
+        'value: String { one: "escaped\\" }\n',
+        "value: String ^\n",
+        "value: String \\ String\n",
+    ],
+)
+def test_Unsupported(content):
+    with pytest.raises(ParseCancellationException):
+        _GetTokens(RegexTokenizer(content))
+
+
+# ----------------------------------------------------------------------
+def test_Random():
+    # Content that the tokenizer supports must produce the same tokens as the ANTLR lexer
+    fragments = [
+        "a", "b", "1", "0", "-", ".", "..", '"', "'", '"""', "'''", "\\", "\n", "\r\n", " ", "\t", "(",
+        ")", "[", "]", "{", "}", "#", "#/", "/#", "*", "_", "@", "$", "&", ":", "::", "->", "=", "|", "+",
+        "?", ",", "/", "pass", "True", "from", "import", "as",
+    ]  # fmt: skip
+
+    rng = random.Random(0)
+
+    num_supported = 0
+
+    for _ in range(2000):
+        content = "".join(rng.choice(fragments) for _ in range(rng.randint(0, 20)))
+
+        try:
+            tokens = _GetTokens(RegexTokenizer(content))
+        except ParseCancellationException:
+            continue
+
+        assert tokens == _GetExpectedTokens(content), repr(content)
+        num_supported += 1
+
+    assert num_supported
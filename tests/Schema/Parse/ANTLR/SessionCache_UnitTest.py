@@ -0,0 +1,82 @@
+# ----------------------------------------------------------------------
+# |
+# |  SessionCache_UnitTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-17 10:37:40
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2026
+# |  Distributed under the MIT License.
+# |
+# ----------------------------------------------------------------------
+"""Unit tests for SessionCache.py."""
+
+from pathlib import Path, PurePath
+
+from SimpleSchemaGenerator.Common.Region import Location, Region
+from SimpleSchemaGenerator.Schema.Elements.Statements.RootStatement import RootStatement
+from SimpleSchemaGenerator.Schema.Parse.ANTLR.ParseCache import ParseCache
+from SimpleSchemaGenerator.Schema.Parse.ANTLR.SessionCache import *
+
+
+# ----------------------------------------------------------------------
+def test_Standard():
+    cache = SessionCache(None)
+
+    assert cache.Get("abcdef") is None
+
+    value = (_CreateRoot(), [], set())
+    cache.Set("abcdef", value)
+
+    assert cache.Get("abcdef") is value
+
+
+# ----------------------------------------------------------------------
+def test_PersistentCache(tmp_path):
+    ParseCache(tmp_path).Set("abcdef", (_CreateRoot(), [], set()))
+
+    cache = SessionCache(ParseCache(tmp_path))
+
+    value = cache.Get("abcdef")
+    assert isinstance(value, tuple)
+    assert isinstance(value[0], RootStatement)
+
+    # The value is retained in memory once it has been read
+    assert cache.Get("abcdef") is value
+
+    cache.Set("ghijkl", (_CreateRoot(), [], set()))
+    assert ParseCache(tmp_path).Get("ghijkl") is not None
+
+
+# ----------------------------------------------------------------------
+def test_Prune():
+    cache = SessionCache(None)
+
+    root1 = _CreateRoot()
+    root2 = _CreateRoot()
+
+    cache.Set("one", (root1, [], set()))
+    cache.Set("two", (root2, [], set()))
+
+    cache.Prune({Path("workspace"): {PurePath("One.SimpleSchema"): root1}})
+
+    assert cache.Get("one") is not None
+    assert cache.Get("two") is None
+
+    # Entries are matched by identity rather than equality
+    assert _CreateRoot() == root1
+
+    cache.Prune({Path("workspace"): {PurePath("One.SimpleSchema"): _CreateRoot()}})
+
+    assert cache.Get("one") is None
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Private Functions
+# |
+# ----------------------------------------------------------------------
+def _CreateRoot() -> RootStatement:
+    return RootStatement(Region(Path("Filename.SimpleSchema"), Location(1, 1), Location(1, 1)), [])
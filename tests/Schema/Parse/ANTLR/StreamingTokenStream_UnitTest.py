@@ -0,0 +1,135 @@
+# ----------------------------------------------------------------------
+# |
+# |  StreamingTokenStream_UnitTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-16 13:51:07
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2026
+# |  Distributed under the MIT License.
+# |
+# ----------------------------------------------------------------------
+"""Unit tests for StreamingTokenStream.py."""
+
+import textwrap
+
+from pathlib import Path
+
+import antlr4
+import pytest
+
+from SimpleSchemaGenerator.Schema.Parse.ANTLR.StreamingTokenStream import *
+from SimpleSchemaGenerator.Schema.Parse.ANTLR.Parse import SimpleSchemaLexer
+
+
+# ----------------------------------------------------------------------
+sample_schemas = (
+    Path(__file__).parent.parent.parent.parent.parent / "src" / "SimpleSchemaGenerator" / "SampleSchemas"
+)
+
+
+# ----------------------------------------------------------------------
+def _CreateLexer(
+    content: str,
+) -> SimpleSchemaLexer:
+    lexer = SimpleSchemaLexer(antlr4.InputStream(content))
+    lexer.CustomInitialization()
+
+    return lexer
+
+
+# ----------------------------------------------------------------------
+@pytest.mark.parametrize(
+    "filename", sorted(sample_schemas.glob("*.SimpleSchema")), ids=lambda value: value.name
+)
+def test_Tokens(filename):
+    content = filename.read_text(encoding="utf-8")
+
+    expected_tokens = antlr4.CommonTokenStream(_CreateLexer(content))
+    expected_tokens.fill()
+
+    tokens = StreamingTokenStream(_CreateLexer(content))
+    tokens.fill()
+
+    assert [(token.type, token.text, token.line, token.column) for token in tokens.tokens] == [
+        (token.type, token.text, token.line, token.column)
+        for token in expected_tokens.tokens
+        if token.channel == antlr4.Token.DEFAULT_CHANNEL
+    ]
+
+    assert [token.tokenIndex for token in tokens.tokens] == list(range(len(tokens.tokens)))
+
+
+# ----------------------------------------------------------------------
+def test_OnDemand():
+    tokens = StreamingTokenStream(
+        _CreateLexer(
+            textwrap.dedent(
+                """\
+                one: String
+                two: Integer
+                """,
+            ),
+        ),
+    )
+
+    assert tokens.tokens == []
+
+    assert tokens.LT(1).text == "one"
+    assert tokens.LT(3).text == "String"
+    assert len(tokens.tokens) == 3
+
+    tokens.fill()
+    assert tokens.LT(1).text == "one"
+    assert tokens.tokens[-1].type == antlr4.Token.EOF
+
+    # Nothing is fetched once the end of the content has been reached
+    assert tokens.fetch(1) == 0
+
+
+# ----------------------------------------------------------------------
+def test_Release():
+    content = "".join(f"value{index}: String\n" for index in range(1000))
+
+    tokens = StreamingTokenStream(_CreateLexer(content))
+
+    while tokens.LA(1) != antlr4.Token.EOF:
+        token = tokens.LT(1)
+        assert token.tokenIndex == tokens.index
+
+        tokens.consume()
+
+        # The previous token is still available
+        assert tokens.LT(-1) is token
+        assert len(tokens.tokens) <= StreamingTokenStream._RELEASE_BATCH_SIZE + 2
+
+    assert tokens.index > StreamingTokenStream._RELEASE_BATCH_SIZE * 2
+    assert tokens.LT(1).tokenIndex == tokens.index
+
+
+# ----------------------------------------------------------------------
+def test_ReleaseMarked():
+    content = "".join(f"value{index}: String\n" for index in range(1000))
+
+    tokens = StreamingTokenStream(_CreateLexer(content))
+
+    marker = tokens.mark()
+    start = tokens.index
+
+    while tokens.LA(1) != antlr4.Token.EOF:
+        tokens.consume()
+
+    # Tokens are not released while a prediction is in progress
+    assert tokens.tokens[0].tokenIndex == start
+
+    tokens.seek(start)
+    tokens.release(marker)
+
+    assert tokens.LT(1).text == "value0"
+
+    while tokens.LA(1) != antlr4.Token.EOF:
+        tokens.consume()
+
+    assert len(tokens.tokens) <= StreamingTokenStream._RELEASE_BATCH_SIZE + 2
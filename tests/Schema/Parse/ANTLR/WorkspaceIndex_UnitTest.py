@@ -0,0 +1,251 @@
+# ----------------------------------------------------------------------
+# |
+# |  WorkspaceIndex_UnitTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-16 12:41:09
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2026
+# |  Distributed under the MIT License.
+# |
+# ----------------------------------------------------------------------
+"""Unit tests for WorkspaceIndex.py."""
+
+import os
+import sys
+
+from pathlib import Path
+
+import pytest
+
+from SimpleSchemaGenerator.Schema.Parse.ANTLR.WorkspaceIndex import *
+
+
+# ----------------------------------------------------------------------
+@pytest.fixture
+def workspace(tmp_path) -> Path:
+    workspace = tmp_path.resolve() / "workspace"
+
+    (workspace / "Dir" / "Nested").mkdir(parents=True)
+
+    (workspace / "File.SimpleSchema").write_text("", encoding="utf-8")
+    (workspace / "Dir" / "Other.SimpleSchema").write_text("", encoding="utf-8")
+    (workspace / "Dir" / "Nested" / "Nested.SimpleSchema").write_text("", encoding="utf-8")
+
+    return workspace
+
+
+# ----------------------------------------------------------------------
+def CreateIndex(*workspace_names: Path) -> WorkspaceIndex:
+    return WorkspaceIndex(list(workspace_names), [".SimpleSchema"])
+
+
+# ----------------------------------------------------------------------
+def test_GetWorkspace(workspace):
+    index = CreateIndex(workspace, workspace / "Dir" / "Nested")
+
+    assert index.GetWorkspace(workspace / "File.SimpleSchema") == workspace
+    assert index.GetWorkspace(workspace / "Dir" / "Other.SimpleSchema") == workspace
+    assert (
+        index.GetWorkspace(workspace / "Dir" / "Nested" / "Nested.SimpleSchema")
+        == workspace / "Dir" / "Nested"
+    )
+    assert index.GetWorkspace(workspace.parent / "File.SimpleSchema") is None
+
+
+# ----------------------------------------------------------------------
+def test_IsFileAndIsDir(workspace):
+    index = CreateIndex(workspace)
+
+    assert index.IsFile(workspace / "File.SimpleSchema")
+    assert not index.IsDir(workspace / "File.SimpleSchema")
+
+    assert index.IsDir(workspace)
+    assert index.IsDir(workspace / "Dir")
+    assert not index.IsFile(workspace / "Dir")
+
+    assert not index.IsFile(workspace / "Dir" / "DoesNotExist.SimpleSchema")
+    assert not index.IsFile(workspace / "File.SimpleSchema" / "Child")
+    assert not index.IsDir(workspace / "DoesNotExist" / "Child")
+
+
+# ----------------------------------------------------------------------
+def test_ResolveIncludeFilename(workspace):
+    index = CreateIndex(workspace)
+
+    assert index.ResolveIncludeFilename(workspace / "File.SimpleSchema", allow_directory=False) == (
+        workspace / "File.SimpleSchema"
+    )
+
+    # Extension
+    assert index.ResolveIncludeFilename(workspace / "File", allow_directory=False) == (
+        workspace / "File.SimpleSchema"
+    )
+
+    # Relative
+    assert index.ResolveIncludeFilename(workspace / "Dir" / ".." / "File", allow_directory=False) == (
+        workspace / "File.SimpleSchema"
+    )
+
+    # Directories
+    assert index.ResolveIncludeFilename(workspace / "Dir", allow_directory=True) == workspace / "Dir"
+    assert index.ResolveIncludeFilename(workspace / "Dir", allow_directory=False) is None
+
+    assert index.ResolveIncludeFilename(workspace / "DoesNotExist", allow_directory=True) is None
+
+
+# ----------------------------------------------------------------------
+def test_ResolveIncludeFilenameMissingPaths(workspace):
+    index = CreateIndex(workspace)
+
+    missing_paths: set[Path] = set()
+
+    assert index.ResolveIncludeFilename(
+        workspace / "File", allow_directory=False, missing_paths=missing_paths
+    ) == (workspace / "File.SimpleSchema")
+    assert missing_paths == {workspace / "File"}
+
+    # Directories that aren't allowed are not missing, as a file can't be created with the same name
+    missing_paths = set()
+
+    assert (
+        index.ResolveIncludeFilename(workspace / "Dir", allow_directory=False, missing_paths=missing_paths)
+        is None
+    )
+    assert missing_paths == {workspace / "Dir.SimpleSchema"}
+
+    # Cached results
+    missing_paths = set()
+
+    assert index.ResolveIncludeFilename(
+        workspace / "File", allow_directory=False, missing_paths=missing_paths
+    ) == (workspace / "File.SimpleSchema")
+    assert missing_paths == {workspace / "File"}
+
+    assert index.Exists(workspace / "Dir")
+    assert index.Exists(workspace / "File.SimpleSchema")
+    assert not index.Exists(workspace / "File")
+
+
+# ----------------------------------------------------------------------
+def test_ResolveIncludeFilenameOutsideWorkspace(workspace):
+    index = CreateIndex(workspace / "Dir")
+
+    assert index.ResolveIncludeFilename(workspace / "Dir" / ".." / "File", allow_directory=False) == (
+        workspace / "File.SimpleSchema"
+    )
+
+
+# ----------------------------------------------------------------------
+def test_ResolveIncludeFilenameCaseInsensitive(workspace, monkeypatch):
+    monkeypatch.setattr(sys, "platform", "darwin")
+
+    index = CreateIndex(workspace)
+
+    # The casing on the file system is returned rather than the casing of the path
+    assert index.ResolveIncludeFilename(workspace / "dir" / "OTHER", allow_directory=False) == (
+        workspace / "Dir" / "Other.SimpleSchema"
+    )
+    assert index.ResolveIncludeFilename(
+        workspace / "DIR" / "nested" / "nested.simpleschema", allow_directory=False
+    ) == (workspace / "Dir" / "Nested" / "Nested.SimpleSchema")
+    assert index.ResolveIncludeFilename(workspace / "dir", allow_directory=True) == workspace / "Dir"
+
+
+# ----------------------------------------------------------------------
+def test_Cached(workspace):
+    index = CreateIndex(workspace)
+
+    assert index.ResolveIncludeFilename(workspace / "New", allow_directory=False) is None
+    assert index.IsFile(workspace / "File.SimpleSchema")
+
+    (workspace / "New.SimpleSchema").write_text("", encoding="utf-8")
+    (workspace / "File.SimpleSchema").unlink()
+
+    # The index reflects the file system when it was first examined
+    assert index.ResolveIncludeFilename(workspace / "New", allow_directory=False) is None
+    assert index.IsFile(workspace / "File.SimpleSchema")
+
+    index = CreateIndex(workspace)
+
+    assert index.ResolveIncludeFilename(workspace / "New", allow_directory=False) == (
+        workspace / "New.SimpleSchema"
+    )
+    assert not index.IsFile(workspace / "File.SimpleSchema")
+
+
+# ----------------------------------------------------------------------
+def test_Refresh(workspace, monkeypatch):
+    index = CreateIndex(workspace)
+
+    assert index.ResolveIncludeFilename(workspace / "New", allow_directory=False) is None
+    assert index.IsFile(workspace / "Dir" / "Other.SimpleSchema")
+
+    # Nothing has changed
+    assert index.Refresh() is False
+
+    (workspace / "New.SimpleSchema").write_text("", encoding="utf-8")
+    os.utime(workspace, ns=(0, 0))
+
+    scanned: list[str] = []
+    original_scandir = os.scandir
+
+    # ----------------------------------------------------------------------
+    def ScanDir(path):
+        scanned.append(str(path))
+        return original_scandir(path)
+
+    # ----------------------------------------------------------------------
+
+    monkeypatch.setattr(os, "scandir", ScanDir)
+
+    assert index.Refresh() is True
+
+    assert index.ResolveIncludeFilename(workspace / "New", allow_directory=False) == (
+        workspace / "New.SimpleSchema"
+    )
+    assert index.IsFile(workspace / "Dir" / "Other.SimpleSchema")
+
+    # Only the directory that changed was listed again
+    assert scanned == [str(workspace)]
+
+
+# ----------------------------------------------------------------------
+def test_ScanOnce(workspace, monkeypatch):
+    index = CreateIndex(workspace)
+
+    scanned: list[str] = []
+    original_scandir = os.scandir
+
+    # ----------------------------------------------------------------------
+    def ScanDir(path):
+        scanned.append(str(path))
+        return original_scandir(path)
+
+    # ----------------------------------------------------------------------
+
+    monkeypatch.setattr(os, "scandir", ScanDir)
+
+    for _ in range(3):
+        assert index.ResolveIncludeFilename(workspace / "Dir" / "Other", allow_directory=False) == (
+            workspace / "Dir" / "Other.SimpleSchema"
+        )
+        assert index.ResolveIncludeFilename(workspace / "Dir" / "Missing", allow_directory=False) is None
+
+    assert scanned == [str(workspace), str(workspace / "Dir")]
+
+
+# ----------------------------------------------------------------------
+@pytest.mark.skipif(sys.platform == "win32", reason="Symbolic links require elevated privileges on Windows")
+def test_SymLink(workspace):
+    (workspace / "Link").symlink_to(workspace / "Dir", target_is_directory=True)
+
+    index = CreateIndex(workspace)
+
+    assert index.ResolveIncludeFilename(workspace / "Link" / "Other", allow_directory=False) == (
+        workspace / "Dir" / "Other.SimpleSchema"
+    )
+    assert index.IsDir(workspace / "Link")
+    assert index.IsFile(workspace / "Link" / "Other.SimpleSchema")
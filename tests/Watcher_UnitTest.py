@@ -0,0 +1,235 @@
+# ----------------------------------------------------------------------
+# |
+# |  Watcher_UnitTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-16 23:59:53
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2026
+# |  Distributed under the MIT License.
+# |
+# ----------------------------------------------------------------------
+"""Unit tests for Watcher.py."""
+
+import io
+import re
+import shutil
+import sys
+import threading
+import time
+
+from pathlib import Path
+
+import pytest
+
+from SimpleSchemaGenerator.Watcher import *
+
+
+# ----------------------------------------------------------------------
+@pytest.fixture
+def workspace(tmp_path) -> Path:
+    workspace = tmp_path.resolve() / "workspace"
+    workspace.mkdir()
+
+    (workspace / "One.SimpleSchema").write_text("one: Integer\n", encoding="utf-8")
+    (workspace / "Two.SimpleSchema").write_text("from One import *\n\ntwo: Integer\n", encoding="utf-8")
+
+    return workspace
+
+
+# ----------------------------------------------------------------------
+@pytest.fixture(
+    params=[
+        pytest.param(
+            "inotify",
+            marks=pytest.mark.skipif(not InotifyFileWatcher.IsAvailable(), reason="inotify is not available"),
+        ),
+        "polling",
+    ],
+)
+def file_watcher_factory(request):
+    if request.param == "inotify":
+        return InotifyFileWatcher
+
+    return lambda workspace_roots: PollingFileWatcher(workspace_roots, poll_interval=0.05)
+
+
+# ----------------------------------------------------------------------
+class TestFileWatcher:
+    # ----------------------------------------------------------------------
+    def test_Modified(self, workspace, file_watcher_factory):
+        with file_watcher_factory([workspace]) as file_watcher:
+            assert file_watcher.Wait(0.2) == set()
+
+            (workspace / "One.SimpleSchema").write_text("one: String\n", encoding="utf-8")
+
+            assert file_watcher.Wait(5) == {workspace / "One.SimpleSchema"}
+
+    # ----------------------------------------------------------------------
+    def test_CreatedAndRemoved(self, workspace, file_watcher_factory):
+        with file_watcher_factory([workspace]) as file_watcher:
+            (workspace / "Three.SimpleSchema").write_text("three: Integer\n", encoding="utf-8")
+            (workspace / "Two.SimpleSchema").unlink()
+
+            # Files with other extensions are ignored
+            (workspace / "Ignored.txt").write_text("ignored\n", encoding="utf-8")
+
+            assert file_watcher.Wait(5) == {
+                workspace / "Three.SimpleSchema",
+                workspace / "Two.SimpleSchema",
+            }
+
+            assert file_watcher.Wait(0.2) == set()
+
+    # ----------------------------------------------------------------------
+    def test_Directories(self, workspace, file_watcher_factory):
+        with file_watcher_factory([workspace]) as file_watcher:
+            (workspace / "Sub" / "Nested").mkdir(parents=True)
+            (workspace / "Sub" / "Nested" / "Three.SimpleSchema").write_text(
+                "three: Integer\n", encoding="utf-8"
+            )
+
+            assert file_watcher.Wait(5) == {workspace / "Sub" / "Nested" / "Three.SimpleSchema"}
+
+            # Files within new directories are watched
+            (workspace / "Sub" / "Nested" / "Three.SimpleSchema").write_text(
+                "three: String\n", encoding="utf-8"
+            )
+
+            assert file_watcher.Wait(5) == {workspace / "Sub" / "Nested" / "Three.SimpleSchema"}
+
+            shutil.rmtree(workspace / "Sub")
+
+            assert workspace / "Sub" / "Nested" / "Three.SimpleSchema" in file_watcher.Wait(5)
+
+    # ----------------------------------------------------------------------
+    def test_Coalesce(self, workspace, file_watcher_factory):
+        with file_watcher_factory([workspace]) as file_watcher:
+            # ----------------------------------------------------------------------
+            def Write() -> None:
+                for index in range(5):
+                    (workspace / f"File{index}.SimpleSchema").write_text("value: Integer\n", encoding="utf-8")
+                    time.sleep(0.05)
+
+            # ----------------------------------------------------------------------
+
+            thread = threading.Thread(target=Write)
+            thread.start()
+
+            try:
+                # The changes are reported together, as each arrives before the settle time has elapsed
+                assert file_watcher.Wait(5, settle_seconds=0.5) == {
+                    workspace / f"File{index}.SimpleSchema" for index in range(5)
+                }
+            finally:
+                thread.join()
+
+
+# ----------------------------------------------------------------------
+def test_FileWatcherIsAbstract():
+    with pytest.raises(TypeError, match="abstract"):
+        FileWatcher(None)  # type: ignore[abstract]
+
+
+# ----------------------------------------------------------------------
+def test_CreateFileWatcher(workspace):
+    with CreateFileWatcher([workspace], polling=True) as file_watcher:
+        assert isinstance(file_watcher, PollingFileWatcher)
+
+    with CreateFileWatcher([workspace]) as file_watcher:
+        if InotifyFileWatcher.IsAvailable():
+            assert isinstance(file_watcher, InotifyFileWatcher)
+        else:
+            assert isinstance(file_watcher, PollingFileWatcher)
+
+
+# ----------------------------------------------------------------------
+class TestWorkspaceWatcher:
+    # ----------------------------------------------------------------------
+    def test_Build(self, workspace):
+        output_stream = io.StringIO()
+
+        with WorkspaceWatcher([workspace], output_stream, polling=True) as watcher:
+            assert watcher.Build() == 0
+            assert re.fullmatch(
+                r"\[\d\d:\d\d:\d\d\] Parsed 2 of 2 files in \d+\.\dms; 0 errors\n",
+                output_stream.getvalue(),
+            )
+
+            # Only the modified file is parsed
+            (workspace / "One.SimpleSchema").write_text("one: String\n", encoding="utf-8")
+
+            output_stream.truncate(0)
+            output_stream.seek(0)
+
+            assert watcher.Build({workspace / "One.SimpleSchema"}) == 0
+            assert "Parsed 1 of 2 files" in output_stream.getvalue()
+
+            # The files that include a removed file are parsed
+            (workspace / "One.SimpleSchema").unlink()
+
+            output_stream.truncate(0)
+            output_stream.seek(0)
+
+            assert watcher.Build({workspace / "One.SimpleSchema"}) == 1
+
+            lines = output_stream.getvalue().splitlines()
+
+            assert len(lines) == 2
+            assert lines[0].endswith("({} <Ln 1, Col 6>)".format(workspace / "Two.SimpleSchema"))
+            assert "Parsed 1 of 1 files" in lines[1]
+            assert lines[1].endswith("; 1 errors")
+
+            # New files are parsed
+            (workspace / "One.SimpleSchema").write_text("one: Integer\n", encoding="utf-8")
+            (workspace / "Three.SimpleSchema").write_text("three: Integer\n", encoding="utf-8")
+
+            output_stream.truncate(0)
+            output_stream.seek(0)
+
+            assert watcher.Build({workspace / "One.SimpleSchema", workspace / "Three.SimpleSchema"}) == 0
+            assert "Parsed 3 of 3 files" in output_stream.getvalue()
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.skipif(sys.platform == "win32", reason="The test relies on modification times")
+    def test_Run(self, workspace):
+        output_stream = io.StringIO()
+        stop_event = threading.Event()
+
+        with WorkspaceWatcher([workspace], output_stream, poll_interval=0.05) as watcher:
+            thread = threading.Thread(target=watcher.Run, args=(stop_event,))
+            thread.start()
+
+            try:
+                # ----------------------------------------------------------------------
+                def WaitForBuilds(
+                    num_builds: int,
+                ) -> None:
+                    deadline = time.monotonic() + 30
+
+                    while output_stream.getvalue().count("Parsed") < num_builds:
+                        assert time.monotonic() < deadline, output_stream.getvalue()
+                        time.sleep(0.05)
+
+                # ----------------------------------------------------------------------
+
+                WaitForBuilds(1)
+
+                (workspace / "One.SimpleSchema").write_text("one: Integer (\n", encoding="utf-8")
+
+                WaitForBuilds(2)
+
+            finally:
+                stop_event.set()
+                thread.join(30)
+
+        assert not thread.is_alive()
+
+        lines = output_stream.getvalue().splitlines()
+
+        assert len(lines) == 3
+        assert "Parsed 2 of 2 files" in lines[0]
+        assert lines[1].startswith("no viable alternative at input 'one: Integer ('")
+        assert "Parsed 1 of 2 files" in lines[2]